@@ -0,0 +1,77 @@
+import asyncio
+import datetime as dt
+from collections import defaultdict
+
+import httpx
+
+from adobe_vipm.adobe.config import Config
+from adobe_vipm.adobe.dataclasses import APIToken, Authorization
+from adobe_vipm.adobe.errors import wrap_http_error
+from adobe_vipm.adobe.mixins.auth import get_token_request_data, parse_api_token
+from adobe_vipm.adobe.token_store import TokenStore
+
+# Seconds before a token request to Adobe times out, as for the blocking client
+TOKEN_REQUEST_TIMEOUT = 60
+
+
+class AsyncAuthTokens:
+    """
+    Tokens of the authorizations used by an `AsyncAdobeClient`.
+
+    A single token request is in flight per authorization, the other tasks wait for it. The
+    tokens are shared with the other processes through the token store, if any, as for the
+    blocking client.
+    """
+
+    def __init__(
+        self, config: Config, http_client: httpx.AsyncClient, token_store: TokenStore | None
+    ):
+        self._config = config
+        self._http_client = http_client
+        self._token_store = token_store
+        self._tokens: dict[Authorization, APIToken] = {}
+        self._locks: defaultdict[Authorization, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+    async def get(self, authorization: Authorization) -> APIToken:
+        """Returns the token of the authorization, requesting a new one if expired."""
+        token = self._tokens.get(authorization)
+        if token and not token.is_expired():
+            return token
+
+        async with self._locks[authorization]:
+            # Another task may have refreshed the token while this one was waiting
+            token = self._tokens.get(authorization)
+            if not token or token.is_expired():
+                token = await self._load(authorization)
+                self._tokens[authorization] = token
+        return token
+
+    async def _load(self, authorization: Authorization) -> APIToken:
+        if self._token_store is None:
+            return await self._request(authorization)
+
+        loop = asyncio.get_running_loop()
+
+        def refresh() -> APIToken:  # noqa: WPS430
+            # Called by the store from the worker thread, while the loop awaits it
+            return asyncio.run_coroutine_threadsafe(self._request(authorization), loop).result()
+
+        # The store locks are shared with the other processes, so they are waited for in a
+        # worker thread instead of blocking the loop
+        return await asyncio.to_thread(
+            self._token_store.get_or_refresh,
+            authorization.authorization_uk,
+            refresh,
+            dt.timedelta(0),
+        )
+
+    @wrap_http_error
+    async def _request(self, authorization: Authorization) -> APIToken:
+        response = await self._http_client.post(
+            self._config.auth_endpoint_url,
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+            data=get_token_request_data(self._config, authorization),
+            timeout=TOKEN_REQUEST_TIMEOUT,
+        )
+        response.raise_for_status()
+        return parse_api_token(response.json())
@@ -0,0 +1,92 @@
+import logging
+from urllib.parse import urljoin
+
+import httpx
+
+from adobe_vipm.adobe.async_auth import AsyncAuthTokens
+from adobe_vipm.adobe.async_mixins.customer import AsyncCustomerClientMixin
+from adobe_vipm.adobe.async_mixins.deployment import AsyncDeploymentClientMixin
+from adobe_vipm.adobe.async_mixins.order import AsyncOrderClientMixin
+from adobe_vipm.adobe.async_mixins.pagination import AsyncPaginationClientMixin
+from adobe_vipm.adobe.async_mixins.reseller import AsyncResellerClientMixin
+from adobe_vipm.adobe.async_mixins.subscription import AsyncSubscriptionClientMixin
+from adobe_vipm.adobe.async_mixins.transfer import AsyncTransferClientMixin
+from adobe_vipm.adobe.async_transport import build_async_http_client
+from adobe_vipm.adobe.client import get_api_headers
+from adobe_vipm.adobe.config import Config, get_config
+from adobe_vipm.adobe.dataclasses import Authorization
+from adobe_vipm.adobe.rate_limit import get_rate_limiter
+from adobe_vipm.adobe.token_store import get_token_store
+
+logger = logging.getLogger(__name__)
+
+# Seconds before a request to Adobe times out, as for the blocking client
+ADOBE_TIMEOUT = 60
+
+
+class AsyncAdobeClient(  # noqa: WPS215
+    AsyncCustomerClientMixin,
+    AsyncResellerClientMixin,
+    AsyncSubscriptionClientMixin,
+    AsyncTransferClientMixin,
+    AsyncDeploymentClientMixin,
+    AsyncOrderClientMixin,
+    AsyncPaginationClientMixin,
+):
+    """
+    Asyncio Adobe API Client.
+
+    It exposes the operations of `AdobeClient` as coroutines, and the iterators as async
+    iterators, so that many Adobe calls can be awaited concurrently from one event loop. The
+    requests are retried, rate limited and recorded as the ones of the blocking client, and
+    the errors are mapped by the same `wrap_http_error`.
+
+    The client must be closed once done with, e.g. using it as an async context manager.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport | None = None) -> None:
+        self._config: Config = get_config()
+        self._logger = logger
+        self._TIMEOUT = ADOBE_TIMEOUT
+        self._session = build_async_http_client(
+            self._config.auth_endpoint_url, rate_limiter=get_rate_limiter(), transport=transport
+        )
+        self._tokens = AsyncAuthTokens(self._config, self._session, get_token_store())
+
+    async def __aenter__(self) -> "AsyncAdobeClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Closes the connections of the client."""
+        await self._session.aclose()
+
+    async def _get_headers(
+        self, authorization: Authorization, correlation_id: str | None = None
+    ) -> dict[str, str]:
+        token = await self._tokens.get(authorization)
+        return get_api_headers(authorization, token.token, correlation_id)
+
+    async def _request(  # noqa: WPS211
+        self,
+        method: str,
+        authorization: Authorization,
+        url: str,
+        *,
+        correlation_id: str | None = None,
+        headers: dict[str, str] | None = None,
+        **kwargs,
+    ) -> dict:
+        request_headers = await self._get_headers(authorization, correlation_id=correlation_id)
+        request_headers.update(headers or {})
+        response = await self._session.request(
+            method,
+            urljoin(self._config.api_base_url, url),
+            headers=request_headers,
+            timeout=self._TIMEOUT,
+            **kwargs,
+        )
+        response.raise_for_status()
+        return response.json()
@@ -0,0 +1,111 @@
+import json
+from hashlib import sha256
+
+from adobe_vipm.adobe.dataclasses import Authorization, Reseller
+from adobe_vipm.adobe.errors import wrap_http_error
+from adobe_vipm.adobe.mixins.customer import CustomerClientMixin
+from adobe_vipm.adobe.request_cache import cached_read, invalidates_customer
+
+
+class AsyncCustomerClientMixin(CustomerClientMixin):
+    """Async Adobe Client Mixin to manage Customers flows of Adobe VIPM."""
+
+    @wrap_http_error
+    async def create_customer_account(  # noqa: WPS211
+        self,
+        authorization_id: str,
+        seller_id: str,
+        agreement_id: str,
+        market_segment: str,
+        customer_data: dict,
+    ) -> dict:
+        """Create customer account, see `CustomerClientMixin.create_customer_account`."""
+        authorization = self._config.get_authorization(authorization_id)
+        reseller: Reseller = self._config.get_reseller(authorization, seller_id)
+        company_name: str = f"{customer_data['companyName']} ({agreement_id})"
+
+        payload = self._build_base_customer_payload(
+            reseller, agreement_id, company_name, market_segment, customer_data
+        )
+
+        if customer_data.get("3YC") == ["Yes"]:
+            self._add_3yc_benefits(payload, customer_data)
+
+        return await self._create_adobe_customer(authorization, payload, company_name, reseller.id)
+
+    @wrap_http_error
+    async def create_customer_account_lga(  # noqa: WPS211
+        self,
+        authorization_id: str,
+        seller_id: str,
+        agreement_id: str,
+        market_segment: str,
+        customer_data: dict,
+    ) -> dict:
+        """Create LGA customer account, see `CustomerClientMixin.create_customer_account_lga`."""
+        authorization = self._config.get_authorization(authorization_id)
+        reseller: Reseller = self._config.get_reseller(authorization, seller_id)
+        company_name: str = f"{customer_data['companyName']} ({agreement_id})"
+
+        payload = self._build_base_customer_payload(
+            reseller, agreement_id, company_name, market_segment, customer_data
+        )
+        self._add_lga_benefits(payload, customer_data)
+
+        return await self._create_adobe_customer(authorization, payload, company_name, reseller.id)
+
+    @cached_read
+    @wrap_http_error
+    async def get_customer(self, authorization_id: str, customer_id: str) -> dict:
+        """Retrieve customer account, see `CustomerClientMixin.get_customer`."""
+        return await self._request(
+            "GET",
+            self._config.get_authorization(authorization_id),
+            f"/v3/customers/{customer_id}",
+        )
+
+    @invalidates_customer
+    @wrap_http_error
+    async def create_3yc_request(  # noqa: WPS114
+        self,
+        authorization_id: str,
+        customer_id: str,
+        commitment_request: dict,
+        is_recommitment: bool = False,  # ruff:ignore[boolean-type-hint-positional-argument, boolean-default-value-positional-argument]
+    ) -> dict:
+        """Create 3YC request for account, see `CustomerClientMixin.create_3yc_request`."""
+        customer = await self.get_customer(authorization_id, customer_id)
+        payload = {
+            "companyProfile": customer["companyProfile"],
+            "benefits": self._get_3yc_request_benefits(commitment_request, is_recommitment),
+        }
+
+        return await self._request(
+            "PATCH",
+            self._config.get_authorization(authorization_id),
+            f"/v3/customers/{customer_id}",
+            correlation_id=sha256(json.dumps(payload).encode()).hexdigest(),
+            json=payload,
+        )
+
+    async def _create_adobe_customer(
+        self,
+        authorization: Authorization,
+        payload: dict,
+        company_name: str,
+        reseller_id: str,
+    ) -> dict:
+        created_customer = await self._request(
+            "POST",
+            authorization,
+            "/v3/customers",
+            correlation_id=sha256(json.dumps(payload).encode()).hexdigest(),
+            json=payload,
+        )
+        self._logger.info(
+            "Customer %s created successfully for reseller %s: %s",
+            company_name,
+            reseller_id,
+            created_customer["customerId"],
+        )
+        return created_customer
@@ -0,0 +1,60 @@
+from collections.abc import AsyncIterator
+
+from adobe_vipm.adobe.constants import AdobeDeploymentStatus
+from adobe_vipm.adobe.deployment_registry import DEPLOYMENT_REGISTRY
+from adobe_vipm.adobe.mixins.deployment import DeploymentClientMixin
+
+
+class AsyncDeploymentClientMixin(DeploymentClientMixin):
+    """Async Adobe Client Mixin to manage Deployments flows of Adobe VIPM."""
+
+    async def iter_customer_deployments(
+        self, authorization_id: str, customer_id: str
+    ) -> AsyncIterator[dict]:
+        """Yields the customer deployments, fetching the pages lazily."""
+        authorization = self._config.get_authorization(authorization_id)
+        async for deployment in self._iter_pages(
+            authorization, f"/v3/customers/{customer_id}/deployments", "items"
+        ):
+            yield deployment
+
+    async def get_customer_deployments(self, authorization_id: str, customer_id: str) -> dict:
+        """Retrieve the customer deployment object."""
+        deployments = [
+            deployment
+            async for deployment in self.iter_customer_deployments(authorization_id, customer_id)
+        ]
+        return {"items": deployments, "totalCount": len(deployments)}
+
+    async def get_customer_deployments_active_status(
+        self,
+        authorization_id: str,
+        customer_id: str,
+        *,
+        cached: bool = False,
+    ) -> list[dict]:
+        """
+        Retrieve the active deployments for a given customer.
+
+        Args:
+            authorization_id: Id of the authorization to use.
+            customer_id: Identifier of the customer.
+            cached: Read the deployments through `DEPLOYMENT_REGISTRY`, shared with the
+                blocking client.
+
+        Returns:
+            list: Customer Deployments.
+        """
+        if cached:
+            deployments = await DEPLOYMENT_REGISTRY.lookup_async(
+                self, authorization_id, customer_id
+            )
+        else:
+            deployments = (await self.get_customer_deployments(authorization_id, customer_id))[
+                "items"
+            ]
+        return [
+            deployment
+            for deployment in deployments
+            if deployment.get("status") == AdobeDeploymentStatus.ACTIVE
+        ]
@@ -0,0 +1,209 @@
+import json
+from collections.abc import AsyncIterator, Iterable
+from hashlib import sha256
+
+from adobe_vipm.adobe import constants as adobe_constants
+from adobe_vipm.adobe.async_mixins.order_preview import (
+    AsyncFlexDiscountClientMixin,
+    AsyncOrderPreviewClientMixin,
+)
+from adobe_vipm.adobe.async_mixins.order_return import AsyncOrderReturnClientMixin
+from adobe_vipm.adobe.dataclasses import Authorization, ReturnableOrderInfo
+from adobe_vipm.adobe.errors import wrap_http_error
+from adobe_vipm.adobe.mixins.order import RETURN_ORDERS_FILTERS, OrderClientMixin
+from adobe_vipm.adobe.request_cache import invalidates_customer
+
+
+class AsyncOrderReadClientMixin:
+    """Async Adobe Client Mixin to read the Orders of Adobe VIPM."""
+
+    async def iter_orders(
+        self, authorization_id: str, customer_id: str, filters: dict | None = None
+    ) -> AsyncIterator[dict]:
+        """Yields the Adobe orders of the customer, see `OrderClientMixin.iter_orders`."""
+        authorization = self._config.get_authorization(authorization_id)
+        async for order in self._iter_pages(
+            authorization,
+            f"/v3/customers/{customer_id}/orders?limit=100&offset=0",
+            "items",
+            filters,
+        ):
+            yield order
+
+    async def get_orders(
+        self, authorization_id: str, customer_id: str, filters: dict | None = None
+    ) -> list[dict]:
+        """Retrieve Adobe orders."""
+        return [order async for order in self.iter_orders(authorization_id, customer_id, filters)]
+
+    # A processed order changes the subscriptions of the customer, so reading an order state
+    # drops the reads cached for the customer too.
+    @invalidates_customer
+    @wrap_http_error
+    async def get_order(self, authorization_id: str, customer_id: str, order_id: str) -> dict:
+        """Retrieve order by ID."""
+        return await self._request(
+            "GET",
+            self._config.get_authorization(authorization_id),
+            f"/v3/customers/{customer_id}/orders/{order_id}",
+        )
+
+    async def get_returnable_orders_by_subscription_id(  # noqa: WPS211
+        self,
+        authorization_id: str,
+        customer_id: str,
+        subscription_id: str,
+        customer_coterm_date: str,
+        return_orders: list | None = None,
+    ) -> list[ReturnableOrderInfo]:
+        """Retrieve the returnable orders of a subscription."""
+        returnable_orders = await self.get_returnable_orders_by_subscription_ids(
+            authorization_id,
+            customer_id,
+            [subscription_id],
+            customer_coterm_date,
+            return_orders={subscription_id: return_orders},
+        )
+        return returnable_orders[subscription_id]
+
+    async def get_returnable_orders_by_subscription_ids(  # noqa: WPS211
+        self,
+        authorization_id: str,
+        customer_id: str,
+        subscription_ids: Iterable[str],
+        customer_coterm_date: str,
+        return_orders: dict[str, list | None] | None = None,
+    ) -> dict[str, list[ReturnableOrderInfo]]:
+        """Retrieve the returnable orders of several subscriptions at once."""
+        subscription_ids = list(subscription_ids)
+        if not subscription_ids:
+            return {}
+
+        orders = await self.get_orders(
+            authorization_id,
+            customer_id,
+            filters=self._get_returnable_orders_filters(customer_coterm_date),
+        )
+        return self._get_returnable_orders_by_subscription_id(
+            orders, subscription_ids, return_orders or {}
+        )
+
+    async def get_return_orders_by_external_reference(
+        self, authorization_id: str, customer_id: str, external_reference: str
+    ) -> dict:
+        """Retrieve RETURN orders filter by external reference."""
+        orders = await self.get_orders(authorization_id, customer_id, filters=RETURN_ORDERS_FILTERS)
+        return self._group_return_orders_by_sku(orders, external_reference)
+
+
+class AsyncOrderCreateClientMixin:
+    """Async Adobe Client Mixin to place the NEW, RENEWAL and SWITCH Orders of Adobe VIPM."""
+
+    @invalidates_customer
+    @wrap_http_error
+    async def create_new_order(
+        self,
+        authorization_id: str,
+        customer_id: str,
+        adobe_preview_order: dict,
+        deployment_id: str | None = None,
+    ) -> dict:
+        """Create Adobe Order based on Preview order."""
+        authorization = self._config.get_authorization(authorization_id)
+        payload = self._build_new_order_payload(authorization, adobe_preview_order, deployment_id)
+        return await self._post_order(authorization, customer_id, payload)
+
+    @wrap_http_error
+    async def create_preview_renewal(self, authorization_id: str, customer_id: str) -> dict:
+        """Create preview order for Renewal."""
+        return await self._request(
+            "POST",
+            self._config.get_authorization(authorization_id),
+            f"/v3/customers/{customer_id}/orders",
+            json={"orderType": adobe_constants.ORDER_TYPE_PREVIEW_RENEWAL},
+        )
+
+    @invalidates_customer
+    @wrap_http_error
+    async def create_renewal_order(  # noqa: WPS211
+        self,
+        authorization_id: str,
+        customer_id: str,
+        external_reference_id: str,
+        line_items: list[dict],
+        order_type: str = adobe_constants.ORDER_TYPE_RENEWAL,
+    ) -> dict:
+        """Create a RENEWAL order for specific subscriptions."""
+        authorization = self._config.get_authorization(authorization_id)
+        payload = self._build_renewal_order_payload(
+            authorization, external_reference_id, line_items, order_type
+        )
+        return await self._post_order(authorization, customer_id, payload)
+
+    @wrap_http_error
+    async def create_switch_preview_order(
+        self,
+        authorization_id: str,
+        customer_id: str,
+        external_reference_id: str,
+        switch_payload: dict,
+    ) -> dict:
+        """Create a PREVIEW_SWITCH order for a mid-term upgrade."""
+        authorization = self._config.get_authorization(authorization_id)
+        return await self._request(
+            "POST",
+            authorization,
+            f"/v3/customers/{customer_id}/orders",
+            params={"fetch-price": "true"},
+            json=self._build_switch_order_payload(
+                authorization,
+                external_reference_id,
+                switch_payload,
+                adobe_constants.ORDER_TYPE_PREVIEW_SWITCH,
+            ),
+        )
+
+    @invalidates_customer
+    @wrap_http_error
+    async def create_switch_order(
+        self,
+        authorization_id: str,
+        customer_id: str,
+        external_reference_id: str,
+        switch_payload: dict,
+    ) -> dict:
+        """Create a SWITCH order for a mid-term upgrade."""
+        authorization = self._config.get_authorization(authorization_id)
+        payload = self._build_switch_order_payload(
+            authorization,
+            external_reference_id,
+            switch_payload,
+            adobe_constants.ORDER_TYPE_SWITCH,
+        )
+        return await self._post_order(authorization, customer_id, payload)
+
+    async def _post_order(
+        self, authorization: Authorization, customer_id: str, payload: dict
+    ) -> dict:
+        return await self._request(
+            "POST",
+            authorization,
+            f"/v3/customers/{customer_id}/orders",
+            correlation_id=sha256(json.dumps(payload).encode()).hexdigest(),
+            json=payload,
+        )
+
+
+class AsyncOrderClientMixin(  # noqa: WPS215
+    AsyncOrderReadClientMixin,
+    AsyncOrderCreateClientMixin,
+    AsyncOrderReturnClientMixin,
+    AsyncOrderPreviewClientMixin,
+    AsyncFlexDiscountClientMixin,
+    OrderClientMixin,
+):
+    """
+    Async Adobe Client Mixin to manage Orders flows of Adobe VIPM.
+
+    The payloads are built by the helpers of `OrderClientMixin`, only the requests differ.
+    """
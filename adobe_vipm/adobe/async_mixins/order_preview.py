@@ -0,0 +1,166 @@
+import logging
+
+from adobe_vipm.adobe.dataclasses import Authorization
+from adobe_vipm.adobe.errors import AdobeAPIError, AdobeError, wrap_http_error
+from adobe_vipm.adobe.mixins.errors import AdobeCreatePreviewError, ProcessingUpsizeLinesError
+from adobe_vipm.adobe.mixins.order import PREVIEW_ORDER_ATTEMPTS
+from adobe_vipm.flows.context import Context
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncOrderPreviewClientMixin:
+    """Async Adobe Client Mixin to preview the Orders of Adobe VIPM."""
+
+    @wrap_http_error
+    async def create_preview_order(self, context: Context) -> dict | None:
+        """Create Preview orders, see `OrderClientMixin.create_preview_order`."""
+        authorization = self._config.get_authorization(context.authorization_id)
+        flex_discounts = await self.get_flex_discounts_per_base_offer(
+            authorization, context, self._get_preview_offer_ids(context)
+        )
+        if flex_discounts:
+            logger.info("Found flex discounts for base SKUs: %s", flex_discounts)
+        payload = self._build_preview_order_payload(context, flex_discounts)
+        if context.upsize_lines:
+            try:
+                await self._process_upsize_lines(
+                    context.authorization_id,
+                    context.adobe_customer_id,
+                    context.upsize_lines,
+                    flex_discounts,
+                    payload,
+                    context.market_segment,
+                    context.deployment_id,
+                )
+            except ProcessingUpsizeLinesError as error:
+                raise AdobeCreatePreviewError(error) from error
+
+        self._update_payload_by_deployment(authorization, context.deployment_id, payload)
+        if not payload["lineItems"]:
+            self._logger.info(
+                "Preview Order for %s was not created: line items are empty.",
+                context.order_id,
+            )
+            return None
+
+        preview_order = await self.get_preview_order(
+            authorization, self._get_preview_customer_id(context), payload
+        )
+        logger.info("Created preview order %s", preview_order["externalReferenceId"])
+        return preview_order
+
+    async def get_preview_order(
+        self, authorization: Authorization, adobe_customer_id: str, payload: dict
+    ) -> dict | None:
+        """Gets a preview of an order, see `OrderClientMixin.get_preview_order`."""
+        response_json = None
+        attempt = 0
+        while attempt < PREVIEW_ORDER_ATTEMPTS:
+            attempt += 1
+            try:
+                response_json = await self._get_preview_order(
+                    authorization, adobe_customer_id, payload
+                )
+            except AdobeError as ex:
+                failed_discount_codes = self._get_fail_discounts_for_cust_not_qualified(ex, payload)
+            else:
+                failed_discount_codes = self._get_failed_discount_codes(response_json)
+            if not failed_discount_codes:
+                break
+            self._discard_failed_discount_codes(
+                authorization, adobe_customer_id, failed_discount_codes, payload
+            )
+        else:
+            self._raise_failed_discount_codes(failed_discount_codes)
+
+        return response_json
+
+    @wrap_http_error
+    async def _get_preview_order(
+        self, authorization: Authorization, adobe_customer_id: str, payload: dict
+    ) -> dict:
+        return await self._request(
+            "POST",
+            authorization,
+            f"/v3/customers/{adobe_customer_id}/orders",
+            params={"fetch-price": "true"},
+            json=payload,
+        )
+
+    async def _process_upsize_lines(  # noqa: WPS211
+        self,
+        authorization_id: str,
+        adobe_customer_id: str,
+        upsize_lines: list[dict],
+        discounts: dict,
+        payload: dict,
+        market_segment: str,
+        deployment_id: str | None,
+    ) -> None:
+        offer_ids = [line_item["item"]["externalIds"]["vendor"] for line_item in upsize_lines]
+        upsize_subscriptions = await self.get_subscriptions_for_offers(
+            authorization_id, adobe_customer_id, offer_ids, deployment_id
+        )
+        self._add_upsize_line_items(
+            adobe_customer_id,
+            upsize_lines,
+            upsize_subscriptions,
+            discounts,
+            payload,
+            market_segment,
+        )
+
+
+class AsyncFlexDiscountClientMixin:
+    """Async Adobe Client Mixin to read the flex discounts of the Orders of Adobe VIPM."""
+
+    async def get_flex_discounts_per_base_offer(
+        self, authorization: Authorization, context: Context, offer_ids: tuple
+    ) -> dict:
+        """Fetches active flex discounts, sharing `FLEX_DISCOUNTS_CACHE` with the sync client."""
+        catalogue_key = self._get_flex_discounts_catalogue_key(authorization, context)
+        base_offers_with_discounts, missing_offer_ids = self._get_cached_flex_discounts(
+            catalogue_key, offer_ids
+        )
+        if not missing_offer_ids:
+            return base_offers_with_discounts
+
+        fetched_discounts = await self._fetch_flex_discounts_per_base_offer(
+            authorization, catalogue_key[1], catalogue_key[2], missing_offer_ids
+        )
+        self._cache_flex_discounts(catalogue_key, missing_offer_ids, fetched_discounts)
+        return {**base_offers_with_discounts, **fetched_discounts}
+
+    async def _fetch_flex_discounts_per_base_offer(
+        self, authorization: Authorization, segment: str, country: str, offer_ids: tuple
+    ) -> dict:
+        logger.info(
+            "Flex discounts: requesting from Adobe market_segment=%s country=%s offer_ids=%s",
+            segment,
+            country,
+            offer_ids,
+        )
+        try:
+            flex_discounts = await self._get_flex_discounts(
+                authorization, segment, country, offer_ids
+            )
+        except AdobeAPIError as error:
+            self._ignore_invalid_country_error(error, country)
+            flex_discounts = []
+        return self._get_active_flex_discounts(flex_discounts)
+
+    async def _get_flex_discounts(
+        self, authorization: Authorization, segment: str, country: str, offer_ids: tuple[str, ...]
+    ) -> list:
+        # The next links carry the query parameters
+        return [
+            flex_discount
+            async for flex_discount in self._iter_pages(
+                authorization,
+                "v3/flex-discounts",
+                "flexDiscounts",
+                self._get_flex_discounts_params(segment, country, offer_ids),
+                repeat_params=False,
+            )
+        ]
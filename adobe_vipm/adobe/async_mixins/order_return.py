@@ -0,0 +1,56 @@
+from adobe_vipm.adobe.errors import wrap_http_error
+from adobe_vipm.adobe.request_cache import invalidates_customer
+
+
+class AsyncOrderReturnClientMixin:
+    """Async Adobe Client Mixin to place the RETURN Orders of Adobe VIPM."""
+
+    @invalidates_customer
+    @wrap_http_error
+    async def create_return_order(  # noqa: WPS211
+        self,
+        authorization_id: str,
+        customer_id: str,
+        returning_order: dict,
+        returning_item: dict,
+        external_reference: str,
+        deployment_id: str | None = None,
+    ) -> dict:
+        """Creates an order of type RETURN for a given `item` that was purchased."""
+        payload = self._build_return_order_payload(
+            self._config.get_authorization(authorization_id),
+            returning_order,
+            returning_item,
+            external_reference,
+            deployment_id,
+        )
+        return await self._create_return_order_base(
+            authorization_id, customer_id, payload, payload["externalReferenceId"]
+        )
+
+    @invalidates_customer
+    @wrap_http_error
+    async def create_return_order_by_adobe_order(
+        self, authorization_id: str, customer_id: str, order_created: dict
+    ) -> dict:
+        """Creates a return order for a given Adobe order."""
+        payload = self._build_adobe_order_return_payload(
+            self._config.get_authorization(authorization_id), order_created
+        )
+        return await self._create_return_order_base(authorization_id, customer_id, payload)
+
+    @wrap_http_error
+    async def _create_return_order_base(
+        self,
+        authorization_id: str,
+        customer_id: str,
+        payload: dict,
+        correlation_id: str | None = None,
+    ) -> dict:
+        return await self._request(
+            "POST",
+            self._config.get_authorization(authorization_id),
+            f"/v3/customers/{customer_id}/orders",
+            correlation_id=correlation_id,
+            json=payload,
+        )
@@ -0,0 +1,52 @@
+from collections.abc import AsyncIterator
+
+import httpx
+
+from adobe_vipm.adobe.dataclasses import Authorization
+from adobe_vipm.adobe.errors import wrap_http_error
+
+
+class AsyncPaginationClientMixin:
+    """Async Adobe Client Mixin to read the paginated listings of Adobe VIPM lazily."""
+
+    async def _iter_pages(
+        self,
+        authorization: Authorization,
+        url: str,
+        items_key: str,
+        query_params: dict | None = None,
+        *,
+        repeat_params: bool = True,
+    ) -> AsyncIterator[dict]:
+        """
+        Yields the items of a paginated listing, fetching each page only when needed.
+
+        Args:
+            authorization: The authorization to use.
+            url: Path of the first page.
+            items_key: Key of the items in each page.
+            query_params: Query parameters of the request.
+            repeat_params: Send the query parameters for every page and not only for the first
+                one, for the endpoints whose next links don't carry them.
+
+        Yields:
+            dict: The items of the listing.
+        """
+        next_url = url
+        while next_url:
+            page = await self._get_page(authorization, next_url, query_params)
+            for resource in page.get(items_key, []):
+                yield resource
+            next_url = page.get("links", {}).get("next", {}).get("uri")
+            if not repeat_params:
+                query_params = None
+
+    @wrap_http_error
+    async def _get_page(
+        self, authorization: Authorization, url: str, query_params: dict | None
+    ) -> dict:
+        if query_params:
+            # httpx replaces the query of the url by the params, while the next links carry
+            # the pagination in it
+            url = str(httpx.URL(url).copy_merge_params(query_params))
+        return await self._request("GET", authorization, url)
@@ -0,0 +1,38 @@
+import json
+from hashlib import sha256
+
+from adobe_vipm.adobe.errors import wrap_http_error
+from adobe_vipm.adobe.mixins.reseller import ResellerClientMixin
+
+
+class AsyncResellerClientMixin(ResellerClientMixin):
+    """Async Adobe Client Mixin to manage Resellers flows of Adobe VIPM."""
+
+    @wrap_http_error
+    async def create_reseller_account(
+        self,
+        authorization_id: str,
+        reseller_id: str,
+        reseller_data: dict,
+    ) -> str:
+        """Create Reseller Account on Adobe, see `ResellerClientMixin.create_reseller_account`."""
+        authorization = self._config.get_authorization(authorization_id)
+        payload = self._build_reseller_payload(authorization, reseller_id, reseller_data)
+        created_reseller = await self._request(
+            "POST",
+            authorization,
+            "/v3/resellers",
+            correlation_id=sha256(json.dumps(payload).encode()).hexdigest(),
+            json=payload,
+        )
+
+        adobe_reseller_id = created_reseller["resellerId"]
+        self._logger.info(
+            "Reseller %s - %s created successfully under authorization %s (%s): %s",
+            reseller_id,
+            reseller_data["companyName"],
+            authorization.name,
+            authorization.authorization_uk,
+            adobe_reseller_id,
+        )
+        return adobe_reseller_id
@@ -0,0 +1,111 @@
+from adobe_vipm.adobe.errors import wrap_http_error
+from adobe_vipm.adobe.mixins.subscription import (
+    SubscriptionClientMixin,
+    filter_active_subscriptions_for_offers,
+    filter_subscriptions_by_deployment,
+    get_new_subscription_payload,
+    get_update_subscription_payload,
+)
+from adobe_vipm.adobe.request_cache import cached_read, invalidates_customer
+
+
+class AsyncSubscriptionClientMixin(SubscriptionClientMixin):
+    """Async Adobe Client Mixin to manage Subscription flows of Adobe VIPM."""
+
+    @cached_read
+    @wrap_http_error
+    async def get_subscription(
+        self, authorization_id: str, customer_id: str, subscription_id: str
+    ) -> dict:
+        """Retrieve a subscription, see `SubscriptionClientMixin.get_subscription`."""
+        return await self._request(
+            "GET",
+            self._config.get_authorization(authorization_id),
+            f"/v3/customers/{customer_id}/subscriptions/{subscription_id}",
+        )
+
+    @cached_read
+    @wrap_http_error
+    async def get_subscriptions(self, authorization_id: str, customer_id: str) -> dict:
+        """Retrieve the customer subscriptions, see `SubscriptionClientMixin.get_subscriptions`."""
+        return await self._request(
+            "GET",
+            self._config.get_authorization(authorization_id),
+            f"/v3/customers/{customer_id}/subscriptions",
+        )
+
+    @wrap_http_error
+    async def get_subscriptions_by_deployment(
+        self, authorization_id: str, customer_id: str, deployment_id: str | None = None
+    ) -> dict:
+        """Retrieve the subscriptions of the given customer and deployment ID."""
+        subscriptions = await self.get_subscriptions(
+            authorization_id=authorization_id, customer_id=customer_id
+        )
+        return filter_subscriptions_by_deployment(subscriptions, deployment_id)
+
+    @wrap_http_error
+    async def get_subscriptions_for_offers(
+        self,
+        authorization_id: str,
+        customer_id: str,
+        base_offer_ids: list[str],
+        deployment_id: str | None = None,
+    ) -> list[dict]:
+        """Retrieve the active subscriptions of the given offer ids."""
+        subscriptions = await self.get_subscriptions_by_deployment(
+            authorization_id, customer_id, deployment_id
+        )
+        return filter_active_subscriptions_for_offers(subscriptions["items"], base_offer_ids)
+
+    @invalidates_customer
+    @wrap_http_error
+    async def update_subscription(  # noqa: WPS211
+        self,
+        authorization_id: str,
+        customer_id: str,
+        subscription_id: str,
+        auto_renewal: bool = True,  # ruff:ignore[boolean-type-hint-positional-argument, boolean-default-value-positional-argument]
+        quantity: int | None = None,
+        flex_discount_codes: list[str] | None = None,
+    ) -> dict:
+        """Update a subscription, see `SubscriptionClientMixin.update_subscription`."""
+        await self._request(
+            "PATCH",
+            self._config.get_authorization(authorization_id),
+            f"/v3/customers/{customer_id}/subscriptions/{subscription_id}",
+            json=get_update_subscription_payload(
+                auto_renewal=auto_renewal,
+                quantity=quantity,
+                flex_discount_codes=flex_discount_codes,
+            ),
+        )
+        # patch doesn't return half of the fields in subscriptions representation
+        # missed fields are offerId, usedQuantity
+        return await self.get_subscription(authorization_id, customer_id, subscription_id)
+
+    @invalidates_customer
+    @wrap_http_error
+    async def create_customer_subscription(  # noqa: WPS211
+        self,
+        authorization_id: str,
+        customer_id: str,
+        offer_id: str,
+        renewal_quantity: int,
+        deployment_id: str | None = None,
+        recommendation_tracker_id: str | None = None,
+    ) -> dict:
+        """Create a scheduled subscription, see `SubscriptionClientMixin`."""
+        authorization = self._config.get_authorization(authorization_id)
+        headers = {}
+        if recommendation_tracker_id:
+            headers["x-recommendation-tracker-id"] = recommendation_tracker_id
+        return await self._request(
+            "POST",
+            authorization,
+            f"/v3/customers/{customer_id}/subscriptions",
+            headers=headers,
+            json=get_new_subscription_payload(
+                authorization, offer_id, renewal_quantity, deployment_id
+            ),
+        )
@@ -0,0 +1,86 @@
+from adobe_vipm.adobe.constants import ResellerChangeAction
+from adobe_vipm.adobe.dataclasses import Reseller
+from adobe_vipm.adobe.errors import wrap_http_error
+from adobe_vipm.adobe.mixins.transfer import TransferClientMixin
+from adobe_vipm.adobe.request_cache import invalidates_customer
+
+
+class AsyncTransferClientMixin(TransferClientMixin):
+    """Async Adobe Client Mixin to manage Transfer flows of Adobe VIPM program."""
+
+    @wrap_http_error
+    async def preview_transfer(self, authorization_id: str, membership_id: str) -> dict:
+        """Retrieve the subscriptions of a membership, see `TransferClientMixin`."""
+        return await self._request(
+            "GET",
+            self._config.get_authorization(authorization_id),
+            f"/v3/memberships/{membership_id}/offers",
+            params=self._do_not_make_return_params(),
+        )
+
+    @invalidates_customer
+    @wrap_http_error
+    async def create_transfer(
+        self,
+        authorization_id: str,
+        seller_id: str,
+        order_id: str,
+        membership_id: str,
+    ) -> dict:
+        """Create a transfer order of a membership, see `TransferClientMixin.create_transfer`."""
+        authorization = self._config.get_authorization(authorization_id)
+        reseller: Reseller = self._config.get_reseller(authorization, seller_id)
+        return await self._request(
+            "POST",
+            authorization,
+            f"/v3/memberships/{membership_id}/transfers",
+            correlation_id=order_id,
+            params=self._do_not_make_return_params(),
+            json={"resellerId": reseller.id},
+        )
+
+    @wrap_http_error
+    async def get_transfer(
+        self, authorization_id: str, membership_id: str, transfer_id: str
+    ) -> dict:
+        """Retrieve a transfer by the membership and transfer identifiers."""
+        return await self._request(
+            "GET",
+            self._config.get_authorization(authorization_id),
+            f"/v3/memberships/{membership_id}/transfers/{transfer_id}",
+        )
+
+    @wrap_http_error
+    async def get_reseller_transfer(self, authorization_id: str, transfer_id: str) -> dict:
+        """Retrieve a reseller transfer by its identifier."""
+        return await self._request(
+            "GET",
+            self._config.get_authorization(authorization_id),
+            f"/v3/transfers/{transfer_id}",
+        )
+
+    @invalidates_customer
+    @wrap_http_error
+    async def reseller_change_request(  # noqa: WPS211
+        self,
+        authorization_id: str,
+        seller_id: str,
+        change_code: str,
+        admin_email: str,
+        action: ResellerChangeAction,
+    ) -> dict:
+        """Request a reseller change, see `TransferClientMixin.reseller_change_request`."""
+        authorization = self._config.get_authorization(authorization_id)
+        reseller: Reseller = self._config.get_reseller(authorization, seller_id)
+        return await self._request(
+            "POST",
+            authorization,
+            "/v3/transfers",
+            json={
+                "type": "RESELLER_CHANGE",
+                "action": action,
+                "approvalCode": change_code,
+                "resellerId": reseller.id,
+                "requestedBy": admin_email,
+            },
+        )
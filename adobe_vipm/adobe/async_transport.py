@@ -0,0 +1,264 @@
+import asyncio
+import logging
+import time
+from collections.abc import Collection
+from http import HTTPStatus
+
+import httpx
+
+from adobe_vipm.adobe.client import (
+    ADOBE_AUTH_RETRY_ALLOWED_METHODS,
+    ADOBE_RATE_LIMITED_RETRY_STATUS_FORCELIST,
+    ADOBE_RETRY_ALLOWED_METHODS,
+    ADOBE_RETRY_BACKOFF_FACTOR,
+    ADOBE_RETRY_STATUS_FORCELIST,
+    ADOBE_RETRY_TOTAL,
+)
+from adobe_vipm.adobe.metrics import (
+    ADOBE_API_METRICS,
+    AUTHORIZATION_HEADER,
+    RETRIES_EXTENSION,
+    get_request_authorization,
+)
+from adobe_vipm.adobe.rate_limit import RateLimiter, get_retry_after_seconds
+
+logger = logging.getLogger(__name__)
+
+# Errors raised once the request may have reached Adobe, like a keep-alive connection closed
+# by Adobe while idle in the pool. They are retried for the allowed methods only.
+READ_ERRORS = (httpx.ReadError, httpx.ReadTimeout, httpx.RemoteProtocolError)
+# Upper bound of the wait between two retries, as for urllib3.
+MAX_BACKOFF_SECONDS = 120
+
+
+class AsyncRetryTransport(httpx.AsyncBaseTransport):
+    """
+    Transport retrying the transient Adobe failures, the async counterpart of urllib3 `Retry`.
+
+    The responses with a retried status and the read errors are retried for the allowed
+    methods only, waiting the Retry-After of a throttled response or an exponential backoff.
+    Connect errors are retried for any method by the wrapped `httpx.AsyncHTTPTransport`, as
+    Adobe never received the request. Once the retries are exhausted the last response is
+    returned, so that `wrap_http_error` still turns a persistent failure into an Adobe error.
+
+    Attributes:
+        total: Max retries of a request.
+        backoff_factor: Factor of the exponential wait between retries.
+        status_forcelist: HTTP statuses retried for the allowed methods.
+        allowed_methods: HTTP methods eligible for status and read retries.
+    """
+
+    def __init__(  # noqa: WPS211
+        self,
+        transport: httpx.AsyncBaseTransport,
+        *,
+        total: int,
+        backoff_factor: float,
+        status_forcelist: Collection[int],
+        allowed_methods: Collection[str],
+    ):
+        self.total = total
+        self.backoff_factor = backoff_factor
+        self.status_forcelist = status_forcelist
+        self.allowed_methods = allowed_methods
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Sends the request, retrying it while it fails with a transient error."""
+        retries = self.total if request.method in self.allowed_methods else 0
+        attempt = 0
+        response = await self._try_send(request, can_retry=retries > 0)
+        while response is None or (
+            response.status_code in self.status_forcelist and attempt < retries
+        ):
+            attempt += 1
+            wait = self._get_wait(response, attempt)
+            if response is not None:
+                await response.aclose()
+            logger.info("Retrying %s %s in %ss", request.method, request.url, wait)
+            await asyncio.sleep(wait)
+            response = await self._try_send(request, can_retry=attempt < retries)
+        response.extensions[RETRIES_EXTENSION] = attempt
+        return response
+
+    async def aclose(self) -> None:
+        """Closes the wrapped transport."""
+        await self._transport.aclose()
+
+    async def _try_send(self, request: httpx.Request, *, can_retry: bool) -> httpx.Response | None:
+        """Sends the request, returning None on a read error that can be retried."""
+        try:
+            return await self._transport.handle_async_request(request)
+        except READ_ERRORS as error:
+            if not can_retry:
+                raise
+            logger.info("Read error on %s %s: %s", request.method, request.url, error)
+            return None
+
+    def _get_wait(self, response: httpx.Response | None, attempt: int) -> float:
+        if (
+            response is not None
+            and response.status_code == HTTPStatus.TOO_MANY_REQUESTS
+            and "Retry-After" in response.headers
+        ):
+            return get_retry_after_seconds(response)
+        # The first retry is immediate, as for urllib3
+        if attempt <= 1:
+            return 0
+        return min(self.backoff_factor * 2 ** (attempt - 1), MAX_BACKOFF_SECONDS)
+
+
+class AsyncRateLimitedTransport(httpx.AsyncBaseTransport):
+    """
+    Transport passing every request through the rate limiter of its authorization.
+
+    The async counterpart of `RateLimitedHTTPAdapter`: the throttled requests are retried
+    here, so that every attempt waits for the pause set by the throttled response and takes a
+    token, without blocking the event loop while waiting.
+
+    Attributes:
+        rate_limiter: The rate limiter of the requests.
+        throttled_retries: Max retries of a throttled request.
+        throttled_retry_methods: HTTP methods whose throttled requests are retried.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        rate_limiter: RateLimiter,
+        *,
+        throttled_retries: int = 0,
+        throttled_retry_methods: Collection[str] = (),
+    ):
+        self.rate_limiter = rate_limiter
+        self.throttled_retries = throttled_retries
+        self.throttled_retry_methods = throttled_retry_methods
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Sends the request once a token of its authorization bucket is available."""
+        key = get_request_authorization(request)
+        if key is None:
+            return await self._transport.handle_async_request(request)
+
+        retries = self.throttled_retries if request.method in self.throttled_retry_methods else 0
+        while True:
+            await self._acquire(key)
+            response = await self._transport.handle_async_request(request)
+            self.rate_limiter.record_response(key, response)
+            if response.status_code != HTTPStatus.TOO_MANY_REQUESTS or retries <= 0:
+                return response
+            retries -= 1
+            logger.info("Retrying throttled %s %s", request.method, request.url)
+            await response.aclose()
+
+    async def aclose(self) -> None:
+        """Closes the wrapped transport."""
+        await self._transport.aclose()
+
+    async def _acquire(self, key: str) -> None:
+        waited: float = 0
+        wait = self.rate_limiter.try_acquire(key)
+        while wait > 0:
+            await asyncio.sleep(wait)
+            waited += wait
+            wait = self.rate_limiter.try_acquire(key, waited)
+
+
+class AsyncInstrumentedTransport(httpx.AsyncBaseTransport):
+    """
+    Transport recording every request it sends in `ADOBE_API_METRICS`.
+
+    The async counterpart of `InstrumentedSession`: the requests name their authorization in
+    `AUTHORIZATION_HEADER`, moved to the `authorization_uk` attribute of the request so it
+    never reaches Adobe. The latency covers the retries and the rate limit waits.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Sends the request and records its latency, status, retries and bytes."""
+        request.authorization_uk = request.headers.pop(AUTHORIZATION_HEADER, None)
+        start = time.monotonic()
+        try:
+            response = await self._send(request)
+        except httpx.TransportError:
+            ADOBE_API_METRICS.record(
+                request.authorization_uk, request, None, time.monotonic() - start
+            )
+            raise
+        ADOBE_API_METRICS.record(
+            request.authorization_uk, request, response, time.monotonic() - start
+        )
+        return response
+
+    async def aclose(self) -> None:
+        """Closes the wrapped transport."""
+        await self._transport.aclose()
+
+    async def _send(self, request: httpx.Request) -> httpx.Response:
+        response = await self._transport.handle_async_request(request)
+        # The content is read before returning, as no request is streamed
+        await response.aread()
+        return response
+
+
+def build_async_http_client(
+    auth_endpoint_url: str,
+    rate_limiter: RateLimiter | None = None,
+    transport: httpx.AsyncBaseTransport | None = None,
+) -> httpx.AsyncClient:
+    """
+    Build an httpx client with the retry policy of the blocking Adobe client.
+
+    As for `_build_retrying_session`, the API requests retry the transient failures of the
+    GET requests only, while the auth endpoint also retries its token POST. Every request is
+    rate limited and recorded in the Adobe API metrics under the authorization it names.
+
+    Args:
+        auth_endpoint_url: Adobe authentication endpoint URL, mounted with its own retries.
+        rate_limiter: Rate limiter the API requests pass through, if any.
+        transport: Transport sending the requests, an `httpx.AsyncHTTPTransport` retrying the
+            connect errors if not given.
+
+    Returns:
+        httpx.AsyncClient: Client with the retrying transports mounted.
+    """
+    transport = transport or httpx.AsyncHTTPTransport(retries=ADOBE_RETRY_TOTAL)
+    if rate_limiter:
+        api_transport = AsyncRateLimitedTransport(
+            AsyncRetryTransport(
+                transport,
+                total=ADOBE_RETRY_TOTAL,
+                backoff_factor=ADOBE_RETRY_BACKOFF_FACTOR,
+                status_forcelist=ADOBE_RATE_LIMITED_RETRY_STATUS_FORCELIST,
+                allowed_methods=ADOBE_RETRY_ALLOWED_METHODS,
+            ),
+            rate_limiter,
+            throttled_retries=ADOBE_RETRY_TOTAL,
+            throttled_retry_methods=ADOBE_RETRY_ALLOWED_METHODS,
+        )
+    else:
+        api_transport = AsyncRetryTransport(
+            transport,
+            total=ADOBE_RETRY_TOTAL,
+            backoff_factor=ADOBE_RETRY_BACKOFF_FACTOR,
+            status_forcelist=ADOBE_RETRY_STATUS_FORCELIST,
+            allowed_methods=ADOBE_RETRY_ALLOWED_METHODS,
+        )
+    auth_transport = AsyncRetryTransport(
+        transport,
+        total=ADOBE_RETRY_TOTAL,
+        backoff_factor=ADOBE_RETRY_BACKOFF_FACTOR,
+        status_forcelist=ADOBE_RETRY_STATUS_FORCELIST,
+        allowed_methods=ADOBE_AUTH_RETRY_ALLOWED_METHODS,
+    )
+    # The Adobe API and auth endpoints are always HTTPS, no clear-text scheme is mounted.
+    # As for the adapters of a requests session, the auth endpoint mount matches its host.
+    return httpx.AsyncClient(
+        mounts={
+            "https://": AsyncInstrumentedTransport(api_transport),
+            auth_endpoint_url: AsyncInstrumentedTransport(auth_transport),
+        },
+    )
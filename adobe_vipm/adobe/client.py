@@ -1,6 +1,4 @@
-import datetime as dt
 import logging
-from collections.abc import MutableMapping
 from uuid import uuid4
 
 import requests
@@ -8,21 +6,24 @@ from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
 from adobe_vipm.adobe.config import Config, get_config
-from adobe_vipm.adobe.dataclasses import APIToken, Authorization
-from adobe_vipm.adobe.errors import wrap_http_error
+from adobe_vipm.adobe.dataclasses import Authorization
+from adobe_vipm.adobe.metrics import (
+    AUTHORIZATION_HEADER,
+    InstrumentedSession,
+    get_request_authorization,
+)
+from adobe_vipm.adobe.mixins.auth import AuthTokenClientMixin
 from adobe_vipm.adobe.mixins.customer import CustomerClientMixin
 from adobe_vipm.adobe.mixins.deployment import DeploymentClientMixin
 from adobe_vipm.adobe.mixins.order import OrderClientMixin
+from adobe_vipm.adobe.mixins.pagination import PaginationClientMixin
 from adobe_vipm.adobe.mixins.reseller import ResellerClientMixin
 from adobe_vipm.adobe.mixins.subscription import SubscriptionClientMixin
 from adobe_vipm.adobe.mixins.transfer import TransferClientMixin
+from adobe_vipm.adobe.rate_limit import RateLimitedHTTPAdapter, RateLimiter, get_rate_limiter
 
 logger = logging.getLogger(__name__)
 
-# setup cache cleanup in number of seconds before actual Adobe token expire
-# just to be sure to refresh token in time
-EXPIRES_IN_DELAY_SECONDS = 180
-
 # Retry policy for transient Adobe API failures. Adobe documents the status
 # set 200/201/202/400/401/403/404/429/500, so 429 and 500 are the only
 # transient/retryable codes; the 4xx are client errors. Status and read retries
@@ -31,17 +32,24 @@ EXPIRES_IN_DELAY_SECONDS = 180
 ADOBE_RETRY_TOTAL = 3
 ADOBE_RETRY_BACKOFF_FACTOR = 1
 ADOBE_RETRY_STATUS_FORCELIST = (429, 500)
+# Behind the rate limiter the throttled requests are retried by the adapter, so that every
+# attempt waits for the bucket pause and takes a token.
+ADOBE_RATE_LIMITED_RETRY_STATUS_FORCELIST = (500,)
 ADOBE_RETRY_ALLOWED_METHODS = frozenset(("GET",))
 # The auth endpoint only mints a bearer token, so resending its POST has no
 # effect on customer or order data and is safe to retry.
 ADOBE_AUTH_RETRY_ALLOWED_METHODS = frozenset(("GET", "POST"))
 
 
-def _build_retry(allowed_methods: frozenset[str]) -> Retry:
+def _build_retry(
+    allowed_methods: frozenset[str],
+    status_forcelist: tuple[int, ...] = ADOBE_RETRY_STATUS_FORCELIST,
+) -> Retry:
     """Build the retry policy for transient Adobe failures.
 
     Args:
         allowed_methods: HTTP methods eligible for status and read retries.
+        status_forcelist: HTTP statuses retried for the allowed methods.
 
     Returns:
         Retry: urllib3 retry policy.
@@ -49,7 +57,7 @@ def _build_retry(allowed_methods: frozenset[str]) -> Retry:
     return Retry(
         total=ADOBE_RETRY_TOTAL,
         backoff_factor=ADOBE_RETRY_BACKOFF_FACTOR,
-        status_forcelist=ADOBE_RETRY_STATUS_FORCELIST,
+        status_forcelist=status_forcelist,
         allowed_methods=allowed_methods,
         # A connect error means Adobe never received the request, so urllib3
         # retries it for any method without gating on allowed_methods.
@@ -67,24 +75,44 @@ def _build_retry(allowed_methods: frozenset[str]) -> Retry:
     )
 
 
-def _build_retrying_session(auth_endpoint_url: str) -> requests.Session:
+def _build_retrying_session(
+    auth_endpoint_url: str, rate_limiter: RateLimiter | None = None
+) -> requests.Session:
     """Build a requests Session that retries transient Adobe failures.
 
     The API adapter retries idempotent GET requests only. The auth endpoint gets
     its own adapter that also retries its token POST, which carries no
-    side effect on customer or order data.
+    side effect on customer or order data. Every request is rate limited and
+    recorded in the Adobe API metrics under the authorization it names.
 
     Args:
         auth_endpoint_url: Adobe authentication endpoint URL, mounted with its
             own retry adapter.
+        rate_limiter: Rate limiter the API requests pass through, if any.
 
     Returns:
         requests.Session: Session with the retrying HTTP adapters mounted.
     """
-    session = requests.Session()
+    session = InstrumentedSession()
     # The Adobe API and auth endpoints are always HTTPS; the retry adapters are
     # only mounted on https:// so no clear-text scheme is used.
-    session.mount("https://", HTTPAdapter(max_retries=_build_retry(ADOBE_RETRY_ALLOWED_METHODS)))
+    if rate_limiter:
+        session.mount(
+            "https://",
+            RateLimitedHTTPAdapter(
+                rate_limiter,
+                get_request_authorization,
+                throttled_retries=ADOBE_RETRY_TOTAL,
+                throttled_retry_methods=ADOBE_RETRY_ALLOWED_METHODS,
+                max_retries=_build_retry(
+                    ADOBE_RETRY_ALLOWED_METHODS, ADOBE_RATE_LIMITED_RETRY_STATUS_FORCELIST
+                ),
+            ),
+        )
+    else:
+        session.mount(
+            "https://", HTTPAdapter(max_retries=_build_retry(ADOBE_RETRY_ALLOWED_METHODS))
+        )
     session.mount(
         auth_endpoint_url,
         HTTPAdapter(max_retries=_build_retry(ADOBE_AUTH_RETRY_ALLOWED_METHODS)),
@@ -92,13 +120,40 @@ def _build_retrying_session(auth_endpoint_url: str) -> requests.Session:
     return session
 
 
+def get_api_headers(
+    authorization: Authorization, token: str, correlation_id: str | None = None
+) -> dict[str, str]:
+    """
+    Returns the headers of an Adobe API request sent with the authorization.
+
+    Args:
+        authorization: The authorization the request is sent with.
+        token: The bearer token of the authorization.
+        correlation_id: Correlation id of the request, a random one if not given.
+
+    Returns:
+        The request headers.
+    """
+    return {
+        "X-Api-Key": authorization.client_id,
+        "Authorization": f"Bearer {token}",
+        "Accept": "application/json",
+        "Content-Type": "application/json",
+        "X-Request-Id": str(uuid4()),
+        "x-correlation-id": correlation_id or str(uuid4()),
+        AUTHORIZATION_HEADER: authorization.authorization_uk,
+    }
+
+
 class AdobeClient(
+    AuthTokenClientMixin,
     CustomerClientMixin,
     ResellerClientMixin,
     SubscriptionClientMixin,
     TransferClientMixin,
     DeploymentClientMixin,
     OrderClientMixin,
+    PaginationClientMixin,
 ):
     """Adobe API Client."""
 
@@ -108,56 +163,18 @@ class AdobeClient(
         # 2. Mixins are using methods from parent (like _get_headers)
         # 3. Agreed to use composition instead of inheritance
         self._config: Config = get_config()
-        self._token_cache: MutableMapping[Authorization, APIToken] = {}
+        self._setup_auth_tokens()
         self._logger = logger
         self._TIMEOUT = 60
-        self._session = _build_retrying_session(self._config.auth_endpoint_url)
-
-    def _get_headers(self, authorization: Authorization, correlation_id=None):
-        token = self._get_auth_token(authorization).token
-        return {
-            "X-Api-Key": authorization.client_id,
-            "Authorization": f"Bearer {token}",
-            "Accept": "application/json",
-            "Content-Type": "application/json",
-            "X-Request-Id": str(uuid4()),
-            "x-correlation-id": correlation_id or str(uuid4()),
-        }
-
-    @wrap_http_error
-    def _refresh_auth_token(self, authorization: Authorization):
-        """Request an authentication token for the Adobe VIPM API.
-
-        Using the credentials associated to a given the reseller. Wrapped so a failure of the
-        auth endpoint is reported against the token request instead of being caught by the
-        calling method's wrapper and attributed to the Adobe API call that triggered it.
-        """
-        response = self._session.post(
-            url=self._config.auth_endpoint_url,
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
-            data={
-                "grant_type": "client_credentials",
-                "client_id": authorization.client_id,
-                "client_secret": authorization.client_secret,
-                "scope": self._config.api_scopes,
-            },
-            timeout=self._TIMEOUT,
+        self._session = _build_retrying_session(
+            self._config.auth_endpoint_url, rate_limiter=get_rate_limiter()
         )
-        response.raise_for_status()
 
-        token_info = response.json()
-        expires_in = dt.timedelta(seconds=token_info["expires_in"] - EXPIRES_IN_DELAY_SECONDS)
-        self._token_cache[authorization] = APIToken(
-            token=token_info["access_token"],
-            expires=dt.datetime.now(tz=dt.UTC) + expires_in,
+    def _get_headers(self, authorization: Authorization, correlation_id=None):
+        return get_api_headers(
+            authorization, self._get_auth_token(authorization).token, correlation_id
         )
 
-    def _get_auth_token(self, authorization: Authorization):
-        token: APIToken | None = self._token_cache.get(authorization)
-        if not token or token.is_expired():
-            self._refresh_auth_token(authorization)
-        return self._token_cache[authorization]
-
 
 _ADOBE_CLIENT = None
 
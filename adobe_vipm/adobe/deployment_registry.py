@@ -0,0 +1,214 @@
+import copy
+import logging
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+from django.conf import settings
+
+from adobe_vipm.adobe.deployment_registry_store import (
+    AcknowledgedDeploymentsStore,
+    SettingsAcknowledgedDeploymentsStore,
+)
+from adobe_vipm.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Seconds the deployments of a customer are kept before being read again from Adobe
+DEPLOYMENTS_TTL = 600
+
+
+@dataclass(frozen=True)
+class DeploymentChanges:
+    """
+    Changes of the deployments of a customer since an agreement last acknowledged them.
+
+    Attributes:
+        agreement_id: Id of the agreement acknowledging the deployments.
+        customer_id: Adobe customer ID.
+        deployments: Current deployments of the customer, whatever their status.
+        added: Deployments not seen before.
+        removed: Deployments seen before that no longer exist.
+        status_changed: Deployments whose status changed.
+        initial: True if the agreement never acknowledged the deployments before, so
+            callers have no baseline and must process all of them.
+    """
+
+    agreement_id: str
+    customer_id: str
+    deployments: list[dict]
+    added: list[dict] = field(default_factory=list)
+    removed: list[dict] = field(default_factory=list)
+    status_changed: list[dict] = field(default_factory=list)
+    initial: bool = False
+
+    def __bool__(self) -> bool:
+        return self.initial or bool(self.added or self.removed or self.status_changed)
+
+    @property
+    def updated_ids(self) -> set[str]:
+        """Ids of the deployments added or whose status changed."""
+        return set(_get_ids(self.added + self.status_changed))
+
+
+class DeploymentRegistry:
+    """
+    Deployments of the Adobe customers keyed by (authorization, customer).
+
+    The agreement sync reads the deployments through the registry, kept for
+    `ADOBE_DEPLOYMENTS_TTL_SECONDS`, so the agreements of a customer don't paginate them
+    again. The registry also remembers the deployments acknowledged by each agreement to
+    report what changed since then, so every agreement of a global customer sees the changes
+    whatever the order they are synchronized in. They are kept in
+    `ADOBE_DEPLOYMENTS_STATE_PATH` across the sync runs if set, otherwise by the current
+    process only, so every run starts over.
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEPLOYMENTS_TTL,
+        acknowledged_store: AcknowledgedDeploymentsStore | None = None,
+    ):
+        self._deployments = TTLCache(ttl=ttl)
+        self._acknowledged = acknowledged_store or SettingsAcknowledgedDeploymentsStore()
+
+    def lookup(self, adobe_client, authorization_id: str, customer_id: str) -> list[dict]:
+        """
+        Returns the deployments of the customer, reading them from Adobe when not cached.
+
+        Args:
+            adobe_client: Adobe API client.
+            authorization_id: Id of the authorization to use.
+            customer_id: Adobe customer ID.
+
+        Returns:
+            Copy of the customer deployments, whatever their status.
+        """
+        deployments = self._deployments.get_or_load(
+            (authorization_id, customer_id),
+            lambda: list(adobe_client.iter_customer_deployments(authorization_id, customer_id)),
+            _get_deployments_ttl(),
+        )
+        return copy.deepcopy(deployments)
+
+    async def lookup_async(
+        self, adobe_client, authorization_id: str, customer_id: str
+    ) -> list[dict]:
+        """
+        Returns the deployments of the customer, reading them from Adobe when not cached.
+
+        The counterpart of `lookup` for the `AsyncAdobeClient`, sharing its cache.
+
+        Args:
+            adobe_client: Async Adobe API client.
+            authorization_id: Id of the authorization to use.
+            customer_id: Adobe customer ID.
+
+        Returns:
+            Copy of the customer deployments, whatever their status.
+        """
+        key = (authorization_id, customer_id)
+        deployments = self._deployments.get(key)
+        if deployments is None:
+            deployments = [
+                deployment
+                async for deployment in adobe_client.iter_customer_deployments(
+                    authorization_id, customer_id
+                )
+            ]
+            self._deployments.set(key, deployments, _get_deployments_ttl())
+        return copy.deepcopy(deployments)
+
+    def get_changes(
+        self, agreement_id: str, customer_id: str, deployments: list[dict]
+    ) -> DeploymentChanges:
+        """
+        Compares the deployments of the customer to the ones acknowledged by the agreement.
+
+        Deployments missing from the given ones are reported as removed, so a deployment
+        leaving a list of active deployments is removed, while a list of all the deployments
+        reports it as status changed.
+
+        Args:
+            agreement_id: Id of the agreement acknowledging the deployments.
+            customer_id: Adobe customer ID.
+            deployments: Current deployments of the customer.
+
+        Returns:
+            The changes of the deployments since the agreement last acknowledged them.
+        """
+        acknowledged = self._acknowledged.get(agreement_id)
+        if acknowledged is None:
+            return DeploymentChanges(agreement_id, customer_id, deployments, initial=True)
+
+        current = {deployment["deploymentId"]: deployment for deployment in deployments}
+        changes = DeploymentChanges(
+            agreement_id,
+            customer_id,
+            deployments,
+            added=[
+                deployment
+                for deployment_id, deployment in current.items()
+                if deployment_id not in acknowledged
+            ],
+            removed=[
+                deployment
+                for deployment_id, deployment in acknowledged.items()
+                if deployment_id not in current
+            ],
+            status_changed=[
+                deployment
+                for deployment_id, deployment in current.items()
+                if deployment_id in acknowledged
+                and deployment.get("status") != acknowledged[deployment_id].get("status")
+            ],
+        )
+        if changes:
+            logger.info(
+                "Deployments of customer %s changed for agreement %s: added %s, removed %s, "
+                "status changed %s",
+                customer_id,
+                agreement_id,
+                _get_ids(changes.added),
+                _get_ids(changes.removed),
+                _get_ids(changes.status_changed),
+            )
+        return changes
+
+    def acknowledge(self, changes: DeploymentChanges, pending_ids: Iterable[str] = ()) -> None:
+        """
+        Records the deployments as processed by the agreement, the baseline of its next changes.
+
+        Args:
+            changes: The processed changes.
+            pending_ids: Ids of the deployments that couldn't be processed yet, reported
+                again as added by the next changes.
+        """
+        pending_ids = set(pending_ids)
+        self._acknowledged.set(
+            changes.agreement_id,
+            {
+                deployment["deploymentId"]: deployment
+                for deployment in changes.deployments
+                if deployment["deploymentId"] not in pending_ids
+            },
+        )
+
+    def invalidate(self, authorization_id: str, customer_id: str) -> None:
+        """Drops the cached deployments of the customer, keeping the acknowledged ones."""
+        self._deployments.pop((authorization_id, customer_id))
+
+    def clear(self) -> None:
+        """Drops all the cached and acknowledged deployments."""
+        self._deployments.clear()
+        self._acknowledged.clear()
+
+
+def _get_deployments_ttl() -> int:
+    return int(settings.EXTENSION_CONFIG.get("ADOBE_DEPLOYMENTS_TTL_SECONDS", DEPLOYMENTS_TTL))
+
+
+def _get_ids(deployments: list[dict]) -> list[str]:
+    return [deployment["deploymentId"] for deployment in deployments]
+
+
+DEPLOYMENT_REGISTRY = DeploymentRegistry()
@@ -0,0 +1,131 @@
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+from django.conf import settings
+
+from adobe_vipm.cache import TTLCache
+
+# Seconds the acknowledged deployments are the baseline of the changes, so that the flows
+# acting on the changes process all the deployments again at least once a day
+ACKNOWLEDGED_DEPLOYMENTS_TTL = 86400
+
+
+class AcknowledgedDeploymentsStore(ABC):
+    """Stores the deployments acknowledged per agreement for a day."""
+
+    @abstractmethod
+    def get(self, agreement_id: str) -> dict[str, dict] | None:
+        """Returns the acknowledged deployments by ID, None if missing or expired."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, agreement_id: str, deployments: dict[str, dict]) -> None:
+        """Stores the acknowledged deployments by ID."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Removes all the acknowledged deployments."""
+        raise NotImplementedError
+
+
+class MemoryAcknowledgedDeploymentsStore(AcknowledgedDeploymentsStore):
+    """Acknowledged deployments kept by the current process only."""
+
+    def __init__(self):
+        self._cache = TTLCache(ttl=ACKNOWLEDGED_DEPLOYMENTS_TTL)
+
+    def get(self, agreement_id: str) -> dict[str, dict] | None:
+        """Returns the acknowledged deployments by ID, None if missing or expired."""
+        return self._cache.get(agreement_id)
+
+    def set(self, agreement_id: str, deployments: dict[str, dict]) -> None:
+        """Stores the acknowledged deployments by ID."""
+        self._cache.set(agreement_id, deployments)
+
+    def clear(self) -> None:
+        """Removes all the acknowledged deployments."""
+        self._cache.clear()
+
+
+class SqliteAcknowledgedDeploymentsStore(AcknowledgedDeploymentsStore):
+    """Acknowledged deployments kept in a local sqlite database across the sync runs."""
+
+    def __init__(self, path: Path):
+        self._lock = threading.Lock()
+        # A single connection shared by the sync workers, serialized by the lock
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS agreement_acknowledged_deployments ("
+                "agreement_id TEXT PRIMARY KEY, deployments TEXT NOT NULL, "
+                "acknowledged_at REAL NOT NULL)"
+            )
+
+    def get(self, agreement_id: str) -> dict[str, dict] | None:
+        """Returns the acknowledged deployments by ID, None if missing or expired."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT deployments FROM agreement_acknowledged_deployments "
+                "WHERE agreement_id = ? AND acknowledged_at > ?",
+                (agreement_id, time.time() - ACKNOWLEDGED_DEPLOYMENTS_TTL),
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set(self, agreement_id: str, deployments: dict[str, dict]) -> None:
+        """Stores the acknowledged deployments by ID, dropping the expired ones."""
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM agreement_acknowledged_deployments WHERE acknowledged_at <= ?",
+                (now - ACKNOWLEDGED_DEPLOYMENTS_TTL,),
+            )
+            self._connection.execute(
+                "INSERT OR REPLACE INTO agreement_acknowledged_deployments "
+                "(agreement_id, deployments, acknowledged_at) VALUES (?, ?, ?)",
+                (agreement_id, json.dumps(deployments), now),
+            )
+
+    def clear(self) -> None:
+        """Removes all the acknowledged deployments."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM agreement_acknowledged_deployments")
+
+
+class SettingsAcknowledgedDeploymentsStore(AcknowledgedDeploymentsStore):
+    """
+    Acknowledged deployments kept where the settings ask for.
+
+    In `ADOBE_DEPLOYMENTS_STATE_PATH` if set, otherwise by the current process only. The
+    store is created on first use, so the settings are read once Django is configured.
+    """
+
+    def __init__(self):
+        self._store: AcknowledgedDeploymentsStore | None = None
+        self._lock = threading.Lock()
+
+    def get(self, agreement_id: str) -> dict[str, dict] | None:
+        """Returns the acknowledged deployments by ID, None if missing or expired."""
+        return self._get_store().get(agreement_id)
+
+    def set(self, agreement_id: str, deployments: dict[str, dict]) -> None:
+        """Stores the acknowledged deployments by ID."""
+        self._get_store().set(agreement_id, deployments)
+
+    def clear(self) -> None:
+        """Removes all the acknowledged deployments."""
+        self._get_store().clear()
+
+    def _get_store(self) -> AcknowledgedDeploymentsStore:
+        with self._lock:
+            if self._store is None:
+                path = settings.EXTENSION_CONFIG.get("ADOBE_DEPLOYMENTS_STATE_PATH")
+                if path:
+                    self._store = SqliteAcknowledgedDeploymentsStore(Path(path))
+                else:
+                    self._store = MemoryAcknowledgedDeploymentsStore()
+            return self._store
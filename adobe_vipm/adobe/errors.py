@@ -1,10 +1,12 @@
+import inspect
 import json
 import logging
 from collections.abc import Callable
 from functools import wraps
 from typing import NoReturn, ParamSpec, TypeVar
 
-from requests import HTTPError, JSONDecodeError, PreparedRequest
+import httpx
+from requests import HTTPError, JSONDecodeError
 from requests.exceptions import ConnectionError as RequestsConnectionError
 from requests.exceptions import RequestException, Timeout
 
@@ -102,17 +104,18 @@ class AdobeTransportError(Exception):
         super().__init__(f"Adobe transport failure on {request_description}: {reason}")
 
 
-def _describe_failed_request(error: RequestException) -> str:
+def _describe_failed_request(error: RequestException | httpx.RequestError) -> str:
     """
     Describe the request behind a transport failure.
 
     Args:
-        error: The requests exception raised for the failed call.
+        error: The requests or httpx exception raised for the failed call.
 
     Returns:
         str: The method, URL, and correlation id of the failed request.
     """
-    request: PreparedRequest | None = error.request
+    # httpx attaches the request to the errors raised while sending it
+    request = error.request
     if request is None:
         return "an Adobe request"
 
@@ -120,12 +123,18 @@ def _describe_failed_request(error: RequestException) -> str:
     return f"{request.method} {request.url} (correlation id: {correlation_id})"
 
 
-def _raise_adobe_response_error(error: HTTPError) -> NoReturn:
+def _raise_adobe_transport_error(error: RequestException | httpx.RequestError) -> NoReturn:
+    request_description = _describe_failed_request(error)
+    logger.warning("Adobe transport failure on %s: %s", request_description, error)
+    raise AdobeTransportError(request_description, str(error)) from error
+
+
+def _raise_adobe_response_error(error: HTTPError | httpx.HTTPStatusError) -> NoReturn:
     """
     Convert an error response into the matching Adobe error.
 
     Args:
-        error: The HTTP error raised for the error response.
+        error: The requests or httpx error raised for the error response.
 
     Raises:
         AdobeAPIError: When the response body is the documented Adobe error JSON.
@@ -134,7 +143,7 @@ def _raise_adobe_response_error(error: HTTPError) -> NoReturn:
     logger.error(error)
     try:  # noqa: WPS328, WPS505
         raise AdobeAPIError(error.response.status_code, error.response.json())
-    except JSONDecodeError:
+    except (JSONDecodeError, json.JSONDecodeError):
         raise AdobeHttpError(error.response.status_code, error.response.content.decode())
 
 
@@ -144,7 +153,8 @@ def wrap_http_error(func: Callable[Param, RetType]) -> Callable[Param, RetType]:
 
     An HTTP response with an error status becomes an `AdobeAPIError` or `AdobeHttpError`. A
     failure with no response at all becomes an `AdobeTransportError` naming the request, so
-    the caller and any alert identify the endpoint that failed.
+    the caller and any alert identify the endpoint that failed. Coroutine functions get the
+    same mapping for the errors of the httpx client.
 
     Args:
         func: function to wrap and handle exceptions
@@ -152,6 +162,8 @@ def wrap_http_error(func: Callable[Param, RetType]) -> Callable[Param, RetType]:
     Returns:
         callable: wrapped function
     """
+    if inspect.iscoroutinefunction(func):
+        return _wrap_async_http_error(func)
 
     @wraps(func)
     def _wrapper(*args: Param.args, **kwargs: Param.kwargs) -> RetType:  # noqa: WPS430
@@ -160,8 +172,19 @@ def wrap_http_error(func: Callable[Param, RetType]) -> Callable[Param, RetType]:
         except HTTPError as error:
             _raise_adobe_response_error(error)
         except (RequestsConnectionError, Timeout) as error:
-            request_description = _describe_failed_request(error)
-            logger.warning("Adobe transport failure on %s: %s", request_description, error)
-            raise AdobeTransportError(request_description, str(error)) from error
+            _raise_adobe_transport_error(error)
 
     return _wrapper
+
+
+def _wrap_async_http_error(func: Callable) -> Callable:
+    @wraps(func)
+    async def _async_wrapper(*args, **kwargs):  # noqa: WPS430
+        try:
+            return await func(*args, **kwargs)
+        except httpx.HTTPStatusError as error:
+            _raise_adobe_response_error(error)
+        except (httpx.NetworkError, httpx.TimeoutException, httpx.RemoteProtocolError) as error:
+            _raise_adobe_transport_error(error)
+
+    return _async_wrapper
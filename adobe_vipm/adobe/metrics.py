@@ -0,0 +1,228 @@
+import re
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter
+from dataclasses import dataclass, field
+from urllib.parse import urlsplit
+
+import httpx
+import requests
+
+# Upper bounds, in seconds, of the latency histogram buckets. Slower requests fall in +Inf.
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+# Status recorded for the requests that didn't get any response.
+NO_RESPONSE_STATUS = "error"
+# Authorization recorded for the requests not sent on behalf of one, like the token requests.
+NO_AUTHORIZATION = "-"
+# Internal header naming the authorization an API request is sent with. The session moves it
+# to the `authorization_uk` attribute of the prepared request, so it never reaches Adobe.
+AUTHORIZATION_HEADER = "X-Authorization-Uk"
+# Extension of the async client responses counting the retries sent to get them.
+RETRIES_EXTENSION = "adobe_retries"
+
+_VERSIONED_PATH_RE = re.compile(r"^/v\d+/")
+
+MetricsKey = tuple[str, str, str]
+
+
+@dataclass
+class EndpointMetrics:
+    """Metrics of the requests sent to an endpoint of the Adobe API with an authorization."""
+
+    requests: int = 0
+    retries: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    latency_seconds: float = 0
+    # Requests per index of their bucket in LATENCY_BUCKETS, the last index is +Inf
+    latency_buckets: Counter = field(default_factory=Counter)
+    statuses: Counter = field(default_factory=Counter)
+
+    def to_dict(self) -> dict:
+        """Returns the metrics as a JSON serializable dict."""
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "latency_seconds": round(self.latency_seconds, 3),
+            "latency_histogram": {
+                bound: self.latency_buckets[index]
+                for index, bound in enumerate([*map(str, LATENCY_BUCKETS), "+Inf"])
+            },
+            "statuses": {str(status): count for status, count in self.statuses.items()},
+        }
+
+
+class AdobeApiMetrics:
+    """
+    Latency, status, retries and bytes of the Adobe API requests sent by the process.
+
+    The requests are grouped by authorization, method and endpoint template, the path with
+    the identifiers replaced by `{id}`, e.g. `/v3/customers/{id}/subscriptions`.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics: dict[MetricsKey, EndpointMetrics] = {}
+
+    def record(  # noqa: WPS211
+        self,
+        authorization_id: str | None,
+        request: requests.PreparedRequest | httpx.Request,
+        response: requests.Response | httpx.Response | None,
+        elapsed: float,
+    ) -> None:
+        """
+        Records a request sent to the Adobe API.
+
+        Args:
+            authorization_id: Authorization the request was sent with, if any.
+            request: The sent request, of the blocking or the async client.
+            response: The final response, None if the request failed without response.
+            elapsed: Seconds spent sending the request, retries included.
+        """
+        key = (
+            authorization_id or NO_AUTHORIZATION,
+            request.method or "",
+            get_endpoint_template(str(request.url or "")),
+        )
+        status = NO_RESPONSE_STATUS if response is None else response.status_code
+        with self._lock:
+            metrics = self._metrics.setdefault(key, EndpointMetrics())
+            metrics.requests += 1
+            metrics.statuses[status] += 1
+            metrics.latency_seconds += elapsed
+            metrics.latency_buckets[bisect_left(LATENCY_BUCKETS, elapsed)] += 1
+            metrics.bytes_sent += len(
+                request.content if isinstance(request, httpx.Request) else request.body or b""
+            )
+            if response is not None:
+                metrics.retries += _get_retries(response)
+                metrics.bytes_received += len(response.content or b"")
+
+    def collect(self) -> list[dict]:
+        """
+        Returns the metrics of every authorization and endpoint.
+
+        Returns:
+            The metrics, sorted by authorization, method and endpoint.
+        """
+        with self._lock:
+            return [
+                {
+                    "authorization": authorization_id,
+                    "method": method,
+                    "endpoint": endpoint,
+                    **metrics.to_dict(),
+                }
+                for (authorization_id, method, endpoint), metrics in sorted(self._metrics.items())
+            ]
+
+    def format_summary(self) -> list[str]:
+        """
+        Returns a line per authorization and endpoint summarizing its requests.
+
+        Returns:
+            The summary lines, empty if no request was sent.
+        """
+        return [
+            (
+                f"{metrics['authorization']} {metrics['method']} {metrics['endpoint']}: "
+                f"{metrics['requests']} requests, {metrics['retries']} retries, "
+                f"{metrics['latency_seconds']}s, {metrics['bytes_received']} bytes received, "
+                f"statuses {metrics['statuses']}"
+            )
+            for metrics in self.collect()
+        ]
+
+    def reset(self) -> None:
+        """Drops all the recorded metrics."""
+        with self._lock:
+            self._metrics.clear()
+
+
+class InstrumentedSession(requests.Session):
+    """
+    Session recording every request it sends in `ADOBE_API_METRICS`.
+
+    The latency covers the whole send, so it includes the retries and the rate limit waits.
+    The requests name their authorization in `AUTHORIZATION_HEADER`, read back by
+    `get_request_authorization`.
+    """
+
+    def prepare_request(self, request: requests.Request) -> requests.PreparedRequest:
+        """Prepares the request, moving its authorization out of the sent headers."""
+        prepared = super().prepare_request(request)
+        prepared.authorization_uk = prepared.headers.pop(AUTHORIZATION_HEADER, None)
+        return prepared
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        """Sends the request and records its latency, status, retries and bytes."""
+        start = time.monotonic()
+        try:
+            # The content is read by the session before returning, as no request is streamed
+            response = super().send(request, **kwargs)
+        except requests.RequestException:
+            self._record(request, None, start)
+            raise
+        self._record(request, response, start)
+        return response
+
+    def _record(
+        self, request: requests.PreparedRequest, response: requests.Response | None, start: float
+    ) -> None:
+        ADOBE_API_METRICS.record(
+            get_request_authorization(request), request, response, time.monotonic() - start
+        )
+
+
+def get_request_authorization(request: requests.PreparedRequest | httpx.Request) -> str | None:
+    """
+    Returns the authorization UK an Adobe API request is sent with.
+
+    Args:
+        request: Request prepared by `InstrumentedSession`, or sent through
+            `AsyncInstrumentedTransport` by the async client.
+
+    Returns:
+        The authorization UK, None for the requests not sent on behalf of an authorization.
+    """
+    return getattr(request, "authorization_uk", None)
+
+
+def get_endpoint_template(url: str) -> str:
+    """
+    Returns the path of the Adobe API url with the identifiers replaced by `{id}`.
+
+    The Adobe API paths alternate collections and identifiers after the version, e.g.
+    `/v3/customers/P1005267002/subscriptions` becomes `/v3/customers/{id}/subscriptions`.
+    Paths without version, like the authentication endpoint one, are returned as is.
+
+    Args:
+        url: The request url.
+
+    Returns:
+        The endpoint template.
+    """
+    path = urlsplit(url).path
+    if not _VERSIONED_PATH_RE.match(path):
+        return path
+    # ["", "v3", "customers", "P1005267002", "subscriptions"], identifiers from index 3
+    segments = path.rstrip("/").split("/")
+    for index in range(3, len(segments), 2):
+        segments[index] = "{id}"
+    return "/".join(segments)
+
+
+def _get_retries(response: requests.Response | httpx.Response) -> int:
+    if isinstance(response, httpx.Response):
+        return response.extensions.get(RETRIES_EXTENSION, 0)
+    retries = getattr(response.raw, "retries", None)
+    if retries is None:
+        return 0
+    return len(retries.history)
+
+
+ADOBE_API_METRICS = AdobeApiMetrics()
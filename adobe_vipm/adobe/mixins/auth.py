@@ -0,0 +1,123 @@
+import datetime as dt
+import threading
+import time
+from collections import defaultdict
+
+from adobe_vipm.adobe.config import Config
+from adobe_vipm.adobe.dataclasses import APIToken, Authorization
+from adobe_vipm.adobe.errors import wrap_http_error
+from adobe_vipm.adobe.token_store import get_token_store, is_token_fresh
+
+# setup cache cleanup in number of seconds before actual Adobe token expire
+# just to be sure to refresh token in time
+EXPIRES_IN_DELAY_SECONDS = 180
+# A new token is requested in background when the cached one expires within this time,
+# so that requests never wait for the token refresh.
+PROACTIVE_REFRESH_SECONDS = 600
+# Seconds without proactive refreshes of a token after a failed one.
+PROACTIVE_REFRESH_BACKOFF_SECONDS = 60
+
+
+def get_token_request_data(config: Config, authorization: Authorization) -> dict[str, str]:
+    """Returns the form sent to the auth endpoint to request a token of the authorization."""
+    return {
+        "grant_type": "client_credentials",
+        "client_id": authorization.client_id,
+        "client_secret": authorization.client_secret,
+        "scope": config.api_scopes,
+    }
+
+
+def parse_api_token(token_info: dict) -> APIToken:
+    """Returns the token answered by the auth endpoint, expiring before the Adobe one."""
+    expires_in = dt.timedelta(seconds=token_info["expires_in"] - EXPIRES_IN_DELAY_SECONDS)
+    return APIToken(
+        token=token_info["access_token"],
+        expires=dt.datetime.now(tz=dt.UTC) + expires_in,
+    )
+
+
+class AuthTokenClientMixin:
+    """Adobe Client Mixin to request and refresh the tokens of the authorizations."""
+
+    def _setup_auth_tokens(self) -> None:
+        self._token_cache: dict[Authorization, APIToken] = {}
+        self._token_store = get_token_store()
+        # One token refresh in flight per authorization, the other threads wait for it.
+        self._token_locks: defaultdict[Authorization, threading.Lock] = defaultdict(threading.Lock)
+        self._token_locks_lock = threading.Lock()
+        # Monotonic time before which no proactive refresh is tried, after a failed one.
+        self._proactive_refresh_backoff: dict[Authorization, float] = {}
+
+    @wrap_http_error
+    def _refresh_auth_token(self, authorization: Authorization):
+        """Request an authentication token for the Adobe VIPM API.
+
+        Using the credentials associated to a given the reseller. Wrapped so a failure of the
+        auth endpoint is reported against the token request instead of being caught by the
+        calling method's wrapper and attributed to the Adobe API call that triggered it.
+        """
+        response = self._session.post(
+            url=self._config.auth_endpoint_url,
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+            data=get_token_request_data(self._config, authorization),
+            timeout=self._TIMEOUT,
+        )
+        response.raise_for_status()
+        self._token_cache[authorization] = parse_api_token(response.json())
+
+    def _get_auth_token(self, authorization: Authorization):
+        token: APIToken | None = self._token_cache.get(authorization)
+        if token and not token.is_expired():
+            if not is_token_fresh(token, dt.timedelta(seconds=PROACTIVE_REFRESH_SECONDS)):
+                self._refresh_auth_token_in_background(authorization)
+            return token
+
+        with self._get_token_lock(authorization):
+            # Another thread may have refreshed the token while this one was waiting
+            token = self._token_cache.get(authorization)
+            if not token or token.is_expired():
+                self._load_auth_token(authorization, dt.timedelta(0))
+        return self._token_cache[authorization]
+
+    def _get_token_lock(self, authorization: Authorization) -> threading.Lock:
+        with self._token_locks_lock:
+            return self._token_locks[authorization]
+
+    def _load_auth_token(self, authorization: Authorization, min_validity: dt.timedelta) -> None:
+        if self._token_store is None:
+            self._refresh_auth_token(authorization)
+            return
+
+        def refresh() -> APIToken:  # noqa: WPS430
+            self._refresh_auth_token(authorization)
+            return self._token_cache[authorization]
+
+        self._token_cache[authorization] = self._token_store.get_or_refresh(
+            authorization.authorization_uk, refresh, min_validity
+        )
+
+    def _refresh_auth_token_in_background(self, authorization: Authorization) -> None:
+        if self._proactive_refresh_backoff.get(authorization, 0) > time.monotonic():
+            return
+        token_lock = self._get_token_lock(authorization)
+        if not token_lock.acquire(blocking=False):
+            # A refresh is already in flight
+            return
+
+        def proactive_refresh() -> None:  # noqa: WPS430
+            try:
+                self._load_auth_token(
+                    authorization, dt.timedelta(seconds=PROACTIVE_REFRESH_SECONDS)
+                )
+            except Exception:
+                self._logger.exception("Proactive refresh of the Adobe token failed.")
+                self._proactive_refresh_backoff[authorization] = (
+                    time.monotonic() + PROACTIVE_REFRESH_BACKOFF_SECONDS
+                )
+            else:
+                self._proactive_refresh_backoff.pop(authorization, None)
+            finally:
+                token_lock.release()
+
+        threading.Thread(target=proactive_refresh, daemon=True).start()
@@ -5,6 +5,7 @@ from urllib.parse import urljoin
 from adobe_vipm.adobe.constants import OfferType
 from adobe_vipm.adobe.dataclasses import Reseller
 from adobe_vipm.adobe.errors import wrap_http_error
+from adobe_vipm.adobe.request_cache import cached_read, invalidates_customer
 from adobe_vipm.adobe.utils import join_phone_number
 from adobe_vipm.flows.constants import Param
 
@@ -76,13 +77,11 @@ class CustomerClientMixin:
         payload = self._build_base_customer_payload(
             reseller, agreement_id, company_name, market_segment, customer_data
         )
-        payload["companyProfile"]["marketSubSegments"] = [
-            customer_data.get(Param.AGENCY_TYPE.value)
-        ]
-        payload["benefits"] = [{"type": "LARGE_GOVERNMENT_AGENCY"}]
+        self._add_lga_benefits(payload, customer_data)
 
         return self._create_adobe_customer(authorization, payload, company_name, reseller.id)
 
+    @cached_read
     @wrap_http_error
     def get_customer(
         self,
@@ -113,6 +112,7 @@ class CustomerClientMixin:
         response.raise_for_status()
         return response.json()
 
+    @invalidates_customer
     @wrap_http_error
     def create_3yc_request(
         self,
@@ -133,32 +133,9 @@ class CustomerClientMixin:
         Returns:
             dict: Customer.
         """
-        request_type = "recommitmentRequest" if is_recommitment else "commitmentRequest"
-        quantities = []
-        if commitment_request["3YCLicenses"]:
-            quantities.append(
-                {
-                    "offerType": "LICENSE",
-                    "quantity": int(commitment_request["3YCLicenses"]),
-                },
-            )
-        if commitment_request["3YCConsumables"]:
-            quantities.append(
-                {
-                    "offerType": "CONSUMABLES",
-                    "quantity": int(commitment_request["3YCConsumables"]),
-                },
-            )
         payload = {
             "companyProfile": self.get_customer(authorization_id, customer_id)["companyProfile"],
-            "benefits": [
-                {
-                    "type": "THREE_YEAR_COMMIT",
-                    request_type: {
-                        "minimumQuantities": quantities,
-                    },
-                },
-            ],
+            "benefits": self._get_3yc_request_benefits(commitment_request, is_recommitment),
         }
 
         response = self._session.patch(
@@ -199,6 +176,44 @@ class CustomerClientMixin:
             },
         ]
 
+    def _add_lga_benefits(self, payload: dict, customer_data: dict) -> None:
+        """Add Large Government Agency benefits to the payload."""
+        payload["companyProfile"]["marketSubSegments"] = [
+            customer_data.get(Param.AGENCY_TYPE.value)
+        ]
+        payload["benefits"] = [{"type": "LARGE_GOVERNMENT_AGENCY"}]
+
+    def _get_3yc_request_benefits(
+        self,
+        commitment_request: dict,
+        is_recommitment: bool,  # ruff:ignore[boolean-type-hint-positional-argument]
+    ) -> list[dict]:
+        """Build the Three Year Commit benefits of a commitment or recommitment request."""
+        request_type = "recommitmentRequest" if is_recommitment else "commitmentRequest"
+        quantities = []
+        if commitment_request["3YCLicenses"]:
+            quantities.append(
+                {
+                    "offerType": "LICENSE",
+                    "quantity": int(commitment_request["3YCLicenses"]),
+                },
+            )
+        if commitment_request["3YCConsumables"]:
+            quantities.append(
+                {
+                    "offerType": "CONSUMABLES",
+                    "quantity": int(commitment_request["3YCConsumables"]),
+                },
+            )
+        return [
+            {
+                "type": "THREE_YEAR_COMMIT",
+                request_type: {
+                    "minimumQuantities": quantities,
+                },
+            },
+        ]
+
     def _build_base_customer_payload(
         self,
         reseller: Reseller,
@@ -1,13 +1,28 @@
-from urllib.parse import urljoin
+from collections.abc import Iterator
 
 from adobe_vipm.adobe.constants import AdobeDeploymentStatus
-from adobe_vipm.adobe.errors import wrap_http_error
+from adobe_vipm.adobe.deployment_registry import DEPLOYMENT_REGISTRY
 
 
 class DeploymentClientMixin:
     """Adobe Client Mixin to manage Deployments flows of Adobe VIPM."""
 
-    @wrap_http_error
+    def iter_customer_deployments(self, authorization_id: str, customer_id: str) -> Iterator[dict]:
+        """
+        Yields the customer deployments, fetching the pages lazily.
+
+        Args:
+            authorization_id: Id of the authorization to use.
+            customer_id: Identifier of the customer.
+
+        Yields:
+            dict: Deployment.
+        """
+        authorization = self._config.get_authorization(authorization_id)
+        yield from self._iter_pages(
+            authorization, f"/v3/customers/{customer_id}/deployments", "items"
+        )
+
     def get_customer_deployments(
         self,
         authorization_id: str,
@@ -24,25 +39,15 @@ class DeploymentClientMixin:
             dict: Deployments.
 
         """
-        headers = self._get_headers(self._config.get_authorization(authorization_id))
-        next_url = f"/v3/customers/{customer_id}/deployments"
-        deployments = []
-        while next_url:
-            response = self._session.get(
-                urljoin(self._config.api_base_url, next_url),
-                headers=headers,
-                timeout=self._TIMEOUT,
-            )
-            response.raise_for_status()
-            page = response.json()
-            deployments.extend(page.get("items", []))
-            next_url = page.get("links", {}).get("next", {}).get("uri")
+        deployments = list(self.iter_customer_deployments(authorization_id, customer_id))
         return {"items": deployments, "totalCount": len(deployments)}
 
     def get_customer_deployments_active_status(
         self,
         authorization_id: str,
         customer_id: str,
+        *,
+        cached: bool = False,
     ) -> list[dict]:
         """
         Retrieve the active deployments for a given customer.
@@ -50,14 +55,19 @@ class DeploymentClientMixin:
         Args:
             authorization_id: Id of the authorization to use.
             customer_id: Identifier of the customer that place the RETURN order.
+            cached: Read the deployments through `DEPLOYMENT_REGISTRY`, so that they are not
+                paginated again until they expire. Meant for the agreement sync only, the
+                flows changing the deployments need them fresh.
 
         Returns:
             list: Customer Deployments.
         """
-        customer_deployments = self.get_customer_deployments(authorization_id, customer_id)
-
+        if cached:
+            deployments = DEPLOYMENT_REGISTRY.lookup(self, authorization_id, customer_id)
+        else:
+            deployments = self.iter_customer_deployments(authorization_id, customer_id)
         return [
             deployment
-            for deployment in customer_deployments.get("items", [])
+            for deployment in deployments
             if deployment.get("status") == AdobeDeploymentStatus.ACTIVE
         ]
@@ -3,39 +3,79 @@ import json
 import logging
 import re
 from collections import defaultdict
+from collections.abc import Iterable, Iterator
 from hashlib import sha256
-from operator import itemgetter
-from typing import Any
+from types import MappingProxyType
+from typing import Any, NoReturn
 from urllib.parse import urljoin
 
+from django.conf import settings
+
 from adobe_vipm.adobe import constants as adobe_constants
 from adobe_vipm.adobe.constants import AdobeErrorCode
 from adobe_vipm.adobe.dataclasses import Authorization, ReturnableOrderInfo
 from adobe_vipm.adobe.errors import AdobeAPIError, AdobeError, wrap_http_error
 from adobe_vipm.adobe.mixins.errors import AdobeCreatePreviewError, ProcessingUpsizeLinesError
+from adobe_vipm.adobe.request_cache import invalidates_customer
 from adobe_vipm.adobe.utils import (  # noqa: WPS347
     find_first,
-    get_item_by_subcription_id,
     to_adobe_line_id,
 )
 from adobe_vipm.airtable.models import get_adobe_product_by_marketplace_sku
+from adobe_vipm.cache import TTLCache
 from adobe_vipm.flows.constants import FAKE_CUSTOMERS_IDS, MARKET_SEGMENTS, Param
 from adobe_vipm.flows.context import Context
-from adobe_vipm.flows.utils.deployment import get_deployment_id
 from adobe_vipm.notifications import send_exception
 from adobe_vipm.utils import get_partial_sku, map_by
 
 logger = logging.getLogger(__name__)
 
-
-def _get_failed_discount_codes(response_json) -> set:
-    failed_discount_codes = set()
-    for line_item in response_json["lineItems"]:
-        failed_discounts = (
-            fd for fd in line_item.get("flexDiscounts", []) if fd["result"] != "SUCCESS"
-        )
-        failed_discount_codes.update(fd["code"] for fd in failed_discounts)
-    return failed_discount_codes
+# Adobe order and its line item of a subscription
+OrderItem = tuple[dict, dict]
+# Filters of the RETURN orders that are placed or being placed
+RETURN_ORDERS_FILTERS = MappingProxyType({
+    "order-type": adobe_constants.ORDER_TYPE_RETURN,
+    "status": [
+        adobe_constants.AdobeOrderStatus.COMPLETE,
+        adobe_constants.AdobeOrderStatus.OPEN,
+    ],
+})
+
+# Seconds a flex discount code of a base offer is kept per authorization, segment and country
+FLEX_DISCOUNTS_TTL = 3600
+FLEX_DISCOUNTS_CACHE = TTLCache(ttl=FLEX_DISCOUNTS_TTL)
+_NOT_CACHED = object()
+# Preview orders sent before giving up on removing the flex discounts rejected by Adobe
+PREVIEW_ORDER_ATTEMPTS = 5
+# Seconds a flex discount code rejected for a customer and offer isn't sent again
+REJECTED_FLEX_DISCOUNTS_TTL = 3600
+REJECTED_FLEX_DISCOUNTS_CACHE = TTLCache(ttl=REJECTED_FLEX_DISCOUNTS_TTL)
+
+
+def _get_flex_discounts_ttl() -> int:
+    return int(
+        settings.EXTENSION_CONFIG.get("ADOBE_FLEX_DISCOUNTS_TTL_SECONDS", FLEX_DISCOUNTS_TTL)
+    )
+
+
+def _invalidate_flex_discounts(authorization_uk: str) -> None:
+    FLEX_DISCOUNTS_CACHE.invalidate(lambda key: key[0] == authorization_uk)
+
+
+def _record_rejected_discount_codes(
+    adobe_customer_id: str, failed_discount_codes: set, payload: dict
+) -> None:
+    # Previews of customers not created yet share a fake customer id
+    if adobe_customer_id in FAKE_CUSTOMERS_IDS.values():
+        return
+    ttl = settings.EXTENSION_CONFIG.get(
+        "ADOBE_REJECTED_FLEX_DISCOUNTS_TTL_SECONDS", REJECTED_FLEX_DISCOUNTS_TTL
+    )
+    for line_item in payload["lineItems"]:
+        for code in failed_discount_codes.intersection(line_item.get("flexDiscountCodes", ())):
+            REJECTED_FLEX_DISCOUNTS_CACHE.set(
+                (adobe_customer_id, line_item["offerId"], code), cached_value=True, ttl=int(ttl)
+            )
 
 
 def _remove_failed_discount_codes(failed_discount_codes: set, payload: dict):
@@ -52,8 +92,36 @@ class OrderClientMixin:
     flex_discount_not_qualify_re = re.compile(r"Line Item: ?(\d+)", re.IGNORECASE)
     deployment_country_pattern = "{} ?- ?([A-Z]{{2,}})"
 
-    @wrap_http_error
-    def get_orders(self, authorization_id: str, customer_id: str, filters: dict | None = None):
+    def iter_orders(
+        self, authorization_id: str, customer_id: str, filters: dict | None = None
+    ) -> Iterator[dict]:
+        """
+        Yields the Adobe orders of the customer, fetching the pages lazily.
+
+        The filters are sent to Adobe, so that only the matching orders are downloaded. A
+        caller that stops iterating once it has found what it needs doesn't download the
+        remaining pages.
+
+        Args:
+            authorization_id: Id of the authorization to use.
+            customer_id: Identifier of the customer that placed the orders.
+            filters: key-value dictionary to filter orders, like `order-type`, `status`,
+                `start-date`, `end-date` or `reference-order-id`.
+
+        Yields:
+            dict: Adobe order.
+        """
+        authorization = self._config.get_authorization(authorization_id)
+        yield from self._iter_pages(
+            authorization,
+            f"/v3/customers/{customer_id}/orders?limit=100&offset=0",
+            "items",
+            filters,
+        )
+
+    def get_orders(
+        self, authorization_id: str, customer_id: str, filters: dict | None = None
+    ) -> list[dict]:
         """
         Retrieve Adobe orders.
 
@@ -63,26 +131,13 @@ class OrderClientMixin:
             filters: key-value dictionary to filter orders.
 
         Returns:
-            dict: The Preview order.
+            list(dict): Adobe orders.
         """
-        authorization = self._config.get_authorization(authorization_id)
-        headers = self._get_headers(authorization)
-        orders = []
-        orders_base_url = f"/v3/customers/{customer_id}/orders"
-        next_url = f"{orders_base_url}?limit=100&offset=0"
-        while next_url:
-            response = self._session.get(
-                urljoin(self._config.api_base_url, next_url),
-                headers=headers,
-                params=filters,
-                timeout=self._TIMEOUT,
-            )
-            response.raise_for_status()
-            page = response.json()
-            orders.extend(page["items"])
-            next_url = page["links"].get("next", {}).get("uri")
-        return orders
+        return list(self.iter_orders(authorization_id, customer_id, filters))
 
+    # A processed order changes the subscriptions of the customer, so reading an order state
+    # drops the reads cached for the customer too.
+    @invalidates_customer
     @wrap_http_error
     def get_order(
         self,
@@ -114,6 +169,7 @@ class OrderClientMixin:
         response.raise_for_status()
         return response.json()
 
+    @invalidates_customer
     @wrap_http_error
     def create_new_order(
         self,
@@ -135,18 +191,7 @@ class OrderClientMixin:
             dict: Adobe order.
         """
         authorization = self._config.get_authorization(authorization_id)
-        line_items = [
-            self._build_line_item(line_item) for line_item in adobe_preview_order["lineItems"]
-        ]
-
-        payload = {
-            "externalReferenceId": adobe_preview_order["externalReferenceId"],
-            "orderType": adobe_constants.ORDER_TYPE_NEW,
-            "lineItems": line_items,
-        }
-        if not deployment_id:
-            payload["currencyCode"] = authorization.currency
-
+        payload = self._build_new_order_payload(authorization, adobe_preview_order, deployment_id)
         correlation_id = sha256(json.dumps(payload).encode()).hexdigest()
         headers = self._get_headers(
             authorization,
@@ -176,22 +221,13 @@ class OrderClientMixin:
             AdobeCreatePreviewError
         """
         authorization = self._config.get_authorization(context.authorization_id)
-        offer_ids = tuple(
-            get_adobe_product_by_marketplace_sku(
-                line["item"]["externalIds"]["vendor"], context.market_segment
-            ).sku
-            for line in context.upsize_lines + context.new_lines
+        flex_discounts = self.get_flex_discounts_per_base_offer(
+            authorization, context, self._get_preview_offer_ids(context)
         )
-        flex_discounts = self.get_flex_discounts_per_base_offer(authorization, context, offer_ids)
         if flex_discounts:
             logger.info("Found flex discounts for base SKUs: %s", flex_discounts)
-        payload = {
-            "externalReferenceId": context.order_id,
-            "orderType": adobe_constants.ORDER_TYPE_PREVIEW,
-            "lineItems": [],
-        }
-        deployment_id = get_deployment_id(context.order)
-        self._process_new_lines(context, flex_discounts, payload)
+        payload = self._build_preview_order_payload(context, flex_discounts)
+        deployment_id = context.deployment_id
         if context.upsize_lines:
             try:
                 self._process_upsize_lines(
@@ -214,8 +250,9 @@ class OrderClientMixin:
             )
             return None
 
-        customer_id = context.adobe_customer_id or FAKE_CUSTOMERS_IDS[context.market_segment]
-        preview_order = self.get_preview_order(authorization, customer_id, payload)
+        preview_order = self.get_preview_order(
+            authorization, self._get_preview_customer_id(context), payload
+        )
         logger.info("Created preview order %s", preview_order["externalReferenceId"])
         return preview_order
 
@@ -247,6 +284,7 @@ class OrderClientMixin:
         response.raise_for_status()
         return response.json()
 
+    @invalidates_customer
     @wrap_http_error
     def create_renewal_order(
         self,
@@ -272,14 +310,9 @@ class OrderClientMixin:
             dict: The Renewal order.
         """
         authorization = self._config.get_authorization(authorization_id)
-        payload = {
-            "externalReferenceId": external_reference_id,
-            "orderType": order_type,
-            "lineItems": line_items,
-        }
-        if not any(line_item.get("deploymentId") for line_item in line_items):
-            payload["currencyCode"] = authorization.currency
-
+        payload = self._build_renewal_order_payload(
+            authorization, external_reference_id, line_items, order_type
+        )
         correlation_id = sha256(json.dumps(payload).encode()).hexdigest()
         headers = self._get_headers(authorization, correlation_id=correlation_id)
         response = self._session.post(
@@ -333,6 +366,7 @@ class OrderClientMixin:
         response.raise_for_status()
         return response.json()
 
+    @invalidates_customer
     @wrap_http_error
     def create_switch_order(
         self,
@@ -396,61 +430,52 @@ class OrderClientMixin:
         Returns:
             list(dict): The RETURN order.
         """
-        current_date = dt.datetime.now(tz=dt.UTC).date()
-        start_date = current_date - dt.timedelta(days=adobe_constants.CANCELLATION_WINDOW_DAYS)
-
-        returning_order_ids = [order["referenceOrderId"] for order in (return_orders or [])]
-
-        orders = self.get_orders(
+        returnable_orders = self.get_returnable_orders_by_subscription_ids(
             authorization_id,
             customer_id,
-            filters={
-                "order-type": [adobe_constants.ORDER_TYPE_NEW, adobe_constants.ORDER_TYPE_RENEWAL],
-                "start-date": start_date.isoformat(),
-                "end-date": customer_coterm_date,
-            },
-        )
-        order_items = (
-            (
-                order,
-                get_item_by_subcription_id(order["lineItems"], subscription_id),
-            )
-            for order in orders
+            [subscription_id],
+            customer_coterm_date,
+            return_orders={subscription_id: return_orders},
         )
+        return returnable_orders[subscription_id]
 
-        order_items = filter(itemgetter(1), order_items)
-        order_items = list(
-            filter(
-                lambda order_item: (
-                    order_item[0]["orderId"] in returning_order_ids
-                    or self._is_processed(order_item)
-                ),
-                order_items,
-            )
+    def get_returnable_orders_by_subscription_ids(
+        self,
+        authorization_id: str,
+        customer_id: str,
+        subscription_ids: Iterable[str],
+        customer_coterm_date: str,
+        return_orders: dict[str, list | None] | None = None,
+    ) -> dict[str, list[ReturnableOrderInfo]]:
+        """
+        Retrieve the returnable orders of several subscriptions at once.
+
+        The NEW and RENEWAL orders placed within the cancellation window are downloaded once
+        and their line items indexed by subscription ID, so the cost doesn't grow with the
+        number of subscriptions.
+
+        Args:
+            authorization_id: Id of the authorization to use.
+            customer_id: Identifier of the customer that place the RETURN order.
+            subscription_ids: Adobe Subscription IDs
+            customer_coterm_date: customer coterm date
+            return_orders: orders to return, per subscription ID
+
+        Returns:
+            dict: The returnable orders per subscription ID.
+        """
+        subscription_ids = list(subscription_ids)
+        if not subscription_ids:
+            return {}
+
+        orders = self.iter_orders(
+            authorization_id,
+            customer_id,
+            filters=self._get_returnable_orders_filters(customer_coterm_date),
         )
-        renewal_order_item = find_first(
-            lambda order_item: order_item[0]["orderType"] == adobe_constants.ORDER_TYPE_RENEWAL,
-            order_items,
+        return self._get_returnable_orders_by_subscription_id(
+            orders, subscription_ids, return_orders or {}
         )
-        if renewal_order_item:
-            renewal_order_date = dt.datetime.fromisoformat(renewal_order_item[0]["creationDate"])
-            order_items = filter(
-                lambda order_item: (
-                    dt.datetime.fromisoformat(order_item[0]["creationDate"]) >= renewal_order_date
-                ),
-                order_items,
-            )
-
-        return_orders = []
-        for order, line_item in order_items:
-            return_orders.append(
-                ReturnableOrderInfo(
-                    order=order,
-                    line=line_item,
-                    quantity=line_item["quantity"],
-                )
-            )
-        return return_orders
 
     def get_return_orders_by_external_reference(
         self,
@@ -469,25 +494,10 @@ class OrderClientMixin:
         Returns:
             The RETURN orders.
         """
-        orders = self.get_orders(
-            authorization_id,
-            customer_id,
-            filters={
-                "order-type": adobe_constants.ORDER_TYPE_RETURN,
-                "status": [
-                    adobe_constants.AdobeOrderStatus.COMPLETE,
-                    adobe_constants.AdobeOrderStatus.OPEN,
-                ],
-            },
-        )
-        return_orders = defaultdict(list)
-        for order in orders:
-            if not order["externalReferenceId"].startswith(external_reference):
-                continue
-            for line_item in order["lineItems"]:
-                return_orders[get_partial_sku(line_item["offerId"])].append(order)
-        return return_orders
+        orders = self.iter_orders(authorization_id, customer_id, filters=RETURN_ORDERS_FILTERS)
+        return self._group_return_orders_by_sku(orders, external_reference)
 
+    @invalidates_customer
     @wrap_http_error
     def create_return_order(
         self,
@@ -514,31 +524,18 @@ class OrderClientMixin:
         Returns:
             dict: The RETURN order.
         """
-        line_number = returning_item["extLineItemNumber"]
-        external_id = f"{external_reference}_{returning_order['externalReferenceId']}_{line_number}"
-
-        payload = {
-            "externalReferenceId": external_id,
-            "referenceOrderId": returning_order["orderId"],
-            "orderType": adobe_constants.ORDER_TYPE_RETURN,
-            "lineItems": [],
-        }
-
-        if not deployment_id:
-            payload["currencyCode"] = self._config.get_authorization(authorization_id).currency
-
-        line_item = {
-            "extLineItemNumber": line_number,
-            "offerId": returning_item["offerId"],
-            "quantity": returning_item["quantity"],
-        }
-        if deployment_id:
-            line_item["deploymentId"] = deployment_id
-            line_item["currencyCode"] = self._config.get_authorization(authorization_id).currency
-        payload["lineItems"].append(line_item)
-
-        return self._create_return_order_base(authorization_id, customer_id, payload, external_id)
+        payload = self._build_return_order_payload(
+            self._config.get_authorization(authorization_id),
+            returning_order,
+            returning_item,
+            external_reference,
+            deployment_id,
+        )
+        return self._create_return_order_base(
+            authorization_id, customer_id, payload, payload["externalReferenceId"]
+        )
 
+    @invalidates_customer
     @wrap_http_error
     def create_return_order_by_adobe_order(
         self,
@@ -557,19 +554,9 @@ class OrderClientMixin:
         Returns:
             dict: The RETURN order.
         """
-        external_reference_id = f"{order_created['externalReferenceId']}_{order_created['orderId']}"
-        adobe_order_id = order_created["orderId"]
-        adobe_line_items = order_created["lineItems"]
-
-        payload = {
-            "externalReferenceId": external_reference_id,
-            "referenceOrderId": adobe_order_id,
-            "orderType": adobe_constants.ORDER_TYPE_RETURN,
-            "lineItems": adobe_line_items,
-        }
-        if not any(line_item.get("deploymentId") for line_item in adobe_line_items):
-            payload["currencyCode"] = self._config.get_authorization(authorization_id).currency
-
+        payload = self._build_adobe_order_return_payload(
+            self._config.get_authorization(authorization_id), order_created
+        )
         return self._create_return_order_base(authorization_id, customer_id, payload)
 
     def get_preview_order(  # noqa: WPS231
@@ -592,21 +579,20 @@ class OrderClientMixin:
             successfully.
         """
         response_json = None
-        for _ in range(1, 6):
+        for _ in range(PREVIEW_ORDER_ATTEMPTS):
             try:
                 response_json = self._get_preview_order(authorization, adobe_customer_id, payload)
             except AdobeError as ex:
                 failed_discount_codes = self._get_fail_discounts_for_cust_not_qualified(ex, payload)
             else:
-                failed_discount_codes = _get_failed_discount_codes(response_json)
+                failed_discount_codes = self._get_failed_discount_codes(response_json)
             if not failed_discount_codes:
                 break
-            logger.warning("Found failed flex discounts: %s", failed_discount_codes)
-            _remove_failed_discount_codes(failed_discount_codes, payload)
+            self._discard_failed_discount_codes(
+                authorization, adobe_customer_id, failed_discount_codes, payload
+            )
         else:
-            msg = f"After 5 attempts still finding failed discount codes: {failed_discount_codes}."
-            send_exception("Failed applying discount codes", msg)
-            raise AdobeError(msg)
+            self._raise_failed_discount_codes(failed_discount_codes)
 
         return response_json
 
@@ -616,8 +602,37 @@ class OrderClientMixin:
         context: Context,
         offer_ids: tuple,
     ) -> dict:
-        """Fetches active flex discounts for the provided base offer IDs."""
+        """
+        Fetches active flex discounts for the provided base offer IDs.
+
+        The discount code of each base offer is kept in `FLEX_DISCOUNTS_CACHE` per
+        authorization, market segment and country for `ADOBE_FLEX_DISCOUNTS_TTL_SECONDS`, so
+        only the offers not looked up yet are requested to Adobe.
+        """
+        catalogue_key = self._get_flex_discounts_catalogue_key(authorization, context)
+        base_offers_with_discounts, missing_offer_ids = self._get_cached_flex_discounts(
+            catalogue_key, offer_ids
+        )
+        if not missing_offer_ids:
+            return base_offers_with_discounts
+
+        fetched_discounts = self._fetch_flex_discounts_per_base_offer(
+            authorization, catalogue_key[1], catalogue_key[2], missing_offer_ids
+        )
+        self._cache_flex_discounts(catalogue_key, missing_offer_ids, fetched_discounts)
+        return {**base_offers_with_discounts, **fetched_discounts}
+
+    def _get_flex_discounts_catalogue_key(
+        self, authorization: Authorization, context: Context
+    ) -> tuple[str, str, str]:
         # TODO: Change this when Adobe starts supporting multiple codes per single baseOfferId
+        return (
+            authorization.authorization_uk,
+            MARKET_SEGMENTS[context.market_segment],
+            self._get_flex_discounts_country(context),
+        )
+
+    def _get_flex_discounts_country(self, context: Context) -> str:
         country = context.customer_data["address"]["country"]
         if context.customer_data[Param.DEPLOYMENT_ID]:
             match = re.match(
@@ -632,43 +647,23 @@ class OrderClientMixin:
                     context.customer_data[Param.DEPLOYMENT_ID],
                     country,
                 )
+        return country
+
+    def _fetch_flex_discounts_per_base_offer(
+        self, authorization: Authorization, segment: str, country: str, offer_ids: tuple
+    ) -> dict:
         logger.info(
             "Flex discounts: requesting from Adobe market_segment=%s country=%s offer_ids=%s",
-            MARKET_SEGMENTS[context.market_segment],
+            segment,
             country,
             offer_ids,
         )
         try:
-            flex_discounts = self._get_flex_discounts(
-                authorization,
-                MARKET_SEGMENTS[context.market_segment],
-                country,
-                offer_ids,
-            )
+            flex_discounts = self._get_flex_discounts(authorization, segment, country, offer_ids)
         except AdobeAPIError as error:
-            if error.code == AdobeErrorCode.INVALID_COUNTRY_FOR_PARTNER:
-                logger.warning(
-                    "Invalid country %s for partner when getting flex discounts.", country
-                )
-                flex_discounts = ()
-            else:
-                raise
-        logger.debug(
-            "Flex discounts: Adobe returned %s discount(s): %s",
-            len(flex_discounts),
-            flex_discounts,
-        )
-        base_offers_with_discounts = {}
-        for flex_discount in filter(lambda fd: fd["status"] == "ACTIVE", flex_discounts):
-            base_offers_with_discounts.update(
-                dict.fromkeys(flex_discount["qualification"]["baseOfferIds"], flex_discount["code"])
-            )
-        logger.info(
-            "Flex discounts: resolved %s base offer(s) with active discounts: %s",
-            len(base_offers_with_discounts),
-            base_offers_with_discounts,
-        )
-        return base_offers_with_discounts
+            self._ignore_invalid_country_error(error, country)
+            flex_discounts = ()
+        return self._get_active_flex_discounts(flex_discounts)
 
     def _get_fail_discounts_for_cust_not_qualified(self, ex: AdobeError, payload: dict) -> set:
         if ex.code == adobe_constants.AdobeErrorCode.CUSTOMER_NOT_QUALIFIED_FOR_FLEX_DISCOUNT:
@@ -694,8 +689,12 @@ class OrderClientMixin:
                 line,
                 adobe_base_sku,
                 line["quantity"],
-                flex_discounts.get(
-                    get_adobe_product_by_marketplace_sku(adobe_base_sku, context.market_segment).sku
+                self._get_discount_code(
+                    context.adobe_customer_id,
+                    flex_discounts,
+                    get_adobe_product_by_marketplace_sku(
+                        adobe_base_sku, context.market_segment
+                    ).sku,
                 ),
                 context.market_segment,
             )
@@ -716,6 +715,24 @@ class OrderClientMixin:
         upsize_subscriptions = self.get_subscriptions_for_offers(
             authorization_id, adobe_customer_id, offer_ids, deployment_id
         )
+        self._add_upsize_line_items(
+            adobe_customer_id,
+            upsize_lines,
+            upsize_subscriptions,
+            discounts,
+            payload,
+            market_segment,
+        )
+
+    def _add_upsize_line_items(
+        self,
+        adobe_customer_id: str,
+        upsize_lines: list[dict],
+        upsize_subscriptions: list[dict],
+        discounts: dict,
+        payload: dict,
+        market_segment: str,
+    ) -> None:
         offer_subscriptions = map_by("offerId", upsize_subscriptions)
         map_by_base_offer_subscriptions = {
             get_partial_sku(offer_id): subs for offer_id, subs in offer_subscriptions.items()
@@ -756,8 +773,10 @@ class OrderClientMixin:
                 line,
                 adobe_base_sku,
                 quantity,
-                discounts.get(
-                    get_adobe_product_by_marketplace_sku(adobe_base_sku, market_segment).sku
+                self._get_discount_code(
+                    adobe_customer_id,
+                    discounts,
+                    get_adobe_product_by_marketplace_sku(adobe_base_sku, market_segment).sku,
                 ),
                 market_segment,
             )
@@ -841,6 +860,24 @@ class OrderClientMixin:
         response.raise_for_status()
         return response.json()
 
+    def _get_discount_code(
+        self, adobe_customer_id: str | None, discounts: dict, offer_id: str
+    ) -> str | None:
+        discount_code = discounts.get(offer_id)
+        if discount_code and REJECTED_FLEX_DISCOUNTS_CACHE.get((
+            adobe_customer_id,
+            offer_id,
+            discount_code,
+        )):
+            logger.info(
+                "Flex discount %s was rejected for customer %s and offer %s, skipping it",
+                discount_code,
+                adobe_customer_id,
+                offer_id,
+            )
+            return None
+        return discount_code
+
     def _get_preview_order_line_item(
         self, line: dict, adobe_base_sku, quantity: int, discount_code, market_segment: str
     ) -> dict:
@@ -854,7 +891,49 @@ class OrderClientMixin:
 
         return line_item
 
-    def _is_processed(self, order_item: tuple[dict, dict]) -> bool:
+    def _index_order_items_by_subscription_id(
+        self, orders: Iterable[dict], subscription_ids: set[str]
+    ) -> defaultdict[str, list[OrderItem]]:
+        order_items = defaultdict(list)
+        for order in orders:
+            # Only the first line item of each subscription in the order is indexed
+            order_subscription_ids = set()
+            for line_item in order["lineItems"]:
+                subscription_id = line_item["subscriptionId"]
+                if (
+                    subscription_id in subscription_ids
+                    and subscription_id not in order_subscription_ids
+                ):
+                    order_subscription_ids.add(subscription_id)
+                    order_items[subscription_id].append((order, line_item))
+        return order_items
+
+    def _get_returnable_orders(
+        self, order_items: list[OrderItem], returning_order_ids: list[str]
+    ) -> list[ReturnableOrderInfo]:
+        order_items = [
+            order_item
+            for order_item in order_items
+            if order_item[0]["orderId"] in returning_order_ids or self._is_processed(order_item)
+        ]
+        renewal_order_item = find_first(
+            lambda order_item: order_item[0]["orderType"] == adobe_constants.ORDER_TYPE_RENEWAL,
+            order_items,
+        )
+        if renewal_order_item:
+            renewal_order_date = dt.datetime.fromisoformat(renewal_order_item[0]["creationDate"])
+            order_items = [
+                order_item
+                for order_item in order_items
+                if dt.datetime.fromisoformat(order_item[0]["creationDate"]) >= renewal_order_date
+            ]
+
+        return [
+            ReturnableOrderInfo(order=order, line=line_item, quantity=line_item["quantity"])
+            for order, line_item in order_items
+        ]
+
+    def _is_processed(self, order_item: OrderItem) -> bool:
         order, mpt_item = order_item
 
         return (
@@ -862,28 +941,31 @@ class OrderClientMixin:
             and mpt_item["status"] == adobe_constants.AdobeOrderStatus.COMPLETE
         )
 
-    @wrap_http_error
+    def _iter_flex_discounts(
+        self, authorization: Authorization, segment: str, country: str, offer_ids: tuple[str, ...]
+    ) -> Iterator[dict]:
+        # The next links carry the query parameters
+        yield from self._iter_pages(
+            authorization,
+            "v3/flex-discounts",
+            "flexDiscounts",
+            self._get_flex_discounts_params(segment, country, offer_ids),
+            repeat_params=False,
+        )
+
+    def _get_flex_discounts_params(
+        self, segment: str, country: str, offer_ids: tuple[str, ...]
+    ) -> dict[str, str]:
+        return {
+            "market-segment": segment,
+            "country": country,
+            "offer-ids": ",".join(offer_ids),
+        }
+
     def _get_flex_discounts(
         self, authorization: Authorization, segment: str, country: str, offer_ids: tuple[str, ...]
     ) -> list:
-        headers = self._get_headers(authorization)
-        offer_ids = ",".join(offer_ids)
-        query_params = {"market-segment": {segment}, "country": {country}, "offer-ids": {offer_ids}}
-        next_url = "v3/flex-discounts"
-        flex_discounts = []
-        while next_url:
-            response = self._session.get(
-                urljoin(self._config.api_base_url, next_url),
-                headers=headers,
-                params=query_params,
-                timeout=self._TIMEOUT,
-            )
-            response.raise_for_status()
-            page = response.json()
-            flex_discounts.extend(page["flexDiscounts"])
-            next_url = page.get("links", {}).get("next", {}).get("uri")
-            query_params = None
-        return flex_discounts
+        return list(self._iter_flex_discounts(authorization, segment, country, offer_ids))
 
     def _update_payload_by_deployment(
         self, authorization: Authorization, deployment_id: str | None, payload: dict[str, Any]
@@ -895,3 +977,226 @@ class OrderClientMixin:
         for line_item in payload["lineItems"]:
             line_item["deploymentId"] = deployment_id
             line_item["currencyCode"] = authorization.currency
+
+    def _get_preview_offer_ids(self, context: Context) -> tuple[str, ...]:
+        return tuple(
+            get_adobe_product_by_marketplace_sku(
+                line["item"]["externalIds"]["vendor"], context.market_segment
+            ).sku
+            for line in context.upsize_lines + context.new_lines
+        )
+
+    def _build_preview_order_payload(self, context: Context, flex_discounts: dict) -> dict:
+        payload = {
+            "externalReferenceId": context.order_id,
+            "orderType": adobe_constants.ORDER_TYPE_PREVIEW,
+            "lineItems": [],
+        }
+        self._process_new_lines(context, flex_discounts, payload)
+        return payload
+
+    def _get_preview_customer_id(self, context: Context) -> str:
+        return context.adobe_customer_id or FAKE_CUSTOMERS_IDS[context.market_segment]
+
+    def _build_new_order_payload(
+        self, authorization: Authorization, adobe_preview_order: dict, deployment_id: str | None
+    ) -> dict:
+        line_items = [
+            self._build_line_item(line_item) for line_item in adobe_preview_order["lineItems"]
+        ]
+
+        payload = {
+            "externalReferenceId": adobe_preview_order["externalReferenceId"],
+            "orderType": adobe_constants.ORDER_TYPE_NEW,
+            "lineItems": line_items,
+        }
+        if not deployment_id:
+            payload["currencyCode"] = authorization.currency
+        return payload
+
+    def _build_renewal_order_payload(
+        self,
+        authorization: Authorization,
+        external_reference_id: str,
+        line_items: list[dict],
+        order_type: str,
+    ) -> dict:
+        payload = {
+            "externalReferenceId": external_reference_id,
+            "orderType": order_type,
+            "lineItems": line_items,
+        }
+        if not any(line_item.get("deploymentId") for line_item in line_items):
+            payload["currencyCode"] = authorization.currency
+        return payload
+
+    def _build_return_order_payload(
+        self,
+        authorization: Authorization,
+        returning_order: dict,
+        returning_item: dict,
+        external_reference: str,
+        deployment_id: str | None,
+    ) -> dict:
+        line_number = returning_item["extLineItemNumber"]
+        external_id = f"{external_reference}_{returning_order['externalReferenceId']}_{line_number}"
+
+        payload = {
+            "externalReferenceId": external_id,
+            "referenceOrderId": returning_order["orderId"],
+            "orderType": adobe_constants.ORDER_TYPE_RETURN,
+            "lineItems": [],
+        }
+
+        if not deployment_id:
+            payload["currencyCode"] = authorization.currency
+
+        line_item = {
+            "extLineItemNumber": line_number,
+            "offerId": returning_item["offerId"],
+            "quantity": returning_item["quantity"],
+        }
+        if deployment_id:
+            line_item["deploymentId"] = deployment_id
+            line_item["currencyCode"] = authorization.currency
+        payload["lineItems"].append(line_item)
+        return payload
+
+    def _build_adobe_order_return_payload(
+        self, authorization: Authorization, order_created: dict
+    ) -> dict:
+        external_reference_id = f"{order_created['externalReferenceId']}_{order_created['orderId']}"
+        adobe_line_items = order_created["lineItems"]
+
+        payload = {
+            "externalReferenceId": external_reference_id,
+            "referenceOrderId": order_created["orderId"],
+            "orderType": adobe_constants.ORDER_TYPE_RETURN,
+            "lineItems": adobe_line_items,
+        }
+        if not any(line_item.get("deploymentId") for line_item in adobe_line_items):
+            payload["currencyCode"] = authorization.currency
+        return payload
+
+    def _get_returnable_orders_filters(self, customer_coterm_date: str) -> dict:
+        current_date = dt.datetime.now(tz=dt.UTC).date()
+        start_date = current_date - dt.timedelta(days=adobe_constants.CANCELLATION_WINDOW_DAYS)
+        return {
+            "order-type": [adobe_constants.ORDER_TYPE_NEW, adobe_constants.ORDER_TYPE_RENEWAL],
+            "start-date": start_date.isoformat(),
+            "end-date": customer_coterm_date,
+        }
+
+    def _get_returnable_orders_by_subscription_id(
+        self,
+        orders: Iterable[dict],
+        subscription_ids: list[str],
+        return_orders: dict[str, list | None],
+    ) -> dict[str, list[ReturnableOrderInfo]]:
+        order_items = self._index_order_items_by_subscription_id(orders, set(subscription_ids))
+        return {
+            subscription_id: self._get_returnable_orders(
+                order_items[subscription_id],
+                [order["referenceOrderId"] for order in (return_orders.get(subscription_id) or [])],
+            )
+            for subscription_id in subscription_ids
+        }
+
+    def _group_return_orders_by_sku(
+        self, orders: Iterable[dict], external_reference: str
+    ) -> defaultdict[str, list[dict]]:
+        return_orders = defaultdict(list)
+        for order in orders:
+            if not order["externalReferenceId"].startswith(external_reference):
+                continue
+            for line_item in order["lineItems"]:
+                return_orders[get_partial_sku(line_item["offerId"])].append(order)
+        return return_orders
+
+    def _get_failed_discount_codes(self, response_json: dict) -> set:
+        failed_discount_codes = set()
+        for line_item in response_json["lineItems"]:
+            failed_discounts = (
+                fd for fd in line_item.get("flexDiscounts", []) if fd["result"] != "SUCCESS"
+            )
+            failed_discount_codes.update(fd["code"] for fd in failed_discounts)
+        return failed_discount_codes
+
+    def _discard_failed_discount_codes(
+        self,
+        authorization: Authorization,
+        adobe_customer_id: str,
+        failed_discount_codes: set,
+        payload: dict,
+    ) -> None:
+        logger.warning("Found failed flex discounts: %s", failed_discount_codes)
+        # The cached discounts of the authorization may be outdated
+        _invalidate_flex_discounts(authorization.authorization_uk)
+        _record_rejected_discount_codes(adobe_customer_id, failed_discount_codes, payload)
+        _remove_failed_discount_codes(failed_discount_codes, payload)
+
+    def _raise_failed_discount_codes(self, failed_discount_codes: set) -> NoReturn:
+        msg = (
+            f"After {PREVIEW_ORDER_ATTEMPTS} attempts still finding failed discount codes: "
+            f"{failed_discount_codes}."
+        )
+        send_exception("Failed applying discount codes", msg)
+        raise AdobeError(msg)
+
+    def _get_cached_flex_discounts(
+        self, catalogue_key: tuple[str, str, str], offer_ids: tuple
+    ) -> tuple[dict, tuple]:
+        cached_discounts = {
+            offer_id: FLEX_DISCOUNTS_CACHE.get((*catalogue_key, offer_id), _NOT_CACHED)
+            for offer_id in offer_ids
+        }
+        base_offers_with_discounts = {
+            offer_id: code
+            for offer_id, code in cached_discounts.items()
+            if code and code is not _NOT_CACHED
+        }
+        missing_offer_ids = tuple(
+            offer_id for offer_id in offer_ids if cached_discounts[offer_id] is _NOT_CACHED
+        )
+        if not missing_offer_ids:
+            logger.info(
+                "Flex discounts: resolved %s base offer(s) from the cache: %s",
+                len(base_offers_with_discounts),
+                base_offers_with_discounts,
+            )
+        return base_offers_with_discounts, missing_offer_ids
+
+    def _cache_flex_discounts(
+        self, catalogue_key: tuple[str, str, str], offer_ids: tuple, fetched_discounts: dict
+    ) -> None:
+        ttl = _get_flex_discounts_ttl()
+        for offer_id in offer_ids:
+            # Offers without discount are cached too, so that they aren't requested again
+            FLEX_DISCOUNTS_CACHE.set(
+                (*catalogue_key, offer_id), fetched_discounts.get(offer_id), ttl
+            )
+        for offer_id, code in fetched_discounts.items():
+            FLEX_DISCOUNTS_CACHE.set((*catalogue_key, offer_id), code, ttl)
+
+    def _ignore_invalid_country_error(self, error: AdobeAPIError, country: str) -> None:
+        if error.code != AdobeErrorCode.INVALID_COUNTRY_FOR_PARTNER:
+            raise error
+        logger.warning("Invalid country %s for partner when getting flex discounts.", country)
+
+    def _get_active_flex_discounts(self, flex_discounts: Iterable[dict]) -> dict:
+        logger.debug(
+            "Flex discounts: Adobe returned %s discount(s): %s",
+            len(flex_discounts),
+            flex_discounts,
+        )
+        base_offers_with_discounts = {}
+        for flex_discount in filter(lambda fd: fd["status"] == "ACTIVE", flex_discounts):
+            base_offers_with_discounts.update(
+                dict.fromkeys(flex_discount["qualification"]["baseOfferIds"], flex_discount["code"])
+            )
+        logger.info(
+            "Flex discounts: resolved %s base offer(s) with active discounts: %s",
+            len(base_offers_with_discounts),
+            base_offers_with_discounts,
+        )
+        return base_offers_with_discounts
@@ -0,0 +1,54 @@
+from collections.abc import Iterator
+from urllib.parse import urljoin
+
+from adobe_vipm.adobe.dataclasses import Authorization
+from adobe_vipm.adobe.errors import wrap_http_error
+
+
+class PaginationClientMixin:
+    """Adobe Client Mixin to read the paginated listings of Adobe VIPM lazily."""
+
+    def _iter_pages(
+        self,
+        authorization: Authorization,
+        url: str,
+        items_key: str,
+        query_params: dict | None = None,
+        *,
+        repeat_params: bool = True,
+    ) -> Iterator[dict]:
+        """
+        Yields the items of a paginated listing, fetching each page only when needed.
+
+        The next page is requested once the caller has consumed the items of the current one,
+        so a caller that stops iterating early doesn't download the remaining pages.
+
+        Args:
+            authorization: The authorization to use.
+            url: Path of the first page.
+            items_key: Key of the items in each page.
+            query_params: Query parameters of the request.
+            repeat_params: Send the query parameters for every page and not only for the first
+                one, for the endpoints whose next links don't carry them.
+
+        Yields:
+            dict: The items of the listing.
+        """
+        next_url = url
+        while next_url:
+            page = self._get_page(authorization, next_url, query_params)
+            yield from page.get(items_key, [])
+            next_url = page.get("links", {}).get("next", {}).get("uri")
+            if not repeat_params:
+                query_params = None
+
+    @wrap_http_error
+    def _get_page(self, authorization: Authorization, url: str, query_params: dict | None) -> dict:
+        response = self._session.get(
+            urljoin(self._config.api_base_url, url),
+            headers=self._get_headers(authorization),
+            params=query_params,
+            timeout=self._TIMEOUT,
+        )
+        response.raise_for_status()
+        return response.json()
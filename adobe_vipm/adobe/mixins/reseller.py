@@ -2,6 +2,7 @@ import json
 from hashlib import sha256
 from urllib.parse import urljoin
 
+from adobe_vipm.adobe.dataclasses import Authorization
 from adobe_vipm.adobe.errors import wrap_http_error
 from adobe_vipm.adobe.utils import join_phone_number
 
@@ -29,18 +30,7 @@ class ResellerClientMixin:
             str: Reseller ID.
         """
         authorization = self._config.get_authorization(authorization_id)
-        payload = {
-            "externalReferenceId": reseller_id,
-            "distributorId": authorization.distributor_id,
-            "companyProfile": {
-                "companyName": reseller_data["companyName"],
-                "preferredLanguage": self._config.get_preferred_language(
-                    reseller_data["address"]["country"]
-                ),
-                "address": self._get_address(reseller_data["address"], reseller_data["contact"]),
-                "contacts": [self._get_contact(reseller_data["contact"])],
-            },
-        }
+        payload = self._build_reseller_payload(authorization, reseller_id, reseller_data)
         response = self._session.post(
             urljoin(self._config.api_base_url, "/v3/resellers"),
             headers=self._get_headers(
@@ -65,6 +55,22 @@ class ResellerClientMixin:
         )
         return adobe_reseller_id
 
+    def _build_reseller_payload(
+        self, authorization: Authorization, reseller_id: str, reseller_data: dict
+    ) -> dict:
+        return {
+            "externalReferenceId": reseller_id,
+            "distributorId": authorization.distributor_id,
+            "companyProfile": {
+                "companyName": reseller_data["companyName"],
+                "preferredLanguage": self._config.get_preferred_language(
+                    reseller_data["address"]["country"]
+                ),
+                "address": self._get_address(reseller_data["address"], reseller_data["contact"]),
+                "contacts": [self._get_contact(reseller_data["contact"])],
+            },
+        }
+
     def _get_address(self, address: dict, contact: dict) -> dict:
         return {
             "country": address["country"],
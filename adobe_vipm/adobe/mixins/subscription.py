@@ -1,14 +1,124 @@
 from urllib.parse import urljoin
 
 from adobe_vipm.adobe.constants import AdobeSubscriptionStatus
+from adobe_vipm.adobe.dataclasses import Authorization
 from adobe_vipm.adobe.errors import wrap_http_error
+from adobe_vipm.adobe.request_cache import cached_read, invalidates_customer
 from adobe_vipm.flows.constants import Param
 from adobe_vipm.utils import get_partial_sku
 
 
+def filter_subscriptions_by_deployment(subscriptions: dict, deployment_id: str | None) -> dict:
+    """
+    Filters the subscriptions of a customer by deployment.
+
+    Args:
+        subscriptions: The subscriptions of the customer, as returned by Adobe.
+        deployment_id: Identifier of the deployment, None for the ones of no deployment.
+
+    Returns:
+        The subscriptions of the deployment.
+    """
+    filtered_items = [
+        sub for sub in subscriptions["items"] if sub.get(Param.DEPLOYMENT_ID) == deployment_id
+    ]
+    return {
+        "items": filtered_items,
+        "links": subscriptions["links"],
+        "totalCount": len(filtered_items),
+    }
+
+
+def filter_active_subscriptions_for_offers(
+    subscriptions: list[dict], base_offer_ids: list[str]
+) -> list[dict]:
+    """
+    Filters the active subscriptions of the given offer ids.
+
+    Args:
+        subscriptions: The subscriptions to filter.
+        base_offer_ids: List of base parts of whole Adobe Offer Ids
+
+    Returns:
+        The active subscriptions of the offers.
+    """
+    active_subscriptions = filter(
+        lambda sub: sub["status"] == AdobeSubscriptionStatus.ACTIVE,
+        subscriptions,
+    )
+    return list(
+        filter(
+            lambda sub: get_partial_sku(sub["offerId"]) in base_offer_ids,
+            active_subscriptions,
+        )
+    )
+
+
+def get_update_subscription_payload(
+    *, auto_renewal: bool, quantity: int | None, flex_discount_codes: list[str] | None
+) -> dict:
+    """
+    Builds the payload updating the auto renewal of a subscription.
+
+    Args:
+        auto_renewal: Set if the subscription must be auto renewed on the anniversary date.
+        quantity: The quantity of licenses renewed on the anniversary date, None to leave it
+            unchanged.
+        flex_discount_codes: Flexible discount codes to apply at the renewal, None to leave
+            them unchanged.
+
+    Returns:
+        The update payload.
+    """
+    payload = {
+        "autoRenewal": {
+            "enabled": auto_renewal,
+        },
+    }
+    # Zero is a meaningful renewal quantity (e.g. restoring a snapshot);
+    # only None means "leave it unchanged".
+    if quantity is not None:
+        payload["autoRenewal"][Param.RENEWAL_QUANTITY.value] = quantity
+    if flex_discount_codes is not None:
+        payload["autoRenewal"]["flexDiscountCodes"] = flex_discount_codes
+    return payload
+
+
+def get_new_subscription_payload(
+    authorization: Authorization,
+    offer_id: str,
+    renewal_quantity: int,
+    deployment_id: str | None,
+) -> dict:
+    """
+    Builds the payload creating a scheduled subscription.
+
+    Args:
+        authorization: The authorization the subscription is created with.
+        offer_id: Full Adobe offer id of the net-new product.
+        renewal_quantity: The quantity of licenses to activate at the anniversary date.
+        deployment_id: Identifier of the deployment to which the subscription belongs to.
+
+    Returns:
+        The creation payload.
+    """
+    payload = {
+        "offerId": offer_id,
+        "autoRenewal": {
+            "enabled": True,
+            Param.RENEWAL_QUANTITY.value: renewal_quantity,
+        },
+        "currencyCode": authorization.currency,
+    }
+    if deployment_id:
+        payload["deploymentId"] = deployment_id
+    return payload
+
+
 class SubscriptionClientMixin:
     """Adobe Client Mixin to manage Subscription flows of Adobe VIPM."""
 
+    @cached_read
     @wrap_http_error
     def get_subscription(
         self, authorization_id: str, customer_id: str, subscription_id: str
@@ -37,6 +147,7 @@ class SubscriptionClientMixin:
         response.raise_for_status()
         return response.json()
 
+    @cached_read
     @wrap_http_error
     def get_subscriptions(self, authorization_id: str, customer_id: str) -> dict:
         """
@@ -77,14 +188,7 @@ class SubscriptionClientMixin:
         subscriptions = self.get_subscriptions(
             authorization_id=authorization_id, customer_id=customer_id
         )
-        filtered_items = [
-            sub for sub in subscriptions["items"] if sub.get(Param.DEPLOYMENT_ID) == deployment_id
-        ]
-        return {
-            "items": filtered_items,
-            "links": subscriptions["links"],
-            "totalCount": len(filtered_items),
-        }
+        return filter_subscriptions_by_deployment(subscriptions, deployment_id)
 
     @wrap_http_error
     def get_subscriptions_for_offers(
@@ -111,18 +215,9 @@ class SubscriptionClientMixin:
         subscriptions = self.get_subscriptions_by_deployment(
             authorization_id, customer_id, deployment_id
         )["items"]
-        active_subscriptions = filter(
-            lambda sub: sub["status"] == AdobeSubscriptionStatus.ACTIVE,
-            subscriptions,
-        )
-
-        return list(
-            filter(
-                lambda sub: get_partial_sku(sub["offerId"]) in base_offer_ids,
-                active_subscriptions,
-            )
-        )
+        return filter_active_subscriptions_for_offers(subscriptions, base_offer_ids)
 
+    @invalidates_customer
     @wrap_http_error
     def update_subscription(
         self,
@@ -154,18 +249,9 @@ class SubscriptionClientMixin:
         """
         authorization = self._config.get_authorization(authorization_id)
         headers = self._get_headers(authorization)
-        payload = {
-            "autoRenewal": {
-                "enabled": auto_renewal,
-            },
-        }
-        # Zero is a meaningful renewal quantity (e.g. restoring a snapshot);
-        # only None means "leave it unchanged".
-        if quantity is not None:
-            payload["autoRenewal"][Param.RENEWAL_QUANTITY.value] = quantity
-        if flex_discount_codes is not None:
-            payload["autoRenewal"]["flexDiscountCodes"] = flex_discount_codes
-
+        payload = get_update_subscription_payload(
+            auto_renewal=auto_renewal, quantity=quantity, flex_discount_codes=flex_discount_codes
+        )
         response = self._session.patch(
             urljoin(
                 self._config.api_base_url,
@@ -180,6 +266,7 @@ class SubscriptionClientMixin:
         # missed fields are offerId, usedQuantity
         return self.get_subscription(authorization_id, customer_id, subscription_id)
 
+    @invalidates_customer
     @wrap_http_error
     def create_customer_subscription(
         self,
@@ -214,17 +301,9 @@ class SubscriptionClientMixin:
         headers = self._get_headers(authorization)
         if recommendation_tracker_id:
             headers["x-recommendation-tracker-id"] = recommendation_tracker_id
-        payload = {
-            "offerId": offer_id,
-            "autoRenewal": {
-                "enabled": True,
-                Param.RENEWAL_QUANTITY.value: renewal_quantity,
-            },
-            "currencyCode": authorization.currency,
-        }
-        if deployment_id:
-            payload["deploymentId"] = deployment_id
-
+        payload = get_new_subscription_payload(
+            authorization, offer_id, renewal_quantity, deployment_id
+        )
         response = self._session.post(
             urljoin(self._config.api_base_url, f"/v3/customers/{customer_id}/subscriptions"),
             headers=headers,
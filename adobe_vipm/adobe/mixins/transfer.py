@@ -3,6 +3,7 @@ from urllib.parse import urljoin
 from adobe_vipm.adobe.constants import ResellerChangeAction
 from adobe_vipm.adobe.dataclasses import Reseller
 from adobe_vipm.adobe.errors import wrap_http_error
+from adobe_vipm.adobe.request_cache import invalidates_customer
 
 
 class TransferClientMixin:
@@ -40,6 +41,7 @@ class TransferClientMixin:
         response.raise_for_status()
         return response.json()
 
+    @invalidates_customer
     @wrap_http_error
     def create_transfer(
         self,
@@ -131,6 +133,7 @@ class TransferClientMixin:
         response.raise_for_status()
         return response.json()
 
+    @invalidates_customer
     @wrap_http_error
     def reseller_change_request(
         self,
@@ -0,0 +1,292 @@
+import functools
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import defaultdict, deque
+from collections.abc import Callable, Collection
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from http import HTTPStatus
+from pathlib import Path
+
+import httpx
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+
+from adobe_vipm.adobe.rate_limit_store import (
+    BucketState,
+    BucketStore,
+    BucketUpdateResult,
+    FileBucketStore,
+    MemoryBucketStore,
+    extend_pause,
+)
+
+logger = logging.getLogger(__name__)
+
+RATE_LIMIT_BACKEND_MEMORY = "memory"
+RATE_LIMIT_BACKEND_FILE = "file"
+DEFAULT_RATE_LIMIT_DIRNAME = "adobe_rate_limit"
+# Requests per second allowed per authorization, 0 disables the limit but keeps honouring
+# the Retry-After of the throttled responses.
+DEFAULT_RATE_LIMIT_PER_SECOND = 0
+DEFAULT_RATE_LIMIT_BURST = 10
+# Pause applied to an authorization throttled by Adobe without a Retry-After header.
+DEFAULT_RETRY_AFTER_SECONDS = 1
+METRICS_WINDOW_SECONDS = 60
+
+
+@dataclass
+class RateLimitMetrics:
+    """Metrics of the requests of a single authorization."""
+
+    acquired: int = 0
+    throttled: int = 0
+    waited_seconds: float = 0
+    recent: deque = field(default_factory=deque, repr=False)
+
+    def record_request(self, now: float) -> None:
+        """Records a request sent at `now`, forgetting the ones out of the metrics window."""
+        self.recent.append(now)
+        self._drop_expired(now)
+
+    def throughput(self, now: float) -> float:
+        """Returns the requests per second sent in the last metrics window."""
+        self._drop_expired(now)
+        return len(self.recent) / METRICS_WINDOW_SECONDS
+
+    def _drop_expired(self, now: float) -> None:
+        while self.recent and self.recent[0] <= now - METRICS_WINDOW_SECONDS:
+            self.recent.popleft()
+
+
+class RateLimiter:
+    """
+    Token bucket rate limiter of the Adobe API requests, with a bucket per authorization.
+
+    Every request takes a token from the bucket of its authorization, waiting for the bucket
+    to refill when empty. A throttled response pauses the whole bucket for the time in its
+    Retry-After header, so that the other callers sharing the authorization quota wait
+    instead of being throttled too.
+
+    Attributes:
+        rate: Tokens added to each bucket per second, 0 for no limit.
+        capacity: Maximum number of tokens of each bucket, the allowed burst.
+    """
+
+    def __init__(self, store: BucketStore, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._store = store
+        self._metrics_lock = threading.Lock()
+        self._metrics: dict[str, RateLimitMetrics] = defaultdict(RateLimitMetrics)
+
+    def acquire(self, key: str) -> float:
+        """
+        Takes a token from the bucket, waiting until one is available.
+
+        Args:
+            key: The bucket key, the authorization UK.
+
+        Returns:
+            The seconds waited for the token.
+        """
+        waited: float = 0
+        wait = self.try_acquire(key)
+        while wait > 0:
+            time.sleep(wait)
+            waited += wait
+            wait = self.try_acquire(key, waited)
+        return waited
+
+    def try_acquire(self, key: str, waited: float = 0) -> float:
+        """
+        Takes a token from the bucket if one is available, without waiting.
+
+        Callers that can't block the thread, like the async client, wait the returned time
+        their own way and try again.
+
+        Args:
+            key: The bucket key, the authorization UK.
+            waited: The seconds already waited for the token, recorded once it is taken.
+
+        Returns:
+            The seconds to wait before trying again, 0 if the token was taken.
+        """
+        wait = self._store.update(key, self._take_token)
+        if wait > 0:
+            return wait
+
+        with self._metrics_lock:
+            metrics = self._metrics[key]
+            metrics.acquired += 1
+            metrics.waited_seconds += waited
+            metrics.record_request(time.time())
+        return 0
+
+    def pause(self, key: str, seconds: float) -> None:
+        """
+        Stops handing out tokens from the bucket for the given amount of seconds.
+
+        Args:
+            key: The bucket key, the authorization UK.
+            seconds: The length of the pause.
+        """
+        self._store.update(key, functools.partial(extend_pause, self.capacity, seconds))
+
+    def record_response(self, key: str, response: requests.Response | httpx.Response) -> None:
+        """
+        Pauses the bucket if Adobe throttled the request.
+
+        Args:
+            key: The bucket key, the authorization UK.
+            response: The Adobe API response, of the blocking or the async client.
+        """
+        if response.status_code != HTTPStatus.TOO_MANY_REQUESTS:
+            return
+
+        retry_after = get_retry_after_seconds(response)
+        logger.warning("Adobe throttled authorization %s, pausing for %ss", key, retry_after)
+        with self._metrics_lock:
+            self._metrics[key].throttled += 1
+        self.pause(key, retry_after)
+
+    def collect_metrics(self) -> dict[str, dict]:
+        """Returns the acquired, throttled, waited seconds and throughput per authorization."""
+        now = time.time()
+        with self._metrics_lock:
+            return {
+                key: {
+                    "acquired": metrics.acquired,
+                    "throttled": metrics.throttled,
+                    "waited_seconds": round(metrics.waited_seconds, 3),
+                    "throughput": metrics.throughput(now),
+                }
+                for key, metrics in self._metrics.items()
+            }
+
+    def _take_token(self, state: BucketState | None, now: float) -> BucketUpdateResult:
+        state = state or BucketState(tokens=self.capacity, updated_at=now)
+        if state.paused_until > now:
+            return state, state.paused_until - now
+        if self.rate <= 0:
+            return state, 0
+
+        refill = (now - state.updated_at) * self.rate
+        tokens = min(self.capacity, state.tokens + refill)
+        if tokens >= 1:
+            return BucketState(tokens - 1, now, state.paused_until), 0
+        return BucketState(tokens, now, state.paused_until), (1 - tokens) / self.rate
+
+
+class RateLimitedHTTPAdapter(HTTPAdapter):
+    """
+    HTTP adapter passing every request through the rate limiter of its authorization.
+
+    Throttled requests are retried here rather than by the urllib3 retry policy, so that
+    every attempt waits for the pause set by the throttled response and takes a token.
+
+    Attributes:
+        rate_limiter: The rate limiter of the requests.
+        get_key: Returns the bucket key of a request, None for requests not rate limited.
+        throttled_retries: Max retries of a throttled request.
+        throttled_retry_methods: HTTP methods whose throttled requests are retried.
+    """
+
+    def __init__(
+        self,
+        rate_limiter: RateLimiter,
+        get_key: Callable[[requests.PreparedRequest], str | None],
+        *,
+        throttled_retries: int = 0,
+        throttled_retry_methods: Collection[str] = (),
+        **kwargs,
+    ):
+        self.rate_limiter = rate_limiter
+        self.get_key = get_key
+        self.throttled_retries = throttled_retries
+        self.throttled_retry_methods = throttled_retry_methods
+        super().__init__(**kwargs)
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        """Sends the request once a token of its authorization bucket is available."""
+        key = self.get_key(request)
+        if key is None:
+            return super().send(request, **kwargs)
+
+        retries = self.throttled_retries if request.method in self.throttled_retry_methods else 0
+        while True:
+            self.rate_limiter.acquire(key)
+            response = super().send(request, **kwargs)
+            self.rate_limiter.record_response(key, response)
+            if response.status_code != HTTPStatus.TOO_MANY_REQUESTS or retries <= 0:
+                return response
+            retries -= 1
+            logger.info("Retrying throttled %s %s", request.method, request.url)
+            response.close()
+
+
+def get_retry_after_seconds(response: requests.Response | httpx.Response) -> float:
+    """
+    Returns the seconds to wait requested by the Retry-After header of the response.
+
+    Args:
+        response: The throttled response.
+
+    Returns:
+        The seconds to wait, `DEFAULT_RETRY_AFTER_SECONDS` if the header is missing or invalid.
+    """
+    retry_after = response.headers.get("Retry-After", "")
+    if retry_after.isdigit():
+        return float(retry_after)
+    try:
+        retry_at = parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return DEFAULT_RETRY_AFTER_SECONDS
+    return max(retry_at.timestamp() - time.time(), 0)
+
+
+_RATE_LIMITER_LOCK = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """
+    Returns the rate limiter shared by all the Adobe clients of the process.
+
+    `ADOBE_RATE_LIMIT_PER_SECOND` and `ADOBE_RATE_LIMIT_BURST` set the rate and the
+    capacity of the bucket of each authorization. `ADOBE_RATE_LIMIT_BACKEND` selects between
+    `memory` (default), shared by the threads of the process, and `file`, shared by the
+    processes of the node through the files in `ADOBE_RATE_LIMIT_PATH`.
+
+    Returns:
+        RateLimiter: The shared rate limiter.
+    """
+    with _RATE_LIMITER_LOCK:
+        return _create_rate_limiter()
+
+
+@functools.cache
+def _create_rate_limiter() -> RateLimiter:
+    backend = settings.EXTENSION_CONFIG.get("ADOBE_RATE_LIMIT_BACKEND", RATE_LIMIT_BACKEND_MEMORY)
+    store: BucketStore = MemoryBucketStore()
+    if backend == RATE_LIMIT_BACKEND_FILE:
+        path = settings.EXTENSION_CONFIG.get("ADOBE_RATE_LIMIT_PATH")
+        store = FileBucketStore(
+            Path(
+                path or Path(tempfile.gettempdir()) / f"{DEFAULT_RATE_LIMIT_DIRNAME}_{os.getuid()}"
+            )
+        )
+    return RateLimiter(
+        store,
+        rate=float(
+            settings.EXTENSION_CONFIG.get(
+                "ADOBE_RATE_LIMIT_PER_SECOND", DEFAULT_RATE_LIMIT_PER_SECOND
+            )
+        ),
+        capacity=float(
+            settings.EXTENSION_CONFIG.get("ADOBE_RATE_LIMIT_BURST", DEFAULT_RATE_LIMIT_BURST)
+        ),
+    )
@@ -0,0 +1,107 @@
+import fcntl
+import hashlib
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TextIO
+
+from adobe_vipm.private_files import ensure_private_directory, open_private_file
+
+
+@dataclass(frozen=True)
+class BucketState:
+    """State of the token bucket of a single authorization."""
+
+    tokens: float
+    updated_at: float
+    paused_until: float = 0
+
+
+BucketUpdateResult = tuple[BucketState, float]
+BucketUpdate = Callable[[BucketState | None, float], BucketUpdateResult]
+
+
+class BucketStore(ABC):
+    """Stores the token buckets, applying every update atomically."""
+
+    @abstractmethod
+    def update(self, key: str, update: BucketUpdate) -> float:
+        """
+        Applies the update to the bucket state and stores the new state.
+
+        Args:
+            key: The bucket key.
+            update: Callable receiving the current state, None if the bucket doesn't exist
+                yet, and the current time, returning the new state and a result.
+
+        Returns:
+            The result returned by the update.
+        """
+        raise NotImplementedError
+
+
+class MemoryBucketStore(BucketStore):
+    """Bucket store shared by the threads of the current process."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._states: dict[str, BucketState] = {}
+
+    def update(self, key: str, update: BucketUpdate) -> float:
+        """Applies the update to the bucket state and stores the new state."""
+        with self._lock:
+            state, update_result = update(self._states.get(key), time.time())
+            self._states[key] = state
+        return update_result
+
+
+class FileBucketStore(BucketStore):
+    """Bucket store shared by the processes of the node through locked files."""
+
+    def __init__(self, directory: Path):
+        self._directory = directory
+        self._directory.parent.mkdir(parents=True, exist_ok=True)
+        ensure_private_directory(self._directory)
+        self._lock = threading.Lock()
+
+    def update(self, key: str, update: BucketUpdate) -> float:
+        """Applies the update to the bucket state and stores the new state."""
+        key_hash = hashlib.sha256(key.encode()).hexdigest()
+        path = self._directory / f"{key_hash}.json"
+        with self._lock, open_private_file(path) as bucket_file:
+            fcntl.flock(bucket_file, fcntl.LOCK_EX)
+            state, update_result = update(_read_state(bucket_file), time.time())
+            bucket_file.seek(0)
+            bucket_file.truncate()
+            bucket_file.write(json.dumps(asdict(state)))
+        return update_result
+
+
+def extend_pause(
+    capacity: float, seconds: float, state: BucketState | None, now: float
+) -> BucketUpdateResult:
+    """
+    Bucket update pausing the bucket for the given amount of seconds from now.
+
+    Args:
+        capacity: Tokens of the bucket when it doesn't exist yet.
+        seconds: The length of the pause.
+        state: The current bucket state, None if the bucket doesn't exist yet.
+        now: The current time.
+
+    Returns:
+        The paused bucket state and the time the pause ends.
+    """
+    state = state or BucketState(tokens=capacity, updated_at=now)
+    paused_until = max(state.paused_until, now + seconds)
+    return BucketState(state.tokens, state.updated_at, paused_until), paused_until
+
+
+def _read_state(bucket_file: TextIO) -> BucketState | None:
+    bucket_file.seek(0)
+    stored_state = bucket_file.read()
+    return BucketState(**json.loads(stored_state)) if stored_state else None
@@ -0,0 +1,232 @@
+import copy
+import inspect
+import logging
+import threading
+from collections.abc import Awaitable, Callable, Generator, Hashable
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import partial, wraps
+from typing import Any, ParamSpec, TypeVar
+
+Param = ParamSpec("Param")  # noqa: WPS110
+RetType = TypeVar("RetType")
+
+logger = logging.getLogger(__name__)
+
+
+class RequestCache:
+    """
+    Adobe API responses read while processing a single order or agreement.
+
+    The entries are keyed by (authorization, customer, resource, arguments), so that a write
+    to a customer drops all the responses read for it.
+
+    Attributes:
+        hits: Number of reads answered by the cache.
+        misses: Number of reads sent to Adobe.
+    """
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: dict[Hashable, Any] = {}
+        # Bumped by every invalidation, so that a response loaded meanwhile isn't stored
+        self._generation = 0
+
+    def get_or_load(self, key: tuple, loader: Callable[[], Any]) -> Any:
+        """
+        Returns a copy of the response stored for the key, loading it when missing.
+
+        Copies are returned so that callers updating the response don't alter the cached one.
+
+        Args:
+            key: The (authorization, customer, resource, arguments) key.
+            loader: Callable reading the response from Adobe.
+
+        Returns:
+            The cached or loaded response.
+        """
+        is_cached, response, generation = self._lookup(key)
+        if is_cached:
+            return response
+
+        response = loader()
+        self._store(key, response, generation)
+        return response
+
+    async def get_or_load_async(self, key: tuple, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Same as `get_or_load`, for a loader reading the response with the async client."""
+        is_cached, response, generation = self._lookup(key)
+        if is_cached:
+            return response
+
+        response = await loader()
+        self._store(key, response, generation)
+        return response
+
+    def invalidate(self, authorization_id: str, customer_id: str | None = None) -> None:
+        """Drops the responses read for the customer, for all the customers if not given."""
+        with self._lock:
+            self._generation += 1
+            self._entries = {
+                key: response
+                for key, response in self._entries.items()
+                if key[0] != authorization_id or customer_id not in {None, key[1]}
+            }
+
+    def _lookup(self, key: tuple) -> tuple[bool, Any, int]:
+        with self._lock:
+            if key in self._entries:
+                self.hits += 1
+                return True, copy.deepcopy(self._entries.get(key)), self._generation
+            self.misses += 1
+            return False, None, self._generation
+
+    def _store(self, key: tuple, response: Any, generation: int) -> None:
+        with self._lock:
+            if generation == self._generation:
+                self._entries[key] = copy.deepcopy(response)
+
+
+_REQUEST_CACHE: ContextVar[RequestCache | None] = ContextVar("adobe_request_cache", default=None)
+
+
+def get_request_cache() -> RequestCache | None:
+    """Returns the request cache of the current scope, None outside of a scope."""
+    return _REQUEST_CACHE.get()
+
+
+@contextmanager
+def request_cache_scope(scope_id: str) -> Generator[RequestCache]:
+    """
+    Caches the Adobe reads made while processing an order or an agreement.
+
+    A scope opened inside another one shares the outer cache. The hits and misses are logged
+    when the outermost scope is closed, if any read went through the cache.
+
+    Args:
+        scope_id: Identifier of the processed object, the order or agreement ID.
+
+    Yields:
+        RequestCache: The cache of the scope.
+    """
+    current_cache = _REQUEST_CACHE.get()
+    if current_cache is not None:
+        yield current_cache
+        return
+
+    cache = RequestCache()
+    token = _REQUEST_CACHE.set(cache)
+    try:
+        yield cache
+    finally:
+        _REQUEST_CACHE.reset(token)
+        if cache.hits or cache.misses:
+            logger.info(
+                "Adobe request cache for %s: %s hits, %s misses", scope_id, cache.hits, cache.misses
+            )
+
+
+def _get_call_arguments(func: Callable, args: tuple, kwargs: dict) -> dict[str, Any]:
+    bound = inspect.signature(func).bind(*args, **kwargs)
+    bound.apply_defaults()
+    return dict(bound.arguments)
+
+
+def _get_read_key(func: Callable, args: tuple, kwargs: dict) -> tuple:
+    arguments = _get_call_arguments(func, args, kwargs)
+    arguments.pop("self")
+    authorization_id = arguments.pop("authorization_id")
+    customer_id = arguments.pop("customer_id")
+    return (authorization_id, customer_id, func.__name__, tuple(arguments.items()))
+
+
+def cached_read(func: Callable[Param, RetType]) -> Callable[Param, RetType]:  # ruff:ignore[non-pep695-generic-function]
+    """
+    Answers the Adobe read from the request cache of the current scope, if any.
+
+    The decorated method must take the `authorization_id` and the `customer_id`.
+
+    Args:
+        func: Client method reading a customer resource.
+
+    Returns:
+        callable: wrapped function
+    """
+    if inspect.iscoroutinefunction(func):
+
+        @wraps(func)
+        async def _async_wrapper(*args, **kwargs):  # noqa: WPS430
+            cache = _REQUEST_CACHE.get()
+            load = partial(func, *args, **kwargs)
+            if cache is None:
+                return await load()
+            return await cache.get_or_load_async(_get_read_key(func, args, kwargs), load)
+
+        return _async_wrapper
+
+    @wraps(func)
+    def _wrapper(*args: Param.args, **kwargs: Param.kwargs) -> RetType:  # noqa: WPS430
+        cache = _REQUEST_CACHE.get()
+        if cache is None:
+            return func(*args, **kwargs)
+
+        key = _get_read_key(func, args, kwargs)
+        return cache.get_or_load(key, lambda: func(*args, **kwargs))
+
+    return _wrapper
+
+
+def invalidates_customer(func: Callable[Param, RetType]) -> Callable[Param, RetType]:  # ruff:ignore[non-pep695-generic-function]
+    """
+    Drops the cached reads of the customer before and after calling the decorated method.
+
+    The reads made by the decorated method itself and the ones made after the call, even
+    if it failed, get the updated state of the customer. The decorated method must take the
+    `authorization_id`, and the `customer_id` unless it creates or moves customers, in which
+    case the reads of all the customers of the authorization are dropped.
+
+    Args:
+        func: Client method changing a customer resource.
+
+    Returns:
+        callable: wrapped function
+    """
+    if inspect.iscoroutinefunction(func):
+
+        @wraps(func)
+        async def _async_wrapper(*args, **kwargs):  # noqa: WPS430
+            cache = _REQUEST_CACHE.get()
+            if cache is None:
+                return await func(*args, **kwargs)
+
+            arguments = _get_call_arguments(func, args, kwargs)
+            authorization_id, customer_id = (
+                arguments["authorization_id"],
+                arguments.get("customer_id"),
+            )
+            cache.invalidate(authorization_id, customer_id)
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                cache.invalidate(authorization_id, customer_id)
+
+        return _async_wrapper
+
+    @wraps(func)
+    def _wrapper(*args: Param.args, **kwargs: Param.kwargs) -> RetType:  # noqa: WPS430
+        cache = _REQUEST_CACHE.get()
+        if cache is None:
+            return func(*args, **kwargs)
+
+        arguments = _get_call_arguments(func, args, kwargs)
+        authorization_id = arguments["authorization_id"]
+        customer_id = arguments.get("customer_id")
+        cache.invalidate(authorization_id, customer_id)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            cache.invalidate(authorization_id, customer_id)
+
+    return _wrapper
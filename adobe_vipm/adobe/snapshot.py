@@ -0,0 +1,77 @@
+from collections import defaultdict
+from types import MappingProxyType
+
+from adobe_vipm.utils import get_3yc_commitment, get_partial_sku
+
+
+class AdobeCustomerView:
+    """
+    Read-only view of the fields of an Adobe customer.
+
+    Attributes:
+        customer: Adobe customer as returned by the Adobe API.
+    """
+
+    def __init__(self, customer: dict):
+        self.customer = customer
+
+    @property
+    def customer_id(self) -> str:
+        """Adobe customer ID."""
+        return self.customer["customerId"]
+
+    @property
+    def discounts(self) -> list[dict]:
+        """Customer discount levels per offer type."""
+        return self.customer.get("discounts", [])
+
+    @property
+    def commitment(self) -> dict:
+        """Customer 3YC commitment, empty if the customer has no 3YC benefit."""
+        return get_3yc_commitment(self.customer)
+
+
+class AdobeCustomerSnapshot(AdobeCustomerView):
+    """
+    Read-only view of an Adobe customer and its subscriptions with lookup indexes.
+
+    The indexes are built once, so flows processing many MPT subscriptions or assets can
+    resolve the related Adobe subscriptions without scanning the whole list each time.
+
+    Attributes:
+        customer: Adobe customer as returned by the Adobe API.
+        subscriptions: Adobe customer subscriptions as returned by the Adobe API.
+    """
+
+    def __init__(self, customer: dict, subscriptions: list[dict]):
+        super().__init__(customer)
+        self.subscriptions = subscriptions
+        self._by_id = {
+            subscription["subscriptionId"]: subscription for subscription in subscriptions
+        }
+        by_partial_sku = defaultdict(list)
+        by_deployment = defaultdict(list)
+        by_status = defaultdict(list)
+        for subscription in subscriptions:
+            by_partial_sku[get_partial_sku(subscription["offerId"])].append(subscription)
+            by_deployment[subscription.get("deploymentId", "")].append(subscription)
+            by_status[subscription["status"]].append(subscription)
+        self._by_partial_sku = MappingProxyType(by_partial_sku)
+        self._by_deployment = MappingProxyType(by_deployment)
+        self._by_status = MappingProxyType(by_status)
+
+    def get_subscription(self, subscription_id: str | None) -> dict | None:
+        """Returns the subscription with the given ID, if any."""
+        return self._by_id.get(subscription_id)
+
+    def get_subscriptions_by_partial_sku(self, sku: str) -> list[dict]:
+        """Returns the subscriptions for the given offer, compared by partial SKU."""
+        return self._by_partial_sku.get(get_partial_sku(sku), [])
+
+    def get_subscriptions_by_deployment(self, deployment_id: str) -> list[dict]:
+        """Returns the subscriptions of the deployment, an empty deployment ID for the main ones."""
+        return self._by_deployment.get(deployment_id, [])
+
+    def get_subscriptions_by_status(self, status: str) -> list[dict]:
+        """Returns the subscriptions in the given status."""
+        return self._by_status.get(status, [])
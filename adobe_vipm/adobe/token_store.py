@@ -0,0 +1,166 @@
+import datetime as dt
+import fcntl
+import json
+import os
+import sqlite3
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from contextlib import closing
+from pathlib import Path
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+from adobe_vipm.adobe.dataclasses import APIToken
+from adobe_vipm.private_files import ensure_private_file
+
+STORE_BACKEND_SQLITE = "sqlite"
+STORE_BACKEND_FILE = "file"
+# Seconds a process waits for another one refreshing the same token.
+SQLITE_LOCK_TIMEOUT_SECONDS = 60
+
+
+def is_token_fresh(token: APIToken | None, min_validity: dt.timedelta) -> bool:
+    """Checks if the token is still valid for at least the given amount of time."""
+    if token is None:
+        return False
+    return token.expires > dt.datetime.now(tz=dt.UTC) + min_validity
+
+
+class TokenStore(ABC):
+    """Adobe API tokens shared by the processes of the node."""
+
+    @abstractmethod
+    def get_or_refresh(
+        self, key: str, refresh: Callable[[], APIToken], min_validity: dt.timedelta
+    ) -> APIToken:
+        """
+        Returns the stored token, refreshing it if missing or expiring.
+
+        The check and the refresh run under a lock shared with the other processes, so only
+        one of them requests a new token while the others wait and reuse it.
+
+        Args:
+            key: The token key, the authorization UK.
+            refresh: Callable requesting a new token to Adobe.
+            min_validity: Refresh the token if it expires within this amount of time.
+
+        Returns:
+            The stored or refreshed token.
+        """
+        raise NotImplementedError
+
+
+class SqliteTokenStore(TokenStore):
+    """Token store backed by a local sqlite database."""
+
+    def __init__(self, path: Path):
+        self._path = path
+        ensure_private_file(self._path)
+        with closing(self._connect()) as connection, connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS adobe_tokens ("
+                "key TEXT PRIMARY KEY, token TEXT NOT NULL, expires TEXT NOT NULL)"
+            )
+
+    def get_or_refresh(
+        self, key: str, refresh: Callable[[], APIToken], min_validity: dt.timedelta
+    ) -> APIToken:
+        """Returns the stored token, refreshing it if missing or expiring."""
+        with closing(self._connect()) as connection:
+            # Takes the database write lock, released by the commit or the rollback
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                token = self._get_or_refresh(connection, key, refresh, min_validity)
+            except Exception:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+        return token
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(
+            self._path, timeout=SQLITE_LOCK_TIMEOUT_SECONDS, isolation_level=None
+        )
+
+    def _get_or_refresh(
+        self,
+        connection: sqlite3.Connection,
+        key: str,
+        refresh: Callable[[], APIToken],
+        min_validity: dt.timedelta,
+    ) -> APIToken:
+        row = connection.execute(
+            "SELECT token, expires FROM adobe_tokens WHERE key = ?", (key,)
+        ).fetchone()
+        if row:
+            token = _to_api_token(*row)
+            if is_token_fresh(token, min_validity):
+                return token
+
+        token = refresh()
+        connection.execute(
+            "INSERT OR REPLACE INTO adobe_tokens (key, token, expires) VALUES (?, ?, ?)",
+            (key, token.token, token.expires.isoformat()),
+        )
+        return token
+
+
+class FileTokenStore(TokenStore):
+    """Token store keeping the tokens in a JSON file locked while in use."""
+
+    def __init__(self, path: Path):
+        self._path = path
+        ensure_private_file(self._path)
+
+    def get_or_refresh(
+        self, key: str, refresh: Callable[[], APIToken], min_validity: dt.timedelta
+    ) -> APIToken:
+        """Returns the stored token, refreshing it if missing or expiring."""
+        file_descriptor = os.open(self._path, os.O_RDWR | os.O_NOFOLLOW)
+        with os.fdopen(file_descriptor, "r+", encoding="utf-8") as token_file:
+            fcntl.flock(token_file, fcntl.LOCK_EX)
+            stored = json.loads(token_file.read() or "{}")
+            stored_token = stored.get(key)
+            if stored_token:
+                token = _to_api_token(stored_token["token"], stored_token["expires"])
+                if is_token_fresh(token, min_validity):
+                    return token
+
+            token = refresh()
+            stored[key] = {"token": token.token, "expires": token.expires.isoformat()}
+            token_file.seek(0)
+            token_file.truncate()
+            token_file.write(json.dumps(stored))
+        return token
+
+
+def _to_api_token(token: str, expires: str) -> APIToken:
+    return APIToken(token, dt.datetime.fromisoformat(expires))
+
+
+def get_token_store() -> TokenStore | None:
+    """
+    Builds the token store configured in the extension settings.
+
+    `ADOBE_TOKEN_STORE_BACKEND` selects between `sqlite` and `file`, tokens are kept by each
+    process if not set. `ADOBE_TOKEN_STORE_PATH` sets the location of the store, a private
+    path of the extension user, and is required by both backends.
+
+    Returns:
+        The configured token store, None if tokens aren't shared between processes.
+
+    Raises:
+        ImproperlyConfigured: If a backend is set without the store path.
+    """
+    backend = settings.EXTENSION_CONFIG.get("ADOBE_TOKEN_STORE_BACKEND")
+    if backend not in {STORE_BACKEND_SQLITE, STORE_BACKEND_FILE}:
+        return None
+    path = settings.EXTENSION_CONFIG.get("ADOBE_TOKEN_STORE_PATH")
+    if not path:
+        raise ImproperlyConfigured(
+            "ADOBE_TOKEN_STORE_PATH is required by the shared Adobe token store."
+        )
+    if backend == STORE_BACKEND_SQLITE:
+        return SqliteTokenStore(Path(path))
+    return FileTokenStore(Path(path))
@@ -1,10 +1,10 @@
 import datetime as dt
-from collections import defaultdict
+import math
+import threading
 from dataclasses import dataclass
 from functools import cache
 
 from django.conf import settings
-from mpt_extension_sdk.mpt_http.utils import find_first
 from mpt_extension_sdk.runtime.djapp.conf import get_for_product
 from pyairtable.api.retrying import retry_strategy
 from pyairtable.formulas import (
@@ -23,6 +23,13 @@ from pyairtable.orm import Model, fields
 from requests import HTTPError
 
 from adobe_vipm.adobe.errors import AdobeProductNotFoundError
+from adobe_vipm.airtable.pricelist import (
+    PRICE_WINDOW_CACHE_MAX_ENTRIES,
+    PriceListMirror,
+    PriceWindow,
+    PriceWindowCache,
+)
+from adobe_vipm.cache import TTLCache
 from adobe_vipm.flows.constants import MARKET_SEGMENT_TO_AIRTABLE_SEGMENT
 from adobe_vipm.utils import get_commitment_start_date
 
@@ -40,7 +47,11 @@ TYPE_3YC_LICENSE = "License"
 
 AIRTABLE_RETRY_STRATEGY = retry_strategy(status_forcelist=(429, 500, 502, 503, 504))
 
-PRICELIST_CACHE = defaultdict(list)
+PRICELIST_CACHE: PriceWindowCache | None = None
+_PRICELIST_CACHE_LOCK = threading.Lock()
+_PRICELIST_MIRRORS_LOCK = threading.Lock()
+SKU_MAPPING_TTL = 3600
+SKU_MAPPING_CACHE = TTLCache(ttl=SKU_MAPPING_TTL)
 
 
 @dataclass(frozen=True)
@@ -459,6 +470,38 @@ def get_pricelist_model(base_info: AirTableBaseInfo):
     return PriceList
 
 
+def get_pricelist_mirror(product_id: str, currency: str) -> PriceListMirror | None:
+    """
+    Returns the local mirror of the product price list in the given currency.
+
+    The mirror is enabled setting `AIRTABLE_PRICELIST_MIRROR_REFRESH_SECONDS` to the
+    minimum amount of seconds between two incremental refreshes of the mirror.
+
+    Args:
+        product_id: The ID of the product used to determine the AirTable base.
+        currency: The currency of the prices.
+
+    Returns:
+        PriceListMirror: The price list mirror, None if the mirror is disabled.
+    """
+    refresh_seconds = int(
+        settings.EXTENSION_CONFIG.get("AIRTABLE_PRICELIST_MIRROR_REFRESH_SECONDS", 0)
+    )
+    if refresh_seconds <= 0:
+        return None
+
+    with _PRICELIST_MIRRORS_LOCK:
+        return _create_pricelist_mirror(product_id, currency, refresh_seconds)
+
+
+@cache
+def _create_pricelist_mirror(
+    product_id: str, currency: str, refresh_seconds: int
+) -> PriceListMirror:
+    pricelist_model = get_pricelist_model(AirTableBaseInfo.for_pricing(product_id))
+    return PriceListMirror(pricelist_model.all, currency, dt.timedelta(seconds=refresh_seconds))
+
+
 def _get_prices_for_skus_from_airtable(
     product_id: str, currency: str, skus: list[str], column_name: str
 ) -> dict:
@@ -530,6 +573,10 @@ def get_prices_for_skus(product_id: str, currency: str, skus: list[str]) -> dict
     """
     if not skus:
         return {}
+    pricelist_mirror = get_pricelist_mirror(product_id, currency)
+    if pricelist_mirror:
+        return pricelist_mirror.get_prices_for_skus(skus)
+
     items = _get_prices_for_skus_from_airtable(product_id, currency, skus, "sku")
     prices = {item.sku: item.unit_pp for item in items}
 
@@ -564,6 +611,12 @@ def get_skus_with_available_prices(product_id: str, currency: str, skus: list[st
     """
     if not skus:
         return set()
+    pricelist_mirror = get_pricelist_mirror(product_id, currency)
+    if pricelist_mirror:
+        return pricelist_mirror.get_skus_with_available_prices(
+            dt.datetime.now(tz=dt.UTC).date(), skus
+        )
+
     items = _get_current_prices_for_skus_from_airtable(product_id, currency, skus, "partial_sku")
     return {item.partial_sku for item in items}
 
@@ -582,6 +635,10 @@ def get_skus_with_available_prices_3yc(
     """
     if not skus:
         return set()
+    pricelist_mirror = get_pricelist_mirror(product_id, currency)
+    if pricelist_mirror:
+        return pricelist_mirror.get_skus_with_available_prices_3yc(start_date, skus)
+
     items = _get_prices_3yc_for_skus_from_airtable(
         product_id, currency, start_date, skus, "partial_sku"
     )
@@ -610,57 +667,49 @@ def _get_prices_3yc_for_skus_from_airtable(
     )
 
 
-def _find_cached_3yc_price(sku: str, currency: str, start_date: dt.date) -> float | None:
-    pricelist_item = find_first(
-        lambda item: (
-            item["currency"] == currency
-            and item["valid_from"] <= start_date
-            and item["valid_until"] > start_date
-        ),
-        PRICELIST_CACHE[sku],
-    )
-    return pricelist_item["unit_pp"] if pricelist_item else None
+def get_pricelist_cache() -> PriceWindowCache:
+    """
+    Returns the cache of the historical prices found for the 3YC start dates.
+
+    The cache is created on first use, sized to the maximum number of (sku, currency)
+    entries set by `AIRTABLE_PRICELIST_CACHE_MAX_ENTRIES`.
+
+    Returns:
+        The shared price window cache.
+    """
+    global PRICELIST_CACHE  # ruff:ignore[global-statement]  # noqa: WPS420
+    with _PRICELIST_CACHE_LOCK:
+        if PRICELIST_CACHE is None:
+            PRICELIST_CACHE = PriceWindowCache(
+                int(
+                    settings.EXTENSION_CONFIG.get(
+                        "AIRTABLE_PRICELIST_CACHE_MAX_ENTRIES", PRICE_WINDOW_CACHE_MAX_ENTRIES
+                    )
+                )
+            )
+        return PRICELIST_CACHE
 
 
 def _collect_3yc_prices_from_items(items, prices: dict) -> None:
+    pricelist_cache = get_pricelist_cache()
     for item in items:
         if item.valid_until:
-            PRICELIST_CACHE[item.sku].append(
-                {
-                    "currency": item.currency,
-                    "valid_from": item.valid_from,
-                    "valid_until": item.valid_until,
-                    "unit_pp": item.unit_pp,
-                },
+            pricelist_cache.add(
+                item.sku,
+                item.currency,
+                PriceWindow(item.valid_from, item.valid_until, item.unit_pp),
             )
         if item.sku not in prices:
             prices[item.sku] = item.unit_pp
 
 
-def get_prices_for_3yc_skus(
+def _get_prices_for_3yc_skus_from_airtable(
     product_id: str, currency: str, start_date: dt.date, skus: list[str]
 ) -> dict:
-    """
-    Given a currency and a list of SKUs and the 3YC start date it retrieves the purchase price.
-
-    For each SKU in the given currency from the pricelist that was valid
-    when the 3YC started. SKUs with no pricelist row covering the start date
-    (e.g. a gap between historical windows) fall back to their most recent price.
-    Prices valid at the start date are cached since they will not change ever, to
-    reduce the amount of API calls to the AirTable API.
-
-    Args:
-        product_id: The ID of the product used to determine the AirTable base.
-        currency: The currency for which the price must be retrieved.
-        start_date: The date in which the 3YC started.
-        skus: List of SKUs which purchase prices must be retrieved.
-
-    Returns:
-        dict: A dictionary with SKU, purchase price items.
-    """
+    pricelist_cache = get_pricelist_cache()
     prices = {}
     for sku in skus:
-        cached_price = _find_cached_3yc_price(sku, currency, start_date)
+        cached_price = pricelist_cache.get_price(sku, currency, start_date)
         if cached_price is not None:
             prices[sku] = cached_price
 
@@ -688,6 +737,34 @@ def get_prices_for_3yc_skus(
     return prices
 
 
+def get_prices_for_3yc_skus(
+    product_id: str, currency: str, start_date: dt.date, skus: list[str]
+) -> dict:
+    """
+    Given a currency and a list of SKUs and the 3YC start date it retrieves the purchase price.
+
+    For each SKU in the given currency from the pricelist that was valid
+    when the 3YC started. SKUs with no pricelist row covering the start date
+    (e.g. a gap between historical windows) fall back to their most recent price.
+    Prices valid at the start date are cached since they will not change ever, to
+    reduce the amount of API calls to the AirTable API.
+
+    Args:
+        product_id: The ID of the product used to determine the AirTable base.
+        currency: The currency for which the price must be retrieved.
+        start_date: The date in which the 3YC started.
+        skus: List of SKUs which purchase prices must be retrieved.
+
+    Returns:
+        dict: A dictionary with SKU, purchase price items.
+    """
+    pricelist_mirror = get_pricelist_mirror(product_id, currency)
+    if pricelist_mirror:
+        return pricelist_mirror.get_prices_for_3yc_skus(start_date, skus)
+
+    return _get_prices_for_3yc_skus_from_airtable(product_id, currency, start_date, skus)
+
+
 def get_sku_price(
     adobe_customer: dict, offer_ids: list[str], product_id: str, deployment_currency: str
 ) -> dict[str, float]:
@@ -920,10 +997,40 @@ def get_sku_adobe_mapping_model(base_info: AirTableBaseInfo):
     return AdobeProductMapping
 
 
+def get_sku_mapping_index(*, refresh: bool = False) -> dict:
+    """
+    Returns the whole SKU Mapping table indexed by vendor external id and segment.
+
+    The table is loaded at once and kept in memory for `AIRTABLE_SKU_MAPPING_TTL_SECONDS`,
+    never expiring if 0 or less.
+
+    Args:
+        refresh: Reload the table even if the index is not expired yet.
+
+    Returns:
+        dict: The AdobeProductMapping entities by (vendor external id, segment).
+    """
+    base_info = AirTableBaseInfo.for_sku_mapping()
+    adobe_item_model = get_sku_adobe_mapping_model(base_info)
+    if refresh:
+        SKU_MAPPING_CACHE.pop(base_info.base_id)
+
+    return SKU_MAPPING_CACHE.get_or_load(
+        base_info.base_id,
+        lambda: {
+            (entity.vendor_external_id, entity.segment): entity for entity in adobe_item_model.all()
+        },
+        ttl=_get_sku_mapping_ttl(),
+    )
+
+
 def get_adobe_product_by_marketplace_sku(vendor_external_id: str, market_segment: str):
     """
     Get an AdobeProductMapping object by the vendor_external_id.
 
+    The lookup is served by the SKU Mapping index, SKUs added to the table after the index
+    was loaded are retrieved one by one and added to the index.
+
     Args:
         vendor_external_id: The vendor external id to search for the AdobeProductMapping.
         market_segment: Adobe market segment.
@@ -932,10 +1039,20 @@ def get_adobe_product_by_marketplace_sku(vendor_external_id: str, market_segment
         AdobeProductNotFoundError: If no AdobeProductMapping exists for the given
         vendor external id.
     """
+    segment = MARKET_SEGMENT_TO_AIRTABLE_SEGMENT[market_segment]
     adobe_item_model = get_sku_adobe_mapping_model(AirTableBaseInfo.for_sku_mapping())
-    return adobe_item_model.from_short_id(
-        vendor_external_id, MARKET_SEGMENT_TO_AIRTABLE_SEGMENT[market_segment]
-    )
+    sku_mapping_index = get_sku_mapping_index()
+    adobe_product = sku_mapping_index.get((vendor_external_id, segment))
+    if adobe_product is None:
+        adobe_product = adobe_item_model.from_short_id(vendor_external_id, segment)
+        sku_mapping_index[vendor_external_id, segment] = adobe_product
+    return adobe_product
+
+
+def _get_sku_mapping_ttl() -> float:
+    ttl = int(settings.EXTENSION_CONFIG.get("AIRTABLE_SKU_MAPPING_TTL_SECONDS", SKU_MAPPING_TTL))
+    # A TTL of 0 or less loads the table once, it is only reloaded on demand
+    return ttl if ttl > 0 else math.inf
 
 
 @cache
@@ -977,12 +1094,11 @@ def create_discount_redemptions(redemptions: list):
     redemption_model.batch_save([redemption_model(**redemption) for redemption in redemptions])
 
 
-@cache
 def get_adobe_sku(vendor_item_id: str, market_segment: str) -> str:
     """
     Retrieves full sku with first discount level based on cutted Adobe SKU.
 
-    Uses AdobeProductMapping table
+    Uses the AdobeProductMapping table index, see `get_sku_mapping_index`.
 
     Args:
         vendor_item_id: cutted Adobe SKU.
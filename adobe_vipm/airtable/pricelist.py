@@ -0,0 +1,412 @@
+import bisect
+import datetime as dt
+import logging
+import threading
+from collections import OrderedDict, defaultdict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+
+from pyairtable.formulas import AND, EQ, GTE, Field
+
+logger = logging.getLogger(__name__)
+
+FULL_RELOAD_INTERVAL = dt.timedelta(days=1)
+PRICE_WINDOW_CACHE_MAX_ENTRIES = 10000
+
+
+@dataclass(frozen=True)
+class PriceListEntry:
+    """A single PriceList row, the price of a SKU in a currency for a validity window."""
+
+    record_id: str
+    sku: str
+    partial_sku: str
+    valid_from: dt.date | None
+    valid_until: dt.date | None
+    unit_pp: float | None
+    updated_at: dt.datetime | None = None
+
+    @classmethod
+    def from_record(cls, record) -> "PriceListEntry":
+        """Builds the entry from a PriceList Airtable model instance."""
+        return cls(
+            record_id=record.id,
+            sku=record.sku,
+            partial_sku=record.partial_sku,
+            valid_from=record.valid_from,
+            valid_until=record.valid_until,
+            unit_pp=record.unit_pp,
+            updated_at=record.updated_at,
+        )
+
+    @property
+    def is_open(self) -> bool:
+        """Checks if the price has no end date."""
+        return self.valid_until is None
+
+    def covers(self, date: dt.date) -> bool:
+        """Checks if the validity window of a historical price includes the given date."""
+        return (
+            self.valid_until is not None
+            and (self.valid_from is None or self.valid_from <= date)
+            and date < self.valid_until
+        )
+
+
+class SkuPriceIndex:
+    """
+    Interval index over the validity windows of the prices of a single SKU.
+
+    The historical windows are kept sorted by start date, so the price valid at a given
+    date is found by bisection instead of scanning all the rows of the SKU.
+    """
+
+    def __init__(self, entries: Iterable[PriceListEntry]):
+        entries = list(entries)
+        self.partial_sku = entries[0].partial_sku if entries else ""
+        self.open_entries = sorted(
+            (entry for entry in entries if entry.is_open),
+            key=lambda entry: entry.valid_from or dt.date.min,
+        )
+        self.historical_entries = sorted(
+            (entry for entry in entries if not entry.is_open),
+            key=lambda entry: entry.valid_from or dt.date.min,
+        )
+        self._starts = [entry.valid_from or dt.date.min for entry in self.historical_entries]
+
+    def get_current(self) -> PriceListEntry | None:
+        """Returns the most recent open-ended price, if any."""
+        return self.open_entries[-1] if self.open_entries else None
+
+    def get_at(self, date: dt.date) -> PriceListEntry | None:
+        """Returns the historical price whose validity window includes the given date."""
+        position = bisect.bisect_right(self._starts, date)
+        for entry in reversed(self.historical_entries[:position]):
+            if entry.covers(date):
+                return entry
+        return None
+
+    def get_latest_historical(self) -> PriceListEntry | None:
+        """Returns the historical price with the most recent end date, if any."""
+        return max(self.historical_entries, key=lambda entry: entry.valid_until, default=None)
+
+    def is_available(self, date: dt.date) -> bool:
+        """Checks if the SKU has a price open-ended or valid until the given date or later."""
+        return bool(self.open_entries) or any(
+            entry.valid_until >= date for entry in self.historical_entries
+        )
+
+
+class PriceListIndex:
+    """
+    Index of the PriceList rows of a currency by SKU and by partial SKU.
+
+    Storing rows rebuilds the indexes and swaps them at once, so concurrent lookups never
+    see a partial update.
+    """
+
+    def __init__(self, records: Iterable = ()):
+        self._entries: dict[str, PriceListEntry] = {}
+        self._by_sku: dict[str, SkuPriceIndex] = {}
+        self._by_partial_sku: dict[str, list[SkuPriceIndex]] = {}
+        self.store(records)
+
+    def get_last_updated_at(self) -> dt.datetime | None:
+        """Returns the most recent update time of the stored rows, if any."""
+        return max(
+            (entry.updated_at for entry in self._entries.values() if entry.updated_at),
+            default=None,
+        )
+
+    def find_by_skus(self, skus: list[str]) -> list[tuple[str, SkuPriceIndex]]:
+        """Returns the price indexes of the given SKUs, skipping the SKUs without prices."""
+        by_sku = self._by_sku
+        return [(sku, by_sku[sku]) for sku in skus if sku in by_sku]
+
+    def find_by_partial_sku(self, partial_sku: str) -> list[SkuPriceIndex]:
+        """Returns the price indexes of the SKUs matching the partial SKU."""
+        return self._by_partial_sku.get(partial_sku, [])
+
+    def store(self, records: Iterable) -> None:
+        """
+        Adds the rows to the index, replacing the ones with the same record ID.
+
+        Args:
+            records: The PriceList Airtable model instances to store.
+        """
+        for record in records:
+            entry = PriceListEntry.from_record(record)
+            self._entries[entry.record_id] = entry
+        self._reindex()
+
+    def _reindex(self) -> None:
+        by_sku = self._index_by_sku()
+        by_partial_sku = defaultdict(list)
+        for sku_index in by_sku.values():
+            by_partial_sku[sku_index.partial_sku].append(sku_index)
+        self._by_sku = by_sku
+        self._by_partial_sku = dict(by_partial_sku)
+
+    def _index_by_sku(self) -> dict[str, SkuPriceIndex]:
+        entries_by_sku = defaultdict(list)
+        for entry in self._entries.values():
+            entries_by_sku[entry.sku].append(entry)
+        return {sku: SkuPriceIndex(sku_entries) for sku, sku_entries in entries_by_sku.items()}
+
+
+class PriceListMirror:
+    """
+    Local copy of the PriceList table rows of a product in a given currency.
+
+    The first lookup downloads all the rows of the currency, later lookups only fetch the
+    rows modified since the last refresh once the refresh interval is elapsed. A full
+    reload runs once a day to drop the rows deleted from Airtable.
+
+    Attributes:
+        currency: The currency of the mirrored prices.
+        refresh_interval: Minimum time between two refreshes.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[..., list],
+        currency: str,
+        refresh_interval: dt.timedelta,
+    ):
+        self.currency = currency
+        self.refresh_interval = refresh_interval
+        self._fetch = fetch
+        self._lock = threading.Lock()
+        self._index = PriceListIndex()
+        self._refreshed_at: dt.datetime | None = None
+        self._reloaded_at: dt.datetime | None = None
+
+    def refresh(self, *, force: bool = False) -> None:
+        """
+        Refreshes the mirror if the refresh interval is elapsed.
+
+        Args:
+            force: Refresh the mirror even if the refresh interval is not elapsed yet.
+        """
+        with self._lock:
+            now = dt.datetime.now(tz=dt.UTC)
+            if self._reloaded_at is None or now - self._reloaded_at >= FULL_RELOAD_INTERVAL:
+                logger.info("Loading %s price list", self.currency)
+                records = self._fetch(formula=EQ(Field("currency"), self.currency))
+                # Swap the whole index so the rows deleted from Airtable are dropped
+                self._index = PriceListIndex(records)
+                self._reloaded_at = now
+                self._refreshed_at = now
+            elif force or now - self._refreshed_at >= self.refresh_interval:
+                self._update(now)
+
+    def get_prices_for_skus(self, skus: list[str]) -> dict:
+        """
+        Returns the current purchase prices, falling back to the latest historical ones.
+
+        Args:
+            skus: List of SKUs which purchase prices must be retrieved.
+
+        Returns:
+            dict: A dictionary with SKU, purchase price items.
+        """
+        self.refresh()
+        prices = {}
+        for sku, sku_index in self._index.find_by_skus(skus):
+            entry = sku_index.get_current() or sku_index.get_latest_historical()
+            if entry:
+                prices[sku] = entry.unit_pp
+        return prices
+
+    def get_prices_for_3yc_skus(  # noqa: WPS114
+        self, start_date: dt.date, skus: list[str]
+    ) -> dict:
+        """
+        Returns the purchase prices valid at the 3YC start date.
+
+        SKUs without a price covering the start date use the current price, then the most
+        recent historical one.
+
+        Args:
+            start_date: The date in which the 3YC started.
+            skus: List of SKUs which purchase prices must be retrieved.
+
+        Returns:
+            dict: A dictionary with SKU, purchase price items.
+        """
+        self.refresh()
+        prices = {}
+        for sku, sku_index in self._index.find_by_skus(skus):
+            entry = (
+                sku_index.get_at(start_date)
+                or sku_index.get_current()
+                or sku_index.get_latest_historical()
+            )
+            if entry:
+                prices[sku] = entry.unit_pp
+        return prices
+
+    def get_skus_with_available_prices(self, date: dt.date, partial_skus: list[str]) -> set:
+        """
+        Returns the partial SKUs with a price open-ended or valid until the given date.
+
+        Args:
+            date: The date the prices must be valid at.
+            partial_skus: List of partial SKUs to check.
+
+        Returns:
+            set: The partial SKUs with an available price.
+        """
+        self.refresh()
+        return {
+            partial_sku
+            for partial_sku in partial_skus
+            if any(
+                sku_index.is_available(date)
+                for sku_index in self._index.find_by_partial_sku(partial_sku)
+            )
+        }
+
+    def get_skus_with_available_prices_3yc(  # noqa: WPS114
+        self, start_date: dt.date, partial_skus: list[str]
+    ) -> set:
+        """
+        Returns the partial SKUs with an open-ended price or a price valid at the 3YC start.
+
+        Args:
+            start_date: The date in which the 3YC started.
+            partial_skus: List of partial SKUs to check.
+
+        Returns:
+            set: The partial SKUs with an available price.
+        """
+        self.refresh()
+        return {
+            partial_sku
+            for partial_sku in partial_skus
+            if any(
+                sku_index.get_current() or sku_index.get_at(start_date)
+                for sku_index in self._index.find_by_partial_sku(partial_sku)
+            )
+        }
+
+    def _update(self, now: dt.datetime) -> None:
+        updated_since = self._index.get_last_updated_at() or self._refreshed_at
+        logger.info("Refreshing %s price list since %s", self.currency, updated_since)
+        records = self._fetch(
+            formula=AND(
+                EQ(Field("currency"), self.currency),
+                GTE(Field("updated_at"), updated_since),
+            ),
+        )
+        self._index.store(records)
+        self._refreshed_at = now
+
+
+@dataclass(frozen=True)
+class PriceWindow:
+    """A historical price of a SKU valid from `valid_from` (included) to `valid_until`."""
+
+    valid_from: dt.date
+    valid_until: dt.date
+    unit_pp: float
+
+
+class PriceWindowCache:
+    """
+    Bounded cache of the historical prices found for the 3YC start dates.
+
+    Historical prices never change, so they can be reused for any later lookup. The cache
+    stores one entry per (sku, currency) with its validity windows sorted by start date
+    and deduplicated, so start date lookups are answered by bisection. When more than
+    `max_entries` entries are stored the least recently used ones are evicted.
+
+    Attributes:
+        max_entries: Maximum number of (sku, currency) entries to keep.
+        hits: Number of lookups answered by the cache.
+        misses: Number of lookups not answered by the cache.
+        evictions: Number of entries evicted to respect `max_entries`.
+    """
+
+    def __init__(self, max_entries: int = PRICE_WINDOW_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[str, str], list[PriceWindow]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_price(self, sku: str, currency: str, date: dt.date) -> float | None:
+        """
+        Returns the cached price of the SKU valid at the given date.
+
+        Args:
+            sku: The SKU to look up.
+            currency: The currency of the price.
+            date: The date the price must be valid at.
+
+        Returns:
+            The unit purchase price or None if no cached window covers the date.
+        """
+        with self._lock:
+            windows = self._entries.get((sku, currency), [])
+            position = bisect.bisect_right(windows, date, key=lambda window: window.valid_from)
+            window = windows[position - 1] if position else None
+            if window is None or window.valid_until <= date:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end((sku, currency))
+            self.hits += 1
+            return window.unit_pp
+
+    def get_windows(self, sku: str, currency: str) -> list[PriceWindow]:
+        """Returns the cached validity windows of the SKU, sorted by start date."""
+        with self._lock:
+            return list(self._entries.get((sku, currency), []))
+
+    def add(self, sku: str, currency: str, window: PriceWindow) -> None:
+        """
+        Stores a historical price window of the SKU.
+
+        A window with the same start and end dates of a cached one replaces it.
+
+        Args:
+            sku: The SKU the price belongs to.
+            currency: The currency of the price.
+            window: The price and its validity window.
+        """
+        with self._lock:
+            windows = [
+                cached
+                for cached in self._entries.get((sku, currency), [])
+                if (cached.valid_from, cached.valid_until)
+                != (window.valid_from, window.valid_until)
+            ]
+            bisect.insort(windows, window, key=lambda cached: cached.valid_from)
+            self._entries[sku, currency] = windows
+            self._entries.move_to_end((sku, currency))
+            while len(self._entries) > max(self.max_entries, 1):
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Removes all the entries and resets the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self) -> dict[str, int]:
+        """Returns the size of the cache and its counters."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
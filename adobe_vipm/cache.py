@@ -0,0 +1,177 @@
+import threading
+import time
+from collections.abc import Callable, Hashable
+from typing import Any
+
+DEFAULT_TTL = 300
+
+
+class _TTLEntries:
+    """
+    Thread safe entries expiring after a time to live, the storage of `TTLCache`.
+
+    Expired entries are dropped lazily when they are looked up.
+
+    Attributes:
+        ttl: Default time to live of the entries, in seconds.
+        hits: Number of lookups answered by the cache.
+        misses: Number of lookups not answered by the cache.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.RLock()
+        self._entries: dict[Hashable, tuple[float, Any]] = {}
+        # Bumped when entries are removed, so that loads started before are not stored
+        self._generation = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return self._get_entry(key) is not None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def set(self, key: Hashable, cached_value: Any, ttl: float | None = None) -> None:
+        """
+        Stores the value for the key.
+
+        Args:
+            key: The key to store the value under.
+            cached_value: The value to store.
+            ttl: Time to live of the entry, in seconds. Defaults to the cache one.
+        """
+        if ttl is None:
+            ttl = self.ttl
+        expires_at = time.monotonic() + ttl
+        with self._lock:
+            self._entries[key] = (expires_at, cached_value)
+
+    def clear(self) -> None:
+        """Removes all the entries and resets the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+            self.hits = 0
+            self.misses = 0
+
+    def _get_entry(self, key: Hashable) -> tuple[float, Any] | None:
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] <= time.monotonic():
+            self._entries.pop(key)
+            return None
+        return entry
+
+
+class TTLCache(_TTLEntries):
+    """
+    Thread safe in-memory cache whose entries expire after a time to live.
+
+    Expired entries are dropped lazily when they are looked up. Values are loaded outside the
+    cache lock, one load at a time per key, so slow loads of a key don't block the others.
+    """
+
+    def __init__(self, ttl: float = DEFAULT_TTL):
+        super().__init__(ttl)
+        self._load_locks: dict[Hashable, threading.Lock] = {}
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Returns the value stored for the key if not expired yet.
+
+        Args:
+            key: The key to look up.
+            default: The value returned when the key is missing or expired.
+
+        Returns:
+            The cached value or the default one.
+        """
+        with self._lock:
+            entry = self._get_entry(key)
+            if entry is None:
+                self.misses += 1
+                return default
+
+            self.hits += 1
+            return entry[1]
+
+    def get_or_load(
+        self, key: Hashable, loader: Callable[[], Any], ttl: float | None = None
+    ) -> Any:
+        """
+        Returns the value stored for the key, loading and storing it when missing or expired.
+
+        Concurrent lookups of a missing key wait for the first one to load the value instead
+        of loading it again. A value loaded while entries were removed is returned but not
+        stored, as it may have been read before the change that removed them.
+
+        Args:
+            key: The key to look up.
+            loader: Callable returning the value to store when the key is missing.
+            ttl: Time to live of the loaded entry, in seconds. Defaults to the cache one.
+
+        Returns:
+            The cached or loaded value.
+        """
+        with self._lock:
+            entry = self._get_entry(key)
+            if entry is not None:
+                self.hits += 1
+                return entry[1]
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+
+        with load_lock:
+            try:
+                loaded = self._load(key, loader, ttl)
+            except Exception:
+                self._release_load_lock(key, load_lock)
+                raise
+            self._release_load_lock(key, load_lock)
+            return loaded
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Removes the key from the cache and returns its value, if not expired."""
+        with self._lock:
+            entry = self._get_entry(key)
+            self._entries.pop(key, None)
+            self._generation += 1
+            return default if entry is None else entry[1]
+
+    def invalidate(self, predicate: Callable[[Hashable], bool]) -> int:
+        """
+        Removes the entries whose key matches the predicate.
+
+        Args:
+            predicate: Callable returning True for the keys to remove.
+
+        Returns:
+            The number of removed entries.
+        """
+        with self._lock:
+            keys = [key for key in self._entries if predicate(key)]
+            for key in keys:
+                self._entries.pop(key)
+            self._generation += 1
+            return len(keys)
+
+    def _load(self, key: Hashable, loader: Callable[[], Any], ttl: float | None) -> Any:
+        with self._lock:
+            entry = self._get_entry(key)
+            if entry is not None:
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            generation = self._generation
+        loaded = loader()
+        with self._lock:
+            if generation == self._generation:
+                self.set(key, loaded, ttl)
+        return loaded
+
+    def _release_load_lock(self, key: Hashable, load_lock: threading.Lock) -> None:
+        with self._lock:
+            if self._load_locks.get(key) is load_lock:
+                self._load_locks.pop(key)
@@ -11,7 +11,10 @@ from mpt_extension_sdk.mpt_http.mpt import get_webhook
 from mpt_extension_sdk.runtime.djapp.conf import get_for_product
 from ninja import Body
 
-from adobe_vipm.flows.fulfillment import fulfill_order
+from adobe_vipm.adobe.metrics import ADOBE_API_METRICS
+from adobe_vipm.adobe.rate_limit import get_rate_limiter
+from adobe_vipm.airtable.models import get_pricelist_cache
+from adobe_vipm.flows.fulfillment import fulfill_order, get_fulfillment_dispatcher
 from adobe_vipm.flows.validation import validate_order
 from adobe_vipm.models import Error
 
@@ -38,8 +41,11 @@ def jwt_secret_callback(client: MPTClient, claims: Mapping[str, Any]) -> str:
 
 @ext.events.listener("orders")
 def process_order_fulfillment(client: MPTClient, event) -> None:
-    """Hook to process fulfillment order."""
-    fulfill_order(client, event.data.order)
+    """Hook to queue the fulfillment of the order after the other orders of its agreement."""
+    order = event.data.order
+    get_fulfillment_dispatcher().submit(
+        order["agreement"]["id"], order["id"], lambda: fulfill_order(client, order)
+    )
 
 
 @ext.api.post(
@@ -63,3 +69,36 @@ def process_order_validation(request, order: Annotated[dict | None, Body()] = No
     else:
         logger.debug("Validated order: %s", pformat(validated_order))
         return 200, validated_order
+
+
+@ext.api.get(
+    "/v1/metrics/adobe",
+    response={200: dict},
+    auth=JWTAuth(jwt_secret_callback),
+)
+def adobe_api_metrics(request):
+    """API handler exposing the metrics of the Adobe API requests sent by the process."""
+    return 200, {
+        "requests": ADOBE_API_METRICS.collect(),
+        "rate_limit": get_rate_limiter().collect_metrics(),
+    }
+
+
+@ext.api.get(
+    "/v1/metrics/fulfillment",
+    response={200: dict},
+    auth=JWTAuth(jwt_secret_callback),
+)
+def fulfillment_metrics(request):
+    """API handler exposing the queue depths and wait times of the fulfillment dispatcher."""
+    return 200, get_fulfillment_dispatcher().collect_metrics()
+
+
+@ext.api.get(
+    "/v1/metrics/airtable",
+    response={200: dict},
+    auth=JWTAuth(jwt_secret_callback),
+)
+def airtable_metrics(request):
+    """API handler exposing the size, hits, misses and evictions of the pricelist cache."""
+    return 200, {"pricelist_cache": get_pricelist_cache().stats()}
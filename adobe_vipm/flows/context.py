@@ -1,14 +1,30 @@
 import datetime as dt
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import Any
 
+from adobe_vipm.adobe.snapshot import AdobeCustomerSnapshot
 from adobe_vipm.flows.constants import Param
-from adobe_vipm.flows.utils import get_fulfillment_parameter, get_ordering_parameter
+from adobe_vipm.flows.utils import ParameterView, get_one_time_skus, split_downsizes_upsizes_new
+
+LineSplits = tuple[list[dict], list[dict], list[dict]]
 
 
 @dataclass
-class Context:
-    """Order flow processing context."""
+class Context:  # noqa: WPS214
+    """
+    Order flow processing context.
+
+    The facts derived from the order, like `customer_data`, `deployment_id`, `line_splits`
+    and `get_one_time_skus`, are computed on first use and memoized. Reassigning `order`,
+    e.g. `context.order = update_order(...)`, any parameter setter result or
+    `context.order = {**context.order, "lines": lines}`, drops them all, so steps changing
+    the lines or the parameters replace the order instead of mutating it in place.
+    The market segment depends on the product only, it is computed once into
+    `market_segment` when the context is set up.
+    `adobe_snapshot` indexes `adobe_customer` and `adobe_customer_subscriptions`, it is
+    rebuilt on first use after either of them is reassigned.
+    """
 
     order: dict
     due_date: dt.date | None = None
@@ -45,6 +61,14 @@ class Context:
     adobe_customer_subscriptions: list = field(default_factory=list)
     preview_renewal_order: dict | None = None
     adobe_renewal_order: dict | None = None
+    _facts: dict[str, Any] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, attribute_value: Any) -> None:
+        super().__setattr__(name, attribute_value)
+        if name == "order":
+            self.invalidate()
+        elif name in {"adobe_customer", "adobe_customer_subscriptions"}:
+            self._facts.pop("adobe_snapshot", None)
 
     def __str__(self):
         due_date = self.due_date.strftime("%Y-%m-%d") if self.due_date else "-"
@@ -57,6 +81,63 @@ class Context:
     @property
     def customer_data(self) -> dict[str, Any]:
         """Customer data extracted from the corresponding parameters."""
+        return self._memoize("customer_data", self._get_customer_data)
+
+    @property
+    def deployment_id(self) -> str | None:
+        """Value of the deploymentId fulfillment parameter."""
+        return self._memoize(
+            "deployment_id",
+            lambda: self.order_parameters.get(
+                Param.PHASE_FULFILLMENT.value, Param.DEPLOYMENT_ID.value
+            ).get("value"),
+        )
+
+    @property
+    def order_parameters(self) -> ParameterView:
+        """Parameters of the order indexed by phase and external identifier."""
+        return self._memoize("parameters", lambda: ParameterView(self.order))
+
+    @property
+    def adobe_snapshot(self) -> AdobeCustomerSnapshot:
+        """Adobe customer and its subscriptions indexed for lookups."""
+        return self._memoize(
+            "adobe_snapshot",
+            lambda: AdobeCustomerSnapshot(
+                self.adobe_customer or {}, self.adobe_customer_subscriptions
+            ),
+        )
+
+    @property
+    def line_splits(self) -> LineSplits:
+        """Copy of the order lines split into downsizes, upsizes and net new lines."""
+        downsize_lines, upsize_lines, new_lines = self._memoize(
+            "line_splits", lambda: split_downsizes_upsizes_new(self.order)
+        )
+        return list(downsize_lines), list(upsize_lines), list(new_lines)
+
+    def get_one_time_skus(self, client) -> list[str]:
+        """
+        Returns the SKUs of the order lines that correspond to One-Time items.
+
+        Args:
+            client (MPTClient): The client to consume the MPT API.
+
+        Returns:
+            List of One-Time SKUs.
+        """
+        return list(self._memoize("one_time_skus", lambda: get_one_time_skus(client, self.order)))
+
+    def invalidate(self) -> None:
+        """Drops the memoized facts derived from the order."""
+        self._facts = {}
+
+    def _memoize(self, name: str, compute: Callable[[], Any]) -> Any:
+        if name not in self._facts:
+            self._facts[name] = compute()
+        return self._facts[name]
+
+    def _get_customer_data(self) -> dict[str, Any]:
         customer_data = {}
         for param_external_id in (
             Param.COMPANY_NAME,
@@ -67,11 +148,15 @@ class Context:
             Param.THREE_YC_LICENSES,
             Param.AGENCY_TYPE,
         ):
-            ordering_param = get_ordering_parameter(self.order, param_external_id)
+            ordering_param = self.order_parameters.get(
+                Param.PHASE_ORDERING.value, param_external_id.value
+            )
             customer_data[param_external_id.value] = ordering_param.get("value")
 
         for param_external_id in (Param.DEPLOYMENT_ID, Param.DEPLOYMENTS):
-            fulfillment_param = get_fulfillment_parameter(self.order, param_external_id)
+            fulfillment_param = self.order_parameters.get(
+                Param.PHASE_FULFILLMENT.value, param_external_id.value
+            )
             customer_data[param_external_id.value] = fulfillment_param.get("value")
 
         return customer_data
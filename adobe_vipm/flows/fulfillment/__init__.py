@@ -1 +1,4 @@
 from adobe_vipm.flows.fulfillment.base import fulfill_order as fulfill_order  # noqa: WPS412
+from adobe_vipm.flows.fulfillment.dispatcher import (  # noqa: WPS412
+    get_fulfillment_dispatcher as get_fulfillment_dispatcher,
+)
@@ -2,6 +2,7 @@ import logging
 import traceback
 
 from adobe_vipm.adobe.errors import AdobeTransportError
+from adobe_vipm.adobe.request_cache import request_cache_scope
 from adobe_vipm.flows.constants import OrderType
 from adobe_vipm.flows.fulfillment.change import fulfill_change_order
 from adobe_vipm.flows.fulfillment.configuration import fulfill_configuration_order
@@ -60,7 +61,8 @@ def fulfill_order(client, order):
     Returns:
         None
     """
-    logger.info("Start processing %s order %s", order["type"], order["id"])
+    order_id = order["id"]
+    logger.info("Start processing %s order %s", order["type"], order_id)
 
     validators = {
         OrderType.PURCHASE: _fulfill_purchase_order_router,
@@ -70,10 +72,11 @@ def fulfill_order(client, order):
     }
 
     try:
-        if order["type"] in validators:
-            validators[order.get("type")](client, order)
-        else:
-            logger.info("Order %s is not a valid order type", order["id"])
+        with request_cache_scope(order_id):
+            if order["type"] in validators:
+                validators[order.get("type")](client, order)
+            else:
+                logger.info("Order %s is not a valid order type", order_id)
     except AdobeTransportError as error:
         # A transport fault is transient and self-recovering: the order stays in processing
         # and is re-dispatched, and a run of failures that outlives the due date fails the
@@ -83,7 +86,7 @@ def fulfill_order(client, order):
             "%s order %s: transient Adobe transport failure in %s for authorization %s: %s. "
             "The order stays in processing and will be retried.",
             order["type"],
-            order["id"],
+            order_id,
             get_failed_step(error) or "fulfillment",
             order.get("authorization", {}).get("id", "unknown"),
             error,
@@ -92,7 +95,7 @@ def fulfill_order(client, order):
     except Exception as error:
         notify_unhandled_exception_in_teams(
             "fulfillment",
-            order["id"],
+            order_id,
             strip_trace_id(traceback.format_exc()),
             step=get_failed_step(error),
         )
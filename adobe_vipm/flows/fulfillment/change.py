@@ -87,18 +87,30 @@ class GetReturnableOrders(Step):
             next_step(client, context)
             return
 
-        for line in context.downsize_lines:
-            sku = line["item"]["externalIds"]["vendor"]
-            subscription_id = get_subscription_by_line_subs_id(
+        subscription_ids = {
+            line["id"]: get_subscription_by_line_subs_id(
                 context.order["agreement"]["subscriptions"], line
             )
-            returnable_orders = adobe_client.get_returnable_orders_by_subscription_id(
+            for line in context.downsize_lines
+        }
+        # One scan of the order history for all the downsized subscriptions
+        returnable_orders_by_subscription_id = (
+            adobe_client.get_returnable_orders_by_subscription_ids(
                 context.authorization_id,
                 context.adobe_customer_id,
-                subscription_id,
+                list(subscription_ids.values()),
                 context.adobe_customer["cotermDate"],
-                return_orders=context.adobe_return_orders.get(sku),
+                return_orders={
+                    subscription_ids[line["id"]]: context.adobe_return_orders.get(
+                        line["item"]["externalIds"]["vendor"]
+                    )
+                    for line in context.downsize_lines
+                },
             )
+        )
+        for line in context.downsize_lines:
+            sku = line["item"]["externalIds"]["vendor"]
+            returnable_orders = returnable_orders_by_subscription_id[subscription_ids[line["id"]]]
             if not returnable_orders:
                 logger.info("%s: no returnable orders found for sku %s", context, sku)
                 continue
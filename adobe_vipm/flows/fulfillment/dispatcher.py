@@ -0,0 +1,207 @@
+import contextvars
+import functools
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from django.conf import settings
+from opentelemetry import trace
+
+logger = logging.getLogger(__name__)
+tracer = trace.get_tracer(__name__)
+
+DEFAULT_FULFILLMENT_WORKERS = 4
+
+
+@dataclass(frozen=True)
+class QueuedOrder:
+    """Order waiting in the queue of its agreement, with the context it was submitted from."""
+
+    order_id: str
+    task: Callable[[], None]
+    queued_at: float = field(default_factory=time.monotonic)
+    context: contextvars.Context = field(default_factory=contextvars.copy_context)
+
+
+@dataclass
+class DispatcherMetrics:
+    """Counters of the orders run by the fulfillment dispatcher."""
+
+    submitted: int = 0
+    skipped: int = 0
+    completed: int = 0
+    failed: int = 0
+    waited_seconds: float = 0
+    max_wait_seconds: float = 0
+
+
+class FulfillmentDispatcher:
+    """
+    Fulfills the orders on a pool of workers, one order of an agreement at a time.
+
+    Every agreement has its own queue, so the orders of an agreement run strictly in the
+    order they were submitted while the orders of different agreements run in parallel.
+    After each order the agreement goes back to the end of the pool queue, so a long queue
+    doesn't hold a worker while other agreements wait. An order already queued or running is
+    not queued again, as the orders still processing are submitted on every poll.
+
+    Every order runs in a copy of the context variables of its submitter, so the logging and
+    tracing context of the order event is kept, inside a span covering its fulfillment.
+    """
+
+    def __init__(self, workers: int = DEFAULT_FULFILLMENT_WORKERS):
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fulfillment")
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        # A queue exists, even empty, while an order of the agreement is running
+        self._queues: dict[str, deque[QueuedOrder]] = {}
+        self._pending_order_ids: set[str] = set()
+        self._running = 0
+        self._metrics = DispatcherMetrics()
+
+    def submit(self, agreement_id: str, order_id: str, task: Callable[[], None]) -> bool:
+        """
+        Queues the fulfillment of an order after the other orders of its agreement.
+
+        Args:
+            agreement_id: Id of the agreement of the order.
+            order_id: Id of the order.
+            task: Callable fulfilling the order.
+
+        Returns:
+            False if the order was already queued or running and has been skipped.
+        """
+        with self._lock:
+            if order_id in self._pending_order_ids:
+                self._metrics.skipped += 1
+                logger.info("Order %s is already queued for fulfillment, skip it", order_id)
+                return False
+
+            self._pending_order_ids.add(order_id)
+            self._metrics.submitted += 1
+            agreement_queue = self._queues.get(agreement_id)
+            is_idle = agreement_queue is None
+            if is_idle:
+                agreement_queue = deque()
+                self._queues[agreement_id] = agreement_queue
+            agreement_queue.append(QueuedOrder(order_id, task))
+            depth = len(agreement_queue)
+
+        logger.info(
+            "Order %s of agreement %s queued for fulfillment, %d in the agreement queue",
+            order_id,
+            agreement_id,
+            depth,
+        )
+        if is_idle:
+            self._executor.submit(self._run_next, agreement_id)
+        return True
+
+    def collect_metrics(self) -> dict:
+        """Returns the queue depths, the wait times and the counters of the orders."""
+        with self._lock:
+            depths = [len(agreement_queue) for agreement_queue in self._queues.values()]
+            started = self._metrics.completed + self._metrics.failed + self._running
+            return {
+                "agreements": len(depths),
+                "queued": sum(depths),
+                "max_queue_depth": max(depths, default=0),
+                "running": self._running,
+                "submitted": self._metrics.submitted,
+                "skipped": self._metrics.skipped,
+                "completed": self._metrics.completed,
+                "failed": self._metrics.failed,
+                "waited_seconds": round(self._metrics.waited_seconds, 3),
+                "average_wait_seconds": (
+                    round(self._metrics.waited_seconds / started, 3) if started else 0
+                ),
+                "max_wait_seconds": round(self._metrics.max_wait_seconds, 3),
+            }
+
+    def join(self, timeout: float | None = None) -> bool:
+        """
+        Waits until all the queued orders have been fulfilled.
+
+        Args:
+            timeout: Maximum seconds to wait, None to wait forever.
+
+        Returns:
+            False if some orders are still queued or running after the timeout.
+        """
+        with self._idle:
+            return self._idle.wait_for(lambda: not self._queues, timeout)
+
+    def shutdown(self) -> None:
+        """Fulfills the queued orders and stops the workers."""
+        self.join()
+        self._executor.shutdown(wait=True)
+
+    def _run_next(self, agreement_id: str) -> None:
+        with self._lock:
+            queued_order = self._queues[agreement_id].popleft()
+            waited = time.monotonic() - queued_order.queued_at
+            self._running += 1
+            self._metrics.waited_seconds += waited
+            self._metrics.max_wait_seconds = max(self._metrics.max_wait_seconds, waited)
+
+        logger.info(
+            "Fulfilling order %s of agreement %s after waiting %.3fs",
+            queued_order.order_id,
+            agreement_id,
+            waited,
+        )
+        succeeded = queued_order.context.run(self._run, agreement_id, queued_order)
+
+        with self._lock:
+            self._running -= 1
+            self._pending_order_ids.discard(queued_order.order_id)
+            if succeeded:
+                self._metrics.completed += 1
+            else:
+                self._metrics.failed += 1
+            has_next = bool(self._queues[agreement_id])
+            if not has_next:
+                del self._queues[agreement_id]  # noqa: WPS420
+                self._idle.notify_all()
+        if has_next:
+            self._executor.submit(self._run_next, agreement_id)
+
+    def _run(self, agreement_id: str, queued_order: QueuedOrder) -> bool:
+        try:
+            with tracer.start_as_current_span(
+                f"Fulfill order {queued_order.order_id}",
+                attributes={"order.id": queued_order.order_id, "agreement.id": agreement_id},
+            ):
+                queued_order.task()
+        except Exception:
+            logger.exception("Unexpected error fulfilling order %s", queued_order.order_id)
+            return False
+        return True
+
+
+_FULFILLMENT_DISPATCHER_LOCK = threading.Lock()
+
+
+def get_fulfillment_dispatcher() -> FulfillmentDispatcher:
+    """
+    Returns the fulfillment dispatcher shared by the order events of the process.
+
+    `FULFILLMENT_WORKERS` sets the number of orders of different agreements fulfilled at
+    the same time.
+
+    Returns:
+        FulfillmentDispatcher: The shared dispatcher.
+    """
+    with _FULFILLMENT_DISPATCHER_LOCK:
+        return _create_fulfillment_dispatcher()
+
+
+@functools.cache
+def _create_fulfillment_dispatcher() -> FulfillmentDispatcher:
+    return FulfillmentDispatcher(
+        int(settings.EXTENSION_CONFIG.get("FULFILLMENT_WORKERS", DEFAULT_FULFILLMENT_WORKERS))
+    )
@@ -143,6 +143,9 @@ class CreateCustomer(Step):
     That belongs to the order currently being processed.
     """
 
+    # The Adobe errors of the following steps are handled as customer creation errors
+    wraps_next_step = True
+
     def save_data(self, client, context):
         """
         Saves customer date back to MPT Order and Agreement.
@@ -53,10 +53,8 @@ from adobe_vipm.flows.utils import (
     get_subscription_by_line_and_item_id,
     notify_not_updated_subscriptions,
 )
-from adobe_vipm.flows.utils.deployment import get_deployment_id
 from adobe_vipm.flows.utils.parameter import update_fulfillment_parameter_value
 from adobe_vipm.notifications import send_exception
-from adobe_vipm.utils import get_partial_sku
 
 logger = logging.getLogger(__name__)
 
@@ -164,7 +162,7 @@ class CreateNetNewSubscriptions(Step):
                 context.adobe_customer_id,
                 offer_id,
                 net_new_item["quantity"],
-                deployment_id=get_deployment_id(context.order),
+                deployment_id=context.deployment_id,
                 recommendation_tracker_id=(
                     context.renewal_payload.get("recommendationTrackerId") or None
                 ),
@@ -252,9 +250,10 @@ class CreateNetNewSubscriptions(Step):
         return next(
             (
                 subscription
-                for subscription in context.adobe_customer_subscriptions
+                for subscription in context.adobe_snapshot.get_subscriptions_by_partial_sku(
+                    offer_id
+                )
                 if subscription["status"] == AdobeSubscriptionStatus.SCHEDULED
-                and get_partial_sku(subscription["offerId"]) == get_partial_sku(offer_id)
             ),
             None,
         )
@@ -19,7 +19,7 @@ from adobe_vipm.flows.pipeline import Pipeline, Step
 from adobe_vipm.flows.sync.agreement import sync_agreements_by_agreement_ids
 from adobe_vipm.flows.utils import exclude_items_with_deployment_id
 from adobe_vipm.flows.utils.customer import get_adobe_customer_id, set_adobe_customer_id
-from adobe_vipm.flows.utils.order import set_adobe_order_id, split_downsizes_upsizes_new
+from adobe_vipm.flows.utils.order import set_adobe_order_id
 from adobe_vipm.flows.utils.parameter import (
     get_change_reseller_admin_email,
     get_change_reseller_code,
@@ -244,7 +244,7 @@ class ProcessResellerTransferOrder(Step):
                 context.order = shared.save_adobe_order_id(mpt_client, context.order, "")
                 context.adobe_new_order_id = ""
 
-            downsize_lines, upsize_lines, new_lines = split_downsizes_upsizes_new(context.order)
+            downsize_lines, upsize_lines, new_lines = context.line_splits
             context.downsize_lines = downsize_lines
             context.upsize_lines = upsize_lines
             context.new_lines = new_lines
@@ -1,9 +1,12 @@
 """This module contains shared functions used by the different fulfillment flows."""
 
+import contextvars
 import datetime as dt
 import json
 import logging
 from collections import Counter
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 
 from django.conf import settings
 from mpt_extension_sdk.mpt_http.mpt import (
@@ -39,6 +42,7 @@ from adobe_vipm.adobe.constants import (
 )
 from adobe_vipm.adobe.errors import AdobeAPIError, AdobeError
 from adobe_vipm.adobe.mixins.errors import AdobeCreatePreviewError
+from adobe_vipm.adobe.snapshot import AdobeCustomerSnapshot
 from adobe_vipm.adobe.utils import (
     get_3yc_commitment_request,
     sanitize_company_name,
@@ -67,12 +71,12 @@ from adobe_vipm.flows.constants import (
 from adobe_vipm.flows.pipeline import Step
 from adobe_vipm.flows.sync.agreement import sync_agreements_by_agreement_ids
 from adobe_vipm.flows.utils import (
+    ParameterView,
+    copy_parameters,
     get_address,
     get_adobe_customer_id,
     get_coterm_date,
-    get_deployment_id,
     get_due_date,
-    get_one_time_skus,
     get_order_line_by_sku,
     get_renewal_payload,
     get_subscription_by_line_and_item_id,
@@ -99,7 +103,6 @@ from adobe_vipm.flows.utils.parameter import (
     set_flex_discounts_parameter,
     set_ordering_parameter_error,
     update_agreement_params_visibility,
-    update_ordering_parameter_value,
 )
 from adobe_vipm.flows.utils.template import get_template_data_by_adobe_subscription
 from adobe_vipm.flows.utils.three_yc import set_adobe_3yc
@@ -108,6 +111,9 @@ from adobe_vipm.utils import get_3yc_commitment, get_partial_sku
 
 logger = logging.getLogger(__name__)
 
+# Subscriptions and assets created or updated in MPT at the same time for an order
+DEFAULT_FULFILLMENT_MPT_WORKERS = 4
+
 
 def save_adobe_order_id_and_customer_data(client, order, order_id, customer):
     """
@@ -538,6 +544,29 @@ def check_processing_template(client, order, template_name):
         set_processing_template(client, order["id"], template)
 
 
+def update_order_parameter_value(client, order, parameter_phase, param_external_id, value):
+    """
+    Sets the value of an order parameter and sends it to MPT only if it changed.
+
+    Args:
+        client (MPTClient): The client used to consume the MPT API.
+        order (dict): The order that must be updated.
+        parameter_phase (str): The phase of the parameter (ordering, fulfillment).
+        param_external_id (str): The external identifier of the parameter.
+        value: The parameter value.
+
+    Returns:
+        dict: The updated order.
+    """
+    updated_order = copy_parameters(order)
+    order_parameters = ParameterView(updated_order)
+    order_parameters.update_value(parameter_phase, param_external_id, value)
+    changed_parameters = order_parameters.get_changed_parameters()
+    if changed_parameters:
+        update_order(client, order["id"], parameters=changed_parameters)
+    return updated_order
+
+
 def save_coterm_dates(client, order, coterm_date):
     """
     Save the customer coterm date as a fulfillment parameter.
@@ -551,9 +580,13 @@ def save_coterm_dates(client, order, coterm_date):
         dict: The updated order.
     """
     coterm_date = dt.datetime.fromisoformat(coterm_date).date()
-    order = set_coterm_date(order, coterm_date.isoformat())
-    update_order(client, order["id"], parameters=order["parameters"])
-    return order
+    return update_order_parameter_value(
+        client,
+        order,
+        Param.PHASE_FULFILLMENT.value,
+        Param.COTERM_DATE.value,
+        coterm_date.isoformat(),
+    )
 
 
 def set_customer_coterm_date_if_null(client, adobe_client, order):
@@ -579,10 +612,13 @@ def set_customer_coterm_date_if_null(client, adobe_client, order):
     customer_id = get_adobe_customer_id(order)
     authorization_id = order["authorization"]["id"]
     customer = adobe_client.get_customer(authorization_id, customer_id)
-    coterm_date = customer["cotermDate"]
-    order = set_coterm_date(order, coterm_date)
-    update_order(client, order["id"], parameters=order["parameters"])
-    return order
+    return update_order_parameter_value(
+        client,
+        order,
+        Param.PHASE_FULFILLMENT.value,
+        Param.COTERM_DATE.value,
+        customer["cotermDate"],
+    )
 
 
 def get_configuration_template_name(order):
@@ -605,15 +641,13 @@ def get_configuration_template_name(order):
 
 def get_existing_renewal_order(adobe_client, context, ext_ref) -> dict | None:
     """Query Adobe for an existing RENEWAL order for this MPT order."""
-    orders = adobe_client.get_orders(
+    orders = adobe_client.iter_orders(
         context.authorization_id,
         context.adobe_customer_id,
         filters={"order-type": ORDER_TYPE_RENEWAL},
     )
-    for order in orders:
-        if order["externalReferenceId"] == ext_ref:
-            return order
-    return None
+    # Stops paging through the order history once the order is found
+    return next((order for order in orders if order["externalReferenceId"] == ext_ref), None)
 
 
 def build_renewal_line_items(manual_renewal_lines: dict) -> list[dict]:
@@ -715,10 +749,10 @@ class SetOrUpdateCotermDate(Step):
         """
         if not context.adobe_customer:
             return False
-        commitment = get_3yc_commitment_request(
-            context.adobe_customer,
-            is_recommitment=False,
-        ) or get_3yc_commitment(context.adobe_customer)
+        commitment = (
+            get_3yc_commitment_request(context.adobe_customer, is_recommitment=False)
+            or context.adobe_snapshot.commitment
+        )
 
         if not commitment:
             return False
@@ -740,10 +774,10 @@ class SetOrUpdateCotermDate(Step):
         """
         update_order(client, context.order_id, parameters=context.order["parameters"])
         updated_params = {"coterm_date": coterm_date.isoformat()}
-        commitment = get_3yc_commitment_request(
-            context.adobe_customer,
-            is_recommitment=False,
-        ) or get_3yc_commitment(context.adobe_customer)
+        commitment = (
+            get_3yc_commitment_request(context.adobe_customer, is_recommitment=False)
+            or context.adobe_snapshot.commitment
+        )
         if commitment:
             updated_params.update({
                 "3yc_enroll_status": commitment.get("status"),
@@ -849,7 +883,7 @@ class SubmitReturnOrders(Step):
         """Creates the return orders for each returnable order to match the downsize quantities."""
         adobe_client = get_adobe_client()
         all_return_orders = []
-        deployment_id = get_deployment_id(context.order)
+        deployment_id = context.deployment_id
         is_returnable = False
 
         logger.info(
@@ -982,7 +1016,7 @@ class SubmitNewOrder(Step):
         adobe_client = get_adobe_client()
 
         if not context.adobe_new_order_id and context.adobe_preview_order:
-            deployment_id = get_deployment_id(context.order)
+            deployment_id = context.deployment_id
             adobe_order = adobe_client.create_new_order(
                 context.authorization_id,
                 context.adobe_customer_id,
@@ -1048,45 +1082,49 @@ class CreateOrUpdateAssets(Step):
             return
 
         adobe_client = get_adobe_client()
-        one_time_skus = get_one_time_skus(client, context.order)
+        one_time_skus = context.get_one_time_skus(client)
         product_id = context.order["agreement"]["product"]["id"]
         template = get_asset_template_by_name(client, product_id, TEMPLATE_ASSET_DEFAULT)
 
-        for line in filter(
-            lambda line_item: get_partial_sku(line_item["offerId"]) in one_time_skus,
-            context.adobe_new_order["lineItems"],
-        ):
-            order_line = get_order_line_by_sku(context.order, line["offerId"])
-            adobe_subscription = adobe_client.get_subscription(
-                context.authorization_id, context.adobe_customer_id, line["subscriptionId"]
-            )
+        lines = [
+            line_item
+            for line_item in context.adobe_new_order["lineItems"]
+            if get_partial_sku(line_item["offerId"]) in one_time_skus
+        ]
+        adobe_subscriptions = get_adobe_subscriptions_by_id(
+            adobe_client, context, [line["subscriptionId"] for line in lines]
+        )
+        run_mpt_updates(
+            lambda line: self._create_or_update_asset(
+                client, context, line, adobe_subscriptions[line["subscriptionId"]], template
+            ),
+            lines,
+        )
 
-            if adobe_subscription["status"] != AdobeSubscriptionStatus.ACTIVE:
-                logger.info(
-                    "%s: subscription %s for customer %s is in status %s, skip it",
-                    context,
-                    adobe_subscription["subscriptionId"],
-                    context.adobe_customer_id,
-                    adobe_subscription["status"],
-                )
-                continue
+        next_step(client, context)
 
-            asset = order_line.get("asset")
-            asset_data = create_asset_payload(adobe_subscription, order_line, line, template)
-            if asset:
-                update_order_asset(
-                    client, context.order_id, asset["id"], parameters=asset_data["parameters"]
-                )
-                logger.info(
-                    "%s: asset %s (%s) updated.", context, line["subscriptionId"], asset["id"]
-                )
-            else:
-                asset = create_order_asset(client, context.order_id, asset_data)
-                logger.info(
-                    "%s: asset %s (%s) created", context, line["subscriptionId"], asset["id"]
-                )
+    def _create_or_update_asset(self, client, context, line, adobe_subscription, template):
+        if adobe_subscription["status"] != AdobeSubscriptionStatus.ACTIVE:
+            logger.info(
+                "%s: subscription %s for customer %s is in status %s, skip it",
+                context,
+                adobe_subscription["subscriptionId"],
+                context.adobe_customer_id,
+                adobe_subscription["status"],
+            )
+            return
 
-        next_step(client, context)
+        order_line = get_order_line_by_sku(context.order, line["offerId"])
+        asset = order_line.get("asset")
+        asset_data = create_asset_payload(adobe_subscription, order_line, line, template)
+        if asset:
+            update_order_asset(
+                client, context.order_id, asset["id"], parameters=asset_data["parameters"]
+            )
+            logger.info("%s: asset %s (%s) updated.", context, line["subscriptionId"], asset["id"])
+        else:
+            asset = create_order_asset(client, context.order_id, asset_data)
+            logger.info("%s: asset %s (%s) created", context, line["subscriptionId"], asset["id"])
 
 
 class CreateOrUpdateSubscriptions(Step):
@@ -1099,7 +1137,7 @@ class CreateOrUpdateSubscriptions(Step):
             return
 
         adobe_client = get_adobe_client()
-        one_time_skus = get_one_time_skus(client, context.order)
+        one_time_skus = context.get_one_time_skus(client)
 
         all_line_items = self._merge_adobe_line_items(context)
 
@@ -1109,6 +1147,8 @@ class CreateOrUpdateSubscriptions(Step):
             if get_partial_sku(line_item["offerId"]) not in one_time_skus
         ]
 
+        new_lines = []
+        existing_lines = []
         for line in lines:
             order_line = get_order_line_by_sku(context.order, line["offerId"])
             order_subscription = get_subscription_by_line_and_item_id(
@@ -1116,11 +1156,15 @@ class CreateOrUpdateSubscriptions(Step):
                 order_line["item"]["id"],
                 order_line["id"],
             )
-
             if order_subscription:
-                self._update_existing_subscription(client, context, order_subscription, line)
+                existing_lines.append((line, order_subscription))
             else:
-                self._create_new_subscription(client, context, adobe_client, line, order_line)
+                new_lines.append((line, order_line))
+
+        for line, order_subscription in existing_lines:
+            self._update_existing_subscription(client, context, order_subscription, line)
+        if new_lines:
+            self._create_new_subscriptions(client, context, adobe_client, new_lines)
 
         next_step(client, context)
 
@@ -1140,37 +1184,30 @@ class CreateOrUpdateSubscriptions(Step):
             order_subscription["id"],
         )
 
-    def _create_new_subscription(self, client, context, adobe_client, line, order_line):
-        """Create a new subscription."""
-        adobe_subscription = self._get_adobe_subscription(adobe_client, context, line)
-        if not adobe_subscription:
-            return
-
+    def _create_new_subscriptions(self, client, context, adobe_client, new_lines):
+        """Create the subscriptions of the new lines, all the Adobe ones retrieved at once."""
+        adobe_subscriptions = get_adobe_subscriptions_by_id(
+            adobe_client, context, [line["subscriptionId"] for line, _ in new_lines]
+        )
         template = get_template_by_name(
             client,
             context.order["agreement"]["product"]["id"],
             TEMPLATE_SUBSCRIPTION_AUTORENEWAL_ENABLE,
         )
-        subscription_data = self._build_subscription_data(
-            line, order_line, adobe_subscription, template
-        )
-
-        subscription = create_subscription(client, context.order_id, subscription_data)
-        logger.info(
-            "%s: subscription %s (%s) created",
-            context,
-            line["subscriptionId"],
-            subscription["id"],
-        )
-
-    def _get_adobe_subscription(self, adobe_client, context, line):
-        """Get Adobe subscription and validate its status."""
-        adobe_subscription = adobe_client.get_subscription(
-            context.authorization_id,
-            context.adobe_customer_id,
-            line["subscriptionId"],
+        run_mpt_updates(
+            lambda new_line: self._create_new_subscription(
+                client,
+                context,
+                new_line,
+                adobe_subscriptions[new_line[0]["subscriptionId"]],
+                template,
+            ),
+            new_lines,
         )
 
+    def _create_new_subscription(self, client, context, new_line, adobe_subscription, template):
+        """Create a new subscription."""
+        line, order_line = new_line
         if adobe_subscription["status"] != AdobeSubscriptionStatus.ACTIVE:
             logger.warning(
                 "%s: subscription %s for customer %s is in status %s, skip it",
@@ -1179,9 +1216,19 @@ class CreateOrUpdateSubscriptions(Step):
                 context.adobe_customer_id,
                 adobe_subscription["status"],
             )
-            return None
+            return
 
-        return adobe_subscription
+        subscription_data = self._build_subscription_data(
+            line, order_line, adobe_subscription, template
+        )
+
+        subscription = create_subscription(client, context.order_id, subscription_data)
+        logger.info(
+            "%s: subscription %s (%s) created",
+            context,
+            line["subscriptionId"],
+            subscription["id"],
+        )
 
     def _build_subscription_data(self, line, order_line, adobe_subscription, template):
         """Build subscription data dictionary."""
@@ -1249,6 +1296,74 @@ class CreateOrUpdateSubscriptions(Step):
         return list(merged.values())
 
 
+def get_adobe_subscriptions_by_id(
+    adobe_client, context, subscription_ids: list[str]
+) -> dict[str, dict]:
+    """
+    Retrieves the Adobe subscriptions of the order customer indexed by subscription ID.
+
+    All the subscriptions of the customer are retrieved with a single request. Only the ones
+    missing from it, if any, are then retrieved one by one.
+
+    Args:
+        adobe_client: Adobe API client.
+        context: Order flow processing context.
+        subscription_ids: IDs of the subscriptions to retrieve.
+
+    Returns:
+        The Adobe subscriptions by subscription ID.
+    """
+    if not subscription_ids:
+        return {}
+
+    context.adobe_customer_subscriptions = adobe_client.get_subscriptions(
+        context.authorization_id, context.adobe_customer_id
+    ).get("items", [])
+    adobe_subscriptions = {}
+    for subscription_id in subscription_ids:
+        adobe_subscription = context.adobe_snapshot.get_subscription(subscription_id)
+        if not adobe_subscription:
+            adobe_subscription = adobe_client.get_subscription(
+                context.authorization_id, context.adobe_customer_id, subscription_id
+            )
+        adobe_subscriptions[subscription_id] = adobe_subscription
+    return adobe_subscriptions
+
+
+def run_mpt_updates(update: Callable[[dict], None], updates: Iterable) -> None:
+    """
+    Runs the MPT updates of an order, at most `FULFILLMENT_MPT_WORKERS` at the same time.
+
+    All the updates run even if some of them fail, the first failure is then raised. Each update
+    runs in a copy of the caller context, so the logging context of the order is kept.
+
+    Args:
+        update: Callable sending a single update to MPT.
+        updates: Arguments of every update call.
+    """
+    updates = list(updates)
+    workers = min(
+        int(
+            settings.EXTENSION_CONFIG.get(
+                "FULFILLMENT_MPT_WORKERS", DEFAULT_FULFILLMENT_MPT_WORKERS
+            )
+        ),
+        len(updates),
+    )
+    if workers <= 1:
+        for update_args in updates:
+            update(update_args)
+        return
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="mpt-update") as executor:
+        futures = [
+            executor.submit(contextvars.copy_context().run, update, update_args)
+            for update_args in updates
+        ]
+    for future in futures:
+        future.result()
+
+
 class CompleteOrder(Step):
     """Complete MPT Order with template."""
 
@@ -1287,18 +1402,14 @@ class SetSubscriptionTemplate(Step):
     def __call__(self, mpt_client, context, next_step):
         """Set subscription template."""
         adobe_client = get_adobe_client()
-        adobe_subscriptions = adobe_client.get_subscriptions(
+        context.adobe_customer_subscriptions = adobe_client.get_subscriptions(
             context.authorization_id,
             context.adobe_customer_id,
-        )
-
-        adobe_subscriptions_map = {
-            item["subscriptionId"]: item for item in adobe_subscriptions["items"]
-        }
+        )["items"]
 
         for subscription in context.order["agreement"]["subscriptions"]:
             subscription_id = subscription.get("externalIds", {}).get("vendor", "")
-            adobe_subscription = adobe_subscriptions_map.get(subscription_id)
+            adobe_subscription = context.adobe_snapshot.get_subscription(subscription_id)
 
             if not adobe_subscription:
                 logger.warning(
@@ -1522,12 +1633,13 @@ class CheckManualRenewalSubscriptions(Step):
             "renewals": context.manual_renewal_lines,
             "diverted": context.diverted_renewal_lines,
         }
-        context.order = update_ordering_parameter_value(
+        context.order = update_order_parameter_value(
+            client,
             context.order,
+            Param.PHASE_ORDERING.value,
             Param.LATE_RENEWALS_INFO.value,
             payload,
         )
-        update_order(client, context.order_id, parameters=context.order["parameters"])
         logger.info(
             "%s: persisted late renewals info (%s renewal SKU(s), %s diverted SKU(s))",
             context,
@@ -1589,10 +1701,12 @@ class CheckManualRenewalSubscriptions(Step):
 
     def _compute_from_adobe(self, context) -> None:
         """Detect manual renewal subscriptions via Adobe API and populate manual_renewal_lines."""
-        adobe_subscriptions_by_sku = self._get_adobe_subscriptions_by_sku(context)
+        deployment_snapshot = self._get_deployment_snapshot(context)
         for line in list(context.upsize_lines) + list(context.new_lines):
             sku = line["item"]["externalIds"]["vendor"]
-            adobe_subscription = adobe_subscriptions_by_sku.get(sku)
+            adobe_subscriptions = deployment_snapshot.get_subscriptions_by_partial_sku(sku)
+            # As for a lookup indexed by partial SKU, the last subscription of the SKU wins
+            adobe_subscription = adobe_subscriptions[-1] if adobe_subscriptions else None
             if self._needs_manual_renewal(adobe_subscription):
                 self._process_renewal_line(context, line, adobe_subscription)
 
@@ -1601,16 +1715,17 @@ class CheckManualRenewalSubscriptions(Step):
             "allowedActions", []
         )
 
-    def _get_adobe_subscriptions_by_sku(self, context) -> dict:
-        """Return all Adobe subscriptions for the customer indexed by partial SKU."""
+    def _get_deployment_snapshot(self, context) -> AdobeCustomerSnapshot:
+        """Return the Adobe subscriptions of the order deployment indexed for lookups."""
         adobe_client = get_adobe_client()
-        deployment_id = get_deployment_id(context.order)
-        all_subscriptions = adobe_client.get_subscriptions_by_deployment(
+        deployment_subscriptions = adobe_client.get_subscriptions_by_deployment(
             context.authorization_id,
             context.adobe_customer_id,
-            deployment_id,
+            context.deployment_id,
+        )
+        return AdobeCustomerSnapshot(
+            context.adobe_customer or {}, deployment_subscriptions["items"]
         )
-        return {get_partial_sku(sub["offerId"]): sub for sub in all_subscriptions["items"]}
 
     def _process_renewal_line(self, context, line, adobe_subscription) -> None:
         """Register a line as a manual renewal and split off any excess quantity."""
@@ -1753,14 +1868,10 @@ class SetupRenewalPlan(Step):
             context.adobe_customer_id,
         )
         context.adobe_customer_subscriptions = subscriptions["items"]
-        subscriptions_by_id = {
-            subscription["subscriptionId"]: subscription
-            for subscription in context.adobe_customer_subscriptions
-        }
 
         context.renewal_plan_subscriptions = []
         for entry in context.renewal_payload.get("subscriptions", []):
-            adobe_subscription = subscriptions_by_id.get(entry["subscriptionId"])
+            adobe_subscription = context.adobe_snapshot.get_subscription(entry["subscriptionId"])
             if not adobe_subscription:
                 switch_order_to_failed(
                     client,
@@ -1328,7 +1328,7 @@ class CreateTransferAssets(Step):
         adobe_client = get_adobe_client()
         adobe_transfer_order = context.adobe_transfer_order
         customer_id = adobe_transfer_order["customerId"]
-        one_time_skus = get_one_time_skus(client, context.order)
+        one_time_skus = context.get_one_time_skus(client)
         assets = []
         for item in adobe_transfer_order["lineItems"]:
             if get_partial_sku(item["offerId"]) not in one_time_skus:
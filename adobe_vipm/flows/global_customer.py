@@ -26,6 +26,7 @@ from mpt_extension_sdk.mpt_http.utils import find_first
 
 from adobe_vipm.adobe.client import get_adobe_client
 from adobe_vipm.adobe.constants import AdobeSubscriptionStatus
+from adobe_vipm.adobe.snapshot import AdobeCustomerSnapshot
 from adobe_vipm.adobe.utils import (
     sanitize_company_name,
     sanitize_first_last_name,
@@ -57,7 +58,9 @@ logger = logging.getLogger(__name__)
 
 
 # TODO: get function also changes state for agreement deployment :-(
-def get_adobe_subscriptions_by_deployment(adobe_client, authorization_id, agreement_deployment):
+def get_adobe_subscriptions_by_deployment(
+    adobe_client, authorization_id, agreement_deployment, adobe_customer
+):
     """
     Retrieve adobe subscriptions for specific agreement deployment.
 
@@ -65,6 +68,7 @@ def get_adobe_subscriptions_by_deployment(adobe_client, authorization_id, agreem
         adobe_client (AdobeClient): Adobe API client.
         authorization_id (str): Agreement auth id.
         agreement_deployment (AgreementDeployment): agreement deployment.
+        adobe_customer (dict): Adobe customer of the agreement deployment.
 
     Returns:
         list[dict]: List of adobe subscriptions.
@@ -80,11 +84,8 @@ def get_adobe_subscriptions_by_deployment(adobe_client, authorization_id, agreem
         agreement_deployment.save()
         return None
 
-    return [
-        item
-        for item in adobe_subscriptions["items"]
-        if item.get("deploymentId", "") == agreement_deployment.deployment_id
-    ]
+    snapshot = AdobeCustomerSnapshot(adobe_customer, adobe_subscriptions["items"])
+    return snapshot.get_subscriptions_by_deployment(agreement_deployment.deployment_id)
 
 
 def get_region_from_country(country):
@@ -679,7 +680,7 @@ def process_agreement_deployment(  # ruff:ignore[complex-structure]
             externalIds={"vendor": adobe_customer["customerId"]},
         )
         adobe_subscriptions = get_adobe_subscriptions_by_deployment(
-            adobe_client, authorization_id, agreement_deployment
+            adobe_client, authorization_id, agreement_deployment, adobe_customer
         )
         if not adobe_subscriptions:
             return
@@ -15,7 +15,8 @@ from adobe_vipm.adobe.constants import (
     ThreeYearCommitmentStatus,
 )
 from adobe_vipm.adobe.errors import AdobeAPIError, AdobeHttpError, AdobeProductNotFoundError
-from adobe_vipm.adobe.utils import get_3yc_commitment_request, get_item_by_partial_sku
+from adobe_vipm.adobe.snapshot import AdobeCustomerSnapshot
+from adobe_vipm.adobe.utils import get_3yc_commitment_request
 from adobe_vipm.airtable.models import (
     get_adobe_product_by_marketplace_sku,
     get_skus_with_available_prices,
@@ -61,7 +62,6 @@ from adobe_vipm.flows.utils import (
     reset_ordering_parameters_error,
     set_customer_data,
     set_order_error,
-    split_downsizes_upsizes_new,
 )
 from adobe_vipm.flows.utils.validation import validate_government_lga_data
 from adobe_vipm.notifications import send_exception, send_warning
@@ -138,11 +138,7 @@ class SetupContext(Step):
         context.order["agreement"]["licensee"] = get_licensee(
             client, context.order["agreement"]["licensee"]["id"]
         )
-        context.downsize_lines, context.upsize_lines, context.new_lines = (
-            split_downsizes_upsizes_new(
-                context.order,
-            )
-        )
+        context.downsize_lines, context.upsize_lines, context.new_lines = context.line_splits
 
         retry_count = get_retry_count(context.order)
         if retry_count and int(retry_count) > 0:
@@ -499,12 +495,10 @@ class Validate3YCCommitment(Step):
     def validate_items_in_subscriptions(self, context, subscriptions) -> tuple[bool, str]:
         """Validates items quantities in subscriptions."""
         if subscriptions.get("items", []):
+            snapshot = AdobeCustomerSnapshot(context.adobe_customer or {}, subscriptions["items"])
             for line in context.downsize_lines + context.upsize_lines:
-                adobe_item = get_item_by_partial_sku(
-                    subscriptions["items"], line["item"]["externalIds"]["vendor"]
-                )
-                if not adobe_item:
-                    vendor_id = line["item"]["externalIds"]["vendor"]
+                vendor_id = line["item"]["externalIds"]["vendor"]
+                if not snapshot.get_subscriptions_by_partial_sku(vendor_id):
                     return False, f"Item {vendor_id} not found in Adobe subscriptions"
         return True, None
 
@@ -624,7 +618,7 @@ class UpdatePrices(Step):
         logger.info("Actual SKUs: %s", self._actual_skus)
         prices = self._get_prices_for_skus()
         updated_lines = self._create_updated_lines(prices)
-        self._context.order["lines"] = updated_lines
+        self._context.order = {**self._context.order, "lines": updated_lines}
         if not self.is_validation:
             self._update_order(updated_lines)
 
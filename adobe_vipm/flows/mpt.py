@@ -2,13 +2,16 @@ import logging
 
 from django.conf import settings
 from mpt_extension_sdk.mpt_http.base import MPTClient
-from mpt_extension_sdk.mpt_http.mpt import get_agreements_by_query
+from mpt_extension_sdk.mpt_http.mpt import get_agreements_by_query, get_subscriptions_by_query
 
 from adobe_vipm.adobe.constants import ThreeYearCommitmentStatus
 from adobe_vipm.flows.constants import Param
+from adobe_vipm.flows.errors import wrap_http_error
 
 logger = logging.getLogger(__name__)
 
+BULK_QUERY_PAGE_SIZE = 100
+
 
 def get_agreements_by_3yc_commitment_request_status(
     mpt_client: MPTClient,
@@ -86,3 +89,44 @@ def get_agreements_by_3yc_commitment_request_invitation(
         "&select=lines,parameters,assets,subscriptions,product,listing"
     )
     return get_agreements_by_query(mpt_client, rql_query)
+
+
+def get_agreement_subscriptions(mpt_client: MPTClient, agreement_id: str) -> list[dict]:
+    """
+    Retrieves all the subscriptions of an agreement with their lines and parameters.
+
+    Args:
+        mpt_client: MPT API Client.
+        agreement_id: Agreement ID.
+
+    Returns:
+        Agreement subscriptions including lines, externalIds and parameters.
+    """
+    rql_query = f"eq(agreement.id,{agreement_id})&select=lines,parameters,externalIds"
+    return get_subscriptions_by_query(mpt_client, rql_query, limit=BULK_QUERY_PAGE_SIZE)
+
+
+@wrap_http_error
+def get_agreement_assets(mpt_client: MPTClient, agreement_id: str) -> list[dict]:
+    """
+    Retrieves all the assets of an agreement with their lines and parameters.
+
+    Args:
+        mpt_client: MPT API Client.
+        agreement_id: Agreement ID.
+
+    Returns:
+        Agreement assets including lines, externalIds and parameters.
+    """
+    url = f"/commerce/assets?eq(agreement.id,{agreement_id})&select=lines,parameters,externalIds"
+    assets = []
+    offset = 0
+    total = None
+    while total is None or offset < total:
+        response = mpt_client.get(f"{url}&limit={BULK_QUERY_PAGE_SIZE}&offset={offset}")
+        response.raise_for_status()
+        page = response.json()
+        assets.extend(page["data"])
+        total = page["$meta"]["pagination"]["total"]
+        offset += BULK_QUERY_PAGE_SIZE
+    return assets
@@ -1,15 +1,25 @@
+import logging
+import time
 from abc import ABC, abstractmethod
+from collections import defaultdict
 from collections.abc import Callable
 
 from mpt_extension_sdk.mpt_http.base import MPTClient
 
 from adobe_vipm.flows.context import Context
 
+logger = logging.getLogger(__name__)
+
 NextStep = Callable[[MPTClient, Context], None]
+ErrorHandler = Callable[[Exception, Context, NextStep], None]
 
 
 # TODO: why it is still here and not in SDK???
 class Step(ABC):
+    # Set by the steps doing work after their next step returns, like handling its errors,
+    # so that the next step runs the rest of the pipeline before returning.
+    wraps_next_step = False
+
     @abstractmethod
     def __call__(
         self,
@@ -42,34 +52,154 @@ def get_failed_step(error: Exception) -> str | None:
     return getattr(error, FAILED_STEP_ATTRIBUTE, None)
 
 
+class StepMiddleware:
+    """Hooks called by the pipeline around every step, doing nothing by default."""
+
+    def before_step(self, step: Step, context: Context) -> None:
+        """Called before the step runs."""
+
+    def after_step(self, step: Step, context: Context) -> None:
+        """Called once the step returned."""
+
+    def on_step_error(self, step: Step, context: Context, error: Exception) -> None:
+        """Called when the step raised, before the error handler."""
+
+
+class StepTimer(StepMiddleware):
+    """
+    Records the wall time spent in every step class.
+
+    Steps running the rest of the pipeline inside their own call (see `Step.wraps_next_step`)
+    include the time of the steps they run.
+
+    Attributes:
+        timings: Seconds spent per step class name, in the order the steps ran.
+    """
+
+    def __init__(self):
+        self.timings: dict[str, float] = defaultdict(float)
+        self._started: list[float] = []
+
+    def before_step(self, step: Step, context: Context) -> None:
+        """Starts timing the step."""
+        self._started.append(time.perf_counter())
+
+    def after_step(self, step: Step, context: Context) -> None:
+        """Records the time spent in the step."""
+        self._stop(step)
+
+    def on_step_error(self, step: Step, context: Context, error: Exception) -> None:
+        """Records the time spent in the step until it raised."""
+        self._stop(step)
+
+    def summary(self) -> str:
+        """Returns the time spent per step class, e.g. `SetupContext=0.120s, ...`."""
+        return ", ".join(f"{name}={seconds:.3f}s" for name, seconds in self.timings.items())
+
+    def _stop(self, step: Step) -> None:
+        self.timings[type(step).__name__] += time.perf_counter() - self._started.pop()
+
+
 class Cursor:
-    def __init__(self, steps, error_handler):
-        self.queue = steps
-        self.error_handler = error_handler
+    """
+    The `next_step` handed to a step, pointing to the index of the following step.
+
+    Calling it only records the request to continue, and the pipeline runs the following
+    step once the current one returned, so the steps don't nest. The cursor of a step that
+    wraps its next step runs the rest of the pipeline right away instead.
+    """
+
+    def __init__(self, pipeline_run: "PipelineRun", index: int, *, eager: bool):
+        self.index = index
+        self.continue_with: tuple[MPTClient, Context] | None = None
+        self._pipeline_run = pipeline_run
+        self._eager = eager
 
     def __call__(self, client: MPTClient, context: Context):
-        if not self.queue:
-            return
-        current_step = self.queue[0]
-        next_step = Cursor(self.queue[1:], self.error_handler)
+        if self._eager:
+            self._pipeline_run.execute(client, context, self.index)
+        else:
+            self.continue_with = (client, context)
+
 
+class PipelineRun:
+    """A single run of the steps of a pipeline."""
+
+    def __init__(
+        self,
+        steps: tuple[Step, ...],
+        error_handler: ErrorHandler,
+        middlewares: tuple[StepMiddleware, ...],
+    ):
+        self.steps = steps
+        self.error_handler = error_handler
+        self.middlewares = middlewares
+
+    def execute(self, client: MPTClient, context: Context, index: int = 0) -> None:
+        """
+        Runs the steps from the index until one doesn't call its next step.
+
+        Args:
+            client: The MPT client.
+            context: The pipeline context.
+            index: Index of the first step to run.
+        """
+        while index < len(self.steps):
+            step = self.steps[index]
+            next_step = Cursor(self, index + 1, eager=step.wraps_next_step)
+            self._run_step(step, client, context, next_step)
+            if next_step.continue_with is None:
+                return
+            client, context = next_step.continue_with
+            index += 1
+
+    def _run_step(self, step: Step, client: MPTClient, context: Context, next_step: Cursor):
+        for middleware in self.middlewares:
+            middleware.before_step(step, context)
         try:
-            current_step(client, context, next_step)
+            step(client, context, next_step)
         except Exception as error:
-            # The innermost cursor annotates first, so the step that actually raised wins
-            # over the outer steps the error propagates through.
+            # The innermost step annotates first, so the step that actually raised wins
+            # over the wrapping steps the error propagates through.
             if not get_failed_step(error):
-                setattr(error, FAILED_STEP_ATTRIBUTE, type(current_step).__name__)
+                setattr(error, FAILED_STEP_ATTRIBUTE, type(step).__name__)
+            for middleware in self.middlewares:
+                middleware.on_step_error(step, context, error)
             self.error_handler(error, context, next_step)
+            return
+        for middleware in self.middlewares:
+            middleware.after_step(step, context)
 
 
 class Pipeline:
-    def __init__(self, *steps):
+    """
+    Steps run in order, each one deciding whether the following ones run.
+
+    Every run logs the wall time spent per step class.
+    """
+
+    def __init__(self, *steps: Step, middlewares: tuple[StepMiddleware, ...] = ()):
         self.queue = steps
+        self.middlewares = middlewares
 
     def run(self, client: MPTClient, context: Context, error_handler=None):
-        execute = Cursor(self.queue, error_handler or _default_error_handler)
-        return execute(client, context)
+        """
+        Runs the steps with the context.
+
+        Args:
+            client: The MPT client.
+            context: The pipeline context.
+            error_handler: Called with the error, the context and the next step when a step
+                raises. Defaults to re-raising the error.
+        """
+        timer = StepTimer()
+        pipeline_run = PipelineRun(
+            self.queue, error_handler or _default_error_handler, (timer, *self.middlewares)
+        )
+        try:
+            pipeline_run.execute(client, context)
+        finally:
+            logger.info("%s: pipeline steps took %s", context, timer.summary())
 
     def __len__(self):
         return len(self.queue)
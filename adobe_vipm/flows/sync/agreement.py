@@ -1,3 +1,4 @@
+import copy
 import datetime as dt
 import logging
 import traceback
@@ -11,6 +12,8 @@ from mpt_extension_sdk.mpt_http import mpt
 from mpt_extension_sdk.mpt_http.base import MPTClient
 from mpt_extension_sdk.mpt_http.utils import find_first
 
+from adobe_vipm.adobe import deployment_registry
+from adobe_vipm.adobe import utils as adobe_utils
 from adobe_vipm.adobe.client import AdobeClient
 from adobe_vipm.adobe.constants import (
     THREE_YC_TEMP_3YC_STATUSES,
@@ -19,12 +22,8 @@ from adobe_vipm.adobe.constants import (
     OfferType,
 )
 from adobe_vipm.adobe.errors import AdobeAPIError, AuthorizationNotFoundError
-from adobe_vipm.adobe.utils import (
-    get_3yc_commitment_request,
-    get_3yc_recommitment_request,
-    sanitize_company_name,
-    sanitize_first_last_name,
-)
+from adobe_vipm.adobe.request_cache import request_cache_scope
+from adobe_vipm.adobe.snapshot import AdobeCustomerSnapshot
 from adobe_vipm.airtable import models
 from adobe_vipm.flows import utils as flows_utils
 from adobe_vipm.flows.benefits import send_3yc_expiration_notification
@@ -39,17 +38,20 @@ from adobe_vipm.flows.constants import (
     Param,
     SubscriptionStatus,
 )
-from adobe_vipm.flows.mpt import get_agreements_by_3yc_commitment_request_invitation
+from adobe_vipm.flows.mpt import (
+    get_agreement_subscriptions,
+    get_agreements_by_3yc_commitment_request_invitation,
+)
+from adobe_vipm.flows.sync import diff as sync_diff
 from adobe_vipm.flows.sync.asset import AssetSyncer
-from adobe_vipm.flows.sync.helper import check_adobe_subscription_id
+from adobe_vipm.flows.sync.engine import (
+    AgreementSyncEngine,
+    AgreementSyncReport,
+    SyncOutcomeStatus,
+)
 from adobe_vipm.flows.sync.price_manager import PriceManager
 from adobe_vipm.flows.sync.subscription import SubscriptionSyncer
-from adobe_vipm.flows.utils import notify_agreement_unhandled_exception_in_teams
-from adobe_vipm.flows.utils.market_segment import (
-    get_market_segment,
-    is_large_government_agency_type,
-)
-from adobe_vipm.flows.utils.parameter import get_fulfillment_parameter
+from adobe_vipm.flows.utils.market_segment import is_large_government_agency_type
 from adobe_vipm.flows.utils.template import get_template_data_by_adobe_subscription
 from adobe_vipm.notifications import send_exception, send_warning
 from adobe_vipm.utils import get_3yc_commitment, get_partial_sku
@@ -83,9 +85,10 @@ class AgreementSyncer:  # noqa: WPS214
         self._mpt_client = mpt_client
         self._adobe_client = adobe_client
         self._agreement = agreement
-        self._adobe_customer = adobe_customer
-        self._adobe_customer_id = adobe_customer["customerId"]
-        self._adobe_subscriptions = adobe_subscriptions
+        self._snapshot = AdobeCustomerSnapshot(adobe_customer, adobe_subscriptions)
+        self._written_lines: dict[str, list[dict]] = {}
+        # Agreements whose update collapsed into the last sync date update, in insertion order
+        self._collapsed_agreement_ids: dict[str, None] = {}
         self._dry_run = dry_run
         self._authorization_id: str = agreement["authorization"]["id"]
         self._seller_id: str = agreement["seller"]["id"]
@@ -102,23 +105,31 @@ class AgreementSyncer:  # noqa: WPS214
         """Agreement product id."""
         return self._agreement["product"]["id"]
 
-    def sync(self, *, sync_prices: bool) -> None:  # ruff:ignore[complex-structure]
+    def sync(self, *, sync_prices: bool) -> SyncOutcomeStatus:  # ruff:ignore[complex-structure]
         """
         Sync agreement with parameters, prices from Adobe API, airtable to MPT agreement.
 
+        Errors are logged and notified instead of raised, so the status tells the callers
+        whether the agreement has been synchronized.
+
         Args:
             sync_prices: If true sync prices. Keep in mind dry_run parameter.
+
+        Returns:
+            The status of the synchronization, failed if an error has been notified.
         """
         logger.info("Synchronizing agreement %s", self.agreement_id)
         if self._agreement["status"] != AgreementStatus.ACTIVE:
             logger.info(
                 "Skipping agreement %s because it is not in Active status", self.agreement_id
             )
-            return
+            return SyncOutcomeStatus.SKIPPED
 
         try:
             if not self._is_sync_possible():
-                return
+                return SyncOutcomeStatus.SKIPPED
+
+            self._written_lines[self.agreement_id] = copy.deepcopy(self._agreement["lines"])
 
             self._update_agreement_customer_parameters(self._adobe_customer, self._agreement)
             self._add_missing_subscriptions_and_assets()  # TODO: move asset part to asset classes
@@ -127,8 +138,7 @@ class AgreementSyncer:  # noqa: WPS214
                 self._mpt_client,
                 self.agreement_id,
                 self._agreement["assets"],
-                self._adobe_customer,
-                self._adobe_subscriptions,
+                self._snapshot,
             ).sync(dry_run=self._dry_run)
 
             subscriptions_for_update = self._get_subscriptions_for_update(self._agreement)
@@ -151,37 +161,83 @@ class AgreementSyncer:  # noqa: WPS214
             )
 
             if self._adobe_customer.get("globalSalesEnabled", False):
-                adobe_deployments = self._adobe_client.get_customer_deployments_active_status(
-                    self._authorization_id, self._adobe_customer_id
-                )
-                self._sync_global_customer_parameters(adobe_deployments)
-
-                deployment_id = flows_utils.get_parameter(
-                    Param.PHASE_FULFILLMENT.value, self._agreement, Param.DEPLOYMENT_ID.value
-                ).get("value", "")
-
-                if not deployment_id and adobe_deployments:
-                    self._process_main_agreement_deployments(
-                        adobe_deployments, sync_prices=sync_prices
-                    )
+                self._sync_deployments(sync_prices=sync_prices)
 
         except AuthorizationNotFoundError:
             logger.exception(
                 "AuthorizationNotFoundError synchronizing agreement %s.", self.agreement_id
             )
+            return SyncOutcomeStatus.FAILED
         except Exception:
             logger.exception("Error synchronizing agreement %s.", self.agreement_id)
             flows_utils.notification.notify_agreement_unhandled_exception_in_teams(
                 self.agreement_id, traceback.format_exc()
             )
+            return SyncOutcomeStatus.FAILED
+
+        self._update_last_sync_date()
+        self._agreement = mpt.get_agreement(self._mpt_client, self._agreement["id"])
+        return SyncOutcomeStatus.SYNCED
+
+    @property
+    def _adobe_customer(self) -> dict:
+        return self._snapshot.customer
+
+    @_adobe_customer.setter
+    def _adobe_customer(self, adobe_customer: dict) -> None:
+        self._snapshot = AdobeCustomerSnapshot(adobe_customer, self._snapshot.subscriptions)
+
+    @property
+    def _adobe_customer_id(self) -> str:
+        return self._snapshot.customer_id
+
+    @property
+    def _adobe_subscriptions(self) -> list[dict]:
+        return self._snapshot.subscriptions
+
+    @_adobe_subscriptions.setter
+    def _adobe_subscriptions(self, adobe_subscriptions: list[dict]) -> None:
+        self._snapshot = AdobeCustomerSnapshot(self._snapshot.customer, adobe_subscriptions)
+
+    def _sync_deployments(self, *, sync_prices: bool) -> None:
+        adobe_deployments = self._adobe_client.get_customer_deployments_active_status(
+            self._authorization_id, self._adobe_customer_id, cached=True
+        )
+        deployment_changes = deployment_registry.DEPLOYMENT_REGISTRY.get_changes(
+            self.agreement_id, self._adobe_customer_id, adobe_deployments
+        )
+        if deployment_changes or flows_utils.get_global_customer(self._agreement) != ["Yes"]:
+            in_sync = self._sync_global_customer_parameters(adobe_deployments)
         else:
-            self._update_last_sync_date()
-            self._agreement = mpt.get_agreement(self._mpt_client, self._agreement["id"])
+            logger.info(
+                "Deployments of agreement %s unchanged since the last sync", self.agreement_id
+            )
+            in_sync = True
+
+        deployment_id = flows_utils.get_parameter(
+            Param.PHASE_FULFILLMENT.value, self._agreement, Param.DEPLOYMENT_ID.value
+        ).get("value", "")
+
+        pending_deployment_ids = set()
+        if not deployment_id and adobe_deployments:
+            pending_deployment_ids = self._process_main_agreement_deployments(
+                adobe_deployments, deployment_changes, sync_prices=sync_prices
+            )
+        if in_sync and not self._dry_run:
+            deployment_registry.DEPLOYMENT_REGISTRY.acknowledge(
+                deployment_changes, pending_deployment_ids
+            )
 
     def _process_main_agreement_deployments(
-        self, adobe_deployments: list[dict], *, sync_prices: bool
-    ):
-        self._check_update_airtable_missing_deployments(adobe_deployments)
+        self,
+        adobe_deployments: list[dict],
+        deployment_changes: deployment_registry.DeploymentChanges | None = None,
+        *,
+        sync_prices: bool,
+    ) -> set[str]:
+        pending_deployment_ids = self._check_update_airtable_missing_deployments(
+            adobe_deployments, deployment_changes
+        )
         deployment_agreements = mpt.get_agreements_by_customer_deployments(
             self._mpt_client,
             Param.DEPLOYMENT_ID.value,
@@ -197,6 +253,7 @@ class AgreementSyncer:  # noqa: WPS214
             self._sync_deployment_agreements(
                 adobe_deployments, active_deployment_agreements, sync_prices=sync_prices
             )
+        return pending_deployment_ids
 
     def _is_sync_possible(self):
         if any(
@@ -215,12 +272,10 @@ class AgreementSyncer:  # noqa: WPS214
             )
             return False
 
-        active_subscriptions = [
-            subscription
-            for subscription in self._adobe_subscriptions
-            if subscription["status"] == AdobeSubscriptionStatus.ACTIVE.value
-        ]
-        if active_subscriptions and not self._adobe_customer.get("discounts", []):
+        active_subscriptions = self._snapshot.get_subscriptions_by_status(
+            AdobeSubscriptionStatus.ACTIVE.value
+        )
+        if active_subscriptions and not self._snapshot.discounts:
             # Discounts only matter when there are active subscriptions to price.
             # Adobe returns no discounts for a customer without active subscriptions
             # (e.g. all subscriptions expired, or a 3YC commitment request still in
@@ -247,9 +302,7 @@ class AgreementSyncer:  # noqa: WPS214
             self.agreement_id,
             deployment_id,
         )
-        adobe_subscriptions = tuple(
-            a_s for a_s in self._adobe_subscriptions if a_s.get("deploymentId", "") == deployment_id
-        )
+        adobe_subscriptions = self._snapshot.get_subscriptions_by_deployment(deployment_id)
         skus = {get_partial_sku(item["offerId"]) for item in adobe_subscriptions}
 
         mpt_entitlements_external_ids = self._extract_mpt_entitlements_external_ids()
@@ -489,7 +542,7 @@ class AgreementSyncer:  # noqa: WPS214
     def _update_agreement_bussiness_parameters(self, agreement: dict) -> None:
         parameters = {}
 
-        commitment_info = get_3yc_commitment(self._adobe_customer)
+        commitment_info = self._snapshot.commitment
 
         if not is_large_government_agency_type(self.product_id):
             self._notify_if_3yc_commitment_expired(agreement, commitment_info)
@@ -503,7 +556,7 @@ class AgreementSyncer:  # noqa: WPS214
             "value": self._adobe_customer.get("cotermDate", ""),
         })
 
-        if get_market_segment(self.product_id) == MARKET_SEGMENT_EDUCATION:
+        if flows_utils.get_market_segment(self.product_id) == MARKET_SEGMENT_EDUCATION:
             self._add_education_market_sub_segments(parameters)
 
         self._execute_agreement_update(agreement, parameters)
@@ -515,7 +568,7 @@ class AgreementSyncer:  # noqa: WPS214
 
         parameters[Param.PHASE_ORDERING.value].append({
             "externalId": Param.COMPANY_NAME.value,
-            "value": sanitize_company_name(company_profile.get("companyName", "")),
+            "value": adobe_utils.sanitize_company_name(company_profile.get("companyName", "")),
         })
 
         if address_source:
@@ -553,8 +606,8 @@ class AgreementSyncer:  # noqa: WPS214
         if not matched:
             return flows_utils.get_contact(contacts[0], country)
 
-        new_first = sanitize_first_last_name(matched.get("firstName", ""))
-        new_last = sanitize_first_last_name(matched.get("lastName", ""))
+        new_first = adobe_utils.sanitize_first_last_name(matched.get("firstName", ""))
+        new_last = adobe_utils.sanitize_first_last_name(matched.get("lastName", ""))
         if (
             current_contact.get("firstName") == new_first
             and current_contact.get("lastName") == new_last
@@ -564,23 +617,33 @@ class AgreementSyncer:  # noqa: WPS214
         return {**current_contact, "firstName": new_first, "lastName": new_last}
 
     def _execute_agreement_update(self, agreement: dict, parameters: dict) -> None:
-        if self._dry_run:
+        # Lines are compared with the last written ones as the line prices are updated in place
+        current_lines = self._written_lines.setdefault(
+            agreement["id"], copy.deepcopy(agreement["lines"])
+        )
+        intended = {"lines": agreement["lines"], "parameters": parameters}
+        payload = sync_diff.get_update_payload({**agreement, "lines": current_lines}, intended)
+        sync_diff.sync_write_stats.record(intended, payload)
+        if sync_diff.is_last_sync_date_only(payload):
+            # The last sync date is only written once the whole agreement is synchronized
             logger.info(
-                "Dry run mode: skipping update for agreement %s with:\n lines: %s\n parameters: %s",
+                "Nothing to update for agreement %s: collapsed into the last sync date update",
                 agreement["id"],
-                agreement["lines"],
-                parameters,
             )
-        else:
-            mpt.update_agreement(
-                self._mpt_client,
+            self._collapsed_agreement_ids[agreement["id"]] = None
+        elif self._dry_run:
+            logger.info(
+                "Dry run mode: skipping update for agreement %s with: %s",
                 agreement["id"],
-                lines=agreement["lines"],
-                parameters=parameters,
+                payload,
             )
+        else:
+            mpt.update_agreement(self._mpt_client, agreement["id"], **payload)
+            if "lines" in payload:
+                self._written_lines[agreement["id"]] = copy.deepcopy(agreement["lines"])
 
     def _notify_if_3yc_commitment_expired(self, agreement: dict, commitment_info: dict) -> None:
-        three_yc_enroll_status = get_fulfillment_parameter(
+        three_yc_enroll_status = flows_utils.get_fulfillment_parameter(
             agreement, Param.THREE_YC_ENROLL_STATUS.value
         )
         enroll_status_value = three_yc_enroll_status.get("value")
@@ -632,7 +695,7 @@ class AgreementSyncer:  # noqa: WPS214
         self, adobe_customer: dict, parameters: dict
     ) -> None:
         parameters.setdefault(Param.PHASE_FULFILLMENT.value, [])
-        commitment_request_info = get_3yc_commitment_request(adobe_customer)
+        commitment_request_info = adobe_utils.get_3yc_commitment_request(adobe_customer)
 
         parameters[Param.PHASE_FULFILLMENT.value] += [
             {
@@ -672,7 +735,7 @@ class AgreementSyncer:  # noqa: WPS214
         self, adobe_customer: dict, parameters: dict
     ) -> None:
         parameters.setdefault(Param.PHASE_FULFILLMENT.value, [])
-        recommitment_request_info = get_3yc_recommitment_request(adobe_customer)
+        recommitment_request_info = adobe_utils.get_3yc_recommitment_request(adobe_customer)
 
         parameters[Param.PHASE_FULFILLMENT.value] += [
             {
@@ -755,7 +818,9 @@ class AgreementSyncer:  # noqa: WPS214
                 )
                 continue
 
-            actual_sku = models.get_adobe_sku(vendor_id, get_market_segment(self.product_id))
+            actual_sku = models.get_adobe_sku(
+                vendor_id, flows_utils.get_market_segment(self.product_id)
+            )
             agreement_lines.append((line, actual_sku))
 
         return agreement_lines
@@ -764,6 +829,7 @@ class AgreementSyncer:  # noqa: WPS214
     def _get_subscriptions_for_update(self, agreement: dict) -> list[tuple[dict, dict, str]]:  # ruff:ignore[complex-structure]
         logger.info("Getting subscriptions for update for agreement %s", agreement["id"])
         for_update = []
+        mpt_subscriptions = self._get_mpt_subscriptions(agreement)
         for subscription in agreement["subscriptions"]:
             if subscription["status"] in {
                 SubscriptionStatus.TERMINATED,
@@ -779,7 +845,9 @@ class AgreementSyncer:  # noqa: WPS214
 
                 continue
 
-            mpt_subscription = mpt.get_agreement_subscription(self._mpt_client, subscription["id"])
+            mpt_subscription = mpt_subscriptions.get(subscription["id"]) or (
+                mpt.get_agreement_subscription(self._mpt_client, subscription["id"])
+            )
             if not mpt_subscription["lines"]:
                 logger.info("Skipping subscription %s because it has no lines", subscription["id"])
                 send_warning(
@@ -789,10 +857,7 @@ class AgreementSyncer:  # noqa: WPS214
 
             adobe_subscription_id = mpt_subscription.get("externalIds", {}).get("vendor")
 
-            adobe_subscription = find_first(
-                partial(check_adobe_subscription_id, adobe_subscription_id),
-                self._adobe_subscriptions,
-            )
+            adobe_subscription = self._snapshot.get_subscription(adobe_subscription_id)
 
             if not adobe_subscription:
                 logger.error("No subscription found in Adobe customer data!")
@@ -824,6 +889,30 @@ class AgreementSyncer:  # noqa: WPS214
 
         return for_update
 
+    def _get_mpt_subscriptions(self, agreement: dict) -> dict[str, dict]:
+        """
+        Loads all the agreement subscriptions with a single paged query.
+
+        Subscriptions missing from the result, e.g. created while the agreement is being
+        synchronized, are fetched one by one by the caller.
+
+        Args:
+            agreement: Agreement to load the subscriptions for.
+
+        Returns:
+            The subscriptions with lines, external ids and parameters by subscription id.
+        """
+        if all(
+            subscription["status"] in {SubscriptionStatus.TERMINATED, SubscriptionStatus.EXPIRED}
+            for subscription in agreement["subscriptions"]
+        ):
+            return {}
+
+        return {
+            subscription["id"]: subscription
+            for subscription in get_agreement_subscriptions(self._mpt_client, agreement["id"])
+        }
+
     def _is_subscription_template_final(self, subscription: dict) -> bool:
         template_name = subscription.get("template", {}).get("name")
         return template_name in {TEMPLATE_SUBSCRIPTION_EXPIRED, TEMPLATE_SUBSCRIPTION_TERMINATION}
@@ -848,9 +937,29 @@ class AgreementSyncer:  # noqa: WPS214
                 self._mpt_client, subscription["id"], template=template_data
             )
 
-    def _check_update_airtable_missing_deployments(self, adobe_deployments: list[dict]) -> None:  # ruff:ignore[complex-structure]
-        logger.info("Checking airtable for missing deployments for agreement %s", self.agreement_id)
+    def _check_update_airtable_missing_deployments(  # ruff:ignore[complex-structure]
+        self,
+        adobe_deployments: list[dict],
+        deployment_changes: deployment_registry.DeploymentChanges | None = None,
+    ) -> set[str]:
+        """
+        Adds to Airtable the deployments of the customer missing there.
+
+        Args:
+            adobe_deployments: Active Adobe customer deployments.
+            deployment_changes: Changes of the deployments since the last sync. If given, only
+                the deployments added or whose status changed since then are checked.
+
+        Returns:
+            Ids of the missing deployments that couldn't be added, as no transfer was found.
+        """
         customer_deployment_ids = {cd["deploymentId"] for cd in adobe_deployments}
+        if deployment_changes is not None and not deployment_changes.initial:
+            customer_deployment_ids &= deployment_changes.updated_ids
+            if not customer_deployment_ids:
+                logger.info("No new deployments to check in airtable for %s", self.agreement_id)
+                return set()
+        logger.info("Checking airtable for missing deployments for agreement %s", self.agreement_id)
         airtable_deployment_ids = {
             ad.deployment_id
             for ad in models.get_gc_agreement_deployments_by_main_agreement(
@@ -859,9 +968,10 @@ class AgreementSyncer:  # noqa: WPS214
         }
         missing_deployment_ids = customer_deployment_ids - airtable_deployment_ids
         if not missing_deployment_ids:
-            return
+            return set()
         logger.info("Found missing deployments: %s", missing_deployment_ids)
         missing_deployments_data = []
+        pending_deployment_ids = set()
         for missing_deployment_id in sorted(missing_deployment_ids):
             transfer = models.get_transfer_by_authorization_membership_or_customer(
                 self.product_id,
@@ -870,12 +980,15 @@ class AgreementSyncer:  # noqa: WPS214
             )
             if not transfer:
                 logger.info("No transfer found for missing deployment %s", missing_deployment_id)
+                pending_deployment_ids.add(missing_deployment_id)
                 continue
 
-            is_deployment_matched = partial(_is_deployment_matched, missing_deployment_id)
+            deployment_subscriptions = self._snapshot.get_subscriptions_by_deployment(
+                missing_deployment_id
+            )
             deployment_currency = (
-                find_first(is_deployment_matched, self._adobe_subscriptions, {})
-            ).get("currencyCode")
+                deployment_subscriptions[0]["currencyCode"] if deployment_subscriptions else None
+            )
             missing_deployments_data.append({
                 "deployment": find_first(
                     partial(_check_adobe_deployment_id, missing_deployment_id), adobe_deployments
@@ -918,13 +1031,17 @@ class AgreementSyncer:  # noqa: WPS214
                     "Missing deployments added to Airtable",
                     f"agreement {self.agreement_id}, deployments: {missing_deployment_ids}.",
                 )
+        return pending_deployment_ids
 
-    def _sync_global_customer_parameters(self, adobe_deployments: list[dict]) -> None:
+    def _sync_global_customer_parameters(self, adobe_deployments: list[dict]) -> bool:
         """
         Sync global customer parameters for the agreement.
 
         Args:
             adobe_deployments: Adobe customer deployments.
+
+        Returns:
+            True if the parameters are in sync, False if updating them failed.
         """
         try:
             parameters = {Param.PHASE_FULFILLMENT.value: []}
@@ -967,6 +1084,8 @@ class AgreementSyncer:  # noqa: WPS214
             flows_utils.notification.notify_agreement_unhandled_exception_in_teams(
                 self.agreement_id, traceback.format_exc()
             )
+            return False
+        return True
 
     def _process_orphaned_deployment_subscriptions(self, deployment_agreements: list[dict]) -> None:
         logger.info("Looking for orphaned deployment subscriptions in Adobe.")
@@ -982,10 +1101,12 @@ class AgreementSyncer:  # noqa: WPS214
             if subscription.get("deploymentId")
         }
         orphaned_subscription_ids = adobe_subscription_ids - mpt_subscription_ids
+        orphaned_subscriptions = (
+            self._snapshot.get_subscription(subscription_id)
+            for subscription_id in sorted(orphaned_subscription_ids)
+        )
 
-        for subscription in filter(
-            partial(_is_subscription_in_set, orphaned_subscription_ids), self._adobe_subscriptions
-        ):
+        for subscription in orphaned_subscriptions:
             if subscription["autoRenewal"]["enabled"] is False or subscription["status"] in {
                 AdobeSubscriptionStatus.INACTIVE.value,
                 AdobeSubscriptionStatus.PENDING.value,
@@ -1080,23 +1201,19 @@ class AgreementSyncer:  # noqa: WPS214
             )
 
     def _update_last_sync_date(self) -> None:
-        logger.info("Updating Last Sync Date for agreement %s", self.agreement_id)
-        parameters_data = {
-            "fulfillment": [
-                {
-                    "externalId": Param.LAST_SYNC_DATE.value,
-                    "value": dt.datetime.now(tz=dt.UTC).date().isoformat(),
-                },
-            ]
-        }
-        if self._dry_run:
-            logger.info(
-                "Dry run mode: skipping update agreement last sync date %s with:\n parameters: %s",
-                self.agreement_id,
-                parameters_data,
-            )
-        else:
-            mpt.update_agreement(self._mpt_client, self.agreement_id, parameters=parameters_data)
+        parameters_data = {"fulfillment": [sync_diff.get_last_sync_date_parameter()]}
+        # The main agreement always, and the deployment agreements that had nothing to update
+        for agreement_id in {self.agreement_id: None, **self._collapsed_agreement_ids}:
+            logger.info("Updating Last Sync Date for agreement %s", agreement_id)
+            if self._dry_run:
+                logger.info(
+                    "Dry run mode: skipping update agreement last sync date %s with:\n"
+                    " parameters: %s",
+                    agreement_id,
+                    parameters_data,
+                )
+            else:
+                mpt.update_agreement(self._mpt_client, agreement_id, parameters=parameters_data)
 
     def _add_education_market_sub_segments(self, parameters: dict) -> None:
         subsegments = self._adobe_customer.get("companyProfile", {}).get("marketSubSegments", [])
@@ -1126,21 +1243,17 @@ class AgreementSyncer:  # noqa: WPS214
             send_exception(title="Price currency mismatch detected!", text=f"{adobe_subscription}")
 
 
-def _is_deployment_matched(missing_deployment_id: str, subscription: dict) -> bool:
-    return subscription.get("deploymentId") == missing_deployment_id
-
-
 def _check_adobe_deployment_id(deployment_id: str, adobe_deployment: dict) -> bool:
     return adobe_deployment.get("deploymentId", "") == deployment_id
 
 
-def _is_subscription_in_set(subscription_ids: set, subscription: dict) -> bool:
-    return subscription["subscriptionId"] in subscription_ids
-
-
 def sync_agreements_by_3yc_end_date(
-    mpt_client: MPTClient, adobe_client: AdobeClient, *, dry_run: bool
-) -> None:
+    mpt_client: MPTClient,
+    adobe_client: AdobeClient,
+    *,
+    dry_run: bool,
+    engine: AgreementSyncEngine | None = None,
+) -> AgreementSyncReport:
     """
     Synchronizes agreements by their active subscriptions renewed yesterday.
 
@@ -1148,16 +1261,29 @@ def sync_agreements_by_3yc_end_date(
         adobe_client: Adobe Client
         mpt_client: MPT API client.
         dry_run: Run in dry run mode.
+        engine: Engine used to run the synchronizations, sequential by default.
+
+    Returns:
+        The report with the outcome of every synchronized agreement.
     """
     logger.info("Syncing agreements by 3yc End Date...")
-    _sync_agreements_by_param(
-        mpt_client, adobe_client, Param.THREE_YC_END_DATE.value, dry_run=dry_run, sync_prices=True
+    return _sync_agreements_by_param(
+        mpt_client,
+        adobe_client,
+        Param.THREE_YC_END_DATE.value,
+        dry_run=dry_run,
+        sync_prices=True,
+        engine=engine,
     )
 
 
 def sync_agreements_by_coterm_date(
-    mpt_client: MPTClient, adobe_client: AdobeClient, *, dry_run: bool
-) -> None:
+    mpt_client: MPTClient,
+    adobe_client: AdobeClient,
+    *,
+    dry_run: bool,
+    engine: AgreementSyncEngine | None = None,
+) -> AgreementSyncReport:
     """
     Synchronizes agreements by their active subscriptions renewed yesterday.
 
@@ -1165,10 +1291,19 @@ def sync_agreements_by_coterm_date(
         adobe_client: Adobe API client.
         mpt_client: MPT API client.
         dry_run: Run in dry run mode.
+        engine: Engine used to run the synchronizations, sequential by default.
+
+    Returns:
+        The report with the outcome of every synchronized agreement.
     """
     logger.info("Synchronizing agreements by cotermDate...")
-    _sync_agreements_by_param(
-        mpt_client, adobe_client, Param.COTERM_DATE.value, dry_run=dry_run, sync_prices=True
+    return _sync_agreements_by_param(
+        mpt_client,
+        adobe_client,
+        Param.COTERM_DATE.value,
+        dry_run=dry_run,
+        sync_prices=True,
+        engine=engine,
     )
 
 
@@ -1179,7 +1314,8 @@ def _sync_agreements_by_param(
     *,
     dry_run: bool,
     sync_prices: bool,
-) -> None:
+    engine: AgreementSyncEngine | None,
+) -> AgreementSyncReport:
     today = dt.datetime.now(tz=dt.UTC).date()
     today_iso = today.isoformat()
     yesterday = (today - dt.timedelta(days=1)).isoformat()
@@ -1191,15 +1327,23 @@ def _sync_agreements_by_param(
         # Let's get only what we need
         "select=lines,parameters,assets,subscriptions,product,listing"
     )
-    for agreement in mpt.get_agreements_by_query(mpt_client, rql_query):
-        sync_agreement(
-            mpt_client, adobe_client, agreement, dry_run=dry_run, sync_prices=sync_prices
-        )
+    return _sync_agreements(
+        mpt_client,
+        adobe_client,
+        mpt.get_agreements_by_query(mpt_client, rql_query),
+        dry_run=dry_run,
+        sync_prices=sync_prices,
+        engine=engine,
+    )
 
 
 def sync_agreements_by_renewal_date(
-    mpt_client: MPTClient, adobe_client: AdobeClient, *, dry_run: bool
-) -> None:
+    mpt_client: MPTClient,
+    adobe_client: AdobeClient,
+    *,
+    dry_run: bool,
+    engine: AgreementSyncEngine | None = None,
+) -> AgreementSyncReport:
     """
     Synchronizes agreements by their active subscriptions renewed yesterday.
 
@@ -1207,6 +1351,10 @@ def sync_agreements_by_renewal_date(
         adobe_client: Adobe API client used for API operations.
         mpt_client: MPT API client.
         dry_run: Run in dry run mode.
+        engine: Engine used to run the synchronizations, sequential by default.
+
+    Returns:
+        The report with the outcome of every synchronized agreement.
     """
     logger.info("Synchronizing agreements by renewal date...")
     today_plus_1_year = dt.datetime.now(tz=dt.UTC).date() + relativedelta(years=1)
@@ -1224,8 +1372,14 @@ def sync_agreements_by_renewal_date(
         # Let's get only what we need
         "select=lines,parameters,assets,subscriptions,product,listing"
     )
-    for agreement in mpt.get_agreements_by_query(mpt_client, rql_query):
-        sync_agreement(mpt_client, adobe_client, agreement, dry_run=dry_run, sync_prices=True)
+    return _sync_agreements(
+        mpt_client,
+        adobe_client,
+        mpt.get_agreements_by_query(mpt_client, rql_query),
+        dry_run=dry_run,
+        sync_prices=True,
+        engine=engine,
+    )
 
 
 def sync_agreements_by_agreement_ids(
@@ -1235,7 +1389,8 @@ def sync_agreements_by_agreement_ids(
     *,
     dry_run: bool,
     sync_prices: bool,
-) -> None:
+    engine: AgreementSyncEngine | None = None,
+) -> AgreementSyncReport:
     """
     Get the agreements given a list of agreement IDs to update the prices for them.
 
@@ -1246,12 +1401,20 @@ def sync_agreements_by_agreement_ids(
         dry_run: if True, it just simulate the prices update but doesn't
         perform it.
         sync_prices: if True also sync prices.
+        engine: Engine used to run the synchronizations, sequential by default.
+
+    Returns:
+        The report with the outcome of every synchronized agreement.
     """
     agreements = mpt.get_agreements_by_ids(mpt_client, ids)
-    for agreement in agreements:
-        sync_agreement(
-            mpt_client, adobe_client, agreement, dry_run=dry_run, sync_prices=sync_prices
-        )
+    return _sync_agreements(
+        mpt_client,
+        adobe_client,
+        agreements,
+        dry_run=dry_run,
+        sync_prices=sync_prices,
+        engine=engine,
+    )
 
 
 def sync_agreements_by_3yc_enroll_status(
@@ -1291,8 +1454,13 @@ def sync_agreements_by_3yc_enroll_status(
 
 
 def sync_all_agreements(
-    mpt_client: MPTClient, adobe_client: AdobeClient, *, dry_run: bool, sync_prices: bool = False
-) -> None:
+    mpt_client: MPTClient,
+    adobe_client: AdobeClient,
+    *,
+    dry_run: bool,
+    sync_prices: bool = False,
+    engine: AgreementSyncEngine | None = None,
+) -> AgreementSyncReport:
     """
     Get all the active agreements to update the prices for them.
 
@@ -1302,12 +1470,36 @@ def sync_all_agreements(
         dry_run: if True, it just simulate the prices update but doesn't
         perform it.
         sync_prices: if True also sync prices.
+        engine: Engine used to run the synchronizations, sequential by default.
+
+    Returns:
+        The report with the outcome of every synchronized agreement.
     """
     agreements = mpt.get_all_agreements(mpt_client)
-    for agreement in agreements:
-        sync_agreement(
-            mpt_client, adobe_client, agreement, dry_run=dry_run, sync_prices=sync_prices
-        )
+    return _sync_agreements(
+        mpt_client,
+        adobe_client,
+        agreements,
+        dry_run=dry_run,
+        sync_prices=sync_prices,
+        engine=engine,
+    )
+
+
+def _sync_agreements(
+    mpt_client: MPTClient,
+    adobe_client: AdobeClient,
+    agreements: list[dict],
+    *,
+    dry_run: bool,
+    sync_prices: bool,
+    engine: AgreementSyncEngine | None,
+) -> AgreementSyncReport:
+    engine = engine or AgreementSyncEngine()
+    return engine.run(
+        agreements,
+        partial(sync_agreement, mpt_client, adobe_client, dry_run=dry_run, sync_prices=sync_prices),
+    )
 
 
 def sync_agreement(
@@ -1317,7 +1509,7 @@ def sync_agreement(
     *,
     dry_run: bool,
     sync_prices: bool,
-):
+) -> SyncOutcomeStatus:
     """
     Synchronizes a specific agreement with Adobe and MPT clients based on the given parameters.
 
@@ -1327,17 +1519,36 @@ def sync_agreement(
         agreement (dict): A dictionary representing the agreement details to synchronize.
         dry_run (bool): Flag indicating whether to execute in dry-run mode (no actual changes).
         sync_prices (bool): Flag indicating whether to synchronize subscription prices.
+
+    Returns:
+        The status of the synchronization: skipped when there is nothing to synchronize, like
+        for not active agreements or agreements without Adobe customer, failed when an error
+        has been notified.
     """
+    with request_cache_scope(agreement["id"]):
+        return _sync_agreement(
+            mpt_client, adobe_client, agreement, dry_run=dry_run, sync_prices=sync_prices
+        )
+
+
+def _sync_agreement(
+    mpt_client: MPTClient,
+    adobe_client: AdobeClient,
+    agreement: dict,
+    *,
+    dry_run: bool,
+    sync_prices: bool,
+) -> SyncOutcomeStatus:
     # Fetch the latest agreement details from MPT to avoid syncing outdated or changed data.
     # Other processes may update the agreement while processing, so we refresh before each sync.
     agreement = mpt.get_agreement(mpt_client, agreement["id"])
     if agreement["status"] != AgreementStatus.ACTIVE:
         logger.info("Skipping agreement %s because it is not in Active status", agreement["id"])
-        return
+        return SyncOutcomeStatus.SKIPPED
 
     if agreement["product"]["id"] not in settings.MPT_PRODUCTS_IDS:
         logger.error("Product %s not in MPT_PRODUCTS_IDS. Skipping.", agreement["product"]["id"])
-        return
+        return SyncOutcomeStatus.SKIPPED
 
     adobe_customer_id = flows_utils.get_adobe_customer_id(agreement)
     if not adobe_customer_id:
@@ -1346,8 +1557,8 @@ def sync_agreement(
             f"{agreement['parameters']}. Skipping."
         )
         logger.warning(message)
-        notify_agreement_unhandled_exception_in_teams(agreement["id"], message)
-        return
+        flows_utils.notify_agreement_unhandled_exception_in_teams(agreement["id"], message)
+        return SyncOutcomeStatus.SKIPPED
 
     adobe_customer = get_customer_or_process_lost_customer(
         mpt_client, adobe_client, agreement, adobe_customer_id, dry_run=dry_run
@@ -1355,14 +1566,14 @@ def sync_agreement(
     if not adobe_customer:
         # The agreement has been processed correctly via the lost customer procedure.
         # All subscriptions have been terminated, so no further action is needed.
-        return
+        return SyncOutcomeStatus.SYNCED
 
     authorization_id: str = agreement["authorization"]["id"]
     adobe_subscriptions = adobe_client.get_subscriptions(authorization_id, adobe_customer_id)[
         "items"
     ]
 
-    AgreementSyncer(
+    return AgreementSyncer(
         mpt_client, adobe_client, agreement, adobe_customer, adobe_subscriptions, dry_run=dry_run
     ).sync(sync_prices=sync_prices)
 
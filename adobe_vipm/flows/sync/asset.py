@@ -1,14 +1,18 @@
-import datetime as dt
 import logging
-from functools import partial
 from typing import Any
 
 from mpt_extension_sdk.mpt_http import mpt
 from mpt_extension_sdk.mpt_http.base import MPTClient
-from mpt_extension_sdk.mpt_http.utils import find_first
 
+from adobe_vipm.adobe.snapshot import AdobeCustomerSnapshot
 from adobe_vipm.flows.constants import AssetStatus, Param
-from adobe_vipm.flows.sync.helper import check_adobe_subscription_id
+from adobe_vipm.flows.mpt import get_agreement_assets
+from adobe_vipm.flows.sync.diff import (
+    get_changed_parameters,
+    get_last_sync_date_parameter,
+    get_update_payload,
+    sync_write_stats,
+)
 from adobe_vipm.flows.utils import get_parameter, get_sku_with_discount_level
 
 logger = logging.getLogger(__name__)
@@ -22,14 +26,12 @@ class AssetSyncer:
         mpt_client: MPTClient,
         agreement_id: str,
         assets: list[dict],
-        _adobe_customer: dict,
-        adobe_subscriptions: list[dict],
+        adobe_snapshot: AdobeCustomerSnapshot,
     ) -> None:
         self._mpt_client = mpt_client
         self._agreement_id = agreement_id
         self._assets = assets
-        self._adobe_customer = _adobe_customer
-        self._adobe_subscriptions = adobe_subscriptions
+        self._adobe_snapshot = adobe_snapshot
 
     def sync(self, *, dry_run: bool) -> None:
         """
@@ -46,11 +48,7 @@ class AssetSyncer:
         logger.info("Getting assets for update for agreement %s", self._agreement_id)
 
         for_update = []
-        for asset in self._assets:
-            if asset["status"] == AssetStatus.TERMINATED:
-                continue
-
-            mpt_asset = mpt.get_asset_by_id(self._mpt_client, asset["id"])
+        for mpt_asset in self._get_mpt_assets():
             adobe_subscription = self._get_adobe_subscription(mpt_asset)
             if not adobe_subscription:
                 logger.error("No subscription found in Adobe customer data!")
@@ -59,11 +57,37 @@ class AssetSyncer:
             for_update.append((
                 mpt_asset,
                 adobe_subscription,
-                get_sku_with_discount_level(adobe_subscription["offerId"], self._adobe_customer),
+                get_sku_with_discount_level(
+                    adobe_subscription["offerId"], self._adobe_snapshot.customer
+                ),
             ))
 
         return for_update
 
+    def _get_mpt_assets(self) -> list[dict]:
+        """
+        Loads the not terminated agreement assets with a single paged query.
+
+        Assets missing from the bulk result, e.g. created while the agreement is being
+        synchronized, are fetched one by one.
+
+        Returns:
+            The MPT assets with lines, external ids and parameters.
+        """
+        assets = [asset for asset in self._assets if asset["status"] != AssetStatus.TERMINATED]
+        if not assets:
+            return []
+
+        mpt_assets = {
+            mpt_asset["id"]: mpt_asset
+            for mpt_asset in get_agreement_assets(self._mpt_client, self._agreement_id)
+        }
+        asset_ids = [asset["id"] for asset in assets]
+        return [
+            mpt_assets.get(asset_id) or mpt.get_asset_by_id(self._mpt_client, asset_id)
+            for asset_id in asset_ids
+        ]
+
     def _get_adobe_subscription(self, asset: dict[str, Any]) -> dict[str, Any] | None:
         adobe_subscription_id = asset.get("externalIds", {}).get("vendor")
         if not adobe_subscription_id:
@@ -73,36 +97,47 @@ class AssetSyncer:
             )
             return None
 
-        return find_first(
-            partial(check_adobe_subscription_id, adobe_subscription_id),
-            self._adobe_subscriptions,
-        )
+        return self._adobe_snapshot.get_subscription(adobe_subscription_id)
 
     def _update_assets(self, assets_for_update: list[dict], *, dry_run: bool) -> None:
         for asset, adobe_subscription, actual_sku in assets_for_update:
-            fulfillment_params = [
-                {
-                    "externalId": Param.LAST_SYNC_DATE.value,
-                    "value": dt.datetime.now(tz=dt.UTC).date().isoformat(),
-                },
-            ]
-            if Param.USED_QUANTITY in adobe_subscription:
-                fulfillment_params.append({
-                    "externalId": Param.USED_QUANTITY.value,
-                    "value": str(adobe_subscription.get(Param.USED_QUANTITY, 0)),
-                })
+            intended = {
+                "parameters": {
+                    Param.PHASE_FULFILLMENT.value: _get_fulfillment_parameters(adobe_subscription)
+                }
+            }
+            if _is_asset_up_to_date(asset, intended):
+                logger.info("Skipping asset %s: already up to date", asset["id"])
+                sync_write_stats.record_avoided()
+                continue
 
+            payload = get_update_payload(asset, intended)
+            sync_write_stats.record(intended, payload)
             if dry_run:
-                current_quantity = get_parameter("fulfillment", asset, "usedQuantity")["value"]
                 logger.info(
                     "Updating asset: %s: sku=%s, current used quantity=%s, new used quantity=%s",
                     asset["id"],
                     actual_sku,
-                    current_quantity,
+                    get_parameter("fulfillment", asset, "usedQuantity")["value"],
                     adobe_subscription["usedQuantity"],
                 )
             else:
                 logger.info("Updating asset: %s: sku=%s", asset["id"], actual_sku)
-                mpt.update_asset(
-                    self._mpt_client, asset["id"], parameters={"fulfillment": fulfillment_params}
-                )
+                mpt.update_asset(self._mpt_client, asset["id"], **payload)
+
+
+def _get_fulfillment_parameters(adobe_subscription: dict) -> list[dict]:
+    fulfillment_params = [
+        get_last_sync_date_parameter(),
+    ]
+    if Param.USED_QUANTITY in adobe_subscription:
+        fulfillment_params.append({
+            "externalId": Param.USED_QUANTITY.value,
+            "value": str(adobe_subscription.get(Param.USED_QUANTITY, 0)),
+        })
+    return fulfillment_params
+
+
+def _is_asset_up_to_date(asset: dict, intended: dict) -> bool:
+    """Checks if the asset already has the last sync date and used quantity to write."""
+    return not get_changed_parameters(asset, intended["parameters"])
@@ -0,0 +1,159 @@
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+from django.conf import settings
+
+from adobe_vipm.private_files import ensure_private_file
+
+CHECKPOINT_BACKEND_SQLITE = "sqlite"
+CHECKPOINT_BACKEND_FILE = "file"
+
+
+class CheckpointStore(ABC):
+    """Persists the agreements already synchronized by every sync run."""
+
+    @abstractmethod
+    def get_completed(self, run_id: str) -> set[str]:
+        """Returns the IDs of the agreements completed by the given run."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def mark_completed(self, run_id: str, agreement_id: str) -> None:
+        """Records the agreement as completed by the given run."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self, run_id: str) -> None:
+        """Removes the agreements recorded by the given run."""
+        raise NotImplementedError
+
+
+class SqliteCheckpointStore(CheckpointStore):
+    """Checkpoint store backed by a local sqlite database."""
+
+    def __init__(self, path: Path):
+        ensure_private_file(path)
+        self._lock = threading.Lock()
+        # A single connection shared by the sync workers, serialized by the lock
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS completed_agreements ("
+                "run_id TEXT NOT NULL, agreement_id TEXT NOT NULL, "
+                "PRIMARY KEY (run_id, agreement_id))"
+            )
+
+    def get_completed(self, run_id: str) -> set[str]:
+        """Returns the IDs of the agreements completed by the given run."""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT agreement_id FROM completed_agreements WHERE run_id = ?", (run_id,)
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def mark_completed(self, run_id: str, agreement_id: str) -> None:
+        """Records the agreement as completed by the given run."""
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR IGNORE INTO completed_agreements (run_id, agreement_id) VALUES (?, ?)",
+                (run_id, agreement_id),
+            )
+
+    def clear(self, run_id: str) -> None:
+        """Removes the agreements recorded by the given run."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM completed_agreements WHERE run_id = ?", (run_id,))
+
+
+class FileCheckpointStore(CheckpointStore):
+    """Checkpoint store appending a JSON line per completed agreement to a local file."""
+
+    def __init__(self, path: Path):
+        self._path = path
+        self._lock = threading.Lock()
+        ensure_private_file(self._path)
+
+    def get_completed(self, run_id: str) -> set[str]:
+        """Returns the IDs of the agreements completed by the given run."""
+        with self._lock:
+            entries = self._read_entries()
+        return {entry["agreement_id"] for entry in entries if entry["run_id"] == run_id}
+
+    def mark_completed(self, run_id: str, agreement_id: str) -> None:
+        """Records the agreement as completed by the given run."""
+        entry = json.dumps({"run_id": run_id, "agreement_id": agreement_id})
+        with self._lock, self._path.open("a", encoding="utf-8") as checkpoint_file:
+            checkpoint_file.write(f"{entry}\n")
+
+    def clear(self, run_id: str) -> None:
+        """Removes the agreements recorded by the given run."""
+        with self._lock:
+            kept_lines = [
+                f"{json.dumps(entry)}\n"
+                for entry in self._read_entries()
+                if entry["run_id"] != run_id
+            ]
+            self._path.write_text("".join(kept_lines), encoding="utf-8")
+
+    def _read_entries(self) -> list[dict]:
+        lines = self._path.read_text(encoding="utf-8").splitlines()
+        return [json.loads(line) for line in lines if line]
+
+
+class SyncCheckpoint:
+    """
+    Checkpoint of a single sync run.
+
+    Loads the agreements completed by the run once, so that resumed runs can skip them, and
+    records every newly completed agreement in the store.
+
+    Attributes:
+        run_id: The sync run identifier.
+    """
+
+    def __init__(self, store: CheckpointStore, run_id: str):
+        self.run_id = run_id
+        self._store = store
+        self._completed = store.get_completed(run_id)
+
+    def is_completed(self, agreement_id: str) -> bool:
+        """Checks if the agreement was already completed by this run."""
+        return agreement_id in self._completed
+
+    def mark_completed(self, agreement_id: str) -> None:
+        """Records the agreement as completed by this run."""
+        self._store.mark_completed(self.run_id, agreement_id)
+
+    def clear(self) -> None:
+        """Removes the agreements recorded by this run, once it has nothing left to resume."""
+        self._store.clear(self.run_id)
+        self._completed = set()
+
+
+def get_checkpoint_store() -> CheckpointStore:
+    """
+    Builds the checkpoint store configured in the extension settings.
+
+    `SYNC_CHECKPOINT_BACKEND` selects between `sqlite` (default) and `file`, and
+    `SYNC_CHECKPOINT_PATH` sets the location of the checkpoint, a private path of the extension
+    user. If not set, the checkpoint is kept in a file of the current user in the temporary
+    directory.
+
+    Returns:
+        The configured checkpoint store.
+    """
+    backend = settings.EXTENSION_CONFIG.get("SYNC_CHECKPOINT_BACKEND", CHECKPOINT_BACKEND_SQLITE)
+    path = settings.EXTENSION_CONFIG.get("SYNC_CHECKPOINT_PATH")
+    if backend == CHECKPOINT_BACKEND_FILE:
+        return FileCheckpointStore(Path(path or _get_default_path(".jsonl")))
+    return SqliteCheckpointStore(Path(path or _get_default_path(".sqlite3")))
+
+
+def _get_default_path(suffix: str) -> Path:
+    # Named after the user, as the temporary directory is shared with the other users
+    return Path(tempfile.gettempdir()) / f"adobe_vipm_sync_checkpoint_{os.getuid()}{suffix}"
@@ -0,0 +1,178 @@
+import datetime as dt
+import threading
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any
+
+from mpt_extension_sdk.mpt_http.utils import find_first
+
+from adobe_vipm.flows.constants import Param
+
+PARAMETERS_FIELD = "parameters"
+LINES_FIELD = "lines"
+
+
+@dataclass
+class SyncWriteStats:
+    """
+    Thread safe counters of the MPT writes issued by the synchronization.
+
+    Attributes:
+        full: Writes sent with the whole intended payload.
+        trimmed: Writes sent with only the fields that changed.
+        collapsed: Writes sent with only the last sync date, nothing else changed.
+        avoided: Writes not sent at all, the MPT object was already up to date.
+    """
+
+    full: int = 0
+    trimmed: int = 0
+    collapsed: int = 0
+    avoided: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record(self, intended: dict, payload: dict) -> None:
+        """
+        Records the write of `payload` computed from the `intended` one.
+
+        Args:
+            intended: The payload the synchronization wanted to write.
+            payload: The payload actually written.
+        """
+        with self._lock:
+            if is_last_sync_date_only(payload):
+                self.collapsed += 1
+            elif payload == intended:
+                self.full += 1
+            else:
+                self.trimmed += 1
+
+    def record_avoided(self) -> None:
+        """Records a write skipped because the MPT object was already up to date."""
+        with self._lock:
+            self.avoided += 1
+
+    def reset(self) -> None:
+        """Resets all the counters."""
+        with self._lock:
+            self.full = 0
+            self.trimmed = 0
+            self.collapsed = 0
+            self.avoided = 0
+
+    def summary(self) -> str:
+        """Returns a one line summary of the counters."""
+        sent = self.full + self.trimmed + self.collapsed
+        return (
+            f"MPT writes: {sent} sent ({self.full} full, {self.trimmed} trimmed, "
+            f"{self.collapsed} collapsed to last sync date), {self.avoided} avoided."
+        )
+
+
+sync_write_stats = SyncWriteStats()
+
+
+def get_update_payload(current: dict, intended: dict) -> dict:
+    """
+    Computes the part of the intended update payload that differs from the MPT object.
+
+    Parameters are compared one by one by externalId per phase and only the changed ones
+    are kept. Lines are kept all together when any of them changed, since the MPT API
+    replaces the whole list. Any other field is kept when its value differs.
+
+    When nothing differs, the write collapses into the last sync date update, taken from the
+    intended parameters or set to today, so the MPT object still records the synchronization.
+
+    Args:
+        current: The MPT object as currently stored.
+        intended: The update payload the synchronization wants to write.
+
+    Returns:
+        The payload to send, only the last sync date if the MPT object is already up to date.
+    """
+    payload = {
+        field_name: field_value
+        for field_name, field_value in intended.items()
+        if field_name not in {PARAMETERS_FIELD, LINES_FIELD}
+        and not _is_contained(field_value, current.get(field_name))
+    }
+    if LINES_FIELD in intended and not _lines_match(
+        current.get(LINES_FIELD) or [], intended[LINES_FIELD]
+    ):
+        payload[LINES_FIELD] = intended[LINES_FIELD]
+    changed_parameters = get_changed_parameters(current, intended.get(PARAMETERS_FIELD, {}))
+    if changed_parameters:
+        payload[PARAMETERS_FIELD] = changed_parameters
+    if payload:
+        return payload
+
+    last_sync_date = find_first(
+        lambda parameter: parameter["externalId"] == Param.LAST_SYNC_DATE.value,
+        intended.get(PARAMETERS_FIELD, {}).get(Param.PHASE_FULFILLMENT.value, []),
+    )
+    return {
+        PARAMETERS_FIELD: {
+            Param.PHASE_FULFILLMENT.value: [last_sync_date or get_last_sync_date_parameter()]
+        }
+    }
+
+
+def get_last_sync_date_parameter() -> dict:
+    """Returns the last sync date fulfillment parameter set to today."""
+    return {
+        "externalId": Param.LAST_SYNC_DATE.value,
+        "value": dt.datetime.now(tz=dt.UTC).date().isoformat(),
+    }
+
+
+def get_changed_parameters(current: dict, intended_parameters: dict[str, list[dict]]) -> dict:
+    """
+    Filters the parameters whose value differs from the ones of the MPT object.
+
+    Args:
+        current: The MPT object as currently stored.
+        intended_parameters: The parameters to write, per phase.
+
+    Returns:
+        The changed parameters per phase, without the phases with no changes.
+    """
+    # The (phase, externalId) and value pairs of the parameters of the MPT object
+    stored = {
+        (phase, parameter["externalId"]): parameter.get("value")
+        for phase, phase_parameters in (current.get(PARAMETERS_FIELD) or {}).items()
+        for parameter in phase_parameters
+    }.items()
+    changed = defaultdict(list)
+    for phase, phase_parameters in intended_parameters.items():
+        for parameter in phase_parameters:
+            if ((phase, parameter["externalId"]), parameter.get("value")) not in stored:
+                changed[phase].append(parameter)
+    return dict(changed)
+
+
+def is_last_sync_date_only(payload: dict) -> bool:
+    """Checks if the payload only updates the last sync date parameter."""
+    payload_parameters = payload.get(PARAMETERS_FIELD, {})
+    fulfillment_parameters = payload_parameters.get(Param.PHASE_FULFILLMENT.value, [])
+    return (
+        payload.keys() == {PARAMETERS_FIELD}
+        and payload_parameters.keys() == {Param.PHASE_FULFILLMENT.value}
+        and [parameter["externalId"] for parameter in fulfillment_parameters]
+        == [Param.LAST_SYNC_DATE.value]
+    )
+
+
+def _lines_match(current_lines: list[dict], intended_lines: list[dict]) -> bool:
+    current_by_id = {line["id"]: line for line in current_lines}
+    return all(
+        _is_contained(line, current_by_id.get(line["id"])) for line in intended_lines
+    ) and len(current_lines) == len(intended_lines)
+
+
+def _is_contained(intended: Any, current: Any) -> bool:
+    """Checks if every key of the intended value has the same value in the current one."""
+    if isinstance(intended, dict) and isinstance(current, dict):
+        return all(
+            _is_contained(intended_value, current.get(key))
+            for key, intended_value in intended.items()
+        )
+    return intended == current
@@ -0,0 +1,206 @@
+import hashlib
+import logging
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from enum import StrEnum
+from functools import partial
+
+from adobe_vipm.flows.sync.checkpoint import SyncCheckpoint
+from adobe_vipm.flows.sync.scheduler import SlotScheduler
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SYNC_WORKERS = 1
+DEFAULT_MAX_PER_AUTHORIZATION = 4
+DEFAULT_MAX_PER_ACCOUNT = 2
+
+
+class SyncOutcomeStatus(StrEnum):
+    """Final status of an agreement synchronization."""
+
+    SYNCED = "synced"
+    FAILED = "failed"
+    SKIPPED = "skipped"
+
+
+# Synchronizes a single agreement, returning its status or None if it was synced
+SyncFunc = Callable[[dict], SyncOutcomeStatus | None]
+
+
+@dataclass(frozen=True)
+class AgreementSyncOutcome:
+    """Outcome of the synchronization of a single agreement."""
+
+    agreement_id: str
+    status: SyncOutcomeStatus
+    duration: float
+    error: str | None = None
+
+
+@dataclass(frozen=True)
+class AgreementShard:
+    """
+    Stable hash partition of the agreement IDs.
+
+    Every agreement ID always belongs to the same shard for a given shard count, so several
+    processes can split the agreements between them without any coordination.
+    """
+
+    index: int
+    count: int
+
+    def __post_init__(self) -> None:
+        if self.count < 1 or not 0 <= self.index < self.count:
+            raise ValueError(f"Invalid shard {self.index} of {self.count}.")
+
+    def __str__(self) -> str:
+        position = self.index + 1
+        return f"{position}/{self.count}"
+
+    def contains(self, agreement_id: str) -> bool:
+        """Checks if the agreement ID belongs to this shard."""
+        digest = hashlib.sha256(agreement_id.encode()).digest()
+        return int.from_bytes(digest) % self.count == self.index
+
+
+@dataclass
+class AgreementSyncReport:
+    """Collects the per-agreement outcomes of a synchronization run."""
+
+    outcomes: list[AgreementSyncOutcome] = field(default_factory=list)
+    shard: AgreementShard | None = None
+
+    @property
+    def synced(self) -> list[AgreementSyncOutcome]:
+        """Outcomes of the agreements synchronized without errors."""
+        return [outcome for outcome in self.outcomes if outcome.status == SyncOutcomeStatus.SYNCED]
+
+    @property
+    def failed(self) -> list[AgreementSyncOutcome]:
+        """Outcomes of the agreements whose synchronization failed."""
+        return [outcome for outcome in self.outcomes if outcome.status == SyncOutcomeStatus.FAILED]
+
+    @property
+    def skipped(self) -> list[AgreementSyncOutcome]:
+        """
+        Outcomes of the agreements not synchronized on purpose.
+
+        E.g. not active agreements, agreements without Adobe customer or already completed by a
+        previous attempt of the run.
+        """
+        return [outcome for outcome in self.outcomes if outcome.status == SyncOutcomeStatus.SKIPPED]
+
+    def extend(self, other: "AgreementSyncReport") -> None:
+        """Appends the outcomes of another report to this one."""
+        self.outcomes.extend(other.outcomes)
+
+    def summary(self) -> str:
+        """Returns a one line summary of the report."""
+        summary = (
+            f"Processed {len(self.outcomes)} agreements: "
+            f"{len(self.synced)} synced, {len(self.failed)} failed, "
+            f"{len(self.skipped)} skipped."
+        )
+        if self.shard:
+            return f"Shard {self.shard}: {summary}"
+        return summary
+
+
+class AgreementSyncEngine:
+    """
+    Runs agreement synchronizations on a pool of worker threads.
+
+    Every agreement runs in isolation: an unexpected error is logged and recorded in the
+    report without stopping the rest of the run. The amount of agreements processed at the
+    same time is capped per Adobe authorization and per MPT account, so that a single
+    distributor or client does not get hammered by all the workers at once.
+
+    Attributes:
+        workers: Number of worker threads.
+        max_per_authorization: Max agreements in flight for the same Adobe authorization.
+        max_per_account: Max agreements in flight for the same MPT account.
+        shard: Partition of the agreements processed by this engine, all of them if not set.
+        checkpoint: Checkpoint of the run, used to skip and record the synced agreements.
+    """
+
+    def __init__(
+        self,
+        workers: int = DEFAULT_SYNC_WORKERS,
+        *,
+        max_per_authorization: int = DEFAULT_MAX_PER_AUTHORIZATION,
+        max_per_account: int = DEFAULT_MAX_PER_ACCOUNT,
+        shard: AgreementShard | None = None,
+        checkpoint: SyncCheckpoint | None = None,
+    ):
+        self.workers = max(workers, 1)
+        self.max_per_authorization = max(max_per_authorization, 1)
+        self.max_per_account = max(max_per_account, 1)
+        self.shard = shard
+        self.checkpoint = checkpoint
+
+    def run(self, agreements: Iterable[dict], sync_func: SyncFunc) -> AgreementSyncReport:
+        """
+        Synchronizes the given agreements calling `sync_func` for each one of them.
+
+        Agreements outside the engine shard are skipped and not included in the report.
+        Agreements already completed according to the checkpoint are reported as skipped.
+
+        Args:
+            agreements: Agreements to synchronize.
+            sync_func: Callable synchronizing a single agreement and returning its status.
+
+        Returns:
+            The report with the outcome of every agreement, in input order.
+        """
+        report = AgreementSyncReport(shard=self.shard)
+        if self.shard:
+            agreements = (
+                agreement for agreement in agreements if self.shard.contains(agreement["id"])
+            )
+        if self.workers == 1:
+            report.outcomes.extend(self._sync(agreement, sync_func) for agreement in agreements)
+            return report
+
+        report.outcomes.extend(self._run_concurrently(agreements, sync_func))
+        return report
+
+    def _run_concurrently(
+        self, agreements: Iterable[dict], sync_func: SyncFunc
+    ) -> list[AgreementSyncOutcome]:
+        scheduler = SlotScheduler(agreements, self.max_per_authorization, self.max_per_account)
+        outcomes: dict[int, AgreementSyncOutcome] = {}
+        with ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="agreement-sync"
+        ) as executor:
+            while scheduler:
+                scheduler.submit_ready(
+                    executor, self.workers, partial(self._sync, sync_func=sync_func)
+                )
+                outcomes.update(scheduler.collect_completed())
+        return [outcomes[index] for index in sorted(outcomes)]
+
+    def _sync(self, agreement: dict, sync_func: SyncFunc) -> AgreementSyncOutcome:
+        agreement_id = agreement["id"]
+        if self.checkpoint and self.checkpoint.is_completed(agreement_id):
+            logger.info("Skipping agreement %s already completed by this run", agreement_id)
+            return AgreementSyncOutcome(agreement_id, SyncOutcomeStatus.SKIPPED, 0)
+
+        started_at = time.monotonic()
+        try:
+            sync_status = sync_func(agreement)
+        except Exception as error:
+            logger.exception("Unexpected error synchronizing agreement %s", agreement_id)
+            return AgreementSyncOutcome(
+                agreement_id,
+                SyncOutcomeStatus.FAILED,
+                time.monotonic() - started_at,
+                error=str(error),
+            )
+        if not isinstance(sync_status, SyncOutcomeStatus):
+            # Sync functions not reporting a status synced the agreement if they returned
+            sync_status = SyncOutcomeStatus.SYNCED
+        if self.checkpoint and sync_status == SyncOutcomeStatus.SYNCED:
+            self.checkpoint.mark_completed(agreement_id)
+        return AgreementSyncOutcome(agreement_id, sync_status, time.monotonic() - started_at)
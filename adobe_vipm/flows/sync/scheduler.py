@@ -0,0 +1,91 @@
+from collections import Counter, defaultdict, deque
+from collections.abc import Callable, Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any
+
+# Input position of an agreement and the agreement itself
+QueuedAgreement = tuple[int, dict]
+
+
+class SlotScheduler:
+    """
+    Submits pending agreements once their authorization and account have a free slot.
+
+    Agreements wait in a queue per authorization instead of in the pool, so a busy
+    authorization never holds a worker while agreements of other authorizations could run.
+    """
+
+    def __init__(
+        self, agreements: Iterable[dict], max_per_authorization: int, max_per_account: int
+    ):
+        self.max_per_authorization = max_per_authorization
+        self.max_per_account = max_per_account
+        self._pending: dict[str, deque[QueuedAgreement]] = defaultdict(deque)
+        for index, agreement in enumerate(agreements):
+            self._pending[_get_authorization_key(agreement)].append((index, agreement))
+        self._in_flight: dict[Future, QueuedAgreement] = {}
+        self._authorization_load: Counter[str] = Counter()
+        self._account_load: Counter[str] = Counter()
+
+    def __bool__(self) -> bool:
+        return bool(self._pending or self._in_flight)
+
+    def submit_ready(
+        self, executor: ThreadPoolExecutor, workers: int, func: Callable[[dict], Any]
+    ) -> None:
+        """Submits agreements able to run until the pool is full or the rest wait for a slot."""
+        while len(self._in_flight) < workers:
+            queued_agreement = self._take()
+            if queued_agreement is None:
+                return
+            self._in_flight[executor.submit(func, queued_agreement[1])] = queued_agreement
+
+    def collect_completed(self) -> list[tuple[int, Any]]:
+        """
+        Waits for at least one submitted agreement to complete and frees its slots.
+
+        Returns:
+            The input position and the result of every completed agreement.
+        """
+        done, _ = wait(self._in_flight, return_when=FIRST_COMPLETED)
+        completed = []
+        for future in done:
+            index, agreement = self._in_flight.pop(future)
+            self._authorization_load[_get_authorization_key(agreement)] -= 1
+            self._account_load[_get_account_key(agreement)] -= 1
+            completed.append((index, future.result()))
+        return completed
+
+    def _take(self) -> QueuedAgreement | None:
+        for authorization_key, queue in self._pending.items():
+            queued_agreement = self._take_from(authorization_key, queue)
+            if queued_agreement is None:
+                continue
+            # The authorization goes last, so the free workers are shared round-robin
+            self._pending.pop(authorization_key)
+            if queue:
+                self._pending[authorization_key] = queue
+            return queued_agreement
+        return None
+
+    def _take_from(
+        self, authorization_key: str, queue: deque[QueuedAgreement]
+    ) -> QueuedAgreement | None:
+        if self._authorization_load[authorization_key] >= self.max_per_authorization:
+            return None
+        for position, queued_agreement in enumerate(queue):
+            account_key = _get_account_key(queued_agreement[1])
+            if self._account_load[account_key] < self.max_per_account:
+                del queue[position]  # noqa: WPS420
+                self._authorization_load[authorization_key] += 1
+                self._account_load[account_key] += 1
+                return queued_agreement
+        return None
+
+
+def _get_authorization_key(agreement: dict) -> str:
+    return (agreement.get("authorization") or {}).get("id", "")
+
+
+def _get_account_key(agreement: dict) -> str:
+    return (agreement.get("client") or {}).get("id", "")
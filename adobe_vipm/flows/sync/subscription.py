@@ -1,4 +1,3 @@
-import datetime as dt
 import logging
 import traceback
 
@@ -6,6 +5,11 @@ from mpt_extension_sdk.mpt_http import mpt
 from mpt_extension_sdk.mpt_http.base import MPTClient
 
 from adobe_vipm.flows.constants import Param
+from adobe_vipm.flows.sync.diff import (
+    get_last_sync_date_parameter,
+    get_update_payload,
+    sync_write_stats,
+)
 from adobe_vipm.flows.sync.price_manager import PriceManager
 from adobe_vipm.flows.utils import notification
 from adobe_vipm.flows.utils.template import get_template_data_by_adobe_subscription
@@ -126,10 +130,7 @@ class SubscriptionSyncer:
                     "externalId": Param.RENEWAL_DATE.value,
                     "value": str(adobe_subscription["renewalDate"]),
                 },
-                {
-                    "externalId": Param.LAST_SYNC_DATE.value,
-                    "value": dt.datetime.now(tz=dt.UTC).date().isoformat(),
-                },
+                get_last_sync_date_parameter(),
             ],
         }
         lines = [
@@ -150,25 +151,20 @@ class SubscriptionSyncer:
         template_data = get_template_data_by_adobe_subscription(
             adobe_subscription, self._product_id
         )
-        auto_renewal_enabled = adobe_subscription["autoRenewal"]["enabled"]
+        intended = {
+            "lines": lines,
+            "parameters": fulfillment_params,
+            "commitmentDate": adobe_subscription["renewalDate"],
+            "autoRenew": adobe_subscription["autoRenewal"]["enabled"],
+            "template": template_data,
+        }
+        payload = get_update_payload(subscription, intended)
+        sync_write_stats.record(intended, payload)
         if self._dry_run:
             logger.info(
-                "Dry run mode: skipping update agreement subscription %s with: \n lines: %s \n "
-                "parameters: %s \n commitmentDate: %s \n autoRenew: %s \n template: %s",
+                "Dry run mode: skipping update agreement subscription %s with: %s",
                 subscription["id"],
-                lines,
-                fulfillment_params,
-                adobe_subscription["renewalDate"],
-                auto_renewal_enabled,
-                template_data,
+                payload,
             )
         else:
-            mpt.update_agreement_subscription(
-                self._mpt_client,
-                subscription["id"],
-                lines=lines,
-                parameters=fulfillment_params,
-                commitmentDate=adobe_subscription["renewalDate"],
-                autoRenew=auto_renewal_enabled,
-                template=template_data,
-            )
+            mpt.update_agreement_subscription(self._mpt_client, subscription["id"], **payload)
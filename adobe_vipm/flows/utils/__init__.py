@@ -61,6 +61,8 @@ from .order import (
     split_downsizes_upsizes_new,
 )
 from .parameter import (
+    ParameterView,
+    copy_parameters,
     get_adobe_membership_id,
     get_coterm_date,
     get_fulfillment_parameter,
@@ -70,6 +72,7 @@ from .parameter import (
     get_retry_count,
     get_switch_payload,
     is_ordering_param_required,
+    replace_parameter_fields,
     reset_ordering_parameters_error,
     set_coterm_date,
     set_ordering_parameter_error,
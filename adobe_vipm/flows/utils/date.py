@@ -8,6 +8,7 @@ from adobe_vipm.flows.constants import LAST_TWO_WEEKS_DAYS, Param
 from adobe_vipm.flows.utils.parameter import (
     get_coterm_date,
     get_fulfillment_parameter,
+    replace_parameter_fields,
 )
 
 
@@ -77,13 +78,9 @@ def reset_due_date(order: dict) -> dict:
     Returns:
         Updated MPT order.
     """
-    param = get_fulfillment_parameter(
-        order,
-        Param.DUE_DATE.value,
+    return replace_parameter_fields(
+        order, Param.PHASE_FULFILLMENT.value, Param.DUE_DATE.value, value=None
     )
-    param["value"] = None
-
-    return order
 
 
 def is_within_last_two_weeks(coterm_date: str) -> bool:
@@ -1,6 +1,7 @@
 import copy
 import functools
 import json
+from collections import defaultdict
 from typing import Any
 
 from django.conf import settings
@@ -15,6 +16,163 @@ from adobe_vipm.flows.constants import (
     AgreementType,
     Param,
 )
+from adobe_vipm.flows.sync.diff import get_changed_parameters
+
+ParameterKey = tuple[str, str]
+
+
+class ParameterView:
+    """
+    Parameters of an MPT order or agreement indexed by phase and external identifier.
+
+    The parameters are indexed once, so reading them doesn't scan the parameter lists. The
+    updates are written through to the parameter objects of the source, which are shared and
+    not copied, so it suits applying many updates to a copy made with `copy_parameters`. The
+    updated parameters are tracked so that only the changed ones can be sent to MPT.
+    """
+
+    def __init__(self, source: dict[str, Any]):
+        self.source = source
+        self._index: dict[ParameterKey, dict] = {}
+        # The value of each updated parameter before its first update
+        self._initial_values: dict[ParameterKey, Any] = {}
+        for phase, phase_parameters in (source.get("parameters") or {}).items():
+            for parameter in phase_parameters:
+                # The first parameter with an external identifier wins, as in `get_parameter`
+                self._index.setdefault((phase, parameter["externalId"]), parameter)
+
+    def get(self, parameter_phase: str, param_external_id: str) -> dict:
+        """
+        Returns a parameter of a given phase by its external identifier.
+
+        Args:
+            parameter_phase: The phase of the parameter (ordering, fulfillment).
+            param_external_id: The unique external identifier of the parameter.
+
+        Returns:
+            The parameter object of the source or an empty dictionary if not found.
+        """
+        return self._index.get((parameter_phase, param_external_id), {})
+
+    def update_value(self, parameter_phase: str, param_external_id: str, value: Any) -> bool:
+        """
+        Sets the value of a parameter.
+
+        Args:
+            parameter_phase: The phase of the parameter (ordering, fulfillment).
+            param_external_id: The unique external identifier of the parameter.
+            value: The parameter value.
+
+        Returns:
+            False if the source has no such parameter and nothing was updated.
+        """
+        return self._update(parameter_phase, param_external_id, value=value)
+
+    def update_constraints(
+        self, parameter_phase: str, param_external_id: str, *, hidden: bool, required: bool
+    ) -> bool:
+        """
+        Replaces the constraints of a parameter.
+
+        Args:
+            parameter_phase: The phase of the parameter (ordering, fulfillment).
+            param_external_id: The unique external identifier of the parameter.
+            hidden: If the parameter is hidden.
+            required: If the parameter is required.
+
+        Returns:
+            False if the source has no such parameter and nothing was updated.
+        """
+        return self._update(
+            parameter_phase,
+            param_external_id,
+            constraints={"hidden": hidden, "required": required},
+        )
+
+    def get_changed_parameters(self) -> dict[str, list[dict]]:
+        """
+        Returns the MPT parameters payload with only the parameter values changed by the view.
+
+        The parameters updated to the value they already had, or with only new constraints,
+        are left out.
+
+        Returns:
+            Copy of the changed parameters by phase, in the order they were first updated.
+        """
+        initial_parameters = defaultdict(list)
+        updated_parameters = defaultdict(list)
+        for (parameter_phase, param_external_id), initial_value in self._initial_values.items():
+            initial_parameters[parameter_phase].append({
+                "externalId": param_external_id,
+                "value": initial_value,
+            })
+            updated_parameters[parameter_phase].append(
+                self._index[parameter_phase, param_external_id]
+            )
+        return copy.deepcopy(
+            get_changed_parameters({"parameters": initial_parameters}, updated_parameters)
+        )
+
+    def _update(self, parameter_phase: str, param_external_id: str, **fields: Any) -> bool:
+        key = (parameter_phase, param_external_id)
+        parameter = self._index.get(key)
+        if parameter is None:
+            return False
+        self._initial_values.setdefault(key, parameter.get("value"))
+        parameter.update(fields)
+        return True
+
+
+def copy_parameters(source: dict[str, Any]) -> dict[str, Any]:
+    """
+    Returns a copy of the order or agreement to update its parameters.
+
+    Only the parameters are deep copied, the rest of the source, like its lines, is shared
+    with the copy instead of being deep copied on every parameter update.
+
+    Args:
+        source: MPT order or agreement.
+
+    Returns:
+        Shallow copy of the source with its own copy of the parameters.
+    """
+    updated_source = copy.copy(source)
+    parameters = source.get("parameters")
+    if parameters is not None:
+        updated_source["parameters"] = copy.deepcopy(parameters)
+    return updated_source
+
+
+def replace_parameter_fields(
+    source: dict[str, Any], parameter_phase: str, param_external_id: str, **fields: Any
+) -> dict[str, Any]:
+    """
+    Returns a copy of the order or agreement with some fields of a parameter replaced.
+
+    Only the parameter list of the phase and the updated parameter are copied, the other
+    parameters and the rest of the source are shared with the copy.
+
+    Args:
+        source: MPT order or agreement.
+        parameter_phase: The phase of the parameter (ordering, fulfillment).
+        param_external_id: The unique external identifier of the parameter.
+        fields: The fields of the parameter to replace.
+
+    Returns:
+        Updated copy of the source, with the same parameters if it has no such parameter.
+    """
+    updated_source = copy.copy(source)
+    phase_parameters = source["parameters"][parameter_phase]
+    for position, parameter in enumerate(phase_parameters):
+        if parameter["externalId"] == param_external_id:
+            updated_phase_parameters = list(phase_parameters)
+            updated_phase_parameters[position] = {**parameter, **fields}
+            updated_source["parameters"] = {
+                **source["parameters"],
+                parameter_phase: updated_phase_parameters,
+            }
+            break
+    return updated_source
 
 
 def get_parameter(parameter_phase: str, source: dict[str, Any], param_external_id: str) -> dict:
@@ -62,17 +220,13 @@ def set_ordering_parameter_error(
     Returns:
         Updated MPT order.
     """
-    updated_order = copy.deepcopy(order)
-    param = get_ordering_parameter(
-        updated_order,
+    return replace_parameter_fields(
+        order,
+        Param.PHASE_ORDERING.value,
         param_external_id,
+        error=error,
+        constraints={"hidden": False, "required": required},
     )
-    param["error"] = error
-    param["constraints"] = {
-        "hidden": False,
-        "required": required,
-    }
-    return updated_order
 
 
 def reset_ordering_parameters_error(order: dict) -> dict:
@@ -85,7 +239,7 @@ def reset_ordering_parameters_error(order: dict) -> dict:
     Returns:
         Updated order.
     """
-    updated_order = copy.deepcopy(order)
+    updated_order = copy_parameters(order)
 
     for param in updated_order["parameters"][Param.PHASE_ORDERING.value]:
         param["error"] = None
@@ -108,7 +262,8 @@ def update_parameters_visibility(order: dict) -> dict:
     """
     agreement_type = get_ordering_parameter(order, Param.AGREEMENT_TYPE.value)
     agreement_value = (agreement_type.get("value") or "").lower()
-    updated_order = copy.deepcopy(order)
+    updated_order = copy_parameters(order)
+    parameters = ParameterView(updated_order)
 
     parameters_map = {
         "new": {
@@ -126,9 +281,16 @@ def update_parameters_visibility(order: dict) -> dict:
     }
     param_config = parameters_map.get(agreement_value, {})
     for param in param_config.get("visible", []):
-        updated_order = set_parameter_visible(updated_order, param)
+        parameters.update_constraints(
+            Param.PHASE_ORDERING.value,
+            param,
+            hidden=False,
+            required=param not in PARAM_OPTIONAL_CUSTOMER_ORDER,
+        )
     for param in param_config.get("hidden", []):
-        updated_order = set_parameter_hidden(updated_order, param)
+        parameters.update_constraints(
+            Param.PHASE_ORDERING.value, param, hidden=True, required=False
+        )
 
     return updated_order
 
@@ -159,13 +321,7 @@ def set_coterm_date(order: dict, coterm_date: str) -> dict:
     Returns:
         Updated MPT order.
     """
-    updated_order = copy.deepcopy(order)
-    customer_ff_param = get_fulfillment_parameter(
-        updated_order,
-        Param.COTERM_DATE.value,
-    )
-    customer_ff_param["value"] = coterm_date
-    return updated_order
+    return update_fulfillment_parameter_value(order, Param.COTERM_DATE.value, coterm_date)
 
 
 def get_coterm_date(order: dict) -> str | None:
@@ -196,14 +352,9 @@ def update_ordering_parameter_value(order: dict, param_external_id: str, value:
     Returns:
         Updated MPT order.
     """
-    updated_order = copy.deepcopy(order)
-    param = get_ordering_parameter(
-        updated_order,
-        param_external_id,
+    return replace_parameter_fields(
+        order, Param.PHASE_ORDERING.value, param_external_id, value=value
     )
-    param["value"] = value
-
-    return updated_order
 
 
 def update_fulfillment_parameter_value(order: dict, param_external_id: str, value: Any) -> dict:
@@ -218,14 +369,9 @@ def update_fulfillment_parameter_value(order: dict, param_external_id: str, valu
     Returns:
         Updated MPT order.
     """
-    updated_order = copy.deepcopy(order)
-    param = get_fulfillment_parameter(
-        updated_order,
-        param_external_id,
+    return replace_parameter_fields(
+        order, Param.PHASE_FULFILLMENT.value, param_external_id, value=value
     )
-    param["value"] = value
-
-    return updated_order
 
 
 def get_adobe_membership_id(source: dict) -> str | None:
@@ -326,16 +472,15 @@ def set_parameter_visible(order: dict, param_external_id: str) -> dict:
     Returns:
         Updated MPT order.
     """
-    updated_order = copy.deepcopy(order)
-    param = get_ordering_parameter(
-        updated_order,
+    return replace_parameter_fields(
+        order,
+        Param.PHASE_ORDERING.value,
         param_external_id,
+        constraints={
+            "hidden": False,
+            "required": param_external_id not in PARAM_OPTIONAL_CUSTOMER_ORDER,
+        },
     )
-    param["constraints"] = {
-        "hidden": False,
-        "required": param_external_id not in PARAM_OPTIONAL_CUSTOMER_ORDER,
-    }
-    return updated_order
 
 
 def set_parameter_hidden(order: dict, param_external_id: str) -> dict:
@@ -349,16 +494,12 @@ def set_parameter_hidden(order: dict, param_external_id: str) -> dict:
     Returns:
         Update MPT order.
     """
-    updated_order = copy.deepcopy(order)
-    param = get_ordering_parameter(
-        updated_order,
+    return replace_parameter_fields(
+        order,
+        Param.PHASE_ORDERING.value,
         param_external_id,
+        constraints={"hidden": True, "required": False},
     )
-    param["constraints"] = {
-        "hidden": True,
-        "required": False,
-    }
-    return updated_order
 
 
 def get_retry_count(order: dict) -> str | None:
@@ -403,7 +544,7 @@ def update_agreement_params_visibility(
     market_segment = get_for_product(settings, "PRODUCT_SEGMENT", order["product"]["id"])
     visible_params = list(AGREEMENT_VISIBLE_PARAMETERS.get(agreement_type_value, []))
     visible_params.extend(AGREEMENT_VISIBLE_PARAMETERS.get(market_segment, []))
-    updated_order = copy.deepcopy(order)  # noqa: WPS204
+    updated_order = copy_parameters(order)
 
     for phase in (Param.PHASE_ORDERING.value, Param.PHASE_FULFILLMENT.value):
         for param in updated_order["parameters"][phase]:
@@ -1,7 +1,8 @@
-import copy
-
 from adobe_vipm.flows.constants import Param
-from adobe_vipm.flows.utils.parameter import get_fulfillment_parameter, get_ordering_parameter
+from adobe_vipm.flows.utils.parameter import (
+    get_fulfillment_parameter,
+    replace_parameter_fields,
+)
 
 
 def set_adobe_3yc_enroll_status(order: dict, enroll_status: str) -> dict:
@@ -15,13 +16,12 @@ def set_adobe_3yc_enroll_status(order: dict, enroll_status: str) -> dict:
     Returns:
         Update order
     """
-    updated_order = copy.deepcopy(order)
-    ff_param = get_fulfillment_parameter(
-        updated_order,
+    return replace_parameter_fields(
+        order,
+        Param.PHASE_FULFILLMENT.value,
         Param.THREE_YC_ENROLL_STATUS.value,
+        value=enroll_status,
     )
-    ff_param["value"] = enroll_status
-    return updated_order
 
 
 def set_adobe_3yc_commitment_request_status(order: dict, status: str) -> dict:
@@ -35,13 +35,12 @@ def set_adobe_3yc_commitment_request_status(order: dict, status: str) -> dict:
     Returns:
         Update order
     """
-    updated_order = copy.deepcopy(order)
-    ff_param = get_fulfillment_parameter(
-        updated_order,
+    return replace_parameter_fields(
+        order,
+        Param.PHASE_FULFILLMENT.value,
         Param.THREE_YC_COMMITMENT_REQUEST_STATUS.value,
+        value=status,
     )
-    ff_param["value"] = status
-    return updated_order
 
 
 # TODO: probably we should operate always with date/time in the code
@@ -57,13 +56,9 @@ def set_adobe_3yc_start_date(order: dict, start_date: str) -> dict:
     Returns:
         Update order
     """
-    updated_order = copy.deepcopy(order)
-    ff_param = get_fulfillment_parameter(
-        updated_order,
-        Param.THREE_YC_START_DATE.value,
+    return replace_parameter_fields(
+        order, Param.PHASE_FULFILLMENT.value, Param.THREE_YC_START_DATE.value, value=start_date
     )
-    ff_param["value"] = start_date
-    return updated_order
 
 
 def set_adobe_3yc_end_date(order: dict, end_date: str) -> dict:
@@ -77,13 +72,9 @@ def set_adobe_3yc_end_date(order: dict, end_date: str) -> dict:
     Returns:
         Update order
     """
-    updated_order = copy.deepcopy(order)
-    ff_param = get_fulfillment_parameter(
-        updated_order,
-        Param.THREE_YC_END_DATE.value,
+    return replace_parameter_fields(
+        order, Param.PHASE_FULFILLMENT.value, Param.THREE_YC_END_DATE.value, value=end_date
     )
-    ff_param["value"] = end_date
-    return updated_order
 
 
 # TODO: checkbox in MPT has specific structure of parameter. Worth to wrap it in SDK
@@ -98,13 +89,9 @@ def set_adobe_3yc(order: dict, value: str) -> dict:
     Returns:
         Update order
     """
-    updated_order = copy.deepcopy(order)
-    ff_param = get_ordering_parameter(
-        updated_order,
-        Param.THREE_YC.value,
+    return replace_parameter_fields(
+        order, Param.PHASE_ORDERING.value, Param.THREE_YC.value, value=value
     )
-    ff_param["value"] = value
-    return updated_order
 
 
 def get_3yc_fulfillment_parameters(order_or_agreement: dict) -> list[str]:
@@ -5,6 +5,7 @@ from typing import Any
 
 from mpt_extension_sdk.mpt_http.base import MPTClient
 
+from adobe_vipm.adobe.request_cache import request_cache_scope
 from adobe_vipm.flows.constants import OrderType
 from adobe_vipm.flows.utils import (
     notify_unhandled_exception_in_teams,
@@ -95,7 +96,8 @@ def validate_order(mpt_client: MPTClient, order: dict[str, Any]) -> dict[str, An
         return order
 
     try:
-        has_errors, order = validator(mpt_client, order)
+        with request_cache_scope(order["id"]):
+            has_errors, order = validator(mpt_client, order)
     except Exception:
         notify_unhandled_exception_in_teams(
             "validation", order["id"], strip_trace_id(traceback.format_exc())
@@ -56,16 +56,23 @@ class ValidateDownsizes(Step):
 
         adobe_client = get_adobe_client()
         errors = []
-        for line in context.downsize_lines:
-            subscription_id = get_subscription_by_line_subs_id(
+        subscription_ids = {
+            line["id"]: get_subscription_by_line_subs_id(
                 context.order["agreement"]["subscriptions"], line
             )
-            returnable_orders = adobe_client.get_returnable_orders_by_subscription_id(
+            for line in context.downsize_lines
+        }
+        # One scan of the order history for all the downsized subscriptions
+        returnable_orders_by_subscription_id = (
+            adobe_client.get_returnable_orders_by_subscription_ids(
                 context.authorization_id,
                 context.adobe_customer_id,
-                subscription_id,
+                list(subscription_ids.values()),
                 context.adobe_customer["cotermDate"],
             )
+        )
+        for line in context.downsize_lines:
+            returnable_orders = returnable_orders_by_subscription_id[subscription_ids[line["id"]]]
             if not returnable_orders:
                 continue
 
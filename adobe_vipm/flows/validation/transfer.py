@@ -52,7 +52,6 @@ from adobe_vipm.flows.utils import (
     is_transferring_item_expired,
     set_order_error,
     set_ordering_parameter_error,
-    split_downsizes_upsizes_new,
 )
 from adobe_vipm.flows.utils.validation import validate_government_lga_data
 from adobe_vipm.notifications import send_error
@@ -547,7 +546,7 @@ class AddResellerChangeLinesToOrder(Step):
         if order_lines_from_transfer:
             if not context.order["lines"]:
                 logger.info("No existing order lines, proceeding with transfer lines")
-                context.order["lines"] = order_lines_from_transfer
+                context.order = {**context.order, "lines": order_lines_from_transfer}
                 context.validation_succeeded = True
                 return
             if not self._transfer_order_lines_match(
@@ -575,7 +574,7 @@ class AddResellerChangeLinesToOrder(Step):
             context.validation_succeeded = False
             return
 
-        downsize_lines, upsize_lines, new_lines = split_downsizes_upsizes_new(context.order)
+        downsize_lines, upsize_lines, new_lines = context.line_splits
         context.downsize_lines = downsize_lines
         context.upsize_lines = upsize_lines
         context.new_lines = new_lines
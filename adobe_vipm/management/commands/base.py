@@ -1,9 +1,22 @@
 from django.core.management.base import BaseCommand
 
+from adobe_vipm.adobe.metrics import ADOBE_API_METRICS
+
 
 class AdobeBaseCommand(BaseCommand):
     """Base Command to share shortcuts for success/info output."""
 
+    def execute(self, *args, **options):
+        """Runs the command, then writes the summary of the Adobe API requests it sent."""
+        ADOBE_API_METRICS.reset()
+        try:
+            output = super().execute(*args, **options)
+        except Exception:
+            self._write_adobe_api_summary()
+            raise
+        self._write_adobe_api_summary()
+        return output
+
     def success(self, message: str) -> None:
         """Shortcut for writing message to stdout with success style."""
         self.stdout.write(self.style.SUCCESS(message), ending="\n")
@@ -19,3 +32,10 @@ class AdobeBaseCommand(BaseCommand):
     def error(self, message: str) -> None:
         """Shortcut for writing message to stdout with error style."""
         self.stderr.write(self.style.ERROR(message), ending="\n")
+
+    def _write_adobe_api_summary(self) -> None:
+        summary = ADOBE_API_METRICS.format_summary()
+        if summary:
+            self.info("Adobe API requests:")
+            for line in summary:
+                self.info(f"  {line}")
@@ -1,3 +1,6 @@
+import uuid
+
+from django.core.management.base import CommandError
 from mpt_extension_sdk.core.utils import setup_client
 
 from adobe_vipm.adobe.client import get_adobe_client
@@ -8,6 +11,16 @@ from adobe_vipm.flows.sync.agreement import (
     sync_agreements_by_renewal_date,
     sync_all_agreements,
 )
+from adobe_vipm.flows.sync.checkpoint import SyncCheckpoint, get_checkpoint_store
+from adobe_vipm.flows.sync.diff import sync_write_stats
+from adobe_vipm.flows.sync.engine import (
+    DEFAULT_MAX_PER_ACCOUNT,
+    DEFAULT_MAX_PER_AUTHORIZATION,
+    DEFAULT_SYNC_WORKERS,
+    AgreementShard,
+    AgreementSyncEngine,
+    AgreementSyncReport,
+)
 from adobe_vipm.management.commands.base import AdobeBaseCommand
 
 
@@ -45,29 +58,127 @@ class Command(AdobeBaseCommand):
             default=False,
             help="Force prices sync",
         )
+        _add_engine_arguments(parser)
+        parser.add_argument(
+            "--resume",
+            metavar="RUN_ID",
+            default=None,
+            help="Resume a previous run skipping the agreements it already synchronized",
+        )
 
     def handle(self, *args, **options):
         """Run sync agreement command."""
         self.info("Start processing agreements...")
         mpt_client = setup_client()
         adobe_client = get_adobe_client()
+        engine = self._get_engine(options)
+        sync_write_stats.reset()
+        report = AgreementSyncReport(shard=engine.shard)
         if options["agreements"]:
-            sync_agreements_by_agreement_ids(
+            report = sync_agreements_by_agreement_ids(
                 mpt_client,
                 adobe_client,
                 options["agreements"],
                 dry_run=options["dry_run"],
                 sync_prices=options["sync_prices"],
+                engine=engine,
             )
         elif options["all"]:
-            sync_all_agreements(
+            report = sync_all_agreements(
                 mpt_client,
                 adobe_client,
                 dry_run=options["dry_run"],
                 sync_prices=options["sync_prices"],
+                engine=engine,
             )
         else:
-            sync_agreements_by_3yc_end_date(mpt_client, adobe_client, dry_run=options["dry_run"])
-            sync_agreements_by_coterm_date(mpt_client, adobe_client, dry_run=options["dry_run"])
-            sync_agreements_by_renewal_date(mpt_client, adobe_client, dry_run=options["dry_run"])
+            for sync_func in (
+                sync_agreements_by_3yc_end_date,
+                sync_agreements_by_coterm_date,
+                sync_agreements_by_renewal_date,
+            ):
+                report.extend(
+                    sync_func(mpt_client, adobe_client, dry_run=options["dry_run"], engine=engine)
+                )
+        self._print_report(report)
+        self._finish_checkpoint(engine.checkpoint, report)
         self.success("Processing agreements completed.")
+
+    def _get_engine(self, options) -> AgreementSyncEngine:
+        shard = self._get_shard(options)
+        return AgreementSyncEngine(
+            options["workers"],
+            max_per_authorization=options["max_per_authorization"],
+            max_per_account=options["max_per_account"],
+            shard=shard,
+            checkpoint=self._get_checkpoint(options),
+        )
+
+    def _get_checkpoint(self, options) -> SyncCheckpoint:
+        checkpoint = SyncCheckpoint(get_checkpoint_store(), options["resume"] or uuid.uuid4().hex)
+        self.info(f"Run ID: {checkpoint.run_id}")
+        return checkpoint
+
+    def _finish_checkpoint(self, checkpoint: SyncCheckpoint, report: AgreementSyncReport) -> None:
+        if report.failed:
+            self.info(f"Resume the failed agreements with --resume {checkpoint.run_id}")
+        else:
+            # Nothing left to resume, so the run doesn't keep growing the checkpoint store
+            checkpoint.clear()
+
+    def _get_shard(self, options) -> AgreementShard | None:
+        if options["shard_count"] == 1 and options["shard_index"] == 0:
+            return None
+        try:
+            return AgreementShard(options["shard_index"], options["shard_count"])
+        except ValueError as error:
+            raise CommandError(str(error)) from error
+
+    def _print_report(self, report: AgreementSyncReport) -> None:
+        for outcome in report.outcomes:
+            message = f"{outcome.agreement_id}: {outcome.status} in {outcome.duration:.2f}s"
+            if outcome.error:
+                self.error(f"{message} ({outcome.error})")
+            else:
+                self.info(message)
+        self.info(report.summary())
+        self.info(sync_write_stats.summary())
+
+
+def _add_engine_arguments(parser):
+    """Add the arguments of the agreement sync engine."""
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_SYNC_WORKERS,
+        metavar="N",
+        help="Number of agreements to synchronize concurrently",
+    )
+    parser.add_argument(
+        "--max-per-authorization",
+        type=int,
+        default=DEFAULT_MAX_PER_AUTHORIZATION,
+        metavar="N",
+        help="Max agreements synchronized concurrently for the same Adobe authorization",
+    )
+    parser.add_argument(
+        "--max-per-account",
+        type=int,
+        default=DEFAULT_MAX_PER_ACCOUNT,
+        metavar="N",
+        help="Max agreements synchronized concurrently for the same MPT account",
+    )
+    parser.add_argument(
+        "--shard-index",
+        type=int,
+        default=0,
+        metavar="INDEX",
+        help="Zero based index of the agreements shard processed by this run",
+    )
+    parser.add_argument(
+        "--shard-count",
+        type=int,
+        default=1,
+        metavar="COUNT",
+        help="Total number of shards the agreements are split into",
+    )
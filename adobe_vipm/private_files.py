@@ -0,0 +1,81 @@
+import os
+import stat
+from pathlib import Path
+from typing import TextIO
+
+# Private files and directories are accessible by the extension user only.
+PRIVATE_FILE_MODE = 0o600
+PRIVATE_DIRECTORY_MODE = 0o700
+# Links are never followed, so a link planted by another user can't redirect the writes
+_OPEN_PRIVATE_FILE_FLAGS = os.O_RDWR | os.O_CREAT | os.O_NOFOLLOW
+
+
+def ensure_private_file(path: Path) -> None:
+    """
+    Creates the file readable by the current user only, or checks the existing one is.
+
+    Args:
+        path: The file path.
+
+    Raises:
+        PermissionError: If the existing file is not a regular file owned by the current user
+            or can be accessed by other users.
+    """
+    try:
+        file_descriptor = os.open(
+            path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | os.O_NOFOLLOW, PRIVATE_FILE_MODE
+        )
+    except FileExistsError:
+        file_stat = path.lstat()
+        if not stat.S_ISREG(file_stat.st_mode) or not _is_private(file_stat, PRIVATE_FILE_MODE):
+            raise PermissionError(
+                f"{path} must be a file owned and only accessible by the current user."
+            ) from None
+    else:
+        os.close(file_descriptor)
+
+
+def ensure_private_directory(path: Path) -> None:
+    """
+    Creates the directory accessible by the current user only, or checks the existing one is.
+
+    Args:
+        path: The directory path.
+
+    Raises:
+        PermissionError: If the existing path is not a directory owned by the current user
+            or can be accessed by other users.
+    """
+    try:
+        path.mkdir(mode=PRIVATE_DIRECTORY_MODE)
+    except FileExistsError:
+        directory_stat = path.lstat()
+        if not stat.S_ISDIR(directory_stat.st_mode) or not _is_private(
+            directory_stat, PRIVATE_DIRECTORY_MODE
+        ):
+            raise PermissionError(
+                f"{path} must be a directory owned and only accessible by the current user."
+            ) from None
+
+
+def open_private_file(path: Path) -> TextIO:
+    """
+    Opens the file for reading and writing, creating it readable by the current user only.
+
+    Args:
+        path: The file path, in a directory checked by `ensure_private_directory`.
+
+    Returns:
+        The opened file.
+
+    Raises:
+        OSError: If the path is a symbolic link.
+    """
+    file_descriptor = os.open(path, _OPEN_PRIVATE_FILE_FLAGS, PRIVATE_FILE_MODE)
+    return os.fdopen(file_descriptor, "r+", encoding="utf-8")
+
+
+def _is_private(path_stat: os.stat_result, mode: int) -> bool:
+    if path_stat.st_uid != os.getuid():
+        return False
+    return not stat.S_IMODE(path_stat.st_mode) & ~mode
@@ -13,8 +13,9 @@ from adobe_vipm.adobe.constants import (
 )
 from adobe_vipm.adobe.errors import AdobeAPIError, AdobeError
 from adobe_vipm.adobe.mixins.errors import AdobeCreatePreviewError
+from adobe_vipm.adobe.mixins.order import FLEX_DISCOUNTS_CACHE, REJECTED_FLEX_DISCOUNTS_CACHE
 from adobe_vipm.adobe.utils import to_adobe_line_id
-from adobe_vipm.flows.constants import MARKET_SEGMENT_COMMERCIAL
+from adobe_vipm.flows.constants import FAKE_CUSTOMERS_IDS, MARKET_SEGMENT_COMMERCIAL
 from adobe_vipm.flows.context import Context
 
 
@@ -526,6 +527,154 @@ def test_get_flex_discounts_per_base_offer_collects_all_pages(
     }
 
 
+def test_get_flex_discounts_per_base_offer_cached(
+    adobe_client_factory, requests_mocker, settings, mock_order, flex_discounts_factory
+):
+    mocked_client, authorization, _ = adobe_client_factory()
+    flex_discounts_url = urljoin(
+        settings.EXTENSION_CONFIG["ADOBE_API_BASE_URL"], "/v3/flex-discounts"
+    )
+    requests_mocker.get(
+        flex_discounts_url,
+        json=flex_discounts_factory(),
+        match=[
+            matchers.query_param_matcher({
+                "market-segment": "COM",
+                "country": "US",
+                "offer-ids": "65304769CA01A12,99999999CA01A12",
+            })
+        ],
+    )
+    context = Context(order=mock_order, market_segment="COM")
+    mocked_client.get_flex_discounts_per_base_offer(
+        authorization, context, ("65304769CA01A12", "99999999CA01A12")
+    )
+
+    result = mocked_client.get_flex_discounts_per_base_offer(
+        authorization, context, ("99999999CA01A12", "65304769CA01A12")
+    )
+
+    assert result == {"65304769CA01A12": "EASTER_26"}
+    assert len(requests_mocker.calls) == 1
+
+
+def test_get_preview_order_failed_discounts_invalidate_cache(
+    mocker,
+    adobe_client_factory,
+    order_preview_discounts_resp_factory,
+    preview_discounts_payload_factory,
+):
+    mocked_client, authorization, _ = adobe_client_factory()
+    discounts_resp_ok = order_preview_discounts_resp_factory()
+    del discounts_resp_ok["lineItems"][1]["flexDiscounts"]
+    mocker.patch.object(
+        mocked_client,
+        "_get_preview_order",
+        side_effect=[order_preview_discounts_resp_factory(), discounts_resp_ok],
+    )
+    FLEX_DISCOUNTS_CACHE.set(
+        (authorization.authorization_uk, "COM", "US", "65304768CA01A12"), "CODE"
+    )
+    FLEX_DISCOUNTS_CACHE.set(("other-authorization", "COM", "US", "65304768CA01A12"), "CODE")
+
+    result = mocked_client.get_preview_order(
+        authorization, "test-customer", preview_discounts_payload_factory()
+    )
+
+    assert result == discounts_resp_ok
+    assert (
+        authorization.authorization_uk,
+        "COM",
+        "US",
+        "65304768CA01A12",
+    ) not in FLEX_DISCOUNTS_CACHE
+    assert ("other-authorization", "COM", "US", "65304768CA01A12") in FLEX_DISCOUNTS_CACHE
+
+
+def test_get_preview_order_records_rejected_discounts(
+    mocker,
+    adobe_client_factory,
+    order_preview_discounts_resp_factory,
+    preview_discounts_payload_factory,
+):
+    mocked_client, authorization, _ = adobe_client_factory()
+    mocker.patch.object(
+        mocked_client,
+        "_get_preview_order",
+        side_effect=[order_preview_discounts_resp_factory(), {"lineItems": []}],
+    )
+
+    mocked_client.get_preview_order(
+        authorization, "test-customer", preview_discounts_payload_factory()
+    )  # act
+
+    assert ("test-customer", "65304838CA03A12", "BLACK_FRIDAY") in REJECTED_FLEX_DISCOUNTS_CACHE
+    assert ("test-customer", "65304837CA03A12", "EASTER_26") not in REJECTED_FLEX_DISCOUNTS_CACHE
+
+
+def test_get_preview_order_fake_customer_rejected_discounts_not_recorded(
+    mocker,
+    adobe_client_factory,
+    order_preview_discounts_resp_factory,
+    preview_discounts_payload_factory,
+):
+    mocked_client, authorization, _ = adobe_client_factory()
+    mocker.patch.object(
+        mocked_client,
+        "_get_preview_order",
+        side_effect=[order_preview_discounts_resp_factory(), {"lineItems": []}],
+    )
+
+    mocked_client.get_preview_order(
+        authorization,
+        FAKE_CUSTOMERS_IDS[MARKET_SEGMENT_COMMERCIAL],
+        preview_discounts_payload_factory(),
+    )  # act
+
+    assert not REJECTED_FLEX_DISCOUNTS_CACHE
+
+
+def test_create_preview_order_skips_rejected_discounts(
+    mocker,
+    adobe_client_factory,
+    adobe_authorizations_file,
+    order_factory,
+    mock_get_adobe_product_by_marketplace_sku,
+):
+    mocker.patch(
+        "adobe_vipm.adobe.mixins.order.get_adobe_product_by_marketplace_sku",
+        side_effect=mock_get_adobe_product_by_marketplace_sku,
+    )
+    mocked_client, _, _ = adobe_client_factory()
+    mocker.patch.object(
+        mocked_client,
+        "get_flex_discounts_per_base_offer",
+        return_value={"65304578CA01A12": "EASTER_26"},
+    )
+    mock_get_preview_order = mocker.patch.object(
+        mocked_client, "get_preview_order", return_value={"externalReferenceId": "ORD-1"}
+    )
+    order = order_factory()
+    order["lines"][0]["item"]["externalIds"] = {"vendor": "65304578CA"}
+    context = Context(
+        order=order,
+        order_id=order["id"],
+        authorization_id=adobe_authorizations_file["authorizations"][0]["authorization_uk"],
+        new_lines=order["lines"],
+        upsize_lines=[],
+        adobe_customer_id="a-customer",
+        market_segment=MARKET_SEGMENT_COMMERCIAL,
+    )
+    REJECTED_FLEX_DISCOUNTS_CACHE.set(
+        ("a-customer", "65304578CA01A12", "EASTER_26"), cached_value=True
+    )
+
+    mocked_client.create_preview_order(context)  # act
+
+    payload = mock_get_preview_order.call_args.args[2]
+    assert "flexDiscountCodes" not in payload["lineItems"][0]
+
+
 def test_create_switch_preview_order(
     adobe_client_factory,
     adobe_authorizations_file,
@@ -0,0 +1,416 @@
+import asyncio
+import datetime as dt
+import inspect
+import json
+from hashlib import sha256
+
+import httpx
+import pytest
+
+from adobe_vipm.adobe import async_transport
+from adobe_vipm.adobe.async_client import AsyncAdobeClient
+from adobe_vipm.adobe.client import ADOBE_RETRY_TOTAL, AdobeClient
+from adobe_vipm.adobe.constants import ORDER_TYPE_NEW, ORDER_TYPE_RETURN, AdobeOrderStatus
+from adobe_vipm.adobe.dataclasses import APIToken
+from adobe_vipm.adobe.deployment_registry import DEPLOYMENT_REGISTRY
+from adobe_vipm.adobe.errors import AdobeAPIError, AdobeTransportError
+from adobe_vipm.adobe.metrics import ADOBE_API_METRICS, AUTHORIZATION_HEADER
+from adobe_vipm.adobe.request_cache import request_cache_scope
+from adobe_vipm.adobe.token_store import FileTokenStore
+
+
+class AdobeMock:
+    """Answers the requests of the async client with the queued responses of each path."""
+
+    def __init__(self):
+        self.requests: list[httpx.Request] = []
+        self._responses: dict[tuple[str, str], list] = {}
+
+    def add(self, method: str, path: str, *responses) -> None:
+        """Queues the responses, or the errors, of the path. The last one is repeated."""
+        self._responses.setdefault((method, path), []).extend(responses)
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        """Records the request and answers it with the next queued response."""
+        self.requests.append(request)
+        responses = self._responses[request.method, request.url.path]
+        response = responses.pop(0) if len(responses) > 1 else responses[0]
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+async def get_customers(client, authorization_id, customer_id, count=5):
+    return await asyncio.gather(
+        *(client.get_customer(authorization_id, customer_id) for _ in range(count))
+    )
+
+
+async def read_update_read(client, authorization_id):
+    with request_cache_scope("AGR-1"):
+        await client.get_subscription(authorization_id, "a-customer", "a-sub")
+        await client.get_subscription(authorization_id, "a-customer", "a-sub")
+        await client.update_subscription(authorization_id, "a-customer", "a-sub", quantity=2)
+
+
+@pytest.fixture
+def adobe_mock():
+    return AdobeMock()
+
+
+@pytest.fixture(autouse=True)
+def no_retry_wait(mocker):
+    return mocker.patch.object(async_transport.asyncio, "sleep")
+
+
+@pytest.fixture
+def async_client_factory(mock_adobe_config, adobe_client_factory, adobe_mock):
+    def _factory(*, with_token=True):
+        _, authorization, api_token = adobe_client_factory()
+        client = AsyncAdobeClient(transport=httpx.MockTransport(adobe_mock))
+        if with_token:
+            client._tokens._tokens[authorization] = api_token
+        return client, authorization
+
+    return _factory
+
+
+def test_async_client_exposes_the_adobe_client_operations():
+    operations = [name for name in dir(AdobeClient) if callable(getattr(AdobeClient, name))]
+
+    result = [
+        name
+        for name in operations
+        if not name.startswith("_")
+        and not inspect.iscoroutinefunction(getattr(AsyncAdobeClient, name))
+        and not inspect.isasyncgenfunction(getattr(AsyncAdobeClient, name))
+    ]
+
+    assert result == []
+
+
+def test_get_customer(async_client_factory, adobe_mock):
+    client, authorization = async_client_factory()
+    adobe_mock.add("GET", "/v3/customers/a-customer", httpx.Response(200, json={"id": "c"}))
+
+    result = run(client.get_customer(authorization.authorization_uk, "a-customer"))
+
+    assert result == {"id": "c"}
+    request = adobe_mock.requests[0]
+    assert str(request.url) == "https://test.adobe.api.url/v3/customers/a-customer"
+    assert request.headers["X-Api-Key"] == authorization.client_id
+    assert request.headers["Authorization"] == "Bearer a-token"
+    assert AUTHORIZATION_HEADER not in request.headers
+    assert ADOBE_API_METRICS.collect()[0]["authorization"] == authorization.authorization_uk
+
+
+def test_token_requested_once_for_concurrent_requests(
+    settings, async_client_factory, adobe_mock, adobe_config_file
+):
+    client, authorization = async_client_factory(with_token=False)
+    adobe_mock.add(
+        "POST",
+        httpx.URL(settings.EXTENSION_CONFIG["ADOBE_AUTH_ENDPOINT_URL"]).path,
+        httpx.Response(500),
+        httpx.Response(200, json={"access_token": "new-token", "expires_in": 3600}),
+    )
+    adobe_mock.add("GET", "/v3/customers/a-customer", httpx.Response(200, json={}))
+
+    run(get_customers(client, authorization.authorization_uk, "a-customer"))  # act
+
+    token_requests = [request for request in adobe_mock.requests if request.method == "POST"]
+    # The token POST is retried on the auth endpoint, once for all the requests
+    assert len(token_requests) == 2
+    assert adobe_mock.requests[-1].headers["Authorization"] == "Bearer new-token"
+
+
+def test_get_request_retries_transient_500_then_succeeds(async_client_factory, adobe_mock):
+    client, authorization = async_client_factory()
+    adobe_mock.add(
+        "GET",
+        "/v3/customers/a-customer",
+        httpx.Response(500, json={"code": "1124", "message": "boom"}),
+        httpx.Response(200, json={"customerId": "a-customer"}),
+    )
+
+    result = run(client.get_customer(authorization.authorization_uk, "a-customer"))
+
+    assert result == {"customerId": "a-customer"}
+    assert len(adobe_mock.requests) == 2
+    assert ADOBE_API_METRICS.collect()[0]["retries"] == 1
+
+
+def test_get_request_raises_adobe_api_error_when_retries_exhausted(
+    async_client_factory, adobe_mock, adobe_api_error_factory
+):
+    client, authorization = async_client_factory()
+    adobe_mock.add(
+        "GET",
+        "/v3/customers/a-customer",
+        httpx.Response(
+            500, json=adobe_api_error_factory(code="1124", message="Internal Server Error")
+        ),
+    )
+
+    with pytest.raises(AdobeAPIError) as exc_info:
+        run(client.get_customer(authorization.authorization_uk, "a-customer"))
+
+    assert exc_info.value.code == "1124"
+    assert len(adobe_mock.requests) == ADOBE_RETRY_TOTAL + 1
+
+
+def test_post_request_not_retried(async_client_factory, adobe_mock, adobe_api_error_factory):
+    client, authorization = async_client_factory()
+    adobe_mock.add(
+        "POST",
+        "/v3/customers/a-customer/orders",
+        httpx.Response(500, json=adobe_api_error_factory(code="1124", message="boom")),
+    )
+
+    with pytest.raises(AdobeAPIError):
+        run(client.create_preview_renewal(authorization.authorization_uk, "a-customer"))
+
+    assert len(adobe_mock.requests) == 1
+
+
+def test_dropped_connection_retried_for_get_requests(async_client_factory, adobe_mock):
+    client, authorization = async_client_factory()
+    adobe_mock.add(
+        "GET",
+        "/v3/customers/a-customer",
+        httpx.ReadError("dropped"),
+        httpx.Response(200, json={"customerId": "a-customer"}),
+    )
+
+    result = run(client.get_customer(authorization.authorization_uk, "a-customer"))
+
+    assert result == {"customerId": "a-customer"}
+
+
+def test_dropped_connection_not_retried_for_post_requests(async_client_factory, adobe_mock):
+    client, authorization = async_client_factory()
+    adobe_mock.add("POST", "/v3/customers/a-customer/orders", httpx.ReadError("dropped"))
+
+    with pytest.raises(AdobeTransportError):
+        run(client.create_preview_renewal(authorization.authorization_uk, "a-customer"))
+
+    assert len(adobe_mock.requests) == 1
+
+
+def test_throttled_get_request_retried_by_rate_limiter(async_client_factory, adobe_mock):
+    client, authorization = async_client_factory()
+    adobe_mock.add(
+        "GET",
+        "/v3/customers/a-customer",
+        httpx.Response(429, headers={"Retry-After": "0"}),
+        httpx.Response(200, json={"customerId": "a-customer"}),
+    )
+
+    result = run(client.get_customer(authorization.authorization_uk, "a-customer"))
+
+    assert result == {"customerId": "a-customer"}
+    assert len(adobe_mock.requests) == 2
+
+
+def test_iter_orders_fetches_the_pages_lazily(async_client_factory, adobe_mock):
+    client, authorization = async_client_factory()
+    adobe_mock.add(
+        "GET",
+        "/v3/customers/a-customer/orders",
+        httpx.Response(
+            200,
+            json={
+                "items": [{"orderId": "1"}],
+                "links": {"next": {"uri": "/v3/customers/a-customer/orders?limit=100&offset=100"}},
+            },
+        ),
+        httpx.Response(200, json={"items": [{"orderId": "2"}], "links": {}}),
+    )
+
+    result = run(
+        anext(
+            client.iter_orders(
+                authorization.authorization_uk, "a-customer", {"order-type": ORDER_TYPE_RETURN}
+            )
+        )
+    )
+
+    assert result == {"orderId": "1"}
+    assert len(adobe_mock.requests) == 1
+    assert adobe_mock.requests[0].url.params["order-type"] == ORDER_TYPE_RETURN
+    assert adobe_mock.requests[0].url.params["limit"] == "100"
+
+
+def test_get_orders_sends_the_filters_with_every_page(async_client_factory, adobe_mock):
+    client, authorization = async_client_factory()
+    adobe_mock.add(
+        "GET",
+        "/v3/customers/a-customer/orders",
+        httpx.Response(
+            200,
+            json={
+                "items": [{"orderId": "1"}],
+                "links": {"next": {"uri": "/v3/customers/a-customer/orders?limit=100&offset=100"}},
+            },
+        ),
+        httpx.Response(200, json={"items": [{"orderId": "2"}], "links": {}}),
+    )
+
+    result = run(
+        client.get_orders(
+            authorization.authorization_uk, "a-customer", {"order-type": ORDER_TYPE_RETURN}
+        )
+    )
+
+    assert result == [{"orderId": "1"}, {"orderId": "2"}]
+    assert adobe_mock.requests[1].url.params["offset"] == "100"
+    assert adobe_mock.requests[1].url.params["order-type"] == ORDER_TYPE_RETURN
+
+
+def test_get_preview_order_drops_failed_discount_codes(async_client_factory, adobe_mock):
+    client, authorization = async_client_factory()
+    payload = {
+        "lineItems": [{"extLineItemNumber": 1, "offerId": "offer", "flexDiscountCodes": ["BAD"]}]
+    }
+    failed_preview = {
+        "lineItems": [{"flexDiscounts": [{"code": "BAD", "result": "FAILURE"}]}],
+    }
+    preview = {"lineItems": [{"offerId": "offer"}]}
+    adobe_mock.add(
+        "POST",
+        "/v3/customers/a-customer/orders",
+        httpx.Response(200, json=failed_preview),
+        httpx.Response(200, json=preview),
+    )
+
+    result = run(client.get_preview_order(authorization, "a-customer", payload))
+
+    assert result == preview
+    assert json.loads(adobe_mock.requests[1].content)["lineItems"][0]["flexDiscountCodes"] == []
+    assert adobe_mock.requests[1].url.params["fetch-price"] == "true"
+
+
+def test_get_return_orders_by_external_reference(async_client_factory, adobe_mock):
+    client, authorization = async_client_factory()
+    order = {
+        "externalReferenceId": "ORD-1_return",
+        "lineItems": [{"offerId": "65304578CA01A12"}],
+    }
+    adobe_mock.add(
+        "GET",
+        "/v3/customers/a-customer/orders",
+        httpx.Response(200, json={"items": [order], "links": {}}),
+    )
+
+    result = run(
+        client.get_return_orders_by_external_reference(
+            authorization.authorization_uk, "a-customer", "ORD-1"
+        )
+    )
+
+    assert result == {"65304578CA": [order]}
+    assert adobe_mock.requests[0].url.params.get_list("status") == [
+        AdobeOrderStatus.COMPLETE,
+        AdobeOrderStatus.OPEN,
+    ]
+
+
+def test_create_new_order(async_client_factory, adobe_mock, adobe_order_factory):
+    client, authorization = async_client_factory()
+    preview_order = adobe_order_factory(ORDER_TYPE_NEW)
+    adobe_mock.add(
+        "POST", "/v3/customers/a-customer/orders", httpx.Response(200, json={"orderId": "o"})
+    )
+
+    result = run(
+        client.create_new_order(authorization.authorization_uk, "a-customer", preview_order)
+    )
+
+    assert result == {"orderId": "o"}
+    payload = json.loads(adobe_mock.requests[0].content)
+    assert payload["orderType"] == ORDER_TYPE_NEW
+    assert payload["currencyCode"] == authorization.currency
+    assert (
+        adobe_mock.requests[0].headers["x-correlation-id"]
+        == sha256(json.dumps(payload).encode()).hexdigest()
+    )
+
+
+def test_reads_cached_and_invalidated_by_writes(async_client_factory, adobe_mock):
+    client, authorization = async_client_factory()
+    subscription_path = "/v3/customers/a-customer/subscriptions/a-sub"
+    adobe_mock.add("GET", subscription_path, httpx.Response(200, json={"subscriptionId": "a-sub"}))
+    adobe_mock.add("PATCH", subscription_path, httpx.Response(200, json={}))
+
+    run(read_update_read(client, authorization.authorization_uk))  # act
+
+    assert [request.method for request in adobe_mock.requests] == ["GET", "PATCH", "GET"]
+    assert json.loads(adobe_mock.requests[1].content) == {
+        "autoRenewal": {"enabled": True, "renewalQuantity": 2}
+    }
+
+
+def test_active_deployments_shared_with_deployment_registry(async_client_factory, adobe_mock):
+    client, authorization = async_client_factory()
+    deployments = [
+        {"deploymentId": "d-1", "status": "1000"},
+        {"deploymentId": "d-2", "status": "1004"},
+    ]
+    adobe_mock.add(
+        "GET",
+        "/v3/customers/a-customer/deployments",
+        httpx.Response(200, json={"items": deployments, "links": {}}),
+    )
+
+    result = run(
+        client.get_customer_deployments_active_status(
+            authorization.authorization_uk, "a-customer", cached=True
+        )
+    )
+
+    assert result == [deployments[0]]
+    assert (
+        DEPLOYMENT_REGISTRY.lookup(None, authorization.authorization_uk, "a-customer")
+        == deployments
+    )
+
+
+def test_expired_token_requested_again(settings, async_client_factory, adobe_mock):
+    client, authorization = async_client_factory(with_token=False)
+    client._tokens._tokens[authorization] = APIToken(
+        "old-token", expires=dt.datetime.now(tz=dt.UTC) - dt.timedelta(seconds=1)
+    )
+    adobe_mock.add(
+        "POST",
+        httpx.URL(settings.EXTENSION_CONFIG["ADOBE_AUTH_ENDPOINT_URL"]).path,
+        httpx.Response(200, json={"access_token": "new-token", "expires_in": 3600}),
+    )
+    adobe_mock.add("GET", "/v3/customers/a-customer", httpx.Response(200, json={}))
+
+    run(client.get_customer(authorization.authorization_uk, "a-customer"))  # act
+
+    assert adobe_mock.requests[-1].headers["Authorization"] == "Bearer new-token"
+
+
+def test_token_shared_through_token_store(settings, tmp_path, async_client_factory, adobe_mock):
+    client, authorization = async_client_factory(with_token=False)
+    client._tokens._token_store = FileTokenStore(tmp_path / "tokens")
+    adobe_mock.add(
+        "POST",
+        httpx.URL(settings.EXTENSION_CONFIG["ADOBE_AUTH_ENDPOINT_URL"]).path,
+        httpx.Response(200, json={"access_token": "stored-token", "expires_in": 3600}),
+    )
+    adobe_mock.add("GET", "/v3/customers/a-customer", httpx.Response(200, json={}))
+    next_client, _ = async_client_factory(with_token=False)
+    next_client._tokens._token_store = FileTokenStore(tmp_path / "tokens")
+
+    run(client.get_customer(authorization.authorization_uk, "a-customer"))  # act
+
+    run(next_client.get_customer(authorization.authorization_uk, "a-customer"))
+    token_requests = [request for request in adobe_mock.requests if request.method == "POST"]
+    assert len(token_requests) == 1
+    assert adobe_mock.requests[-1].headers["Authorization"] == "Bearer stored-token"
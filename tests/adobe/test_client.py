@@ -2842,6 +2842,35 @@ def test_get_orders_extra_filters(
     assert result == page
 
 
+def test_iter_orders_stops_fetching_pages(
+    requests_mocker, settings, adobe_client_factory, adobe_authorizations_file
+):
+    authorization_uk = adobe_authorizations_file["authorizations"][0]["authorization_uk"]
+    customer_id = "a-customer"
+    client, _, _ = adobe_client_factory()
+    first_page_url = urljoin(
+        settings.EXTENSION_CONFIG["ADOBE_API_BASE_URL"],
+        f"/v3/customers/{customer_id}/orders?limit=100&offset=0&order-type=RENEWAL",
+    )
+    next_page_url = urljoin(
+        settings.EXTENSION_CONFIG["ADOBE_API_BASE_URL"],
+        f"/v3/customers/{customer_id}/orders?limit=100&offset=100&order-type=RENEWAL",
+    )
+    requests_mocker.get(
+        first_page_url,
+        json={
+            "items": [{"orderId": "P0"}, {"orderId": "P1"}],
+            "links": {"next": {"uri": next_page_url}},
+        },
+    )
+    orders = client.iter_orders(authorization_uk, customer_id, filters={"order-type": "RENEWAL"})
+
+    result = next(order for order in orders if order["orderId"] == "P1")
+
+    assert result == {"orderId": "P1"}
+    assert requests_mocker.assert_call_count(first_page_url, 1)
+
+
 @freeze_time("2024-01-01")
 def test_get_returnable_orders_by_subscription_id(
     mocker,
@@ -2907,9 +2936,9 @@ def test_get_returnable_orders_by_subscription_id(
         status=AdobeOrderStatus.COMPLETE.value,
         creation_date="2024-01-10T00:00:00Z",
     )
-    mocked_get_orders = mocker.patch.object(
+    mocked_iter_orders = mocker.patch.object(
         adobe_client.AdobeClient,
-        "get_orders",
+        "iter_orders",
         return_value=[
             order_ko_0,
             order_ok_1,
@@ -2942,7 +2971,7 @@ def test_get_returnable_orders_by_subscription_id(
             quantity=order_ok_2["lineItems"][0]["quantity"],
         ),
     ]
-    mocked_get_orders.assert_called_once_with(
+    mocked_iter_orders.assert_called_once_with(
         authorization_uk,
         customer_id,
         filters={
@@ -3019,9 +3048,9 @@ def test_get_returnable_orders_by_subscription_id_with_returning_orders(
     )
     ret_order_1 = adobe_order_factory(reference_order_id="order_ok_3", order_type=ORDER_TYPE_RETURN)
     ret_order_2 = adobe_order_factory(reference_order_id="order_ok_4", order_type=ORDER_TYPE_RETURN)
-    mocked_get_orders = mocker.patch.object(
+    mocked_iter_orders = mocker.patch.object(
         adobe_client.AdobeClient,
-        "get_orders",
+        "iter_orders",
         return_value=[
             order_ko_0,
             order_ok_1,
@@ -3065,7 +3094,7 @@ def test_get_returnable_orders_by_subscription_id_with_returning_orders(
             quantity=order_ok_4["lineItems"][0]["quantity"],
         ),
     ]
-    mocked_get_orders.assert_called_once_with(
+    mocked_iter_orders.assert_called_once_with(
         authorization_uk,
         customer_id,
         filters={
@@ -3101,9 +3130,9 @@ def test_get_return_orders_by_external_reference(
         status=AdobeOrderStatus.COMPLETE.value,
         external_id="returning-mpt-order-987_returned-mpt-order-456_line1",
     )
-    mocked_get_orders = mocker.patch.object(
+    mocked_iter_orders = mocker.patch.object(
         adobe_client.AdobeClient,
-        "get_orders",
+        "iter_orders",
         return_value=[order_ok_1, order_ok_2, order_ko_1],
     )
     authorization_uk = adobe_authorizations_file["authorizations"][0]["authorization_uk"]
@@ -3115,7 +3144,7 @@ def test_get_return_orders_by_external_reference(
     )
 
     assert result[order_ok_1["lineItems"][0]["offerId"][:10]] == [order_ok_1, order_ok_2]
-    mocked_get_orders.assert_called_once_with(
+    mocked_iter_orders.assert_called_once_with(
         authorization_uk,
         customer_id,
         filters={
@@ -3189,9 +3218,9 @@ def test_get_returnable_orders_by_subscription_id_no_renewal_for_period(
         status=AdobeOrderStatus.COMPLETE.value,
         creation_date="2024-01-10T00:00:00Z",
     )
-    mocked_get_orders = mocker.patch.object(
+    mocked_iter_orders = mocker.patch.object(
         adobe_client.AdobeClient,
-        "get_orders",
+        "iter_orders",
         return_value=[
             order_ok_0,
             order_ok_1,
@@ -3229,7 +3258,7 @@ def test_get_returnable_orders_by_subscription_id_no_renewal_for_period(
             quantity=order_ok_2["lineItems"][0]["quantity"],
         ),
     ]
-    mocked_get_orders.assert_called_once_with(
+    mocked_iter_orders.assert_called_once_with(
         authorization_uk,
         customer_id,
         filters={
@@ -3240,6 +3269,74 @@ def test_get_returnable_orders_by_subscription_id_no_renewal_for_period(
     )
 
 
+@freeze_time("2024-01-01")
+def test_get_returnable_orders_by_subscription_ids(
+    mocker,
+    adobe_order_factory,
+    adobe_items_factory,
+    adobe_client_factory,
+    adobe_authorizations_file,
+):
+    multi_line_order = adobe_order_factory(
+        order_id="multi_line_order",
+        order_type=ORDER_TYPE_NEW,
+        items=[
+            *adobe_items_factory(subscription_id="SUB-1", status=AdobeOrderStatus.COMPLETE.value),
+            *adobe_items_factory(
+                line_number=2, subscription_id="SUB-2", status=AdobeOrderStatus.COMPLETE.value
+            ),
+        ],
+        status=AdobeOrderStatus.COMPLETE.value,
+        creation_date="2023-12-20",
+    )
+    open_order = adobe_order_factory(
+        order_id="open_order",
+        order_type=ORDER_TYPE_NEW,
+        items=adobe_items_factory(subscription_id="SUB-2"),
+        status=AdobeOrderStatus.OPEN.value,
+        creation_date="2023-12-21",
+    )
+    mocked_iter_orders = mocker.patch.object(
+        adobe_client.AdobeClient,
+        "iter_orders",
+        return_value=iter([multi_line_order, open_order]),
+    )
+    authorization_uk = adobe_authorizations_file["authorizations"][0]["authorization_uk"]
+    client, _, _ = adobe_client_factory()
+
+    result = client.get_returnable_orders_by_subscription_ids(
+        authorization_uk,
+        "a-customer",
+        ["SUB-1", "SUB-2", "SUB-3"],
+        "2024-03-03",
+        return_orders={"SUB-2": [{"referenceOrderId": "open_order"}]},
+    )
+
+    assert result == {
+        "SUB-1": [
+            ReturnableOrderInfo(
+                order=multi_line_order,
+                line=multi_line_order["lineItems"][0],
+                quantity=multi_line_order["lineItems"][0]["quantity"],
+            ),
+        ],
+        "SUB-2": [
+            ReturnableOrderInfo(
+                order=multi_line_order,
+                line=multi_line_order["lineItems"][1],
+                quantity=multi_line_order["lineItems"][1]["quantity"],
+            ),
+            ReturnableOrderInfo(
+                order=open_order,
+                line=open_order["lineItems"][0],
+                quantity=open_order["lineItems"][0]["quantity"],
+            ),
+        ],
+        "SUB-3": [],
+    }
+    mocked_iter_orders.assert_called_once()
+
+
 def test_get_customer_deployments(
     requests_mocker, settings, adobe_client_factory, adobe_authorizations_file
 ):
@@ -3662,11 +3759,14 @@ def test_build_session_retry_policy_retries_token_post_on_auth_endpoint():
 def test_client_wires_retrying_session(settings, mock_adobe_config, adobe_config_file):
     client = adobe_client.AdobeClient()
 
-    result = client._session.get_adapter("https://partners.adobe.io").max_retries
+    result = client._session.get_adapter("https://partners.adobe.io")
 
     assert isinstance(client._session, requests.Session)
-    assert set(result.status_forcelist) == {429, 500}
-    assert result.allowed_methods == frozenset(("GET",))
+    # Throttled requests are retried by the rate limited adapter, not by urllib3
+    assert set(result.max_retries.status_forcelist) == {500}
+    assert result.max_retries.allowed_methods == frozenset(("GET",))
+    assert result.throttled_retries == adobe_client.ADOBE_RETRY_TOTAL
+    assert result.throttled_retry_methods == frozenset(("GET",))
 
 
 def test_client_wires_auth_endpoint_retrying_adapter(
@@ -0,0 +1,179 @@
+from urllib.parse import urljoin
+
+from freezegun import freeze_time
+
+from adobe_vipm.adobe.deployment_registry import DEPLOYMENT_REGISTRY, DeploymentRegistry
+from adobe_vipm.adobe.deployment_registry_store import SqliteAcknowledgedDeploymentsStore
+from adobe_vipm.adobe.mixins.deployment import DeploymentClientMixin
+
+
+def test_get_customer_deployments_active_status_cached(
+    requests_mocker, settings, adobe_client_factory
+):
+    client, authorization, _ = adobe_client_factory()
+    deployments_url = urljoin(
+        settings.EXTENSION_CONFIG["ADOBE_API_BASE_URL"], "/v3/customers/a-customer/deployments"
+    )
+    requests_mocker.get(
+        deployments_url,
+        json={
+            "items": [
+                {"deploymentId": "deployment-1", "status": "1000"},
+                {"deploymentId": "deployment-2", "status": "1004"},
+            ],
+            "links": {},
+        },
+    )
+    client.get_customer_deployments_active_status(
+        authorization.authorization_uk, "a-customer", cached=True
+    )
+
+    result = client.get_customer_deployments_active_status(
+        authorization.authorization_uk, "a-customer", cached=True
+    )
+
+    assert result == [{"deploymentId": "deployment-1", "status": "1000"}]
+    assert requests_mocker.assert_call_count(deployments_url, 1)
+
+
+def test_get_customer_deployments_active_status_not_cached(mocker):
+    adobe_client = mocker.MagicMock()
+    adobe_client.iter_customer_deployments.side_effect = [
+        iter([{"deploymentId": "deployment-1", "status": "1000"}]),
+        iter([{"deploymentId": "deployment-2", "status": "1000"}]),
+    ]
+    DeploymentClientMixin.get_customer_deployments_active_status(
+        adobe_client, "auth-id", "a-customer"
+    )
+
+    result = DeploymentClientMixin.get_customer_deployments_active_status(
+        adobe_client, "auth-id", "a-customer"
+    )
+
+    assert result == [{"deploymentId": "deployment-2", "status": "1000"}]
+
+
+def test_lookup_invalidated(mocker):
+    adobe_client = mocker.MagicMock()
+    adobe_client.iter_customer_deployments.side_effect = [
+        iter([{"deploymentId": "deployment-1"}]),
+        iter([{"deploymentId": "deployment-2"}]),
+    ]
+    DEPLOYMENT_REGISTRY.lookup(adobe_client, "auth-id", "a-customer")
+    DEPLOYMENT_REGISTRY.invalidate("auth-id", "a-customer")
+
+    result = DEPLOYMENT_REGISTRY.lookup(adobe_client, "auth-id", "a-customer")
+
+    assert result == [{"deploymentId": "deployment-2"}]
+
+
+def test_get_changes_initial():
+    registry = DeploymentRegistry()
+    deployments = [{"deploymentId": "deployment-1", "status": "1000"}]
+
+    result = registry.get_changes("AGR-1", "a-customer", deployments)
+
+    assert result.initial
+    assert result.deployments == deployments
+    assert bool(result)
+
+
+def test_get_changes():
+    registry = DeploymentRegistry()
+    registry.acknowledge(
+        registry.get_changes(
+            "AGR-1",
+            "a-customer",
+            [
+                {"deploymentId": "deployment-1", "status": "1000"},
+                {"deploymentId": "deployment-2", "status": "1000"},
+            ],
+        )
+    )
+
+    result = registry.get_changes(
+        "AGR-1",
+        "a-customer",
+        [
+            {"deploymentId": "deployment-2", "status": "1004"},
+            {"deploymentId": "deployment-3", "status": "1000"},
+        ],
+    )
+
+    assert not result.initial
+    assert result.added == [{"deploymentId": "deployment-3", "status": "1000"}]
+    assert result.removed == [{"deploymentId": "deployment-1", "status": "1000"}]
+    assert result.status_changed == [{"deploymentId": "deployment-2", "status": "1004"}]
+    assert result.updated_ids == {"deployment-2", "deployment-3"}
+
+
+def test_get_changes_unchanged():
+    registry = DeploymentRegistry()
+    deployments = [{"deploymentId": "deployment-1", "status": "1000"}]
+    registry.acknowledge(registry.get_changes("AGR-1", "a-customer", deployments))
+
+    result = registry.get_changes("AGR-1", "a-customer", deployments)
+
+    assert not result
+
+
+def test_get_changes_per_agreement():
+    registry = DeploymentRegistry()
+    deployments = [{"deploymentId": "deployment-1", "status": "1000"}]
+    registry.acknowledge(registry.get_changes("AGR-1", "a-customer", deployments))
+
+    result = registry.get_changes("AGR-2", "a-customer", deployments)
+
+    assert result.initial
+    assert not registry.get_changes("AGR-1", "a-customer", deployments)
+
+
+def test_acknowledge_pending_deployments():
+    registry = DeploymentRegistry()
+    deployments = [
+        {"deploymentId": "deployment-1", "status": "1000"},
+        {"deploymentId": "deployment-2", "status": "1000"},
+    ]
+    registry.acknowledge(registry.get_changes("AGR-1", "a-customer", deployments), ["deployment-2"])
+
+    result = registry.get_changes("AGR-1", "a-customer", deployments)
+
+    assert result.added == [{"deploymentId": "deployment-2", "status": "1000"}]
+
+
+def test_acknowledged_deployments_persisted(tmp_path):
+    deployments = [{"deploymentId": "deployment-1", "status": "1000"}]
+    registry = DeploymentRegistry(
+        acknowledged_store=SqliteAcknowledgedDeploymentsStore(tmp_path / "deployments")
+    )
+    registry.acknowledge(registry.get_changes("AGR-1", "a-customer", deployments))
+    next_run_registry = DeploymentRegistry(
+        acknowledged_store=SqliteAcknowledgedDeploymentsStore(tmp_path / "deployments")
+    )
+
+    result = next_run_registry.get_changes("AGR-1", "a-customer", deployments)
+
+    assert not result
+
+
+def test_acknowledged_deployments_persisted_expire(tmp_path):
+    deployments = [{"deploymentId": "deployment-1", "status": "1000"}]
+    store = SqliteAcknowledgedDeploymentsStore(tmp_path / "deployments")
+    with freeze_time("2025-06-01 10:00:00") as frozen_time:
+        store.set("AGR-1", {"deployment-1": deployments[0]})
+        frozen_time.tick(86400)
+
+        result = DeploymentRegistry(acknowledged_store=store).get_changes(
+            "AGR-1", "a-customer", deployments
+        )
+
+    assert result.initial
+
+
+def test_get_acknowledged_store_from_settings(settings, tmp_path):
+    settings.EXTENSION_CONFIG = {"ADOBE_DEPLOYMENTS_STATE_PATH": str(tmp_path / "deployments")}
+    registry = DeploymentRegistry()
+
+    registry.acknowledge(registry.get_changes("AGR-1", "a-customer", []))  # act
+
+    assert (tmp_path / "deployments").exists()
@@ -0,0 +1,88 @@
+from urllib.parse import urljoin
+
+import pytest
+import requests
+
+from adobe_vipm.adobe.errors import AdobeTransportError
+from adobe_vipm.adobe.metrics import ADOBE_API_METRICS, get_endpoint_template
+
+
+@pytest.mark.parametrize(
+    ("url", "expected_template"),
+    [
+        (
+            "https://adobe.api/v3/customers/P1005267002/subscriptions",
+            "/v3/customers/{id}/subscriptions",
+        ),
+        (
+            "https://adobe.api/v3/customers/P1005267002/orders/O12345?fetch-price=true",
+            "/v3/customers/{id}/orders/{id}",
+        ),
+        ("https://adobe.api/v3/flex-discounts", "/v3/flex-discounts"),
+        ("https://adobe.auth/ims/token/v3", "/ims/token/v3"),
+    ],
+)
+def test_get_endpoint_template(url, expected_template):
+    result = get_endpoint_template(url)
+
+    assert result == expected_template
+
+
+def test_adobe_client_requests_recorded(requests_mocker, settings, adobe_client_factory):
+    client, authorization, _ = adobe_client_factory()
+    customer_url = urljoin(
+        settings.EXTENSION_CONFIG["ADOBE_API_BASE_URL"], "/v3/customers/a-customer"
+    )
+    requests_mocker.get(customer_url, json={"customerId": "a-customer"})
+    client.get_customer(authorization.authorization_uk, "a-customer")
+
+    result = ADOBE_API_METRICS.collect()
+
+    assert result == [
+        {
+            "authorization": authorization.authorization_uk,
+            "method": "GET",
+            "endpoint": "/v3/customers/{id}",
+            "requests": 1,
+            "retries": 0,
+            "bytes_sent": 0,
+            "bytes_received": len(b'{"customerId": "a-customer"}'),
+            "latency_seconds": pytest.approx(0, abs=1),
+            "latency_histogram": {
+                "0.05": 1,
+                "0.1": 0,
+                "0.25": 0,
+                "0.5": 0,
+                "1": 0,
+                "2.5": 0,
+                "5": 0,
+                "10": 0,
+                "30": 0,
+                "60": 0,
+                "+Inf": 0,
+            },
+            "statuses": {"200": 1},
+        }
+    ]
+
+
+def test_adobe_client_failed_requests_recorded(requests_mocker, settings, adobe_client_factory):
+    client, authorization, _ = adobe_client_factory()
+    requests_mocker.get(
+        urljoin(settings.EXTENSION_CONFIG["ADOBE_API_BASE_URL"], "/v3/customers/a-customer"),
+        body=requests.ConnectionError("Connection refused"),
+    )
+    get_customer_failing(client, authorization)
+
+    result = ADOBE_API_METRICS.format_summary()
+
+    assert len(result) == 1
+    assert result[0].startswith(
+        f"{authorization.authorization_uk} GET /v3/customers/{{id}}: 1 requests, 0 retries, "
+    )
+    assert result[0].endswith("s, 0 bytes received, statuses {'error': 1}")
+
+
+def get_customer_failing(client, authorization):
+    with pytest.raises(AdobeTransportError):
+        client.get_customer(authorization.authorization_uk, "a-customer")
@@ -0,0 +1,226 @@
+import dataclasses
+import functools
+import hashlib
+import io
+import os
+import stat
+from urllib.parse import urljoin
+
+import pytest
+import requests
+from freezegun import freeze_time
+
+from adobe_vipm.adobe import rate_limit, rate_limit_store
+from adobe_vipm.adobe.metrics import AUTHORIZATION_HEADER
+from adobe_vipm.adobe.rate_limit import (
+    RateLimitedHTTPAdapter,
+    RateLimiter,
+    RateLimitMetrics,
+    get_retry_after_seconds,
+)
+from adobe_vipm.adobe.rate_limit_store import FileBucketStore, MemoryBucketStore
+
+
+@pytest.fixture
+def frozen_time():
+    with freeze_time("2025-06-01 10:00:00") as frozen:
+        yield frozen
+
+
+@pytest.fixture
+def mocked_sleep(mocker, frozen_time):
+    return mocker.patch("adobe_vipm.adobe.rate_limit.time.sleep", side_effect=frozen_time.tick)
+
+
+def build_response(status_code, headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    response.raw = io.BytesIO()
+    return response
+
+
+def test_rate_limiter_waits_for_refill(mocked_sleep):
+    rate_limiter = RateLimiter(MemoryBucketStore(), rate=2, capacity=2)
+    rate_limiter.acquire("auth-uk")
+    rate_limiter.acquire("auth-uk")
+
+    result = rate_limiter.acquire("auth-uk")
+
+    assert result == pytest.approx(0.5)
+    assert rate_limiter.collect_metrics()["auth-uk"] == {
+        "acquired": 3,
+        "throttled": 0,
+        "waited_seconds": 0.5,
+        "throughput": 3 / rate_limit.METRICS_WINDOW_SECONDS,
+    }
+
+
+def test_rate_limit_metrics_forget_requests_out_of_window():
+    metrics = RateLimitMetrics()
+    metrics.record_request(0)
+    metrics.record_request(1)
+
+    metrics.record_request(rate_limit.METRICS_WINDOW_SECONDS + 0.5)  # act
+
+    assert list(metrics.recent) == [1, rate_limit.METRICS_WINDOW_SECONDS + 0.5]
+
+
+@pytest.mark.parametrize("store_factory", [MemoryBucketStore, "file"])
+def test_rate_limiter_pauses_on_retry_after(tmp_path, mocked_sleep, store_factory):
+    store = FileBucketStore(tmp_path) if store_factory == "file" else store_factory()
+    rate_limiter = RateLimiter(store, rate=0, capacity=10)
+    rate_limiter.record_response("auth-uk", build_response(429, {"Retry-After": "3"}))
+
+    result = rate_limiter.acquire("auth-uk")
+
+    assert result == 3
+    assert rate_limiter.acquire("other-auth-uk") == 0
+    assert rate_limiter.collect_metrics()["auth-uk"]["throttled"] == 1
+
+
+@freeze_time("2025-06-01 10:00:00")
+@pytest.mark.parametrize(
+    ("headers", "expected_seconds"),
+    [
+        ({"Retry-After": "7"}, 7),
+        ({"Retry-After": "Sun, 01 Jun 2025 10:00:05 GMT"}, 5),
+        ({"Retry-After": "soon"}, rate_limit.DEFAULT_RETRY_AFTER_SECONDS),
+        ({}, rate_limit.DEFAULT_RETRY_AFTER_SECONDS),
+    ],
+)
+def test_get_retry_after_seconds(headers, expected_seconds):
+    result = get_retry_after_seconds(build_response(429, headers))
+
+    assert result == expected_seconds
+
+
+def test_client_requests_pass_through_rate_limiter(
+    mocker, requests_mocker, settings, adobe_client_factory
+):
+    client, authorization, _ = adobe_client_factory()
+    adapter = client._session.get_adapter(settings.EXTENSION_CONFIG["ADOBE_API_BASE_URL"])
+    mocked_acquire = mocker.patch.object(adapter.rate_limiter, "acquire")
+    customer_id = "adobe-customer-id"
+    requests_mocker.get(
+        urljoin(settings.EXTENSION_CONFIG["ADOBE_API_BASE_URL"], f"/v3/customers/{customer_id}"),
+        json={"customerId": customer_id},
+    )
+
+    result = client.get_customer(authorization.authorization_uk, customer_id)
+
+    assert result == {"customerId": customer_id}
+    assert isinstance(adapter, RateLimitedHTTPAdapter)
+    mocked_acquire.assert_called_once_with(authorization.authorization_uk)
+
+
+def test_client_requests_rate_limited_per_authorization(
+    mocker, requests_mocker, settings, adobe_client_factory
+):
+    client, authorization, api_token = adobe_client_factory()
+    shared_client_id_authorization = dataclasses.replace(
+        authorization, authorization_uk="uk-auth-adobe-us-02"
+    )
+    client._token_cache[shared_client_id_authorization] = api_token
+    adapter = client._session.get_adapter(settings.EXTENSION_CONFIG["ADOBE_API_BASE_URL"])
+    mocked_acquire = mocker.patch.object(adapter.rate_limiter, "acquire")
+    customer_url = urljoin(
+        settings.EXTENSION_CONFIG["ADOBE_API_BASE_URL"], "/v3/customers/a-customer"
+    )
+    requests_mocker.get(customer_url, json={"customerId": "a-customer"})
+    # Both requests get their headers before any of them is sent, as concurrent callers do
+    headers = client._get_headers(authorization)
+    shared_client_id_headers = client._get_headers(shared_client_id_authorization)
+
+    client._session.get(customer_url, headers=headers)  # act
+
+    client._session.get(customer_url, headers=shared_client_id_headers)
+    assert mocked_acquire.mock_calls == [
+        mocker.call(authorization.authorization_uk),
+        mocker.call("uk-auth-adobe-us-02"),
+    ]
+    assert not any(AUTHORIZATION_HEADER in call.request.headers for call in requests_mocker.calls)
+
+
+@pytest.mark.parametrize(("method", "expected_sends"), [("GET", 3), ("POST", 1)])
+def test_rate_limited_adapter_retries_throttled_requests(mocker, method, expected_sends):
+    rate_limiter = RateLimiter(MemoryBucketStore(), rate=0, capacity=1)
+    mocked_acquire = mocker.patch.object(rate_limiter, "acquire")
+    mocked_pause = mocker.patch.object(rate_limiter, "pause")
+    mocked_send = mocker.patch(
+        "adobe_vipm.adobe.rate_limit.HTTPAdapter.send",
+        side_effect=[
+            build_response(429, {"Retry-After": "2"}),
+            build_response(429, {"Retry-After": "2"}),
+            build_response(200),
+        ],
+    )
+    adapter = RateLimitedHTTPAdapter(
+        rate_limiter,
+        lambda request: "auth-uk",
+        throttled_retries=2,
+        throttled_retry_methods=frozenset(("GET",)),
+    )
+    request = requests.Request(method, "https://partners.adobe.io/v3/customers").prepare()
+
+    result = adapter.send(request)
+
+    assert result.status_code == (200 if method == "GET" else 429)
+    assert mocked_send.call_count == expected_sends
+    assert mocked_acquire.call_count == expected_sends
+    mocked_pause.assert_called_with("auth-uk", 2)
+
+
+def test_get_rate_limiter_file_backend(mocker, settings, tmp_path):
+    settings.EXTENSION_CONFIG = {
+        "ADOBE_RATE_LIMIT_BACKEND": "file",
+        "ADOBE_RATE_LIMIT_PATH": str(tmp_path),
+        "ADOBE_RATE_LIMIT_PER_SECOND": 5,
+    }
+    mocker.patch.object(
+        rate_limit,
+        "_create_rate_limiter",
+        functools.cache(rate_limit._create_rate_limiter.__wrapped__),
+    )
+
+    result = rate_limit.get_rate_limiter()
+
+    assert isinstance(result._store, FileBucketStore)
+    assert (result.rate, result.capacity) == (5, rate_limit.DEFAULT_RATE_LIMIT_BURST)
+
+
+def test_get_rate_limiter_file_backend_default_path(mocker, settings, tmp_path):
+    settings.EXTENSION_CONFIG = {"ADOBE_RATE_LIMIT_BACKEND": "file"}
+    mocker.patch("adobe_vipm.adobe.rate_limit.tempfile.gettempdir", return_value=str(tmp_path))
+    mocker.patch.object(
+        rate_limit,
+        "_create_rate_limiter",
+        functools.cache(rate_limit._create_rate_limiter.__wrapped__),
+    )
+
+    result = rate_limit.get_rate_limiter()
+
+    assert result._store._directory == tmp_path / f"adobe_rate_limit_{os.getuid()}"
+    assert stat.S_IMODE(result._store._directory.stat().st_mode) == 0o700
+
+
+def test_file_bucket_store_rejects_shared_directory(tmp_path):
+    directory = tmp_path / "buckets"
+    directory.mkdir()
+    directory.chmod(0o777)
+
+    with pytest.raises(PermissionError, match="only accessible by the current user"):
+        FileBucketStore(directory)  # act
+
+
+def test_file_bucket_store_does_not_follow_links(tmp_path):
+    victim = tmp_path / "victim"
+    victim.write_text("secret")
+    store = FileBucketStore(tmp_path / "buckets")
+    key_hash = hashlib.sha256(b"auth-uk").hexdigest()
+    (tmp_path / "buckets" / f"{key_hash}.json").symlink_to(victim)
+
+    with pytest.raises(OSError):
+        store.update("auth-uk", functools.partial(rate_limit_store.extend_pause, 10, 1))  # act
+
+    assert victim.read_text() == "secret"
@@ -0,0 +1,144 @@
+import contextlib
+import logging
+from urllib.parse import urljoin
+
+import pytest
+
+from adobe_vipm.adobe.request_cache import (
+    get_request_cache,
+    invalidates_customer,
+    request_cache_scope,
+)
+
+
+@pytest.fixture
+def adobe_api_url(settings):
+    def _adobe_api_url(path):
+        return urljoin(settings.EXTENSION_CONFIG["ADOBE_API_BASE_URL"], path)
+
+    return _adobe_api_url
+
+
+def test_request_cache_scope_reuses_reads(requests_mocker, adobe_client_factory, adobe_api_url):
+    client, authorization, _ = adobe_client_factory()
+    customer_url = adobe_api_url("/v3/customers/a-customer")
+    requests_mocker.get(customer_url, json={"customerId": "a-customer"})
+
+    with request_cache_scope("ORD-1234"):
+        result = [
+            client.get_customer(authorization.authorization_uk, "a-customer") for _ in range(3)
+        ]
+
+    assert result == [{"customerId": "a-customer"}] * 3
+    assert requests_mocker.assert_call_count(customer_url, 1)
+
+
+def test_request_cache_not_used_outside_scope(requests_mocker, adobe_client_factory, adobe_api_url):
+    client, authorization, _ = adobe_client_factory()
+    customer_url = adobe_api_url("/v3/customers/a-customer")
+    requests_mocker.get(customer_url, json={"customerId": "a-customer"})
+    client.get_customer(authorization.authorization_uk, "a-customer")
+
+    result = client.get_customer(authorization.authorization_uk, "a-customer")
+
+    assert result == {"customerId": "a-customer"}
+    assert get_request_cache() is None
+    assert requests_mocker.assert_call_count(customer_url, 2)
+
+
+def test_request_cache_returns_copies(requests_mocker, adobe_client_factory, adobe_api_url):
+    client, authorization, _ = adobe_client_factory()
+    requests_mocker.get(
+        adobe_api_url("/v3/customers/a-customer/subscriptions"), json={"items": [{"a": "sub"}]}
+    )
+
+    with request_cache_scope("ORD-1234"):
+        result = read_subscriptions_after_clear(client, authorization)
+
+    assert result == {"items": [{"a": "sub"}]}
+
+
+def test_request_cache_invalidated_by_write(requests_mocker, adobe_client_factory, adobe_api_url):
+    client, authorization, _ = adobe_client_factory()
+    subscriptions_url = adobe_api_url("/v3/customers/a-customer/subscriptions")
+    subscription_url = adobe_api_url("/v3/customers/a-customer/subscriptions/a-sub-id")
+    other_customer_url = adobe_api_url("/v3/customers/other-customer")
+    requests_mocker.get(subscriptions_url, json={"items": []})
+    requests_mocker.get(other_customer_url, json={"customerId": "other-customer"})
+    requests_mocker.patch(subscription_url, json={})
+    requests_mocker.get(subscription_url, json={"subscriptionId": "a-sub-id"})
+
+    with request_cache_scope("ORD-1234") as cache:
+        read_and_update_twice(client, authorization)  # act
+
+    assert requests_mocker.assert_call_count(subscriptions_url, 2)
+    assert requests_mocker.assert_call_count(other_customer_url, 1)
+    assert (cache.hits, cache.misses) == (1, 5)
+
+
+class _WritingClient:
+    @invalidates_customer
+    def update_customer(self, authorization_id, customer_id, error=None):
+        get_request_cache().get_or_load(
+            (authorization_id, customer_id, "get_customer", ()), lambda: {"read": "during"}
+        )
+        if error:
+            raise error
+
+    @invalidates_customer
+    def create_transfer(self, authorization_id, membership_id):
+        return membership_id
+
+
+@pytest.mark.parametrize("error", [None, ValueError("write failed")])
+def test_invalidates_customer_drops_reads_made_during_the_call(error):
+    with request_cache_scope("ORD-1234") as cache, contextlib.suppress(ValueError):
+        _WritingClient().update_customer("auth", "a-customer", error=error)  # act
+
+    assert cache._entries == {}
+
+
+def test_invalidates_customer_without_customer_drops_authorization_reads():
+    with request_cache_scope("ORD-1234") as cache:
+        cache.get_or_load(("auth", "a-customer", "get_customer", ()), dict)
+        cache.get_or_load(("other-auth", "a-customer", "get_customer", ()), dict)
+
+        _WritingClient().create_transfer("auth", "a-membership")  # act
+
+    assert list(cache._entries) == [("other-auth", "a-customer", "get_customer", ())]
+
+
+def test_request_cache_nested_scope_logs_once(
+    caplog, requests_mocker, adobe_client_factory, adobe_api_url
+):
+    client, authorization, _ = adobe_client_factory()
+    requests_mocker.get(adobe_api_url("/v3/customers/a-customer"), json={})
+
+    with caplog.at_level(logging.INFO), request_cache_scope("ORD-1234") as cache:
+        nested_cache = read_in_nested_scope(client, authorization)  # act
+
+    assert nested_cache is cache
+    assert [
+        record.message for record in caplog.records if record.name.endswith("request_cache")
+    ] == ["Adobe request cache for ORD-1234: 1 hits, 1 misses"]
+
+
+def read_subscriptions_after_clear(client, authorization):
+    client.get_subscriptions(authorization.authorization_uk, "a-customer")["items"].clear()
+    return client.get_subscriptions(authorization.authorization_uk, "a-customer")
+
+
+def read_and_update_twice(client, authorization):
+    for _ in range(2):
+        client.get_subscriptions(authorization.authorization_uk, "a-customer")
+        client.get_customer(authorization.authorization_uk, "other-customer")
+        client.update_subscription(
+            authorization.authorization_uk, "a-customer", "a-sub-id", quantity=1
+        )
+
+
+def read_in_nested_scope(client, authorization):
+    client.get_customer(authorization.authorization_uk, "a-customer")
+    with request_cache_scope("AGR-1234") as nested_cache:
+        client.get_customer(authorization.authorization_uk, "a-customer")
+    return nested_cache
@@ -0,0 +1,64 @@
+from adobe_vipm.adobe.constants import AdobeSubscriptionStatus
+from adobe_vipm.adobe.snapshot import AdobeCustomerSnapshot
+
+
+def test_snapshot_indexes(adobe_customer_factory, adobe_subscription_factory):
+    main_subscription = adobe_subscription_factory(subscription_id="sub-1")
+    deployment_subscription = adobe_subscription_factory(
+        subscription_id="sub-2", offer_id="77777777CA01A12", deployment_id="deployment-1"
+    )
+    inactive_subscription = adobe_subscription_factory(
+        subscription_id="sub-3",
+        offer_id="65304578CA01A13",
+        status=AdobeSubscriptionStatus.INACTIVE.value,
+    )
+
+    result = AdobeCustomerSnapshot(
+        adobe_customer_factory(),
+        [main_subscription, deployment_subscription, inactive_subscription],
+    )
+
+    assert result.customer_id == "a-client-id"
+    assert result.get_subscription("sub-2") == deployment_subscription
+    assert result.get_subscription("sub-4") is None
+    assert result.get_subscription(None) is None
+    assert result.get_subscriptions_by_partial_sku("65304578CA01A12") == [
+        main_subscription,
+        inactive_subscription,
+    ]
+    assert result.get_subscriptions_by_partial_sku("99999999CA01A12") == []
+    assert result.get_subscriptions_by_deployment("deployment-1") == [deployment_subscription]
+    assert result.get_subscriptions_by_deployment("") == [
+        main_subscription,
+        inactive_subscription,
+    ]
+    assert result.get_subscriptions_by_deployment(None) == []
+    assert result.get_subscriptions_by_status(AdobeSubscriptionStatus.ACTIVE.value) == [
+        main_subscription,
+        deployment_subscription,
+    ]
+    assert result.get_subscriptions_by_status(AdobeSubscriptionStatus.PENDING.value) == []
+
+
+def test_snapshot_discounts_and_commitment(adobe_customer_factory, adobe_commitment_factory):
+    commitment = adobe_commitment_factory()
+    snapshot = AdobeCustomerSnapshot(
+        adobe_customer_factory(
+            licenses_discount_level="03", consumables_discount_level="T2", commitment=commitment
+        ),
+        [],
+    )
+
+    result = snapshot.commitment
+
+    assert result == commitment
+    assert snapshot.discounts == snapshot.customer["discounts"]
+
+
+def test_snapshot_without_discounts_and_commitment():
+    snapshot = AdobeCustomerSnapshot({"customerId": "a-client-id"}, [])
+
+    result = snapshot.commitment
+
+    assert result == {}
+    assert snapshot.discounts == []
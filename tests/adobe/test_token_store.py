@@ -0,0 +1,219 @@
+import datetime as dt
+import stat
+import threading
+import time
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from freezegun import freeze_time
+
+from adobe_vipm.adobe import client as adobe_client
+from adobe_vipm.adobe.dataclasses import APIToken
+from adobe_vipm.adobe.token_store import (
+    FileTokenStore,
+    SqliteTokenStore,
+    get_token_store,
+)
+
+
+@pytest.fixture(params=["sqlite", "file"])
+def token_store(request, tmp_path):
+    if request.param == "sqlite":
+        return SqliteTokenStore(tmp_path / "tokens.sqlite3")
+    return FileTokenStore(tmp_path / "tokens.json")
+
+
+@pytest.fixture
+def authorization(adobe_client_factory):
+    _, authorization, _ = adobe_client_factory()
+    return authorization
+
+
+def build_token(token, seconds):
+    return APIToken(token, dt.datetime.now(tz=dt.UTC) + dt.timedelta(seconds=seconds))
+
+
+@freeze_time("2025-06-01 10:00:00")
+def test_token_store_reuses_stored_token(mocker, token_store):
+    refresh = mocker.MagicMock(return_value=build_token("a-token", 3600))
+    token_store.get_or_refresh("auth-uk", refresh, dt.timedelta(0))
+
+    result = token_store.get_or_refresh("auth-uk", refresh, dt.timedelta(0))
+
+    assert result == build_token("a-token", 3600)
+    refresh.assert_called_once_with()
+
+
+@freeze_time("2025-06-01 10:00:00")
+def test_token_store_refreshes_expiring_token(mocker, token_store):
+    refresh = mocker.MagicMock(
+        side_effect=[build_token("old-token", 300), build_token("new-token", 3600)]
+    )
+    token_store.get_or_refresh("auth-uk", refresh, dt.timedelta(0))
+
+    result = token_store.get_or_refresh("auth-uk", refresh, dt.timedelta(seconds=600))
+
+    assert result.token == "new-token"
+    assert refresh.call_count == 2
+
+
+def test_token_store_keeps_token_on_refresh_error(mocker, token_store):
+    token_store.get_or_refresh("auth-uk", lambda: build_token("a-token", 300), dt.timedelta(0))
+    refresh = mocker.MagicMock(side_effect=ValueError("auth failed"))
+
+    with pytest.raises(ValueError, match="auth failed"):
+        token_store.get_or_refresh("auth-uk", refresh, dt.timedelta(seconds=600))
+
+    assert token_store.get_or_refresh("auth-uk", refresh, dt.timedelta(0)).token == "a-token"
+
+
+@pytest.mark.parametrize(
+    ("backend", "expected_store"), [("sqlite", SqliteTokenStore), ("file", FileTokenStore)]
+)
+def test_get_token_store(settings, tmp_path, backend, expected_store):
+    settings.EXTENSION_CONFIG = {
+        "ADOBE_TOKEN_STORE_BACKEND": backend,
+        "ADOBE_TOKEN_STORE_PATH": str(tmp_path / "tokens"),
+    }
+
+    result = get_token_store()
+
+    assert isinstance(result, expected_store)
+
+
+@pytest.mark.parametrize("backend", ["sqlite", "file"])
+def test_get_token_store_requires_path(settings, backend):
+    settings.EXTENSION_CONFIG = {"ADOBE_TOKEN_STORE_BACKEND": backend}
+
+    with pytest.raises(ImproperlyConfigured, match="ADOBE_TOKEN_STORE_PATH"):
+        get_token_store()  # act
+
+
+@pytest.mark.parametrize("store_class", [SqliteTokenStore, FileTokenStore])
+def test_token_store_creates_private_file(tmp_path, store_class):
+    path = tmp_path / "tokens"
+
+    store_class(path)  # act
+
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
+
+
+@pytest.mark.parametrize("store_class", [SqliteTokenStore, FileTokenStore])
+def test_token_store_rejects_shared_file(tmp_path, store_class):
+    path = tmp_path / "tokens"
+    path.touch(mode=0o644)
+    path.chmod(0o644)
+
+    with pytest.raises(PermissionError, match="only accessible by the current user"):
+        store_class(path)  # act
+
+
+def test_get_token_store_not_shared(settings):
+    settings.EXTENSION_CONFIG = {}
+
+    result = get_token_store()
+
+    assert result is None
+
+
+def test_client_refreshes_token_once_for_concurrent_requests(
+    mocker, mock_adobe_config, adobe_config_file, authorization
+):
+    client = adobe_client.AdobeClient()
+    mocked_refresh = mocker.patch.object(
+        client, "_refresh_auth_token", side_effect=lambda auth: store_token_slowly(client, auth)
+    )
+
+    run_in_threads(client._get_auth_token, authorization, 5)  # act
+
+    mocked_refresh.assert_called_once_with(authorization)
+    assert client._token_cache[authorization].token == "a-token"
+
+
+def test_client_refreshes_expiring_token_in_background(
+    mocker, mock_adobe_config, adobe_config_file, authorization
+):
+    client = adobe_client.AdobeClient()
+    client._token_cache[authorization] = build_token("old-token", 60)
+    refreshed = threading.Event()
+    mocker.patch.object(
+        client,
+        "_refresh_auth_token",
+        side_effect=lambda auth: store_token_and_notify(client, auth, refreshed),
+    )
+
+    result = client._get_auth_token(authorization)
+
+    assert result.token == "old-token"
+    assert refreshed.wait(timeout=5)
+    assert client._token_cache[authorization].token == "new-token"
+
+
+def test_client_backs_off_failed_background_refresh(
+    mocker, mock_adobe_config, adobe_config_file, authorization
+):
+    client = adobe_client.AdobeClient()
+    client._token_cache[authorization] = build_token("old-token", 60)
+    mocked_refresh = mocker.patch.object(
+        client, "_refresh_auth_token", side_effect=ValueError("auth failed")
+    )
+    client._get_auth_token(authorization)
+    wait_for_background_refresh(client, authorization)
+
+    result = client._get_auth_token(authorization)
+
+    assert result.token == "old-token"
+    mocked_refresh.assert_called_once_with(authorization)
+    assert authorization in client._proactive_refresh_backoff
+
+
+def test_clients_share_token_through_store(
+    mocker, settings, tmp_path, mock_adobe_config, adobe_config_file, authorization
+):
+    settings.EXTENSION_CONFIG = {
+        **settings.EXTENSION_CONFIG,
+        "ADOBE_TOKEN_STORE_BACKEND": "sqlite",
+        "ADOBE_TOKEN_STORE_PATH": str(tmp_path / "tokens.sqlite3"),
+    }
+    clients = [adobe_client.AdobeClient(), adobe_client.AdobeClient()]
+    mocked_refreshes = [
+        mocker.patch.object(
+            client,
+            "_refresh_auth_token",
+            side_effect=lambda auth, client=client: store_token(client, auth, "a-token"),
+        )
+        for client in clients
+    ]
+
+    result = [client._get_auth_token(authorization) for client in clients]
+
+    assert result[0] == result[1]
+    assert [mocked_refresh.call_count for mocked_refresh in mocked_refreshes] == [1, 0]
+
+
+def run_in_threads(target, argument, count):
+    threads = [threading.Thread(target=target, args=(argument,)) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def store_token(client, authorization, access_token):
+    client._token_cache[authorization] = build_token(access_token, 3600)
+
+
+def store_token_slowly(client, authorization):
+    time.sleep(0.05)
+    store_token(client, authorization, "a-token")
+
+
+def store_token_and_notify(client, authorization, refreshed):
+    store_token(client, authorization, "new-token")
+    refreshed.set()
+
+
+def wait_for_background_refresh(client, authorization):
+    deadline = time.monotonic() + 5
+    while authorization not in client._proactive_refresh_backoff and time.monotonic() < deadline:
+        time.sleep(0.01)
@@ -1,5 +1,7 @@
 import datetime as dt
-from collections import defaultdict
+import functools
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 from freezegun import freeze_time
@@ -18,6 +20,7 @@ from pyairtable.formulas import (
 from requests import HTTPError
 
 from adobe_vipm.adobe.errors import AdobeProductNotFoundError
+from adobe_vipm.airtable import models
 from adobe_vipm.airtable.models import (
     AirTableBaseInfo,
     create_discount_redemptions,
@@ -34,10 +37,13 @@ from adobe_vipm.airtable.models import (
     get_gc_main_agreement_model,
     get_offer_ids_by_membership_id,
     get_offer_model,
+    get_pricelist_cache,
+    get_pricelist_mirror,
     get_pricelist_model,
     get_prices_for_3yc_skus,
     get_prices_for_skus,
     get_sku_adobe_mapping_model,
+    get_sku_mapping_index,
     get_skus_with_available_prices,
     get_skus_with_available_prices_3yc,
     get_transfer_by_authorization_membership_or_customer,
@@ -46,6 +52,7 @@ from adobe_vipm.airtable.models import (
     get_transfers_to_check,
     get_transfers_to_process,
 )
+from adobe_vipm.airtable.pricelist import PriceWindow, PriceWindowCache
 from adobe_vipm.flows.constants import MARKET_SEGMENT_COMMERCIAL
 
 
@@ -426,6 +433,44 @@ def test_get_prices_for_skus_missing_everywhere(mocker, settings):
     assert mocked_pricelist_model.all.call_count == 2
 
 
+def test_get_prices_for_skus_uses_pricelist_mirror(mocker, settings):
+    settings.EXTENSION_CONFIG = {
+        "AIRTABLE_API_TOKEN": "api_key",
+        "AIRTABLE_PRICING_BASES": {"product_id": "base_id"},
+        "AIRTABLE_PRICELIST_MIRROR_REFRESH_SECONDS": 300,
+    }
+    mocked_pricelist_model = mocker.MagicMock()
+    mocker.patch(
+        "adobe_vipm.airtable.models.get_pricelist_model",
+        return_value=mocked_pricelist_model,
+    )
+    mocker.patch.object(
+        models,
+        "_create_pricelist_mirror",
+        functools.cache(models._create_pricelist_mirror.__wrapped__),
+    )
+    price_item = mocker.MagicMock()
+    price_item.id = "rec1"
+    price_item.sku = "sku-1"
+    price_item.valid_until = None
+    price_item.unit_pp = 12.44
+    mocked_pricelist_model.all.return_value = [price_item]
+
+    result = get_prices_for_skus("product_id", "currency", ["sku-1", "sku-2"])
+
+    assert result == {"sku-1": 12.44}
+    assert get_pricelist_mirror("product_id", "currency").currency == "currency"
+    mocked_pricelist_model.all.assert_called_once_with(formula=EQ(Field("currency"), "currency"))
+
+
+def test_get_pricelist_mirror_disabled(settings):
+    settings.EXTENSION_CONFIG = {}
+
+    result = get_pricelist_mirror("product_id", "currency")
+
+    assert result is None
+
+
 @freeze_time("2024-06-01")
 def test_get_skus_with_available_prices(mocker, settings):
     settings.EXTENSION_CONFIG = {
@@ -589,16 +634,14 @@ def test_get_prices_for_3yc_skus(mocker, settings, mocked_pricelist_cache):
         ),
         sort=["-valid_until"],
     )
-    assert mocked_pricelist_cache == {
-        "sku-1": [
-            {
-                "currency": price_item_1.currency,
-                "valid_from": price_item_1.valid_from,
-                "valid_until": price_item_1.valid_until,
-                "unit_pp": price_item_1.unit_pp,
-            }
-        ],
-        "sku-2": [],
+    assert mocked_pricelist_cache.get_windows("sku-1", "currency") == [
+        PriceWindow(price_item_1.valid_from, price_item_1.valid_until, price_item_1.unit_pp)
+    ]
+    assert mocked_pricelist_cache.stats() == {
+        "entries": 1,
+        "hits": 0,
+        "misses": 2,
+        "evictions": 0,
     }
 
 
@@ -642,7 +685,7 @@ def test_get_prices_for_3yc_skus_falls_back_to_most_recent_when_no_window_match(
         sort=["-valid_until"],
     )
     # fallback prices aren't guaranteed correct at future lookups, so they're not cached
-    assert mocked_pricelist_cache == {"sku-1": []}
+    assert not mocked_pricelist_cache.get_windows("sku-1", "currency")
 
 
 def test_get_prices_for_3yc_skus_missing_everywhere(mocker, settings, mocked_pricelist_cache):
@@ -669,13 +712,14 @@ def test_get_prices_for_3yc_skus_missing_everywhere(mocker, settings, mocked_pri
 
 
 def test_get_prices_for_3yc_skus_hit_cache(mocker, settings, mock_pricelist_cache_factory):
-    cache = defaultdict(list)
-    cache["sku-1"].append({
-        "currency": "currency",
-        "valid_from": dt.date.fromisoformat("2024-01-01"),
-        "valid_until": dt.date.fromisoformat("2025-01-01"),
-        "unit_pp": 12.44,
-    })
+    cache = PriceWindowCache()
+    cache.add(
+        "sku-1",
+        "currency",
+        PriceWindow(
+            dt.date.fromisoformat("2024-01-01"), dt.date.fromisoformat("2025-01-01"), 12.44
+        ),
+    )
     mock_pricelist_cache_factory(cache=cache)
     settings.EXTENSION_CONFIG = {
         "AIRTABLE_API_TOKEN": "api_key",
@@ -719,13 +763,14 @@ def test_get_prices_for_3yc_skus_hit_cache(mocker, settings, mock_pricelist_cach
 
 
 def test_get_prices_for_3yc_skus_just_cache(mocker, settings, mock_pricelist_cache_factory):
-    cache = defaultdict(list)
-    cache["sku-1"].append({
-        "currency": "currency",
-        "valid_from": dt.date.fromisoformat("2024-01-01"),
-        "valid_until": dt.date.fromisoformat("2025-01-01"),
-        "unit_pp": 12.44,
-    })
+    cache = PriceWindowCache()
+    cache.add(
+        "sku-1",
+        "currency",
+        PriceWindow(
+            dt.date.fromisoformat("2024-01-01"), dt.date.fromisoformat("2025-01-01"), 12.44
+        ),
+    )
     mock_pricelist_cache_factory(cache=cache)
     settings.EXTENSION_CONFIG = {
         "AIRTABLE_API_TOKEN": "api_key",
@@ -1071,6 +1116,91 @@ def test_get_adobe_product_by_marketplace_sku(mocker, mock_get_sku_adobe_mapping
     assert result.is_valid_3yc_type()
 
 
+def test_get_adobe_product_by_marketplace_sku_from_index(mocker, settings):
+    settings.EXTENSION_CONFIG = {
+        "AIRTABLE_API_TOKEN": "api_key",
+        "AIRTABLE_SKU_MAPPING_BASE": "base_id",
+    }
+    adobe_product = mocker.MagicMock(vendor_external_id="65304578CA", segment="Commercial")
+    mocked_mapping_model = mocker.MagicMock()
+    mocked_mapping_model.all.return_value = [adobe_product]
+    mocker.patch(
+        "adobe_vipm.airtable.models.get_sku_adobe_mapping_model",
+        return_value=mocked_mapping_model,
+    )
+    get_adobe_product_by_marketplace_sku("65304578CA", MARKET_SEGMENT_COMMERCIAL)
+
+    result = get_adobe_product_by_marketplace_sku("65304578CA", MARKET_SEGMENT_COMMERCIAL)
+
+    assert result == adobe_product
+    mocked_mapping_model.all.assert_called_once_with()
+    mocked_mapping_model.from_short_id.assert_not_called()
+
+
+def test_get_adobe_product_by_marketplace_sku_missing_from_index(mocker, settings):
+    settings.EXTENSION_CONFIG = {
+        "AIRTABLE_API_TOKEN": "api_key",
+        "AIRTABLE_SKU_MAPPING_BASE": "base_id",
+    }
+    adobe_product = mocker.MagicMock(vendor_external_id="65304578CA", segment="Commercial")
+    mocked_mapping_model = mocker.MagicMock()
+    mocked_mapping_model.all.return_value = []
+    mocked_mapping_model.from_short_id.return_value = adobe_product
+    mocker.patch(
+        "adobe_vipm.airtable.models.get_sku_adobe_mapping_model",
+        return_value=mocked_mapping_model,
+    )
+
+    result = get_adobe_product_by_marketplace_sku("65304578CA", MARKET_SEGMENT_COMMERCIAL)
+
+    assert result == adobe_product
+    mocked_mapping_model.from_short_id.assert_called_once_with("65304578CA", "Commercial")
+    assert get_sku_mapping_index() == {("65304578CA", "Commercial"): adobe_product}
+
+
+def test_get_adobe_product_by_marketplace_sku_index_never_expires(mocker, settings):
+    settings.EXTENSION_CONFIG = {
+        "AIRTABLE_API_TOKEN": "api_key",
+        "AIRTABLE_SKU_MAPPING_BASE": "base_id",
+        "AIRTABLE_SKU_MAPPING_TTL_SECONDS": 0,
+    }
+    adobe_product = mocker.MagicMock(vendor_external_id="65304578CA", segment="Commercial")
+    mocked_mapping_model = mocker.MagicMock()
+    mocked_mapping_model.all.return_value = [adobe_product]
+    mocker.patch(
+        "adobe_vipm.airtable.models.get_sku_adobe_mapping_model",
+        return_value=mocked_mapping_model,
+    )
+    mocked_monotonic = mocker.patch("adobe_vipm.cache.time.monotonic", return_value=0)
+    get_adobe_product_by_marketplace_sku("65304578CA", MARKET_SEGMENT_COMMERCIAL)
+    mocked_monotonic.return_value = 10**9
+
+    result = get_adobe_product_by_marketplace_sku("65304578CA", MARKET_SEGMENT_COMMERCIAL)
+
+    assert result == adobe_product
+    mocked_mapping_model.all.assert_called_once()
+    mocked_mapping_model.from_short_id.assert_not_called()
+
+
+def test_get_sku_mapping_index_refresh(mocker, settings):
+    settings.EXTENSION_CONFIG = {
+        "AIRTABLE_API_TOKEN": "api_key",
+        "AIRTABLE_SKU_MAPPING_BASE": "base_id",
+    }
+    mocked_mapping_model = mocker.MagicMock()
+    mocked_mapping_model.all.return_value = []
+    mocker.patch(
+        "adobe_vipm.airtable.models.get_sku_adobe_mapping_model",
+        return_value=mocked_mapping_model,
+    )
+    get_sku_mapping_index()
+
+    result = get_sku_mapping_index(refresh=True)
+
+    assert result == {}
+    assert mocked_mapping_model.all.call_count == 2
+
+
 def test_adobe_product_mapping_retry_strategy_configured():
     base_info = AirTableBaseInfo(api_key="api-key", base_id="base-id")
 
@@ -1112,3 +1242,37 @@ def test_adobe_product_mapping_from_short_id_retries_on_transient_server_error(r
 
     assert result.vendor_external_id == "65304578CA"
     assert result.sku == "65304578CA01A12"
+
+
+def _build_pricelist_cache_slowly(max_entries):
+    time.sleep(0.05)
+    return PriceWindowCache(max_entries)
+
+
+def _get_pricelist_cache_id(_):
+    return id(get_pricelist_cache())
+
+
+def test_get_pricelist_cache_created_once_across_threads(mocker):
+    mocker.patch("adobe_vipm.airtable.models.PRICELIST_CACHE", None)
+    cache_class = mocker.patch(
+        "adobe_vipm.airtable.models.PriceWindowCache", side_effect=_build_pricelist_cache_slowly
+    )
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        result = set(executor.map(_get_pricelist_cache_id, range(4)))
+
+    assert len(result) == 1
+    cache_class.assert_called_once()
+
+
+def test_get_pricelist_cache_sized_once(mocker, settings):
+    mocker.patch("adobe_vipm.airtable.models.PRICELIST_CACHE", None)
+    settings.EXTENSION_CONFIG = {"AIRTABLE_PRICELIST_CACHE_MAX_ENTRIES": "5"}
+    pricelist_cache = get_pricelist_cache()
+    settings.EXTENSION_CONFIG = {"AIRTABLE_PRICELIST_CACHE_MAX_ENTRIES": "10"}
+
+    result = get_pricelist_cache()
+
+    assert result is pricelist_cache
+    assert result.max_entries == 5
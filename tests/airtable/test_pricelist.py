@@ -0,0 +1,155 @@
+import datetime as dt
+
+import pytest
+from freezegun import freeze_time
+from pyairtable.formulas import AND, EQ, GTE, Field
+
+from adobe_vipm.airtable.pricelist import (
+    PriceListEntry,
+    PriceListMirror,
+    PriceWindow,
+    PriceWindowCache,
+    SkuPriceIndex,
+)
+
+
+def build_price_item(mocker, record_id, sku, valid_from, valid_until, unit_pp, updated_at=None):
+    price_item = mocker.MagicMock()
+    price_item.id = record_id
+    price_item.sku = sku
+    price_item.partial_sku = sku[:10]
+    price_item.valid_from = valid_from
+    price_item.valid_until = valid_until
+    price_item.unit_pp = unit_pp
+    price_item.updated_at = updated_at
+    return price_item
+
+
+@pytest.fixture
+def price_items(mocker):
+    return [
+        build_price_item(
+            mocker, "rec1", "65304578CA01A12", dt.date(2023, 1, 1), dt.date(2024, 1, 1), 10.0
+        ),
+        build_price_item(
+            mocker, "rec2", "65304578CA01A12", dt.date(2024, 1, 1), dt.date(2025, 1, 1), 11.0
+        ),
+        build_price_item(mocker, "rec3", "65304578CA01A12", dt.date(2025, 1, 1), None, 12.0),
+        build_price_item(
+            mocker,
+            "rec4",
+            "77777777CA01A12",
+            dt.date(2023, 1, 1),
+            dt.date(2024, 6, 1),
+            20.0,
+            dt.datetime(2025, 1, 1, tzinfo=dt.UTC),
+        ),
+    ]
+
+
+@pytest.fixture
+def mirror(mocker, price_items):
+    fetch = mocker.MagicMock(return_value=price_items)
+    return PriceListMirror(fetch, "USD", dt.timedelta(minutes=5))
+
+
+def test_sku_price_index_get_at(mocker, price_items):
+    index = SkuPriceIndex(PriceListEntry.from_record(record) for record in price_items[:3])
+
+    result = [index.get_at(dt.date(2023, 6, 1)), index.get_at(dt.date(2024, 1, 1))]
+
+    assert [entry.record_id for entry in result] == ["rec1", "rec2"]
+    assert index.get_at(dt.date(2022, 1, 1)) is None
+    assert index.get_current().record_id == "rec3"
+    assert index.get_latest_historical().record_id == "rec2"
+
+
+@freeze_time("2025-06-01")
+def test_price_list_mirror_prices(mirror):
+    result = mirror.get_prices_for_skus(["65304578CA01A12", "77777777CA01A12", "missing"])
+
+    assert result == {"65304578CA01A12": 12.0, "77777777CA01A12": 20.0}
+    assert mirror.get_prices_for_3yc_skus(
+        dt.date(2023, 3, 1), ["65304578CA01A12", "77777777CA01A12"]
+    ) == {"65304578CA01A12": 10.0, "77777777CA01A12": 20.0}
+    mirror._fetch.assert_called_once_with(formula=EQ(Field("currency"), "USD"))
+
+
+@freeze_time("2025-06-01")
+def test_price_list_mirror_available_skus(mirror):
+    result = mirror.get_skus_with_available_prices(
+        dt.date(2025, 6, 1), ["65304578CA", "77777777CA", "missing"]
+    )
+
+    assert result == {"65304578CA"}
+    assert mirror.get_skus_with_available_prices_3yc(
+        dt.date(2024, 1, 1), ["77777777CA", "missing"]
+    ) == {"77777777CA"}
+
+
+def test_price_list_mirror_incremental_refresh(mocker, mirror):
+    updated_item = build_price_item(
+        mocker, "rec4", "77777777CA01A12", dt.date(2023, 1, 1), None, 25.0
+    )
+    with freeze_time("2025-06-01 10:00:00"):
+        mirror.refresh()
+    mirror._fetch.return_value = [updated_item]
+    with freeze_time("2025-06-01 10:03:00"):
+        mirror.refresh()
+
+    with freeze_time("2025-06-01 10:06:00"):
+        result = mirror.get_prices_for_skus(["77777777CA01A12"])
+
+    assert result == {"77777777CA01A12": 25.0}
+    assert mirror._fetch.call_count == 2
+    mirror._fetch.assert_called_with(
+        formula=AND(
+            EQ(Field("currency"), "USD"),
+            GTE(Field("updated_at"), dt.datetime(2025, 1, 1, tzinfo=dt.UTC)),
+        ),
+    )
+
+
+def test_price_list_mirror_daily_reload(mirror):
+    with freeze_time("2025-06-01 10:00:00"):
+        mirror.refresh()
+    mirror._fetch.return_value = []
+
+    with freeze_time("2025-06-02 10:00:00"):
+        result = mirror.get_prices_for_skus(["65304578CA01A12"])
+
+    assert result == {}
+    mirror._fetch.assert_called_with(formula=EQ(Field("currency"), "USD"))
+
+
+def test_price_window_cache_get_price():
+    cache = PriceWindowCache()
+    cache.add("sku-1", "USD", PriceWindow(dt.date(2024, 1, 1), dt.date(2025, 1, 1), 11.0))
+    cache.add("sku-1", "USD", PriceWindow(dt.date(2023, 1, 1), dt.date(2024, 1, 1), 10.0))
+    cache.add("sku-1", "USD", PriceWindow(dt.date(2023, 1, 1), dt.date(2024, 1, 1), 10.5))
+
+    result = [
+        cache.get_price("sku-1", "USD", dt.date(2023, 6, 1)),
+        cache.get_price("sku-1", "USD", dt.date(2024, 1, 1)),
+        cache.get_price("sku-1", "USD", dt.date(2025, 1, 1)),
+        cache.get_price("sku-1", "EUR", dt.date(2023, 6, 1)),
+    ]
+
+    assert result == [10.5, 11.0, None, None]
+    assert [window.unit_pp for window in cache.get_windows("sku-1", "USD")] == [10.5, 11.0]
+    assert cache.stats() == {"entries": 1, "hits": 2, "misses": 2, "evictions": 0}
+
+
+def test_price_window_cache_evicts_least_recently_used():
+    cache = PriceWindowCache(max_entries=2)
+    window = PriceWindow(dt.date(2024, 1, 1), dt.date(2025, 1, 1), 11.0)
+    cache.add("sku-1", "USD", window)
+    cache.add("sku-2", "USD", window)
+    cache.get_price("sku-1", "USD", dt.date(2024, 6, 1))
+
+    cache.add("sku-3", "USD", window)  # act
+
+    assert cache.get_windows("sku-1", "USD") == [window]
+    assert not cache.get_windows("sku-2", "USD")
+    assert len(cache) == 2
+    assert cache.evictions == 1
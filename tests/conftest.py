@@ -1,6 +1,5 @@
 import copy
 import datetime as dt
-from collections import defaultdict
 
 import jwt
 import pytest
@@ -17,14 +16,40 @@ from adobe_vipm.adobe.constants import (
     OfferType,
 )
 from adobe_vipm.adobe.dataclasses import APIToken, Authorization
+from adobe_vipm.adobe.deployment_registry import DEPLOYMENT_REGISTRY
+from adobe_vipm.adobe.metrics import ADOBE_API_METRICS
+from adobe_vipm.adobe.mixins.order import FLEX_DISCOUNTS_CACHE, REJECTED_FLEX_DISCOUNTS_CACHE
 from adobe_vipm.airtable.models import (
+    SKU_MAPPING_CACHE,
     AdobeProductNotFoundError,
     AirTableBaseInfo,
     get_sku_adobe_mapping_model,
 )
+from adobe_vipm.airtable.pricelist import PriceWindowCache
 from adobe_vipm.flows.constants import AgreementStatus, AssetStatus, ItemTermsModel, Param
 
 
+@pytest.fixture(autouse=True)
+def clear_sku_mapping_cache():
+    SKU_MAPPING_CACHE.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_flex_discounts_caches():
+    FLEX_DISCOUNTS_CACHE.clear()
+    REJECTED_FLEX_DISCOUNTS_CACHE.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_deployment_registry():
+    DEPLOYMENT_REGISTRY.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_adobe_api_metrics():
+    ADOBE_API_METRICS.reset()
+
+
 @pytest.fixture
 def requests_mocker():
     with responses.RequestsMock() as rsps:
@@ -2105,7 +2130,7 @@ def mock_adobe_customer_deployments_external_ids():
 @pytest.fixture
 def mock_pricelist_cache_factory(mocker):
     def _mocked_cache(cache=None):
-        new_cache = cache or defaultdict(list)
+        new_cache = cache or PriceWindowCache()
         mocker.patch("adobe_vipm.airtable.models.PRICELIST_CACHE", new_cache)
         return new_cache
 
@@ -2149,7 +2174,7 @@ def mock_get_sku_adobe_mapping_model(mocker, mock_sku_mapping_data):
     all_sku = {
         i["vendor_external_id"]: adobe_product_mapping_model(**i) for i in mock_sku_mapping_data
     }
-    mocker.patch.object(adobe_product_mapping_model, "all", return_value=all_sku)
+    mocker.patch.object(adobe_product_mapping_model, "all", return_value=list(all_sku.values()))
 
     def from_id(external_id, market_segment):
         if external_id not in all_sku:
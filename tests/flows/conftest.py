@@ -43,7 +43,18 @@ def mock_mpt_terminate_subscription(mocker):
 
 
 @pytest.fixture
-def mock_mpt_get_agreement_subscription(mocker, subscriptions_factory):
+def mock_get_agreement_subscriptions(mocker):
+    return mocker.patch(
+        "adobe_vipm.flows.sync.agreement.get_agreement_subscriptions",
+        return_value=[],
+        autospec=True,
+    )
+
+
+@pytest.fixture
+def mock_mpt_get_agreement_subscription(
+    mocker, subscriptions_factory, mock_get_agreement_subscriptions
+):
     return mocker.patch(
         "mpt_extension_sdk.mpt_http.mpt.get_agreement_subscription",
         return_value=subscriptions_factory()[0],
@@ -97,11 +97,13 @@ def test_get_returnable_orders_step(
         adobe_order_3, adobe_order_3["lineItems"][0], adobe_order_3["lineItems"][0]["quantity"]
     )
     sku = order["lines"][0]["item"]["externalIds"]["vendor"]
-    mock_adobe_client.get_returnable_orders_by_subscription_id.return_value = [
-        ret_info_1,
-        ret_info_2,
-        ret_info_3,
-    ]
+    mock_adobe_client.get_returnable_orders_by_subscription_ids.return_value = {
+        "6158e1cf0e4414a9b3a06d123969fdNA": [
+            ret_info_1,
+            ret_info_2,
+            ret_info_3,
+        ]
+    }
     mocked_client = mocker.MagicMock()
     mocked_next_step = mocker.MagicMock()
     context = Context(
@@ -117,12 +119,12 @@ def test_get_returnable_orders_step(
     step(mocked_client, context, mocked_next_step)  # act
 
     assert context.adobe_returnable_orders[sku] == (ret_info_3,)
-    mock_adobe_client.get_returnable_orders_by_subscription_id.assert_called_once_with(
+    mock_adobe_client.get_returnable_orders_by_subscription_ids.assert_called_once_with(
         context.authorization_id,
         context.adobe_customer_id,
-        "6158e1cf0e4414a9b3a06d123969fdNA",
+        ["6158e1cf0e4414a9b3a06d123969fdNA"],
         context.adobe_customer["cotermDate"],
-        return_orders=return_orders,
+        return_orders={"6158e1cf0e4414a9b3a06d123969fdNA": return_orders},
     )
     mocked_next_step.assert_called_once_with(mocked_client, context)
 
@@ -140,7 +142,9 @@ def test_get_returnable_orders_step_no_returnable_order(
     order = order_factory(lines=lines_factory(quantity=3, old_quantity=7))
     adobe_customer = adobe_customer_factory(coterm_date="2025-10-09")
     sku = order["lines"][0]["item"]["externalIds"]["vendor"]
-    mock_adobe_client.get_returnable_orders_by_subscription_id.return_value = []
+    mock_adobe_client.get_returnable_orders_by_subscription_ids.return_value = {
+        "6158e1cf0e4414a9b3a06d123969fdNA": []
+    }
     mocked_client = mocker.MagicMock()
     mocked_next_step = mocker.MagicMock()
     context = Context(
@@ -156,12 +160,12 @@ def test_get_returnable_orders_step_no_returnable_order(
     step(mocked_client, context, mocked_next_step)  # act
 
     assert sku not in context.adobe_returnable_orders
-    mock_adobe_client.get_returnable_orders_by_subscription_id.assert_called_once_with(
+    mock_adobe_client.get_returnable_orders_by_subscription_ids.assert_called_once_with(
         context.authorization_id,
         context.adobe_customer_id,
-        "6158e1cf0e4414a9b3a06d123969fdNA",
+        ["6158e1cf0e4414a9b3a06d123969fdNA"],
         context.adobe_customer["cotermDate"],
-        return_orders=[],
+        return_orders={"6158e1cf0e4414a9b3a06d123969fdNA": []},
     )
     mocked_next_step.assert_called_once_with(mocked_client, context)
 
@@ -209,11 +213,13 @@ def test_get_returnable_orders_step_quantity_mismatch(
         adobe_order_3, adobe_order_3["lineItems"][0], adobe_order_3["lineItems"][0]["quantity"]
     )
     sku = order["lines"][0]["item"]["externalIds"]["vendor"]
-    mock_adobe_client.get_returnable_orders_by_subscription_id.return_value = [
-        ret_info_1,
-        ret_info_2,
-        ret_info_3,
-    ]
+    mock_adobe_client.get_returnable_orders_by_subscription_ids.return_value = {
+        "6158e1cf0e4414a9b3a06d123969fdNA": [
+            ret_info_1,
+            ret_info_2,
+            ret_info_3,
+        ]
+    }
     mocked_client = mocker.MagicMock()
     mocked_next_step = mocker.MagicMock()
     context = Context(
@@ -229,12 +235,12 @@ def test_get_returnable_orders_step_quantity_mismatch(
     step(mocked_client, context, mocked_next_step)  # act
 
     assert context.adobe_returnable_orders[sku] is None
-    mock_adobe_client.get_returnable_orders_by_subscription_id.assert_called_once_with(
+    mock_adobe_client.get_returnable_orders_by_subscription_ids.assert_called_once_with(
         context.authorization_id,
         context.adobe_customer_id,
-        "6158e1cf0e4414a9b3a06d123969fdNA",
+        ["6158e1cf0e4414a9b3a06d123969fdNA"],
         context.adobe_customer["cotermDate"],
-        return_orders=None,
+        return_orders={"6158e1cf0e4414a9b3a06d123969fdNA": None},
     )
     mocked_next_step.assert_called_once_with(mocked_client, context)
 
@@ -266,7 +272,7 @@ def test_get_returnable_orders_step_last_two_weeks(
     step(mocked_client, context, mocked_next_step)  # act
 
     assert context.adobe_returnable_orders == {}
-    mock_adobe_client.get_returnable_orders_by_subscription_id.assert_not_called()
+    mock_adobe_client.get_returnable_orders_by_subscription_ids.assert_not_called()
     mocked_next_step.assert_called_once_with(mocked_client, context)
 
 
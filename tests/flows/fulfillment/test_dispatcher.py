@@ -0,0 +1,137 @@
+import contextvars
+import functools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from adobe_vipm.flows.fulfillment import dispatcher as dispatcher_module
+from adobe_vipm.flows.fulfillment.dispatcher import (
+    FulfillmentDispatcher,
+    get_fulfillment_dispatcher,
+)
+
+request_id = contextvars.ContextVar("request_id", default=None)
+
+
+@pytest.fixture
+def dispatcher_factory():
+    dispatchers = []
+
+    def _dispatcher(workers):
+        dispatcher = FulfillmentDispatcher(workers=workers)
+        dispatchers.append(dispatcher)
+        return dispatcher
+
+    yield _dispatcher
+
+    for dispatcher in dispatchers:
+        dispatcher.shutdown()
+
+
+def test_submit_runs_agreement_orders_in_order(dispatcher_factory):
+    dispatcher = dispatcher_factory(4)
+    fulfilled = []
+    for order_id in ("ORD-1", "ORD-2", "ORD-3"):
+        dispatcher.submit("AGR-1", order_id, lambda order_id=order_id: fulfilled.append(order_id))
+
+    result = dispatcher.join(timeout=5)
+
+    assert result is True
+    assert fulfilled == ["ORD-1", "ORD-2", "ORD-3"]
+
+
+def test_submit_runs_agreements_in_parallel(dispatcher_factory):
+    dispatcher = dispatcher_factory(2)
+    started = threading.Barrier(2, timeout=5)
+    dispatcher.submit("AGR-1", "ORD-1", started.wait)
+    dispatcher.submit("AGR-2", "ORD-2", started.wait)
+
+    result = dispatcher.join(timeout=5)
+
+    assert result is True
+    assert dispatcher.collect_metrics()["completed"] == 2
+
+
+def test_submit_skips_queued_order(dispatcher_factory):
+    dispatcher = dispatcher_factory(1)
+    release = threading.Event()
+    dispatcher.submit("AGR-1", "ORD-1", lambda: release.wait(5))
+    dispatcher.submit("AGR-1", "ORD-2", lambda: None)
+
+    result = dispatcher.submit("AGR-1", "ORD-2", lambda: None)
+
+    assert result is False
+    metrics = dispatcher.collect_metrics()
+    assert metrics["queued"] == 1
+    assert metrics["skipped"] == 1
+    release.set()
+    dispatcher.join(timeout=5)
+
+
+def test_failed_order_doesnt_block_agreement(dispatcher_factory):
+    dispatcher = dispatcher_factory(1)
+    fulfilled = []
+    dispatcher.submit("AGR-1", "ORD-1", lambda: 1 / 0)
+    dispatcher.submit("AGR-1", "ORD-2", lambda: fulfilled.append("ORD-2"))
+
+    dispatcher.join(timeout=5)  # act
+
+    assert fulfilled == ["ORD-2"]
+    metrics = dispatcher.collect_metrics()
+    assert (metrics["completed"], metrics["failed"], metrics["queued"]) == (1, 1, 0)
+
+
+def test_submit_runs_order_in_submitter_context(dispatcher_factory):
+    dispatcher = dispatcher_factory(1)
+    seen = []
+    request_id.set("event-1")
+    dispatcher.submit("AGR-1", "ORD-1", lambda: seen.append(request_id.get()))
+    request_id.set("event-2")
+
+    dispatcher.join(timeout=5)  # act
+
+    assert seen == ["event-1"]
+
+
+def test_submit_traces_order(mocker, dispatcher_factory):
+    mocked_start_span = mocker.patch(
+        "adobe_vipm.flows.fulfillment.dispatcher.tracer.start_as_current_span"
+    )
+    dispatcher = dispatcher_factory(1)
+    dispatcher.submit("AGR-1", "ORD-1", lambda: None)
+
+    dispatcher.join(timeout=5)  # act
+
+    mocked_start_span.assert_called_once_with(
+        "Fulfill order ORD-1", attributes={"order.id": "ORD-1", "agreement.id": "AGR-1"}
+    )
+
+
+def _build_dispatcher_slowly(workers):
+    time.sleep(0.05)
+    return FulfillmentDispatcher(workers=workers)
+
+
+def _get_dispatcher_id(_):
+    return id(get_fulfillment_dispatcher())
+
+
+def test_get_fulfillment_dispatcher_created_once_across_threads(mocker, settings):
+    settings.EXTENSION_CONFIG = {"FULFILLMENT_WORKERS": "2"}
+    mocker.patch.object(
+        dispatcher_module,
+        "_create_fulfillment_dispatcher",
+        functools.cache(dispatcher_module._create_fulfillment_dispatcher.__wrapped__),
+    )
+    dispatcher_class = mocker.patch(
+        "adobe_vipm.flows.fulfillment.dispatcher.FulfillmentDispatcher",
+        side_effect=_build_dispatcher_slowly,
+    )
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        result = set(executor.map(_get_dispatcher_id, range(4)))
+
+    assert len(result) == 1
+    dispatcher_class.assert_called_once_with(2)
@@ -97,7 +97,7 @@ def test_preview_renewal_now_order_step_no_renewing_subscriptions(
     step(mock_mpt_client, renewal_now_context, mocked_next_step)  # act
 
     mock_adobe_client.create_renewal_order.assert_not_called()
-    mock_adobe_client.get_orders.assert_not_called()
+    mock_adobe_client.iter_orders.assert_not_called()
     mocked_next_step.assert_called_once_with(mock_mpt_client, renewal_now_context)
 
 
@@ -111,7 +111,7 @@ def test_preview_renewal_now_order_step_existing_order_skips_preview(
         external_id=renewal_now_context.order_id,
         order_id="ADOBE-RENEWAL-EXISTING",
     )
-    mock_adobe_client.get_orders.return_value = [existing_order]
+    mock_adobe_client.iter_orders.return_value = [existing_order]
     mocked_next_step = mocker.MagicMock()
     step = PreviewRenewalNowOrder()
 
@@ -126,7 +126,7 @@ def test_preview_renewal_now_order_step_validates_preview(
     mocker, mock_adobe_client, mock_mpt_client, renewal_now_context, adobe_order_factory
 ):
     renewal_now_context.renewal_plan_subscriptions = [plan_entry(flex_discount_codes=["CODE-1"])]
-    mock_adobe_client.get_orders.return_value = []
+    mock_adobe_client.iter_orders.return_value = []
     preview_order = adobe_order_factory(
         order_type="PREVIEW_RENEWAL", status=AdobeOrderStatus.COMPLETE.value
     )
@@ -136,7 +136,7 @@ def test_preview_renewal_now_order_step_validates_preview(
 
     step(mock_mpt_client, renewal_now_context, mocked_next_step)  # act
 
-    mock_adobe_client.get_orders.assert_called_once_with(
+    mock_adobe_client.iter_orders.assert_called_once_with(
         renewal_now_context.authorization_id,
         renewal_now_context.adobe_customer_id,
         filters={"order-type": ORDER_TYPE_RENEWAL},
@@ -165,7 +165,7 @@ def test_preview_renewal_now_order_step_includes_already_renewed_subscription(
 ):
     """A renewing sub already committed in a previous renewal order is re-submitted normally."""
     renewal_now_context.renewal_plan_subscriptions = [plan_entry(snapshot_renewed_quantity=9)]
-    mock_adobe_client.get_orders.return_value = []
+    mock_adobe_client.iter_orders.return_value = []
     mock_adobe_client.create_renewal_order.return_value = adobe_order_factory(
         order_type="PREVIEW_RENEWAL", status=AdobeOrderStatus.COMPLETE.value
     )
@@ -204,7 +204,7 @@ def test_preview_renewal_now_order_step_excludes_already_renewed_without_change(
         ),
         plan_entry(),
     ]
-    mock_adobe_client.get_orders.return_value = []
+    mock_adobe_client.iter_orders.return_value = []
     mock_adobe_client.create_renewal_order.return_value = adobe_order_factory(
         order_type="PREVIEW_RENEWAL", status=AdobeOrderStatus.COMPLETE.value
     )
@@ -241,7 +241,7 @@ def test_preview_renewal_now_order_step_all_already_renewed_skips_preview(
 
     step(mock_mpt_client, renewal_now_context, mocked_next_step)  # act
 
-    mock_adobe_client.get_orders.assert_not_called()
+    mock_adobe_client.iter_orders.assert_not_called()
     mock_adobe_client.create_renewal_order.assert_not_called()
     mocked_next_step.assert_called_once_with(mock_mpt_client, renewal_now_context)
 
@@ -257,7 +257,7 @@ def test_submit_renewal_now_order_step_all_already_renewed_skips_order(
 
     step(mock_mpt_client, renewal_now_context, mocked_next_step)  # act
 
-    mock_adobe_client.get_orders.assert_not_called()
+    mock_adobe_client.iter_orders.assert_not_called()
     mock_adobe_client.create_renewal_order.assert_not_called()
     mocked_next_step.assert_called_once_with(mock_mpt_client, renewal_now_context)
 
@@ -266,7 +266,7 @@ def test_preview_renewal_now_order_step_preview_failed(
     mocker, mock_adobe_client, mock_mpt_client, renewal_now_context, adobe_api_error_factory
 ):
     renewal_now_context.renewal_plan_subscriptions = [plan_entry()]
-    mock_adobe_client.get_orders.return_value = []
+    mock_adobe_client.iter_orders.return_value = []
     mock_adobe_client.create_renewal_order.side_effect = AdobeAPIError(
         400,
         adobe_api_error_factory(
@@ -299,7 +299,7 @@ def test_submit_renewal_now_order_step_no_renewing_subscriptions(
 
     step(mock_mpt_client, renewal_now_context, mocked_next_step)  # act
 
-    mock_adobe_client.get_orders.assert_not_called()
+    mock_adobe_client.iter_orders.assert_not_called()
     mock_adobe_client.create_renewal_order.assert_not_called()
     mocked_next_step.assert_called_once_with(mock_mpt_client, renewal_now_context)
 
@@ -310,7 +310,7 @@ def test_submit_renewal_now_order_step_no_preview_available(
     """Defensive fallback if this step ever runs without PreviewRenewalNowOrder first."""
     renewal_now_context.renewal_plan_subscriptions = [plan_entry()]
     renewal_now_context.preview_renewal_order = None
-    mock_adobe_client.get_orders.return_value = []
+    mock_adobe_client.iter_orders.return_value = []
     mocked_next_step = mocker.MagicMock()
     step = SubmitRenewalNowOrder()
 
@@ -331,7 +331,7 @@ def test_submit_renewal_now_order_step_existing_order_reused(
         external_id=renewal_now_context.order_id,
         order_id="ADOBE-RENEWAL-EXISTING",
     )
-    mock_adobe_client.get_orders.return_value = [existing_order]
+    mock_adobe_client.iter_orders.return_value = [existing_order]
     mocked_next_step = mocker.MagicMock()
     step = SubmitRenewalNowOrder()
 
@@ -369,14 +369,14 @@ def test_submit_renewal_now_order_step_commits_order(
         status=AdobeOrderStatus.COMPLETE.value,
         order_id="ADOBE-RENEWAL-001",
     )
-    mock_adobe_client.get_orders.return_value = []
+    mock_adobe_client.iter_orders.return_value = []
     mock_adobe_client.create_renewal_order.return_value = renewal_order
     mocked_next_step = mocker.MagicMock()
     step = SubmitRenewalNowOrder()
 
     step(mock_mpt_client, renewal_now_context, mocked_next_step)  # act
 
-    mock_adobe_client.get_orders.assert_called_once_with(
+    mock_adobe_client.iter_orders.assert_called_once_with(
         renewal_now_context.authorization_id,
         renewal_now_context.adobe_customer_id,
         filters={"order-type": ORDER_TYPE_RENEWAL},
@@ -418,7 +418,7 @@ def test_submit_renewal_now_order_step_order_failed(
             },
         ],
     }
-    mock_adobe_client.get_orders.return_value = []
+    mock_adobe_client.iter_orders.return_value = []
     mock_adobe_client.create_renewal_order.side_effect = AdobeAPIError(
         400, adobe_api_error_factory("9999", "order error")
     )
@@ -452,7 +452,7 @@ def test_submit_renewal_now_order_step_pending(
     }
     mocker.patch("adobe_vipm.flows.fulfillment.renewal_now.update_order")
     renewal_order = adobe_order_factory(order_type="RENEWAL", status=AdobeOrderStatus.OPEN.value)
-    mock_adobe_client.get_orders.return_value = []
+    mock_adobe_client.iter_orders.return_value = []
     mock_adobe_client.create_renewal_order.return_value = renewal_order
     mocked_next_step = mocker.MagicMock()
     step = SubmitRenewalNowOrder()
@@ -483,7 +483,7 @@ def test_submit_renewal_now_order_step_unrecoverable_status(
         status=AdobeOrderStatus.FAILED.value,
         order_id="ADOBE-RENEWAL-002",
     )
-    mock_adobe_client.get_orders.return_value = []
+    mock_adobe_client.iter_orders.return_value = []
     mock_adobe_client.create_renewal_order.return_value = renewal_order
     mocked_switch_to_failed = mocker.patch(
         "adobe_vipm.flows.fulfillment.renewal_now.switch_order_to_failed"
@@ -517,7 +517,7 @@ def test_submit_renewal_now_order_step_unexpected_status(
         **adobe_order_factory(order_type="RENEWAL", order_id="ADOBE-RENEWAL-003"),
         "status": "9999",
     }
-    mock_adobe_client.get_orders.return_value = []
+    mock_adobe_client.iter_orders.return_value = []
     mock_adobe_client.create_renewal_order.return_value = renewal_order
     mocked_switch_to_failed = mocker.patch(
         "adobe_vipm.flows.fulfillment.renewal_now.switch_order_to_failed"
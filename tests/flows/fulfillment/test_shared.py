@@ -1,3 +1,4 @@
+import contextvars
 import datetime as dt
 import json
 
@@ -60,6 +61,7 @@ from adobe_vipm.flows.fulfillment.shared import (
     build_renewal_line_items,
     check_processing_template,
     is_renewal_unsupported_error,
+    run_mpt_updates,
     send_gc_mpt_notification,
     set_customer_coterm_date_if_null,
 )
@@ -133,7 +135,6 @@ def test_set_customer_coterm_date_if_null(
     mock_mpt_client,
     mock_order,
     adobe_customer_factory,
-    fulfillment_parameters_factory,
 ):
     customer = adobe_customer_factory()
     mock_adobe_client.get_customer.return_value = customer
@@ -147,10 +148,7 @@ def test_set_customer_coterm_date_if_null(
         mock_mpt_client,
         order["id"],
         parameters={
-            "ordering": order["parameters"]["ordering"],
-            "fulfillment": fulfillment_parameters_factory(
-                coterm_date=customer["cotermDate"],
-            ),
+            "fulfillment": [get_fulfillment_parameter(order, Param.COTERM_DATE.value)],
         },
     )
 
@@ -1431,7 +1429,7 @@ def test_create_or_update_asset_step(
     adobe_subscription = adobe_subscription_factory()
     mock_adobe_client.get_subscription.return_value = adobe_subscription
     mocker.patch(
-        "adobe_vipm.flows.fulfillment.shared.get_one_time_skus",
+        "adobe_vipm.flows.context.get_one_time_skus",
         return_value=[items_factory()[0]["externalIds"]["vendor"]],
     )
     mocked_get_asset_template_by_name = mocker.patch(
@@ -1509,7 +1507,7 @@ def test_create_or_update_assets_exists(
     adobe_subscription = adobe_subscription_factory()
     mock_adobe_client.get_subscription.return_value = adobe_subscription
     mocker.patch(
-        "adobe_vipm.flows.fulfillment.shared.get_one_time_skus",
+        "adobe_vipm.flows.context.get_one_time_skus",
         return_value=[items_factory()[0]["externalIds"]["vendor"]],
     )
     mocked_update_order_asset = mocker.patch(
@@ -1577,7 +1575,7 @@ def test_create_or_update_asset_step_subscription_not_processed(
     adobe_subscription = adobe_subscription_factory(status=AdobeSubscriptionStatus.PENDING.value)
     mock_adobe_client.get_subscription.return_value = adobe_subscription
     mocker.patch(
-        "adobe_vipm.flows.fulfillment.shared.get_one_time_skus",
+        "adobe_vipm.flows.context.get_one_time_skus",
         return_value=[items_factory()[0]["externalIds"]["vendor"]],
     )
     mocked_create_order_asset = mocker.patch(
@@ -1630,7 +1628,7 @@ def test_create_or_update_subscriptions_step(
     )
     adobe_subscription = adobe_subscription_factory()
     mock_adobe_client.get_subscription.return_value = adobe_subscription
-    mocker.patch("adobe_vipm.flows.fulfillment.shared.get_one_time_skus", return_value=[])
+    mocker.patch("adobe_vipm.flows.context.get_one_time_skus", return_value=[])
     mocked_create_subscription = mocker.patch(
         "adobe_vipm.flows.fulfillment.shared.create_subscription",
         return_value=subscriptions_factory()[0],
@@ -1694,6 +1692,87 @@ def test_create_or_update_subscriptions_step(
     mocked_next_step.assert_called_once_with(mock_mpt_client, context)
 
 
+def test_create_or_update_subscriptions_step_bulk_subscriptions(
+    mocker,
+    settings,
+    mock_adobe_client,
+    mock_mpt_client,
+    order_factory,
+    lines_factory,
+    subscriptions_factory,
+    adobe_order_factory,
+    adobe_items_factory,
+    adobe_subscription_factory,
+):
+    settings.EXTENSION_CONFIG = {**settings.EXTENSION_CONFIG, "FULFILLMENT_MPT_WORKERS": 2}
+    order = order_factory(
+        lines=lines_factory(line_id=1, item_id=1, external_vendor_id="65304578CA")
+        + lines_factory(line_id=2, item_id=2, external_vendor_id="77777777CA")
+    )
+    adobe_order = adobe_order_factory(
+        order_type=ORDER_TYPE_NEW,
+        items=adobe_items_factory(
+            line_number=1, offer_id="65304578CA01A12", subscription_id="sub-1"
+        )
+        + adobe_items_factory(line_number=2, offer_id="77777777CA01A12", subscription_id="sub-2"),
+    )
+    mock_adobe_client.get_subscriptions.return_value = {
+        "items": [
+            adobe_subscription_factory(subscription_id="sub-1"),
+            adobe_subscription_factory(subscription_id="sub-2"),
+            adobe_subscription_factory(subscription_id="other-sub"),
+        ]
+    }
+    mocker.patch("adobe_vipm.flows.context.get_one_time_skus", return_value=[])
+    mocked_get_template_by_name = mocker.patch(
+        "adobe_vipm.flows.fulfillment.shared.get_template_by_name",
+        return_value={"id": "TPL-6095-3767-0032", "name": "Renewing"},
+    )
+    mocked_create_subscription = mocker.patch(
+        "adobe_vipm.flows.fulfillment.shared.create_subscription",
+        return_value=subscriptions_factory()[0],
+    )
+    mocked_next_step = mocker.MagicMock()
+    context = Context(
+        order=order,
+        order_id=order["id"],
+        authorization_id="auth-id",
+        adobe_customer_id="adobe-customer-id",
+        adobe_new_order=adobe_order,
+    )
+
+    CreateOrUpdateSubscriptions()(mock_mpt_client, context, mocked_next_step)  # act
+
+    mock_adobe_client.get_subscriptions.assert_called_once_with("auth-id", "adobe-customer-id")
+    mock_adobe_client.get_subscription.assert_not_called()
+    mocked_get_template_by_name.assert_called_once()
+    assert sorted(
+        call.args[2]["externalIds"]["vendor"] for call in mocked_create_subscription.call_args_list
+    ) == ["sub-1", "sub-2"]
+    mocked_next_step.assert_called_once_with(mock_mpt_client, context)
+
+
+def test_run_mpt_updates_runs_all_and_raises_first_error(mocker, settings):
+    settings.EXTENSION_CONFIG = {**settings.EXTENSION_CONFIG, "FULFILLMENT_MPT_WORKERS": 3}
+    mocked_update = mocker.MagicMock(side_effect=[None, ValueError("failed"), None])
+
+    with pytest.raises(ValueError, match="failed"):
+        run_mpt_updates(mocked_update, [1, 2, 3])  # act
+
+    assert mocked_update.call_count == 3
+
+
+def test_run_mpt_updates_keeps_context(settings):
+    settings.EXTENSION_CONFIG = {**settings.EXTENSION_CONFIG, "FULFILLMENT_MPT_WORKERS": 3}
+    order_id = contextvars.ContextVar("order_id")
+    order_id.set("ORD-1234")
+    order_ids = []
+
+    run_mpt_updates(lambda _: order_ids.append(order_id.get(None)), [1, 2, 3])  # act
+
+    assert order_ids == ["ORD-1234", "ORD-1234", "ORD-1234"]
+
+
 def test_create_or_update_subscriptions_step_subscription_exists(
     mocker,
     mock_adobe_client,
@@ -1711,7 +1790,7 @@ def test_create_or_update_subscriptions_step_subscription_exists(
     adobe_subscription = adobe_subscription_factory()
     mock_adobe_client.get_subscription.return_value = adobe_subscription
     mocker.patch(
-        "adobe_vipm.flows.fulfillment.shared.get_one_time_skus",
+        "adobe_vipm.flows.context.get_one_time_skus",
         return_value=[],
     )
     mocked_set_sku = mocker.patch(
@@ -1784,7 +1863,7 @@ def test_create_or_update_subscriptions_step_sub_expired(
         status=AdobeSubscriptionStatus.INACTIVE.value,
     )
     mock_adobe_client.get_subscription.return_value = adobe_subscription
-    mocker.patch("adobe_vipm.flows.fulfillment.shared.get_one_time_skus", return_value=[])
+    mocker.patch("adobe_vipm.flows.context.get_one_time_skus", return_value=[])
     mocked_create_subscription = mocker.patch(
         "adobe_vipm.flows.fulfillment.shared.create_subscription"
     )
@@ -1826,7 +1905,7 @@ def test_create_or_update_subscriptions_step_update_existing_subscription(
         return_value=mocker.MagicMock(),
     )
     mocker.patch(
-        "adobe_vipm.flows.fulfillment.shared.get_one_time_skus",
+        "adobe_vipm.flows.context.get_one_time_skus",
         return_value=[],
     )
     mocked_set_sku = mocker.patch(
@@ -2373,7 +2452,7 @@ def test_create_or_update_subscriptions_step_without_template(
     adobe_subscription = adobe_subscription_factory()
     mock_adobe_client.get_subscription.return_value = adobe_subscription
     mocker.patch(
-        "adobe_vipm.flows.fulfillment.shared.get_one_time_skus",
+        "adobe_vipm.flows.context.get_one_time_skus",
         return_value=[],
     )
     mocked_create_subscription = mocker.patch(
@@ -2449,6 +2528,7 @@ def test_set_subscription_template_step(
 ):
     mock_adobe_subscription = {
         "subscriptionId": "a-sub-id",
+        "offerId": "65304578CA01A12",
         "status": "1000",
         "autoRenewal": {"enabled": True},
     }
@@ -2497,6 +2577,7 @@ def test_set_subscription_template_step_auto_renewal_disabled(
 ):
     mock_adobe_subscription = {
         "subscriptionId": "a-sub-id",
+        "offerId": "65304578CA01A12",
         "status": "1000",
         "autoRenewal": {"enabled": True},
     }
@@ -2543,6 +2624,7 @@ def test_set_subscription_template_step_terminated_subscription(
 ):
     mock_adobe_subscription = {
         "subscriptionId": "a-sub-id",
+        "offerId": "65304578CA01A12",
         "status": "1000",
         "autoRenewal": {"enabled": True},
     }
@@ -2590,16 +2672,19 @@ def test_set_subscription_template_step_multiple_subscriptions(
         "items": [
             {
                 "subscriptionId": "adobe-sub-123",
+                "offerId": "65304578CA01A12",
                 "status": "1000",
                 "autoRenewal": {"enabled": True},
             },
             {
                 "subscriptionId": "adobe-sub-456",
+                "offerId": "65304578CA01A12",
                 "status": "1000",
                 "autoRenewal": {"enabled": False},
             },
             {
                 "subscriptionId": "adobe-sub-789",
+                "offerId": "65304578CA01A12",
                 "status": "1004",
                 "autoRenewal": {"enabled": True},
             },
@@ -2648,6 +2733,7 @@ def test_set_subscription_template_step_subscription_not_found(
         "items": [
             {
                 "subscriptionId": "adobe-sub-999",
+                "offerId": "65304578CA01A12",
                 "status": "1000",
                 "autoRenewal": {"enabled": True},
             }
@@ -2834,6 +2920,49 @@ def test_check_manual_renewal_subscriptions_subscription_not_found(
     mocked_next_step.assert_called_once_with(mocked_client, context)
 
 
+@pytest.mark.parametrize(
+    ("manual_renewal_subscription_id", "expected_manual_renewal_lines"),
+    [
+        ("a-sub-id", set()),
+        ("b-sub-id", {"65304578CA"}),
+    ],
+)
+def test_check_manual_renewal_subscriptions_same_partial_sku(
+    mocker,
+    mock_adobe_client,
+    order_factory,
+    lines_factory,
+    adobe_subscription_factory,
+    manual_renewal_subscription_id,
+    expected_manual_renewal_lines,
+):
+    mocked_client = mocker.MagicMock()
+    mocked_next_step = mocker.MagicMock()
+    mocker.patch("adobe_vipm.flows.fulfillment.shared.update_order")
+    order = order_factory(lines=lines_factory(quantity=5))
+    adobe_subscriptions = [
+        adobe_subscription_factory(subscription_id="a-sub-id", offer_id="65304578CA01A12"),
+        adobe_subscription_factory(subscription_id="b-sub-id", offer_id="65304578CA03A12"),
+    ]
+    for adobe_subscription in adobe_subscriptions:
+        if adobe_subscription["subscriptionId"] == manual_renewal_subscription_id:
+            adobe_subscription["allowedActions"] = ["MANUAL_RENEWAL"]
+    mock_adobe_client.get_subscriptions_by_deployment.return_value = {"items": adobe_subscriptions}
+    context = Context(
+        order=order,
+        order_id=order["id"],
+        authorization_id="authorization-id",
+        adobe_customer_id="customer-id",
+        upsize_lines=list(order["lines"]),
+        new_lines=[],
+    )
+
+    CheckManualRenewalSubscriptions()(mocked_client, context, mocked_next_step)  # act
+
+    assert set(context.manual_renewal_lines) == expected_manual_renewal_lines
+    mocked_next_step.assert_called_once_with(mocked_client, context)
+
+
 def test_check_manual_renewal_subscriptions_upsize_line_full_renewal(
     mocker, mock_adobe_client, order_factory, lines_factory, adobe_subscription_factory, caplog
 ):
@@ -2871,9 +3000,13 @@ def test_check_manual_renewal_subscriptions_upsize_line_full_renewal(
         }
     }
     assert "subscription 65304578CA (a-sub-id) requires manual renewal" in caplog.text
-    # Renewal found on first run — parameter must be persisted
+    # Renewal found on first run — only the parameter must be persisted
     mocked_update_order.assert_called_once_with(
-        mocked_client, order["id"], parameters=context.order["parameters"]
+        mocked_client,
+        order["id"],
+        parameters={
+            "ordering": [get_ordering_parameter(context.order, Param.LATE_RENEWALS_INFO.value)]
+        },
     )
     stored = next(
         p for p in context.order["parameters"]["ordering"] if p["externalId"] == "lateRenewalsInfo"
@@ -3729,7 +3862,7 @@ def test_preview_renewal_orders_reuses_isolation_preview(
     mocked_client = mocker.MagicMock()
     mocked_next_step = mocker.MagicMock()
     order = order_factory(lines=lines_factory(quantity=5))
-    mock_adobe_client.get_orders.return_value = []
+    mock_adobe_client.iter_orders.return_value = []
     existing_preview = {"orderId": "preview-from-isolation", "lineItems": []}
     context = Context(
         order=order,
@@ -3768,7 +3901,7 @@ def test_preview_renewal_orders_existing_order_skips_preview(
         "orderType": "RENEWAL",
         "lineItems": [],
     }
-    mock_adobe_client.get_orders.return_value = [existing_order]
+    mock_adobe_client.iter_orders.return_value = [existing_order]
     context = Context(
         order=order,
         order_id=order["id"],
@@ -3806,7 +3939,7 @@ def test_submit_renewal_orders_no_manual_renewal_lines(mocker, mock_adobe_client
 
     SubmitRenewalOrders()(mocked_client, context, mocked_next_step)  # act
 
-    mock_adobe_client.get_orders.assert_not_called()
+    mock_adobe_client.iter_orders.assert_not_called()
     mocked_next_step.assert_called_once_with(mocked_client, context)
 
 
@@ -3833,7 +3966,7 @@ def test_submit_renewal_orders_renewal_completed(
         status=AdobeOrderStatus.COMPLETE.value,
         external_id="OTHER_ORDER_RENEWAL",
     )
-    mock_adobe_client.get_orders.return_value = [unrelated_order]
+    mock_adobe_client.iter_orders.return_value = [unrelated_order]
     mock_adobe_client.create_renewal_order.return_value = preview_order
     mock_adobe_client.create_renewal_order.return_value = renewal_order
     context = Context(
@@ -3854,7 +3987,7 @@ def test_submit_renewal_orders_renewal_completed(
 
     SubmitRenewalOrders()(mocked_client, context, mocked_next_step)  # act
 
-    mock_adobe_client.get_orders.assert_called_once_with(
+    mock_adobe_client.iter_orders.assert_called_once_with(
         "authorization-id",
         "customer-id",
         filters={"order-type": ORDER_TYPE_RENEWAL},
@@ -3888,7 +4021,7 @@ def test_submit_renewal_orders_order_creation_failed(
     preview_order = adobe_order_factory(
         order_type="PREVIEW_RENEWAL", status=AdobeOrderStatus.COMPLETE.value
     )
-    mock_adobe_client.get_orders.return_value = []
+    mock_adobe_client.iter_orders.return_value = []
     mock_adobe_client.create_renewal_order.return_value = preview_order
     mock_adobe_client.create_renewal_order.side_effect = AdobeAPIError(
         400, adobe_api_error_factory("9999", "order error")
@@ -3931,7 +4064,7 @@ def test_submit_renewal_orders_pending(
         order_type="PREVIEW_RENEWAL", status=AdobeOrderStatus.COMPLETE.value
     )
     renewal_order = adobe_order_factory(order_type="RENEWAL", status=AdobeOrderStatus.OPEN.value)
-    mock_adobe_client.get_orders.return_value = []
+    mock_adobe_client.iter_orders.return_value = []
     mock_adobe_client.create_renewal_order.return_value = preview_order
     mock_adobe_client.create_renewal_order.return_value = renewal_order
     context = Context(
@@ -3976,7 +4109,7 @@ def test_submit_renewal_orders_unexpected_status(
         "status": "9999",
         "lineItems": preview_order["lineItems"],
     }
-    mock_adobe_client.get_orders.return_value = []
+    mock_adobe_client.iter_orders.return_value = []
     mock_adobe_client.create_renewal_order.return_value = preview_order
     mock_adobe_client.create_renewal_order.return_value = renewal_order
     context = Context(
@@ -4022,7 +4155,7 @@ def test_submit_renewal_orders_existing_order_reused(
         "orderType": "RENEWAL",
         "lineItems": [],
     }
-    mock_adobe_client.get_orders.return_value = [existing_order]
+    mock_adobe_client.iter_orders.return_value = [existing_order]
     context = Context(
         order=order,
         order_id=order["id"],
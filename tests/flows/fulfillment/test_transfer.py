@@ -50,7 +50,7 @@ from adobe_vipm.flows.utils import (
     set_ordering_parameter_error,
     split_phone_number,
 )
-from adobe_vipm.flows.utils.date import reset_due_date
+from adobe_vipm.flows.utils.date import reset_due_date, set_due_date
 from adobe_vipm.flows.utils.order import reset_order_error
 from adobe_vipm.flows.utils.parameter import reset_ordering_parameters_error
 
@@ -610,86 +610,6 @@ def test_transfer(
     assert mocked_update_order.mock_calls[5].kwargs == {
         "parameters": {
             "fulfillment": [
-                {
-                    "constraints": {"hidden": False},
-                    "externalId": "customerId",
-                    "id": "PAR-1234-5678",
-                    "name": "Customer Id",
-                    "type": "SingleLineText",
-                    "value": "a-client-id",
-                },
-                {
-                    "constraints": {"hidden": False},
-                    "externalId": "dueDate",
-                    "id": "PAR-7771-1777",
-                    "name": "Due Date",
-                    "type": "Date",
-                    "value": None,
-                },
-                {
-                    "constraints": {"hidden": True},
-                    "externalId": "flexibleDiscounts",
-                    "id": "PAR-7771-1778",
-                    "name": "Flexible Discounts",
-                    "type": "Object",
-                    "value": None,
-                },
-                {
-                    "constraints": {"hidden": False},
-                    "externalId": "3YCEnrollStatus",
-                    "id": "PAR-9876-5432",
-                    "name": "3YC Enroll Status",
-                    "type": "SingleLineText",
-                    "value": "",
-                },
-                {
-                    "constraints": {"hidden": False},
-                    "externalId": "3YCStartDate",
-                    "id": "PAR-2266-4848",
-                    "name": "3YC Start Date",
-                    "type": "Date",
-                    "value": "",
-                },
-                {
-                    "constraints": {"hidden": False},
-                    "externalId": "3YCEndDate",
-                    "id": "PAR-3528-2927",
-                    "name": "3YC End Date",
-                    "type": "Date",
-                    "value": "",
-                },
-                {
-                    "constraints": {"hidden": False},
-                    "externalId": "3YCCommitmentRequestStatus",
-                    "id": "PAR-0022-2200",
-                    "name": "3YC Commitment Request Status",
-                    "type": "SingleLineText",
-                    "value": "",
-                },
-                {
-                    "constraints": {"hidden": False},
-                    "externalId": "3YCRecommitmentRequestStatus",
-                    "id": "PAR-0077-7700",
-                    "name": "3YC Recommitment Request Status",
-                    "type": "SingleLineText",
-                    "value": "",
-                },
-                {
-                    "constraints": {"hidden": False},
-                    "externalId": "3YCRecommit",
-                    "id": "PAR-0000-6666",
-                    "name": "3YCRecommitment",
-                    "type": "Checkbox",
-                    "value": [],
-                },
-                {
-                    "constraints": {"hidden": True},
-                    "externalId": "marketSegmentEligibilityStatus",
-                    "id": "PAR-0000-6666",
-                    "name": "Eligibility Status",
-                    "type": "Dropdown",
-                    "value": None,
-                },
                 {
                     "constraints": {"hidden": False},
                     "externalId": "cotermDate",
@@ -698,139 +618,8 @@ def test_transfer(
                     "type": "Date",
                     "value": "2024-01-01",
                 },
-                {
-                    "constraints": {"hidden": False},
-                    "displayValue": "Yes",
-                    "externalId": "globalCustomer",
-                    "id": "PAR-6179-6384-0024",
-                    "name": "Global Customer",
-                    "type": "Checkbox",
-                    "value": [None],
-                },
-                {
-                    "constraints": {"hidden": False},
-                    "externalId": "deploymentId",
-                    "id": "PAR-6179-6384-0025",
-                    "name": "Deployment ID",
-                    "type": "SingleLineText",
-                    "value": "",
-                },
-                {
-                    "constraints": {"hidden": False},
-                    "externalId": "deployments",
-                    "id": "PAR-6179-6384-0026",
-                    "name": "Deployments",
-                    "type": "MultiLineText",
-                    "value": "",
-                },
-            ],
-            "ordering": [
-                {
-                    "constraints": {"hidden": False, "required": False},
-                    "error": None,
-                    "externalId": "companyName",
-                    "id": "PAR-0000-0001",
-                    "name": "Company Name",
-                    "type": "SingleLineText",
-                    "value": "Migrated Company",
-                },
-                {
-                    "constraints": {"hidden": False, "required": False},
-                    "error": None,
-                    "externalId": "address",
-                    "id": "PAR-0000-0002",
-                    "name": "Address",
-                    "type": "Address",
-                    "value": {
-                        "addressLine1": "addressLine1",
-                        "addressLine2": "addressLine2",
-                        "city": "city",
-                        "country": "US",
-                        "postCode": "postalCode",
-                        "state": "region",
-                    },
-                },
-                {
-                    "constraints": {"hidden": False, "required": False},
-                    "error": None,
-                    "externalId": "contact",
-                    "id": "PAR-0000-0003",
-                    "name": "Contact",
-                    "type": "Contact",
-                    "value": {
-                        "email": "email",
-                        "firstName": "firstName",
-                        "lastName": "lastName",
-                        "phone": {"number": "8004449890", "prefix": "+1"},
-                    },
-                },
-                {
-                    "constraints": {"hidden": False, "required": True},
-                    "error": None,
-                    "externalId": "agreementType",
-                    "id": "PAR-0000-0004",
-                    "name": "Account type",
-                    "type": "SingleLineText",
-                    "value": "Migrate",
-                },
-                {
-                    "constraints": {"hidden": False, "required": True},
-                    "error": None,
-                    "externalId": "membershipId",
-                    "id": "PAR-0000-0005",
-                    "name": "Membership Id",
-                    "type": "SingleLineText",
-                    "value": "a-membership-id",
-                },
-                {
-                    "constraints": {"hidden": False, "required": False},
-                    "error": None,
-                    "externalId": "3YC",
-                    "id": "PAR-0000-0006",
-                    "name": "3YC",
-                    "type": "Checkbox",
-                    "value": None,
-                },
-                {
-                    "constraints": {"hidden": False, "required": False},
-                    "error": None,
-                    "externalId": "3YCLicenses",
-                    "id": "PAR-0000-0007",
-                    "name": "3YCLicenses",
-                    "type": "SingleLineText",
-                    "value": "",
-                },
-                {
-                    "constraints": {"hidden": False, "required": False},
-                    "error": None,
-                    "externalId": "3YCConsumables",
-                    "id": "PAR-0000-0008",
-                    "name": "3YCConsumables",
-                    "type": "SingleLineText",
-                    "value": "",
-                },
-                {
-                    "constraints": {"hidden": True, "required": False},
-                    "error": None,
-                    "externalId": "companyAgencyType",
-                    "id": "PAR-0000-0009",
-                    "name": "Agency type",
-                    "type": "SingleLineText",
-                    "value": "STATE",
-                },
-                {
-                    "constraints": {
-                        "hidden": True,
-                    },
-                    "error": None,
-                    "externalId": "adobeOrderIds",
-                    "id": "PAR-0000-0010",
-                    "name": "Adobe Order IDs",
-                    "type": "SingleLineText",
-                    "value": "",
-                },
             ],
-        }
+        },
     }
     mocked_update_agreement.assert_has_calls([
         mocker.call(
@@ -1937,7 +1726,7 @@ def test_transfer_reached_due_date(
     fulfill_order(mock_mpt_client, order)  # act
 
     mocked_update_order.assert_not_called()
-    reset_due_date(order)
+    order = reset_due_date(order)
     mocked_fail_order.assert_called_once_with(
         mock_mpt_client,
         order["id"],
@@ -2600,7 +2389,9 @@ def test_fulfill_transfer_order_already_migrated_error_order_line_updated(
         parameters=order["parameters"],
     )
     assert mocked_update_order.mock_calls[0].args == (mock_mpt_client, order["id"])
-    assert mocked_update_order.mock_calls[0].kwargs == {"parameters": order["parameters"]}
+    assert mocked_update_order.mock_calls[0].kwargs == {
+        "parameters": set_due_date(order)["parameters"]
+    }
     mock_sync_agreements_by_agreement_ids.assert_called_once_with(
         mock_mpt_client, mock_adobe_client, [agreement["id"]], dry_run=False, sync_prices=False
     )
@@ -3153,252 +2944,41 @@ def test_transfer_3yc_customer(
                     "city": adobe_customer_address["city"],
                     "addressLine1": adobe_customer_address["addressLine1"],
                     "addressLine2": adobe_customer_address["addressLine2"],
-                    "postCode": adobe_customer_address["postalCode"],
-                },
-                contact={
-                    "firstName": adobe_customer_contact["firstName"],
-                    "lastName": adobe_customer_contact["lastName"],
-                    "email": adobe_customer_contact["email"],
-                    "phone": split_phone_number(
-                        adobe_customer_contact.get("phoneNumber"),
-                        adobe_customer_address["country"],
-                    ),
-                },
-                p3yc=None,
-                p3yc_licenses="15",
-                p3yc_consumables="37",
-            ),
-        },
-        "externalIds": {"vendor": "a-transfer-id"},
-    }
-    assert mocked_update_order.mock_calls[4].args == (
-        mock_mpt_client,
-        order["id"],
-    )
-    assert mocked_update_order.mock_calls[5].kwargs == {
-        "parameters": {
-            "fulfillment": [
-                {
-                    "constraints": {"hidden": False},
-                    "externalId": "customerId",
-                    "id": "PAR-1234-5678",
-                    "name": "Customer Id",
-                    "type": "SingleLineText",
-                    "value": "a-client-id",
-                },
-                {
-                    "constraints": {"hidden": False},
-                    "externalId": "dueDate",
-                    "id": "PAR-7771-1777",
-                    "name": "Due Date",
-                    "type": "Date",
-                    "value": None,
-                },
-                {
-                    "constraints": {"hidden": True},
-                    "externalId": "flexibleDiscounts",
-                    "id": "PAR-7771-1778",
-                    "name": "Flexible Discounts",
-                    "type": "Object",
-                    "value": None,
-                },
-                {
-                    "constraints": {"hidden": False},
-                    "externalId": "3YCEnrollStatus",
-                    "id": "PAR-9876-5432",
-                    "name": "3YC Enroll Status",
-                    "type": "SingleLineText",
-                    "value": "COMMITTED",
-                },
-                {
-                    "constraints": {"hidden": False},
-                    "externalId": "3YCStartDate",
-                    "id": "PAR-2266-4848",
-                    "name": "3YC Start Date",
-                    "type": "Date",
-                    "value": "2024-01-01",
-                },
-                {
-                    "constraints": {"hidden": False},
-                    "externalId": "3YCEndDate",
-                    "id": "PAR-3528-2927",
-                    "name": "3YC End Date",
-                    "type": "Date",
-                    "value": "2025-01-01",
-                },
-                {
-                    "constraints": {"hidden": False},
-                    "externalId": "3YCCommitmentRequestStatus",
-                    "id": "PAR-0022-2200",
-                    "name": "3YC Commitment Request Status",
-                    "type": "SingleLineText",
-                    "value": "",
-                },
-                {
-                    "constraints": {"hidden": False},
-                    "externalId": "3YCRecommitmentRequestStatus",
-                    "id": "PAR-0077-7700",
-                    "name": "3YC Recommitment Request Status",
-                    "type": "SingleLineText",
-                    "value": "",
-                },
-                {
-                    "constraints": {"hidden": False},
-                    "externalId": "3YCRecommit",
-                    "id": "PAR-0000-6666",
-                    "name": "3YCRecommitment",
-                    "type": "Checkbox",
-                    "value": [],
-                },
-                {
-                    "constraints": {"hidden": True},
-                    "externalId": "marketSegmentEligibilityStatus",
-                    "id": "PAR-0000-6666",
-                    "name": "Eligibility Status",
-                    "type": "Dropdown",
-                    "value": None,
-                },
-                {
-                    "constraints": {"hidden": False},
-                    "externalId": "cotermDate",
-                    "id": "PAR-7373-1919",
-                    "name": "Customer Coterm date",
-                    "type": "Date",
-                    "value": "2024-01-01",
-                },
-                {
-                    "constraints": {"hidden": False},
-                    "displayValue": "Yes",
-                    "externalId": "globalCustomer",
-                    "id": "PAR-6179-6384-0024",
-                    "name": "Global Customer",
-                    "type": "Checkbox",
-                    "value": [None],
-                },
-                {
-                    "constraints": {"hidden": False},
-                    "externalId": "deploymentId",
-                    "id": "PAR-6179-6384-0025",
-                    "name": "Deployment ID",
-                    "type": "SingleLineText",
-                    "value": "",
-                },
-                {
-                    "constraints": {"hidden": False},
-                    "externalId": "deployments",
-                    "id": "PAR-6179-6384-0026",
-                    "name": "Deployments",
-                    "type": "MultiLineText",
-                    "value": "",
-                },
-            ],
-            "ordering": [
-                {
-                    "constraints": {"hidden": False, "required": False},
-                    "error": None,
-                    "externalId": "companyName",
-                    "id": "PAR-0000-0001",
-                    "name": "Company Name",
-                    "type": "SingleLineText",
-                    "value": "Migrated Company",
-                },
-                {
-                    "constraints": {"hidden": False, "required": False},
-                    "error": None,
-                    "externalId": "address",
-                    "id": "PAR-0000-0002",
-                    "name": "Address",
-                    "type": "Address",
-                    "value": {
-                        "addressLine1": "addressLine1",
-                        "addressLine2": "addressLine2",
-                        "city": "city",
-                        "country": "US",
-                        "postCode": "postalCode",
-                        "state": "region",
-                    },
-                },
-                {
-                    "constraints": {"hidden": False, "required": False},
-                    "error": None,
-                    "externalId": "contact",
-                    "id": "PAR-0000-0003",
-                    "name": "Contact",
-                    "type": "Contact",
-                    "value": {
-                        "email": "email",
-                        "firstName": "firstName",
-                        "lastName": "lastName",
-                        "phone": {"number": "8004449890", "prefix": "+1"},
-                    },
-                },
-                {
-                    "constraints": {"hidden": False, "required": True},
-                    "error": None,
-                    "externalId": "agreementType",
-                    "id": "PAR-0000-0004",
-                    "name": "Account type",
-                    "type": "SingleLineText",
-                    "value": "Migrate",
-                },
-                {
-                    "constraints": {"hidden": False, "required": True},
-                    "error": None,
-                    "externalId": "membershipId",
-                    "id": "PAR-0000-0005",
-                    "name": "Membership Id",
-                    "type": "SingleLineText",
-                    "value": "a-membership-id",
-                },
-                {
-                    "constraints": {"hidden": False, "required": False},
-                    "error": None,
-                    "externalId": "3YC",
-                    "id": "PAR-0000-0006",
-                    "name": "3YC",
-                    "type": "Checkbox",
-                    "value": None,
-                },
-                {
-                    "constraints": {"hidden": False, "required": False},
-                    "error": None,
-                    "externalId": "3YCLicenses",
-                    "id": "PAR-0000-0007",
-                    "name": "3YCLicenses",
-                    "type": "SingleLineText",
-                    "value": "15",
-                },
-                {
-                    "constraints": {"hidden": False, "required": False},
-                    "error": None,
-                    "externalId": "3YCConsumables",
-                    "id": "PAR-0000-0008",
-                    "name": "3YCConsumables",
-                    "type": "SingleLineText",
-                    "value": "37",
-                },
-                {
-                    "constraints": {"hidden": True, "required": False},
-                    "error": None,
-                    "externalId": "companyAgencyType",
-                    "id": "PAR-0000-0009",
-                    "name": "Agency type",
-                    "type": "SingleLineText",
-                    "value": "STATE",
+                    "postCode": adobe_customer_address["postalCode"],
+                },
+                contact={
+                    "firstName": adobe_customer_contact["firstName"],
+                    "lastName": adobe_customer_contact["lastName"],
+                    "email": adobe_customer_contact["email"],
+                    "phone": split_phone_number(
+                        adobe_customer_contact.get("phoneNumber"),
+                        adobe_customer_address["country"],
+                    ),
                 },
+                p3yc=None,
+                p3yc_licenses="15",
+                p3yc_consumables="37",
+            ),
+        },
+        "externalIds": {"vendor": "a-transfer-id"},
+    }
+    assert mocked_update_order.mock_calls[4].args == (
+        mock_mpt_client,
+        order["id"],
+    )
+    assert mocked_update_order.mock_calls[5].kwargs == {
+        "parameters": {
+            "fulfillment": [
                 {
-                    "constraints": {
-                        "hidden": True,
-                    },
-                    "error": None,
-                    "externalId": "adobeOrderIds",
-                    "id": "PAR-0000-0010",
-                    "name": "Adobe Order IDs",
-                    "type": "SingleLineText",
-                    "value": "",
+                    "constraints": {"hidden": False},
+                    "externalId": "cotermDate",
+                    "id": "PAR-7373-1919",
+                    "name": "Customer Coterm date",
+                    "type": "Date",
+                    "value": "2024-01-01",
                 },
             ],
-        }
+        },
     }
     mocked_create_subscription.assert_called_once_with(
         mock_mpt_client,
@@ -8228,7 +7808,9 @@ def test_fulfill_transfer_migrated_order_all_items_expired_add_new_item(
     )
     mocked_process_order.assert_called_once_with(mock_mpt_client, order["id"], {"id": "TPL-0000"})
     assert mocked_update_order.mock_calls[0].args == (mock_mpt_client, order["id"])
-    assert mocked_update_order.mock_calls[0].kwargs == {"parameters": order["parameters"]}
+    assert mocked_update_order.mock_calls[0].kwargs == {
+        "parameters": set_due_date(order)["parameters"]
+    }
     mock_sync_agreements_by_agreement_ids.assert_called_once_with(
         mock_mpt_client, mock_adobe_client, [agreement["id"]], dry_run=False, sync_prices=False
     )
@@ -8884,86 +8466,6 @@ def test_transfer_lga_product_with_lga_agency_type(
     assert mocked_update_order.mock_calls[5].kwargs == {
         "parameters": {
             "fulfillment": [
-                {
-                    "constraints": {"hidden": False},
-                    "externalId": "customerId",
-                    "id": "PAR-1234-5678",
-                    "name": "Customer Id",
-                    "type": "SingleLineText",
-                    "value": "a-client-id",
-                },
-                {
-                    "constraints": {"hidden": False},
-                    "externalId": "dueDate",
-                    "id": "PAR-7771-1777",
-                    "name": "Due Date",
-                    "type": "Date",
-                    "value": None,
-                },
-                {
-                    "constraints": {"hidden": True},
-                    "externalId": "flexibleDiscounts",
-                    "id": "PAR-7771-1778",
-                    "name": "Flexible Discounts",
-                    "type": "Object",
-                    "value": None,
-                },
-                {
-                    "constraints": {"hidden": False},
-                    "externalId": "3YCEnrollStatus",
-                    "id": "PAR-9876-5432",
-                    "name": "3YC Enroll Status",
-                    "type": "SingleLineText",
-                    "value": "",
-                },
-                {
-                    "constraints": {"hidden": False},
-                    "externalId": "3YCStartDate",
-                    "id": "PAR-2266-4848",
-                    "name": "3YC Start Date",
-                    "type": "Date",
-                    "value": "",
-                },
-                {
-                    "constraints": {"hidden": False},
-                    "externalId": "3YCEndDate",
-                    "id": "PAR-3528-2927",
-                    "name": "3YC End Date",
-                    "type": "Date",
-                    "value": "",
-                },
-                {
-                    "constraints": {"hidden": False},
-                    "externalId": "3YCCommitmentRequestStatus",
-                    "id": "PAR-0022-2200",
-                    "name": "3YC Commitment Request Status",
-                    "type": "SingleLineText",
-                    "value": "",
-                },
-                {
-                    "constraints": {"hidden": False},
-                    "externalId": "3YCRecommitmentRequestStatus",
-                    "id": "PAR-0077-7700",
-                    "name": "3YC Recommitment Request Status",
-                    "type": "SingleLineText",
-                    "value": "",
-                },
-                {
-                    "constraints": {"hidden": False},
-                    "externalId": "3YCRecommit",
-                    "id": "PAR-0000-6666",
-                    "name": "3YCRecommitment",
-                    "type": "Checkbox",
-                    "value": [],
-                },
-                {
-                    "constraints": {"hidden": True},
-                    "externalId": "marketSegmentEligibilityStatus",
-                    "id": "PAR-0000-6666",
-                    "name": "Eligibility Status",
-                    "type": "Dropdown",
-                    "value": None,
-                },
                 {
                     "constraints": {"hidden": False},
                     "externalId": "cotermDate",
@@ -8972,139 +8474,8 @@ def test_transfer_lga_product_with_lga_agency_type(
                     "type": "Date",
                     "value": "2024-01-01",
                 },
-                {
-                    "constraints": {"hidden": False},
-                    "displayValue": "Yes",
-                    "externalId": "globalCustomer",
-                    "id": "PAR-6179-6384-0024",
-                    "name": "Global Customer",
-                    "type": "Checkbox",
-                    "value": [None],
-                },
-                {
-                    "constraints": {"hidden": False},
-                    "externalId": "deploymentId",
-                    "id": "PAR-6179-6384-0025",
-                    "name": "Deployment ID",
-                    "type": "SingleLineText",
-                    "value": "",
-                },
-                {
-                    "constraints": {"hidden": False},
-                    "externalId": "deployments",
-                    "id": "PAR-6179-6384-0026",
-                    "name": "Deployments",
-                    "type": "MultiLineText",
-                    "value": "",
-                },
-            ],
-            "ordering": [
-                {
-                    "constraints": {"hidden": False, "required": False},
-                    "error": None,
-                    "externalId": "companyName",
-                    "id": "PAR-0000-0001",
-                    "name": "Company Name",
-                    "type": "SingleLineText",
-                    "value": "Migrated Company",
-                },
-                {
-                    "constraints": {"hidden": False, "required": False},
-                    "error": None,
-                    "externalId": "address",
-                    "id": "PAR-0000-0002",
-                    "name": "Address",
-                    "type": "Address",
-                    "value": {
-                        "addressLine1": "addressLine1",
-                        "addressLine2": "addressLine2",
-                        "city": "city",
-                        "country": "US",
-                        "postCode": "postalCode",
-                        "state": "region",
-                    },
-                },
-                {
-                    "constraints": {"hidden": False, "required": False},
-                    "error": None,
-                    "externalId": "contact",
-                    "id": "PAR-0000-0003",
-                    "name": "Contact",
-                    "type": "Contact",
-                    "value": {
-                        "email": "email",
-                        "firstName": "firstName",
-                        "lastName": "lastName",
-                        "phone": {"number": "8004449890", "prefix": "+1"},
-                    },
-                },
-                {
-                    "constraints": {"hidden": False, "required": True},
-                    "error": None,
-                    "externalId": "agreementType",
-                    "id": "PAR-0000-0004",
-                    "name": "Account type",
-                    "type": "SingleLineText",
-                    "value": "Migrate",
-                },
-                {
-                    "constraints": {"hidden": False, "required": True},
-                    "error": None,
-                    "externalId": "membershipId",
-                    "id": "PAR-0000-0005",
-                    "name": "Membership Id",
-                    "type": "SingleLineText",
-                    "value": "a-membership-id",
-                },
-                {
-                    "constraints": {"hidden": False, "required": False},
-                    "error": None,
-                    "externalId": "3YC",
-                    "id": "PAR-0000-0006",
-                    "name": "3YC",
-                    "type": "Checkbox",
-                    "value": None,
-                },
-                {
-                    "constraints": {"hidden": False, "required": False},
-                    "error": None,
-                    "externalId": "3YCLicenses",
-                    "id": "PAR-0000-0007",
-                    "name": "3YCLicenses",
-                    "type": "SingleLineText",
-                    "value": "",
-                },
-                {
-                    "constraints": {"hidden": False, "required": False},
-                    "error": None,
-                    "externalId": "3YCConsumables",
-                    "id": "PAR-0000-0008",
-                    "name": "3YCConsumables",
-                    "type": "SingleLineText",
-                    "value": "",
-                },
-                {
-                    "constraints": {"hidden": False, "required": False},
-                    "error": None,
-                    "externalId": "companyAgencyType",
-                    "id": "PAR-0000-0009",
-                    "name": "Agency type",
-                    "type": "SingleLineText",
-                    "value": "STATE",
-                },
-                {
-                    "constraints": {
-                        "hidden": True,
-                    },
-                    "error": None,
-                    "externalId": "adobeOrderIds",
-                    "id": "PAR-0000-0010",
-                    "name": "Adobe Order IDs",
-                    "type": "SingleLineText",
-                    "value": "",
-                },
             ],
-        }
+        },
     }
     mocked_update_agreement.assert_has_calls([
         mocker.call(
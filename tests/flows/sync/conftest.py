@@ -3,6 +3,13 @@ import pytest
 from adobe_vipm.flows.sync.agreement import AgreementSyncer
 
 
+@pytest.fixture(autouse=True)
+def mock_get_agreement_assets(mocker):
+    return mocker.patch(
+        "adobe_vipm.flows.sync.asset.get_agreement_assets", return_value=[], autospec=True
+    )
+
+
 @pytest.fixture
 def mock_check_update_airtable_missing_deployments(mocker, mocked_agreement_syncer):
     return mocker.patch.object(
@@ -10,6 +10,7 @@ from adobe_vipm.adobe.constants import (
     AdobeErrorCode,
     AdobeSubscriptionStatus,
 )
+from adobe_vipm.adobe.deployment_registry import DeploymentChanges
 from adobe_vipm.adobe.errors import AdobeAPIError, AuthorizationNotFoundError
 from adobe_vipm.airtable.models import AirTableBaseInfo, get_gc_agreement_deployment_model
 from adobe_vipm.flows.constants import (
@@ -34,6 +35,7 @@ from adobe_vipm.flows.sync.agreement import (
     sync_agreements_by_renewal_date,
     sync_all_agreements,
 )
+from adobe_vipm.flows.sync.engine import AgreementSyncEngine, SyncOutcomeStatus
 
 
 def test_agreement_syncer_sync_dry_run(
@@ -207,7 +209,6 @@ def test_sync_agreement_prices(
             ],
             parameters={
                 "fulfillment": [
-                    {"externalId": "adobeSKU", "value": "65304578CA01A12"},
                     {
                         "externalId": Param.CURRENT_QUANTITY.value,
                         "value": str(adobe_subscription[Param.CURRENT_QUANTITY.value]),
@@ -226,7 +227,6 @@ def test_sync_agreement_prices(
                 ]
             },
             commitmentDate=adobe_subscription["renewalDate"],
-            autoRenew=adobe_subscription["autoRenewal"]["enabled"],
             template={"id": "TPL-1234", "name": "Renewing"},
         ),
         mocker.call(
@@ -237,10 +237,6 @@ def test_sync_agreement_prices(
             ],
             parameters={
                 "fulfillment": [
-                    {
-                        "externalId": "adobeSKU",
-                        "value": "77777777CA01A12",
-                    },
                     {
                         "externalId": Param.CURRENT_QUANTITY.value,
                         "value": str(another_adobe_subscription[Param.CURRENT_QUANTITY.value]),
@@ -259,7 +255,6 @@ def test_sync_agreement_prices(
                 ]
             },
             commitmentDate=another_adobe_subscription["renewalDate"],
-            autoRenew=another_adobe_subscription["autoRenewal"]["enabled"],
             template={"id": "TPL-1234", "name": "Renewing"},
         ),
     ])
@@ -293,7 +288,6 @@ def test_sync_agreement_prices(
         mocker.call(
             mock_mpt_client,
             agreement["id"],
-            lines=expected_lines,
             parameters={
                 "ordering": [
                     {"externalId": "companyName", "value": "Migrated Company"},
@@ -328,6 +322,7 @@ def test_sync_agreement_prices(
     ])
 
 
+@pytest.mark.usefixtures("mock_get_agreement_subscriptions")
 @freeze_time("2025-06-23")
 def test_sync_agreement_update_agreement(
     mock_mpt_client, mocked_agreement_syncer, mock_get_agreement, mock_get_prices_for_skus
@@ -339,6 +334,7 @@ def test_sync_agreement_update_agreement(
     )
 
 
+@pytest.mark.usefixtures("mock_get_agreement_subscriptions")
 @freeze_time("2025-06-23")
 def test_sync_agreement_update_agreement_education(
     mock_mpt_client,
@@ -359,7 +355,6 @@ def test_sync_agreement_update_agreement_education(
         mock.call(
             mock_mpt_client,
             mocked_agreement_syncer._agreement["id"],
-            lines=[],
             parameters={
                 "fulfillment": [
                     {"externalId": "lmID", "value": None},
@@ -394,12 +389,10 @@ def test_sync_agreement_update_agreement_education(
                     {"externalId": "educationSubSegment", "value": "EDU_1,EDU_2"},
                 ],
             },
-            lines=[],
         ),
         mock.call(
             mock_mpt_client,
             mocked_agreement_syncer._agreement["id"],
-            lines=[],
             parameters={
                 "ordering": [
                     {"externalId": "companyName", "value": "Migrated Company"},
@@ -482,12 +475,10 @@ def test_sync_agreement_not_prices(
     mock_mpt_update_agreement_subscription.assert_called_once_with(
         mock_mpt_client,
         "SUB-1000-2000-3000",
-        autoRenew=True,
         commitmentDate="2026-10-11",
         lines=[{"id": "ALI-2119-4550-8674-5962-0001", "quantity": 10}],
         parameters={
             "fulfillment": [
-                {"externalId": "adobeSKU", "value": "65304578CA01A12"},
                 {"externalId": "currentQuantity", "value": "10"},
                 {"externalId": "renewalQuantity", "value": "10"},
                 {"externalId": "renewalDate", "value": "2026-10-11"},
@@ -498,6 +489,7 @@ def test_sync_agreement_not_prices(
     )
 
 
+@pytest.mark.usefixtures("mock_get_agreement_subscriptions")
 @pytest.mark.parametrize(
     ("agreement_status"),
     [
@@ -757,7 +749,6 @@ def test_sync_agreement_prices_exception(
     mock_mpt_update_agreement.assert_called_once_with(
         mock_mpt_client,
         agreement["id"],
-        lines=[],
         parameters={
             "fulfillment": [
                 {"externalId": "lmID", "value": None},
@@ -870,7 +861,6 @@ def test_sync_agreement_prices_with_3yc(
             ],
             parameters={
                 "fulfillment": [
-                    {"externalId": "adobeSKU", "value": "65304578CA01A12"},
                     {
                         "externalId": Param.CURRENT_QUANTITY.value,
                         "value": str(adobe_subscription[Param.CURRENT_QUANTITY.value]),
@@ -889,7 +879,6 @@ def test_sync_agreement_prices_with_3yc(
                 ]
             },
             commitmentDate=adobe_subscription["renewalDate"],
-            autoRenew=adobe_subscription["autoRenewal"]["enabled"],
             template={"id": "TPL-1234", "name": TEMPLATE_SUBSCRIPTION_AUTORENEWAL_ENABLE},
         ),
     ])
@@ -898,7 +887,6 @@ def test_sync_agreement_prices_with_3yc(
         mocker.call(
             mock_mpt_client,
             agreement["id"],
-            lines=expected_lines,
             parameters={
                 "fulfillment": [
                     {"externalId": "lmID", "value": None},
@@ -937,7 +925,6 @@ def test_sync_agreement_prices_with_3yc(
         mocker.call(
             mock_mpt_client,
             agreement["id"],
-            lines=expected_lines,
             parameters={
                 "ordering": [
                     {"externalId": "companyName", "value": "Migrated Company"},
@@ -1042,7 +1029,6 @@ def test_sync_agreement_prices_large_government_agency(
             ],
             parameters={
                 "fulfillment": [
-                    {"externalId": "adobeSKU", "value": "65304578CA01A12"},
                     {
                         "externalId": Param.CURRENT_QUANTITY.value,
                         "value": str(adobe_subscription[Param.CURRENT_QUANTITY.value]),
@@ -1061,7 +1047,6 @@ def test_sync_agreement_prices_large_government_agency(
                 ]
             },
             commitmentDate=adobe_subscription["renewalDate"],
-            autoRenew=adobe_subscription["autoRenewal"]["enabled"],
             template={"id": "TPL-1234", "name": TEMPLATE_SUBSCRIPTION_AUTORENEWAL_ENABLE},
         ),
     ])
@@ -1070,7 +1055,6 @@ def test_sync_agreement_prices_large_government_agency(
         mocker.call(
             mock_mpt_client,
             agreement["id"],
-            lines=expected_lines,
             parameters={
                 "fulfillment": [
                     {"externalId": "lmID", "value": None},
@@ -1094,7 +1078,6 @@ def test_sync_agreement_prices_large_government_agency(
         mocker.call(
             mock_mpt_client,
             agreement["id"],
-            lines=expected_lines,
             parameters={
                 "ordering": [
                     {"externalId": "companyName", "value": "Migrated Company"},
@@ -1135,6 +1118,7 @@ def test_sync_agreement_prices_large_government_agency(
     )
 
 
+@pytest.mark.usefixtures("mock_get_agreement_subscriptions")
 def test_notify_if_3yc_commitment_expired_when_expired(
     mocker,
     mock_mpt_client,
@@ -1240,6 +1224,7 @@ def test_notify_if_3yc_commitment_expired_when_commitment_has_status(
     mock_send_notification.assert_not_called()
 
 
+@pytest.mark.usefixtures("mock_get_agreement_subscriptions")
 @freeze_time("2025-06-19")
 def test_sync_global_customer_parameter(
     mocker,
@@ -1340,12 +1325,10 @@ def test_sync_global_customer_parameter(
     )  # act
 
     mock_add_missing_subscriptions_and_assets.assert_called_once()
-    expected_lines = lines_factory(external_vendor_id="77777777CA", unit_purchase_price=20.22)
     mock_mpt_update_agreement.assert_has_calls([
         mocker.call(
             mock_mpt_client,
             agreement["id"],
-            lines=expected_lines,
             parameters={
                 "fulfillment": [
                     {"externalId": "lmID", "value": None},
@@ -1359,7 +1342,6 @@ def test_sync_global_customer_parameter(
         mocker.call(
             mock_mpt_client,
             agreement["id"],
-            lines=expected_lines,
             parameters={
                 "fulfillment": [
                     {"externalId": "3YCEnrollStatus", "value": None},
@@ -1384,7 +1366,6 @@ def test_sync_global_customer_parameter(
         mocker.call(
             mock_mpt_client,
             agreement["id"],
-            lines=expected_lines,
             parameters={
                 "ordering": [
                     {"externalId": "companyName", "value": "Migrated Company"},
@@ -1424,7 +1405,6 @@ def test_sync_global_customer_parameter(
         mocker.call(
             mock_mpt_client,
             deployment_agreements[0]["id"],
-            lines=expected_lines,
             parameters={
                 "fulfillment": [
                     {"externalId": "3YCEnrollStatus", "value": None},
@@ -1449,7 +1429,6 @@ def test_sync_global_customer_parameter(
         mocker.call(
             mock_mpt_client,
             deployment_agreements[0]["id"],
-            lines=expected_lines,
             parameters={
                 "ordering": [
                     {"externalId": "companyName", "value": "Migrated Company"},
@@ -1779,7 +1758,6 @@ def test_update_agreement_profile_parameters_with_address(
     mock_mpt_update_agreement.assert_called_once_with(
         mocked_agreement_syncer._mpt_client,
         deployment_agreement["id"],
-        lines=deployment_agreement["lines"],
         parameters={
             "ordering": [
                 {"externalId": "companyName", "value": "Migrated Company"},
@@ -1826,7 +1804,6 @@ def test_update_agreement_profile_parameters_no_address_source(
     mock_mpt_update_agreement.assert_called_once_with(
         mocked_agreement_syncer._mpt_client,
         deployment_agreement["id"],
-        lines=deployment_agreement["lines"],
         parameters={
             "ordering": [
                 {"externalId": "companyName", "value": "Migrated Company"},
@@ -1916,6 +1893,7 @@ def test_resolve_contact_parameter_no_contacts_returns_none(
     assert result is None
 
 
+@pytest.mark.usefixtures("mock_get_agreement_subscriptions")
 @freeze_time("2025-06-19")
 def test_sync_global_customer_parameter_dry_run(
     mocker,
@@ -2053,7 +2031,6 @@ def test_sync_global_customer_update_not_required(
         mocker.call(
             mock_mpt_client,
             "AGR-2119-4550-8674-5962",
-            lines=[],
             parameters={
                 "fulfillment": [
                     {"externalId": "lmID", "value": None},
@@ -2067,7 +2044,6 @@ def test_sync_global_customer_update_not_required(
         mocker.call(
             mock_mpt_client,
             "AGR-2119-4550-8674-5962",
-            lines=[],
             parameters={
                 "fulfillment": [
                     {"externalId": "3YCEnrollStatus", "value": None},
@@ -2092,7 +2068,6 @@ def test_sync_global_customer_update_not_required(
         mocker.call(
             mock_mpt_client,
             "AGR-2119-4550-8674-5962",
-            lines=[],
             parameters={
                 "ordering": [
                     {"externalId": "companyName", "value": "Migrated Company"},
@@ -2162,7 +2137,6 @@ def test_sync_global_customer_no_active_deployments(
         mocker.call(
             mock_mpt_client,
             "AGR-2119-4550-8674-5962",
-            lines=[],
             parameters={
                 "fulfillment": [
                     {"externalId": "lmID", "value": None},
@@ -2176,7 +2150,6 @@ def test_sync_global_customer_no_active_deployments(
         mocker.call(
             mock_mpt_client,
             "AGR-2119-4550-8674-5962",
-            lines=[],
             parameters={
                 "fulfillment": [
                     {"externalId": "3YCEnrollStatus", "value": None},
@@ -2201,7 +2174,6 @@ def test_sync_global_customer_no_active_deployments(
         mocker.call(
             mock_mpt_client,
             "AGR-2119-4550-8674-5962",
-            lines=[],
             parameters={
                 "ordering": [
                     {"externalId": "companyName", "value": "Migrated Company"},
@@ -2294,8 +2266,9 @@ def test_sync_agreement_notify_exception(
 ):
     mock_add_missing_subscriptions_and_assets.side_effect = Exception("Test exception")
 
-    mocked_agreement_syncer.sync(sync_prices=False)  # act
+    result = mocked_agreement_syncer.sync(sync_prices=False)
 
+    assert result == SyncOutcomeStatus.FAILED
     mock_notify_agreement_unhandled_exception_in_teams.assert_called_once()
     assert (
         mock_notify_agreement_unhandled_exception_in_teams.call_args_list[0].args[0]
@@ -2303,6 +2276,7 @@ def test_sync_agreement_notify_exception(
     )
 
 
+@pytest.mark.usefixtures("mock_get_agreement_subscriptions")
 def test_sync_agreement_updates_linked_membership_params(
     mock_mpt_client, mock_mpt_update_agreement, mocked_agreement_syncer, mocker
 ):
@@ -2324,7 +2298,6 @@ def test_sync_agreement_updates_linked_membership_params(
     assert first_call_args == mocker.call(
         mock_mpt_client,
         "AGR-2119-4550-8674-5962",
-        lines=[],
         parameters={
             Param.PHASE_FULFILLMENT.value: [
                 {"externalId": Param.LINKED_MEMBERSHIP_ID.value, "value": "membership-id"},
@@ -2413,7 +2386,6 @@ def test_sync_agreement_empty_discounts_no_active_subscriptions(
         mocker.call(
             mock_mpt_client,
             agreement["id"],
-            lines=expected_lines,
             parameters={
                 "fulfillment": [
                     {"externalId": "lmID", "value": None},
@@ -2452,7 +2424,6 @@ def test_sync_agreement_empty_discounts_no_active_subscriptions(
         mocker.call(
             mock_mpt_client,
             agreement["id"],
-            lines=expected_lines,
             parameters={
                 "ordering": [
                     {"externalId": "companyName", "value": "Migrated Company"},
@@ -2646,24 +2617,6 @@ def test_sync_agreement_prices_with_missing_prices(
         mocker.call(
             mock_mpt_client,
             agreement["id"],
-            lines=[
-                {
-                    "item": {
-                        "id": "ITM-1234-1234-1234-0001",
-                        "name": "Awesome product",
-                        "externalIds": {"vendor": "77777777CA"},
-                    },
-                    "subscription": {
-                        "id": "SUB-1000-2000-3000",
-                        "status": "Active",
-                        "name": "Subscription for Acrobat Pro for Teams; Multi Language",
-                    },
-                    "oldQuantity": 0,
-                    "quantity": 170,
-                    "price": {"unitPP": 20.22},
-                    "id": "ALI-2119-4550-8674-5962-0001",
-                }
-            ],
             parameters={
                 "fulfillment": [
                     {"externalId": "lmID", "value": None},
@@ -2719,24 +2672,6 @@ def test_sync_agreement_prices_with_missing_prices(
         mocker.call(
             mock_mpt_client,
             agreement["id"],
-            lines=[
-                {
-                    "item": {
-                        "id": "ITM-1234-1234-1234-0001",
-                        "name": "Awesome product",
-                        "externalIds": {"vendor": "77777777CA"},
-                    },
-                    "subscription": {
-                        "id": "SUB-1000-2000-3000",
-                        "status": "Active",
-                        "name": "Subscription for Acrobat Pro for Teams; Multi Language",
-                    },
-                    "oldQuantity": 0,
-                    "quantity": 170,
-                    "price": {"unitPP": 20.22},
-                    "id": "ALI-2119-4550-8674-5962-0001",
-                }
-            ],
             parameters={
                 "ordering": [
                     {"externalId": "companyName", "value": "Migrated Company"},
@@ -2781,7 +2716,6 @@ def test_sync_agreement_prices_with_missing_prices(
             lines=[{"id": "ALI-2119-4550-8674-5962-0001", "quantity": 10}],
             parameters={
                 "fulfillment": [
-                    {"externalId": Param.ADOBE_SKU.value, "value": "65304578CA01A12"},
                     {"externalId": Param.CURRENT_QUANTITY.value, "value": "10"},
                     {"externalId": Param.RENEWAL_QUANTITY.value, "value": "10"},
                     {"externalId": Param.RENEWAL_DATE.value, "value": "2026-10-11"},
@@ -2789,7 +2723,6 @@ def test_sync_agreement_prices_with_missing_prices(
                 ]
             },
             commitmentDate="2026-10-11",
-            autoRenew=True,
             template={"id": "TPL-1234", "name": "Renewing"},
         ),
         mocker.call(
@@ -2800,7 +2733,6 @@ def test_sync_agreement_prices_with_missing_prices(
             ],
             parameters={
                 "fulfillment": [
-                    {"externalId": Param.ADOBE_SKU.value, "value": "77777777CA01A12"},
                     {"externalId": Param.CURRENT_QUANTITY.value, "value": "15"},
                     {"externalId": Param.RENEWAL_QUANTITY.value, "value": "15"},
                     {"externalId": Param.RENEWAL_DATE.value, "value": "2026-10-11"},
@@ -2808,7 +2740,6 @@ def test_sync_agreement_prices_with_missing_prices(
                 ]
             },
             commitmentDate="2026-10-11",
-            autoRenew=True,
             template={"id": "TPL-1234", "name": "Renewing"},
         ),
     ]
@@ -2831,7 +2762,7 @@ def test_sync_agreement_empty_customer_id(
         ordering_parameters=[{"externalId": "FakeOrderingParam"}],
     )
     mock_notify_agreement_unhandled_exception_in_teams = mocker.patch(
-        "adobe_vipm.flows.sync.agreement.notify_agreement_unhandled_exception_in_teams"
+        "adobe_vipm.flows.sync.agreement.flows_utils.notify_agreement_unhandled_exception_in_teams"
     )
     mock_mpt_get_agreement.return_value = agreement
 
@@ -2975,8 +2906,9 @@ def test_sync_agreement_skips_inactive_agreement(
 ):
     mocked_agreement_syncer._agreement = {"id": "1", "status": status, "subscriptions": []}
 
-    mocked_agreement_syncer.sync(sync_prices=False)  # act
+    result = mocked_agreement_syncer.sync(sync_prices=False)
 
+    assert result == SyncOutcomeStatus.SKIPPED
     mock_update_last_sync_date.assert_not_called()
 
 
@@ -3216,6 +3148,46 @@ def test_get_subscriptions_for_update_with_no_lines(
     mock_mpt_update_agreement_subscription.assert_not_called()
 
 
+@freeze_time("2025-07-23")
+def test_get_subscriptions_for_update_bulk_loaded(
+    mock_mpt_client,
+    agreement_factory,
+    subscriptions_factory,
+    adobe_subscription_factory,
+    mock_get_agreement_subscriptions,
+    mock_mpt_get_agreement_subscription,
+    mocked_agreement_syncer,
+):
+    adobe_subscription = adobe_subscription_factory()
+    mocked_agreement_syncer._adobe_subscriptions = [adobe_subscription]
+    agreement = agreement_factory()
+    agreement["subscriptions"] = [agreement["subscriptions"][0]]
+    mpt_subscription = subscriptions_factory()[0]
+    mock_get_agreement_subscriptions.return_value = [mpt_subscription]
+
+    result = mocked_agreement_syncer._get_subscriptions_for_update(agreement)
+
+    assert result == [(mpt_subscription, adobe_subscription, "65304578CA01A12")]
+    mock_get_agreement_subscriptions.assert_called_once_with(mock_mpt_client, agreement["id"])
+    mock_mpt_get_agreement_subscription.assert_not_called()
+
+
+def test_get_subscriptions_for_update_all_terminated_skips_bulk_load(
+    agreement_factory,
+    mock_get_agreement_subscriptions,
+    mock_mpt_update_agreement_subscription,
+    mocked_agreement_syncer,
+):
+    agreement = agreement_factory()
+    agreement["subscriptions"] = [agreement["subscriptions"][1]]
+    agreement["subscriptions"][0]["template"] = {"id": "TPL-1234", "name": "Expired"}
+
+    result = mocked_agreement_syncer._get_subscriptions_for_update(agreement)
+
+    assert result == []
+    mock_get_agreement_subscriptions.assert_not_called()
+
+
 def test_add_missing_subscriptions_none(
     mock_mpt_client,
     mock_adobe_client,
@@ -3753,6 +3725,7 @@ def test_add_missing_subscriptions_wrong_currency(
     mock_mpt_create_agreement_subscription.assert_not_called()
 
 
+@pytest.mark.usefixtures("mock_get_agreement_subscriptions")
 def test_process_orphaned_deployment_subscriptions_none(
     mock_adobe_client,
     agreement_factory,
@@ -3797,6 +3770,7 @@ def test_process_orphaned_deployment_subscriptions_none(
     mock_adobe_client.update_subscription.assert_not_called()
 
 
+@pytest.mark.usefixtures("mock_get_agreement_subscriptions")
 def test_process_orphaned_deployment_subscriptions_error(
     mock_adobe_client,
     agreement_factory,
@@ -3843,6 +3817,7 @@ def test_process_orphaned_deployment_subscriptions_error(
     )
 
 
+@pytest.mark.usefixtures("mock_get_agreement_subscriptions")
 @pytest.mark.parametrize(
     "subscription_status",
     [AdobeSubscriptionStatus.INACTIVE.value, AdobeSubscriptionStatus.PENDING.value],
@@ -3894,6 +3869,7 @@ def test_process_orphaned_deployment_subscriptions_skip_on_status(
     assert "Skipping orphaned subscription inactive_subscription_id" in caplog.text
 
 
+@pytest.mark.usefixtures("mock_get_agreement_subscriptions")
 def test_process_orphaned_deployment_subscriptions_skip_autorenewal_false_with_logging(
     mock_adobe_client,
     agreement_factory,
@@ -4088,8 +4064,9 @@ def test_check_update_airtable_missing_deployments(
         spec=True,
     )
 
-    mocked_agreement_syncer._check_update_airtable_missing_deployments(adobe_deployments)  # act
+    result = mocked_agreement_syncer._check_update_airtable_missing_deployments(adobe_deployments)
 
+    assert result == {"deployment-3"}
     assert mock_get_gc_agreement_deployment_model.mock_calls[:2] == [
         mocker.call(
             deployment_id="deployment-1",
@@ -4155,6 +4132,84 @@ def test_check_update_airtable_missing_deployments_none(
     mock_send_warning.assert_not_called()
 
 
+def test_check_update_airtable_missing_deployments_unchanged(
+    mock_create_gc_agreement_deployments,
+    mock_get_gc_agreement_deployments_by_main_agreement,
+    mocked_agreement_syncer,
+):
+    adobe_deployments = [{"deploymentId": "deployment-1", "status": "1000"}]
+    deployment_changes = DeploymentChanges(
+        "AGR-2119-4550-8674-5962", "a-client-id", adobe_deployments
+    )
+
+    result = mocked_agreement_syncer._check_update_airtable_missing_deployments(
+        adobe_deployments, deployment_changes
+    )
+
+    assert result == set()
+    mock_get_gc_agreement_deployments_by_main_agreement.assert_not_called()
+    mock_create_gc_agreement_deployments.assert_not_called()
+
+
+def test_sync_deployments_per_agreement(
+    mocker,
+    mock_mpt_client,
+    mock_adobe_client,
+    agreement_factory,
+    adobe_customer_factory,
+    fulfillment_parameters_factory,
+):
+    mock_sync_global_customer_parameters = mocker.patch.object(
+        AgreementSyncer, "_sync_global_customer_parameters", return_value=True
+    )
+    mock_process_main_agreement_deployments = mocker.patch.object(
+        AgreementSyncer, "_process_main_agreement_deployments", return_value=set()
+    )
+    deployment_1 = {"deploymentId": "deployment-1", "status": "1000"}
+    deployment_2 = {"deploymentId": "deployment-2", "status": "1000"}
+    adobe_customer = adobe_customer_factory(global_sales_enabled=True)
+    main_syncer = AgreementSyncer(
+        mock_mpt_client,
+        mock_adobe_client,
+        agreement_factory(
+            fulfillment_parameters=fulfillment_parameters_factory(global_customer=["Yes"])
+        ),
+        adobe_customer,
+        [],
+        dry_run=False,
+    )
+    deployment_syncer = AgreementSyncer(
+        mock_mpt_client,
+        mock_adobe_client,
+        agreement_factory(
+            agreement_id="AGR-0000-0000-0002",
+            fulfillment_parameters=fulfillment_parameters_factory(
+                global_customer=["Yes"], deployment_id="deployment-1"
+            ),
+        ),
+        adobe_customer,
+        [],
+        dry_run=False,
+    )
+    mock_adobe_client.get_customer_deployments_active_status.return_value = [deployment_1]
+    main_syncer._sync_deployments(sync_prices=False)
+    deployment_syncer._sync_deployments(sync_prices=False)
+    mock_sync_global_customer_parameters.reset_mock()
+    mock_process_main_agreement_deployments.reset_mock()
+    mock_adobe_client.get_customer_deployments_active_status.return_value = [
+        deployment_1,
+        deployment_2,
+    ]
+    deployment_syncer._sync_deployments(sync_prices=False)
+
+    main_syncer._sync_deployments(sync_prices=False)  # act
+
+    assert mock_sync_global_customer_parameters.call_count == 2
+    deployment_changes = mock_process_main_agreement_deployments.call_args.args[1]
+    assert deployment_changes.agreement_id == "AGR-2119-4550-8674-5962"
+    assert deployment_changes.updated_ids == {"deployment-2"}
+
+
 def test_not_syncing_unknown_products(
     mocker,
     mock_mpt_client,
@@ -4455,7 +4510,7 @@ def test_sync_agreements_by_agreement_ids(
         "mpt_extension_sdk.mpt_http.mpt.get_agreements_by_ids", return_value=[mock_agreement]
     )
 
-    sync_agreements_by_agreement_ids(
+    result = sync_agreements_by_agreement_ids(
         mock_mpt_client,
         mock_adobe_client,
         [mock_agreement["id"]],
@@ -4466,6 +4521,7 @@ def test_sync_agreements_by_agreement_ids(
     mock_sync_agreement.assert_called_once_with(
         mock_mpt_client, mock_adobe_client, mock_agreement, dry_run=dry_run, sync_prices=False
     )
+    assert [outcome.agreement_id for outcome in result.synced] == [mock_agreement["id"]]
 
 
 @pytest.mark.parametrize("dry_run", [True, False])
@@ -4491,6 +4547,35 @@ def test_sync_all_agreements(
     )
 
 
+def _raise_for_agreement(agreement, failing_agreement_id):
+    if agreement["id"] == failing_agreement_id:
+        raise MPTAPIError(500, {})
+
+
+def test_sync_all_agreements_isolates_errors(
+    mocker, mock_mpt_client, mock_sync_agreement, mock_adobe_client, agreement_factory
+):
+    agreements = [agreement_factory(agreement_id=f"AGR-0000-000{i}") for i in range(3)]
+    mocker.patch("mpt_extension_sdk.mpt_http.mpt.get_all_agreements", return_value=agreements)
+    mock_sync_agreement.side_effect = lambda *args, **kwargs: _raise_for_agreement(
+        args[2], "AGR-0000-0001"
+    )
+
+    result = sync_all_agreements(
+        mock_mpt_client,
+        mock_adobe_client,
+        dry_run=False,
+        engine=AgreementSyncEngine(workers=2),
+    )
+
+    assert mock_sync_agreement.call_count == 3
+    assert [outcome.agreement_id for outcome in result.synced] == [
+        "AGR-0000-0000",
+        "AGR-0000-0002",
+    ]
+    assert [outcome.agreement_id for outcome in result.failed] == ["AGR-0000-0001"]
+
+
 def test_get_customer_or_process_lost_customer(
     mock_mpt_client, mock_adobe_client, agreement, adobe_customer_factory
 ):
@@ -4797,3 +4882,27 @@ def test_update_3yc_recommitment_request_parameters_without_request(
             {"externalId": "3YCRecommitmentRequestConsumables", "value": ""},
         ],
     }
+
+
+@freeze_time("2025-06-23")
+def test_update_last_sync_date_collapsed_deployment_agreement(
+    mock_mpt_client,
+    mock_adobe_client,
+    agreement_factory,
+    adobe_customer_factory,
+    mock_mpt_update_agreement,
+):
+    syncer = _build_agreement_syncer(
+        mock_mpt_client, mock_adobe_client, agreement_factory, adobe_customer_factory()
+    )
+    deployment_agreement = agreement_factory()
+    deployment_agreement["id"] = "AGR-0000-0000-0000-0001"
+    syncer._execute_agreement_update(deployment_agreement, deployment_agreement["parameters"])
+
+    syncer._update_last_sync_date()  # act
+
+    last_sync_date = {"fulfillment": [{"externalId": "lastSyncDate", "value": "2025-06-23"}]}
+    assert mock_mpt_update_agreement.mock_calls == [
+        mock.call(mock_mpt_client, syncer.agreement_id, parameters=last_sync_date),
+        mock.call(mock_mpt_client, "AGR-0000-0000-0000-0001", parameters=last_sync_date),
+    ]
@@ -1,6 +1,10 @@
+import pytest
 from freezegun import freeze_time
 
+from adobe_vipm.adobe.snapshot import AdobeCustomerSnapshot
+from adobe_vipm.flows.constants import AssetStatus, Param
 from adobe_vipm.flows.sync.asset import AssetSyncer
+from adobe_vipm.flows.sync.diff import is_last_sync_date_only
 
 
 @freeze_time("2025-06-23")
@@ -13,12 +17,11 @@ def test_asset_syncer_sync(
     assets_factory,
     lines_factory,
     mock_mpt_update_asset,
+    mock_get_agreement_assets,
 ):
     asset_id = "AST-1111-2222-3333"
     mock_asset = assets_factory(asset_id=asset_id, adobe_subscription_id="sub-one-time-id")[0]
-    mock_mpt_get_asset_by_id = mocker.patch(
-        "mpt_extension_sdk.mpt_http.mpt.get_asset_by_id", return_value=mock_asset
-    )
+    mock_get_agreement_assets.return_value = [mock_asset]
     mock_lines = lines_factory(external_vendor_id="65304578CA")
     agreement = agreement_factory(lines=mock_lines, assets=[mock_asset], subscriptions=[])
     adobe_subscription = adobe_subscription_factory(
@@ -28,12 +31,15 @@ def test_asset_syncer_sync(
     )
     mock_customer = adobe_customer_factory(coterm_date="2025-04-04")
     assets_syncer = AssetSyncer(
-        mock_mpt_client, agreement["id"], [mock_asset], mock_customer, [adobe_subscription]
+        mock_mpt_client,
+        agreement["id"],
+        [mock_asset],
+        AdobeCustomerSnapshot(mock_customer, [adobe_subscription]),
     )
 
     assets_syncer.sync(dry_run=False)  # act
 
-    mock_mpt_get_asset_by_id.assert_called_once_with(mock_mpt_client, asset_id)
+    mock_get_agreement_assets.assert_called_once_with(mock_mpt_client, agreement["id"])
     mock_mpt_update_asset.assert_called_once_with(
         mock_mpt_client,
         asset_id,
@@ -56,12 +62,11 @@ def test_asset_syncer_sync_without_used_quantity(
     assets_factory,
     lines_factory,
     mock_mpt_update_asset,
+    mock_get_agreement_assets,
 ):
     asset_id = "AST-1111-2222-3333"
     mock_asset = assets_factory(asset_id=asset_id, adobe_subscription_id="sub-one-time-id")[0]
-    mock_mpt_get_asset_by_id = mocker.patch(
-        "mpt_extension_sdk.mpt_http.mpt.get_asset_by_id", return_value=mock_asset
-    )
+    mock_get_agreement_assets.return_value = [mock_asset]
     mock_lines = lines_factory(external_vendor_id="65304578CA")
     agreement = agreement_factory(lines=mock_lines, assets=[mock_asset], subscriptions=[])
     adobe_subscription = adobe_subscription_factory(
@@ -71,12 +76,15 @@ def test_asset_syncer_sync_without_used_quantity(
     del adobe_subscription["usedQuantity"]
     mock_customer = adobe_customer_factory(coterm_date="2025-04-04")
     assets_syncer = AssetSyncer(
-        mock_mpt_client, agreement["id"], [mock_asset], mock_customer, [adobe_subscription]
+        mock_mpt_client,
+        agreement["id"],
+        [mock_asset],
+        AdobeCustomerSnapshot(mock_customer, [adobe_subscription]),
     )
 
     assets_syncer.sync(dry_run=False)  # act
 
-    mock_mpt_get_asset_by_id.assert_called_once_with(mock_mpt_client, asset_id)
+    mock_get_agreement_assets.assert_called_once_with(mock_mpt_client, agreement["id"])
     mock_mpt_update_asset.assert_called_once_with(
         mock_mpt_client,
         asset_id,
@@ -97,14 +105,13 @@ def test_asset_syncer_sync_asset_without_external_id(
     assets_factory,
     lines_factory,
     mock_mpt_update_asset,
+    mock_get_agreement_assets,
     caplog,
 ):
     asset_id = "AST-1111-2222-3333"
     mock_asset = assets_factory(asset_id=asset_id, adobe_subscription_id="sub-one-time-id")[0]
     mock_asset["externalIds"] = {}
-    mock_mpt_get_asset_by_id = mocker.patch(
-        "mpt_extension_sdk.mpt_http.mpt.get_asset_by_id", return_value=mock_asset
-    )
+    mock_get_agreement_assets.return_value = [mock_asset]
     mock_lines = lines_factory(external_vendor_id="65304578CA")
     agreement = agreement_factory(lines=mock_lines, assets=[mock_asset], subscriptions=[])
     adobe_subscription = adobe_subscription_factory(
@@ -114,12 +121,15 @@ def test_asset_syncer_sync_asset_without_external_id(
     )
     mock_customer = adobe_customer_factory(coterm_date="2025-04-04")
     assets_syncer = AssetSyncer(
-        mock_mpt_client, agreement["id"], [mock_asset], mock_customer, [adobe_subscription]
+        mock_mpt_client,
+        agreement["id"],
+        [mock_asset],
+        AdobeCustomerSnapshot(mock_customer, [adobe_subscription]),
     )
 
     assets_syncer.sync(dry_run=False)  # act
 
-    mock_mpt_get_asset_by_id.assert_called_once_with(mock_mpt_client, asset_id)
+    mock_get_agreement_assets.assert_called_once_with(mock_mpt_client, agreement["id"])
     mock_mpt_update_asset.assert_not_called()
     assert (
         "No vendor subscription found for asset AST-1111-2222-3333: asset.externalIds.vendor "
@@ -137,12 +147,11 @@ def test_sync_agreement_update_asset_dry_run(
     assets_factory,
     lines_factory,
     mock_mpt_update_asset,
+    mock_get_agreement_assets,
 ):
     asset_id = "AST-1111-2222-3333"
     mock_asset = assets_factory(asset_id=asset_id, adobe_subscription_id="sub-one-time-id")[0]
-    mock_mpt_get_asset_by_id = mocker.patch(
-        "mpt_extension_sdk.mpt_http.mpt.get_asset_by_id", return_value=mock_asset
-    )
+    mock_get_agreement_assets.return_value = [mock_asset]
     mock_lines = lines_factory(external_vendor_id="65304578CA")
     agreement = agreement_factory(lines=mock_lines, assets=[mock_asset], subscriptions=[])
     adobe_subscription = adobe_subscription_factory(
@@ -152,10 +161,144 @@ def test_sync_agreement_update_asset_dry_run(
     )
     mock_customer = adobe_customer_factory(coterm_date="2025-04-04")
     assets_syncer = AssetSyncer(
-        mock_mpt_client, agreement["id"], [mock_asset], mock_customer, [adobe_subscription]
+        mock_mpt_client,
+        agreement["id"],
+        [mock_asset],
+        AdobeCustomerSnapshot(mock_customer, [adobe_subscription]),
     )
 
     assets_syncer.sync(dry_run=True)  # act
 
-    mock_mpt_get_asset_by_id.assert_called_once()
+    mock_get_agreement_assets.assert_called_once()
+    mock_mpt_update_asset.assert_not_called()
+
+
+@freeze_time("2025-06-23")
+def test_asset_syncer_sync_asset_missing_in_bulk_result(
+    mocker,
+    mock_mpt_client,
+    adobe_subscription_factory,
+    adobe_customer_factory,
+    assets_factory,
+    mock_mpt_update_asset,
+    mock_get_agreement_assets,
+):
+    asset_id = "AST-1111-2222-3333"
+    mock_asset = assets_factory(asset_id=asset_id, adobe_subscription_id="sub-one-time-id")[0]
+    mock_mpt_get_asset_by_id = mocker.patch(
+        "mpt_extension_sdk.mpt_http.mpt.get_asset_by_id", return_value=mock_asset
+    )
+    adobe_subscription = adobe_subscription_factory(
+        subscription_id="sub-one-time-id", offer_id="65304578CA01A12", used_quantity=6
+    )
+    assets_syncer = AssetSyncer(
+        mock_mpt_client,
+        "AGR-1234",
+        [mock_asset],
+        AdobeCustomerSnapshot(
+            adobe_customer_factory(coterm_date="2025-04-04"), [adobe_subscription]
+        ),
+    )
+
+    assets_syncer.sync(dry_run=False)  # act
+
+    mock_mpt_get_asset_by_id.assert_called_once_with(mock_mpt_client, asset_id)
+    mock_mpt_update_asset.assert_called_once()
+
+
+@freeze_time("2025-06-23")
+@pytest.mark.parametrize(
+    ("last_sync_date", "used_quantity", "is_collapsed"),
+    [
+        ("2025-06-22", 16, True),
+        ("2025-06-23", 6, False),
+        ("2025-06-22", 6, False),
+    ],
+)
+def test_asset_syncer_sync_collapses_up_to_date_assets(
+    mock_mpt_client,
+    adobe_subscription_factory,
+    adobe_customer_factory,
+    assets_factory,
+    mock_mpt_update_asset,
+    mock_get_agreement_assets,
+    last_sync_date,
+    used_quantity,
+    is_collapsed,
+):
+    mock_asset = assets_factory(adobe_subscription_id="sub-one-time-id")[0]
+    mock_asset["parameters"]["fulfillment"].append({
+        "externalId": Param.LAST_SYNC_DATE.value,
+        "value": last_sync_date,
+    })
+    mock_get_agreement_assets.return_value = [mock_asset]
+    adobe_subscription = adobe_subscription_factory(
+        subscription_id="sub-one-time-id", offer_id="65304578CA01A12", used_quantity=used_quantity
+    )
+    assets_syncer = AssetSyncer(
+        mock_mpt_client,
+        "AGR-1234",
+        [mock_asset],
+        AdobeCustomerSnapshot(
+            adobe_customer_factory(coterm_date="2025-04-04"), [adobe_subscription]
+        ),
+    )
+
+    assets_syncer.sync(dry_run=False)  # act
+
+    mock_mpt_update_asset.assert_called_once()
+    assert is_last_sync_date_only(mock_mpt_update_asset.call_args.kwargs) is is_collapsed
+
+
+@freeze_time("2025-06-23")
+def test_asset_syncer_sync_skips_up_to_date_assets(
+    mock_mpt_client,
+    adobe_subscription_factory,
+    adobe_customer_factory,
+    assets_factory,
+    mock_mpt_update_asset,
+    mock_get_agreement_assets,
+):
+    mock_asset = assets_factory(adobe_subscription_id="sub-one-time-id")[0]
+    mock_asset["parameters"]["fulfillment"].append({
+        "externalId": Param.LAST_SYNC_DATE.value,
+        "value": "2025-06-23",
+    })
+    mock_get_agreement_assets.return_value = [mock_asset]
+    adobe_subscription = adobe_subscription_factory(
+        subscription_id="sub-one-time-id", offer_id="65304578CA01A12", used_quantity=16
+    )
+    assets_syncer = AssetSyncer(
+        mock_mpt_client,
+        "AGR-1234",
+        [mock_asset],
+        AdobeCustomerSnapshot(
+            adobe_customer_factory(coterm_date="2025-04-04"), [adobe_subscription]
+        ),
+    )
+
+    assets_syncer.sync(dry_run=False)  # act
+
+    mock_mpt_update_asset.assert_not_called()
+
+
+def test_asset_syncer_sync_only_terminated_assets(
+    mock_mpt_client,
+    adobe_customer_factory,
+    assets_factory,
+    mock_mpt_update_asset,
+    mock_get_agreement_assets,
+):
+    mock_asset = assets_factory()[0]
+    mock_asset["status"] = AssetStatus.TERMINATED.value
+    assets_syncer = AssetSyncer(
+        mock_mpt_client,
+        "AGR-1234",
+        [mock_asset],
+        AdobeCustomerSnapshot(adobe_customer_factory(), []),
+    )
+
+    assets_syncer.sync(dry_run=False)  # act
+
+    mock_get_agreement_assets.assert_not_called()
     mock_mpt_update_asset.assert_not_called()
@@ -0,0 +1,99 @@
+import os
+import stat
+
+import pytest
+
+from adobe_vipm.flows.sync.checkpoint import (
+    FileCheckpointStore,
+    SqliteCheckpointStore,
+    SyncCheckpoint,
+    get_checkpoint_store,
+)
+
+
+@pytest.fixture(params=[SqliteCheckpointStore, FileCheckpointStore])
+def checkpoint_store(request, tmp_path):
+    return request.param(tmp_path / "checkpoint")
+
+
+def test_checkpoint_store_records_per_run(checkpoint_store):
+    checkpoint_store.mark_completed("run-1", "AGR-0001")
+    checkpoint_store.mark_completed("run-1", "AGR-0002")
+    checkpoint_store.mark_completed("run-1", "AGR-0002")
+    checkpoint_store.mark_completed("run-2", "AGR-0003")
+
+    result = checkpoint_store.get_completed("run-1")
+
+    assert result == {"AGR-0001", "AGR-0002"}
+
+
+def test_checkpoint_store_unknown_run(checkpoint_store):
+    result = checkpoint_store.get_completed("run-1")
+
+    assert result == set()
+
+
+def test_sync_checkpoint(checkpoint_store):
+    checkpoint_store.mark_completed("run-1", "AGR-0001")
+    checkpoint = SyncCheckpoint(checkpoint_store, "run-1")
+
+    checkpoint.mark_completed("AGR-0002")  # act
+
+    assert checkpoint.is_completed("AGR-0001")
+    assert checkpoint_store.get_completed("run-1") == {"AGR-0001", "AGR-0002"}
+
+
+def test_checkpoint_store_clear(checkpoint_store):
+    checkpoint_store.mark_completed("run-1", "AGR-0001")
+    checkpoint_store.mark_completed("run-2", "AGR-0002")
+    checkpoint = SyncCheckpoint(checkpoint_store, "run-1")
+
+    checkpoint.clear()  # act
+
+    assert not checkpoint.is_completed("AGR-0001")
+    assert checkpoint_store.get_completed("run-1") == set()
+    assert checkpoint_store.get_completed("run-2") == {"AGR-0002"}
+
+
+@pytest.mark.parametrize(
+    ("backend", "expected_class"),
+    [("sqlite", SqliteCheckpointStore), ("file", FileCheckpointStore)],
+)
+def test_get_checkpoint_store(settings, tmp_path, backend, expected_class):
+    settings.EXTENSION_CONFIG = {
+        "SYNC_CHECKPOINT_BACKEND": backend,
+        "SYNC_CHECKPOINT_PATH": str(tmp_path / "checkpoint"),
+    }
+
+    result = get_checkpoint_store()
+
+    assert isinstance(result, expected_class)
+
+
+def test_get_checkpoint_store_without_path(settings, mocker, tmp_path):
+    mocker.patch("adobe_vipm.flows.sync.checkpoint.tempfile.gettempdir", return_value=tmp_path)
+    settings.EXTENSION_CONFIG = {"SYNC_CHECKPOINT_BACKEND": "file"}
+
+    result = get_checkpoint_store()
+
+    assert isinstance(result, FileCheckpointStore)
+    checkpoint_path = tmp_path / f"adobe_vipm_sync_checkpoint_{os.getuid()}.jsonl"
+    assert stat.S_IMODE(checkpoint_path.stat().st_mode) == 0o600
+
+
+def test_file_checkpoint_store_agreement_id_with_spaces(tmp_path):
+    checkpoint_store = FileCheckpointStore(tmp_path / "checkpoint")
+    checkpoint_store.mark_completed("run 1", "AGR 0001")
+    checkpoint_store.mark_completed("run", "1 AGR-0002")
+
+    result = checkpoint_store.get_completed("run 1")
+
+    assert result == {"AGR 0001"}
+
+
+def test_checkpoint_store_not_private(tmp_path):
+    checkpoint_path = tmp_path / "checkpoint"
+    checkpoint_path.touch(mode=0o644)
+
+    with pytest.raises(PermissionError, match="only accessible by the current user"):
+        FileCheckpointStore(checkpoint_path)
@@ -0,0 +1,145 @@
+import pytest
+from freezegun import freeze_time
+
+from adobe_vipm.flows.constants import Param
+from adobe_vipm.flows.sync.diff import (
+    SyncWriteStats,
+    get_changed_parameters,
+    get_update_payload,
+    is_last_sync_date_only,
+)
+
+LAST_SYNC_DATE_PARAMETER = {"externalId": Param.LAST_SYNC_DATE.value, "value": "2025-06-23"}
+
+
+@pytest.fixture
+def mpt_subscription():
+    return {
+        "id": "SUB-1000-2000-3000",
+        "lines": [{"id": "ALI-0001", "quantity": 10, "price": {"unitPP": 12.5, "unitSP": 15}}],
+        "parameters": {
+            "fulfillment": [
+                {"externalId": Param.ADOBE_SKU.value, "value": "65304578CA01A12", "type": "Text"},
+                {"externalId": Param.LAST_SYNC_DATE.value, "value": "2025-06-22"},
+            ],
+        },
+        "commitmentDate": "2026-10-11",
+        "autoRenew": True,
+        "template": {"id": "TPL-1234", "name": "Renewing", "type": "Subscription"},
+    }
+
+
+@freeze_time("2025-06-23")
+def test_get_update_payload_unchanged(mpt_subscription):
+    intended = {
+        "lines": [{"id": "ALI-0001", "quantity": 10, "price": {"unitPP": 12.5}}],
+        "parameters": {
+            "fulfillment": [{"externalId": Param.ADOBE_SKU.value, "value": "65304578CA01A12"}]
+        },
+        "commitmentDate": "2026-10-11",
+        "autoRenew": True,
+        "template": {"id": "TPL-1234", "name": "Renewing"},
+    }
+
+    result = get_update_payload(mpt_subscription, intended)
+
+    assert result == {"parameters": {"fulfillment": [LAST_SYNC_DATE_PARAMETER]}}
+
+
+def test_get_update_payload_unchanged_with_last_sync_date(mpt_subscription):
+    last_sync_date = {"externalId": Param.LAST_SYNC_DATE.value, "value": "2025-06-22"}
+    intended = {"parameters": {"fulfillment": [last_sync_date]}, "autoRenew": True}
+
+    result = get_update_payload(mpt_subscription, intended)
+
+    assert result == {"parameters": {"fulfillment": [last_sync_date]}}
+
+
+def test_get_update_payload_changed_fields(mpt_subscription):
+    intended = {
+        "lines": [{"id": "ALI-0001", "quantity": 12, "price": {"unitPP": 12.5}}],
+        "parameters": {
+            "fulfillment": [
+                {"externalId": Param.ADOBE_SKU.value, "value": "65304578CA01A12"},
+                LAST_SYNC_DATE_PARAMETER,
+            ]
+        },
+        "commitmentDate": "2026-10-11",
+        "autoRenew": False,
+        "template": {"id": "TPL-1234", "name": "Renewing"},
+    }
+
+    result = get_update_payload(mpt_subscription, intended)
+
+    assert result == {
+        "lines": [{"id": "ALI-0001", "quantity": 12, "price": {"unitPP": 12.5}}],
+        "parameters": {"fulfillment": [LAST_SYNC_DATE_PARAMETER]},
+        "autoRenew": False,
+    }
+
+
+@pytest.mark.parametrize(
+    "lines",
+    [
+        [{"id": "ALI-0002", "quantity": 10}],
+        [{"id": "ALI-0001", "quantity": 10}, {"id": "ALI-0002", "quantity": 1}],
+        [],
+    ],
+)
+def test_get_update_payload_lines_changed(mpt_subscription, lines):
+    result = get_update_payload(mpt_subscription, {"lines": lines})
+
+    assert result == {"lines": lines}
+
+
+def test_get_changed_parameters_missing_parameter():
+    current = {"parameters": {"fulfillment": []}}
+    parameters = {
+        "fulfillment": [LAST_SYNC_DATE_PARAMETER],
+        "ordering": [],
+    }
+
+    result = get_changed_parameters(current, parameters)
+
+    assert result == {"fulfillment": [LAST_SYNC_DATE_PARAMETER]}
+
+
+@pytest.mark.parametrize(
+    ("payload", "expected_result"),
+    [
+        ({"parameters": {"fulfillment": [LAST_SYNC_DATE_PARAMETER]}}, True),
+        ({"parameters": {"fulfillment": [LAST_SYNC_DATE_PARAMETER]}, "autoRenew": True}, False),
+        (
+            {
+                "parameters": {
+                    "fulfillment": [LAST_SYNC_DATE_PARAMETER],
+                    "ordering": [{"externalId": "companyName", "value": "Company"}],
+                }
+            },
+            False,
+        ),
+        ({"parameters": {"fulfillment": [{"externalId": "cotermDate", "value": ""}]}}, False),
+        ({}, False),
+    ],
+)
+def test_is_last_sync_date_only(payload, expected_result):
+    result = is_last_sync_date_only(payload)
+
+    assert result is expected_result
+
+
+def test_sync_write_stats():
+    stats = SyncWriteStats()
+    intended = {"parameters": {"fulfillment": [LAST_SYNC_DATE_PARAMETER]}, "autoRenew": True}
+    stats.record(intended, {"parameters": {"fulfillment": [LAST_SYNC_DATE_PARAMETER]}})
+    stats.record(intended, {"autoRenew": True})
+    stats.record(intended, intended)
+    stats.record_avoided()
+
+    result = stats.summary()
+
+    assert result == (
+        "MPT writes: 3 sent (1 full, 1 trimmed, 1 collapsed to last sync date), 1 avoided."
+    )
+    stats.reset()
+    assert stats.avoided == 0
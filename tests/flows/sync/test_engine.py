@@ -0,0 +1,212 @@
+import threading
+import time
+
+import pytest
+
+from adobe_vipm.flows.sync.checkpoint import FileCheckpointStore, SyncCheckpoint
+from adobe_vipm.flows.sync.engine import (
+    AgreementShard,
+    AgreementSyncEngine,
+    AgreementSyncOutcome,
+    AgreementSyncReport,
+    SyncOutcomeStatus,
+)
+
+
+def _agreement(agreement_id, authorization_id="AUT-1", account_id="ACC-1"):
+    return {
+        "id": agreement_id,
+        "authorization": {"id": authorization_id},
+        "client": {"id": account_id},
+    }
+
+
+def _fail_on_agr_3(agreement):
+    if agreement["id"] == "AGR-3":
+        raise ValueError("boom")
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_run_reports_outcomes_in_order(workers):
+    agreements = [_agreement(f"AGR-{i}", account_id=f"ACC-{i}") for i in range(5)]
+    engine = AgreementSyncEngine(workers)
+
+    result = engine.run(agreements, _fail_on_agr_3)
+
+    assert [outcome.agreement_id for outcome in result.outcomes] == [
+        "AGR-0",
+        "AGR-1",
+        "AGR-2",
+        "AGR-3",
+        "AGR-4",
+    ]
+    assert [outcome.agreement_id for outcome in result.failed] == ["AGR-3"]
+    assert result.failed[0].error == "boom"
+    assert result.summary() == "Processed 5 agreements: 4 synced, 1 failed, 0 skipped."
+
+
+def _track_concurrency(key_func):
+    lock = threading.Lock()
+    in_flight = {}
+    peaks = {}
+
+    def sync_func(agreement):
+        key = key_func(agreement)
+        with lock:
+            in_flight[key] = in_flight.get(key, 0) + 1
+            peaks[key] = max(peaks.get(key, 0), in_flight[key])
+        time.sleep(0.05)
+        with lock:
+            in_flight[key] -= 1
+
+    return sync_func, peaks
+
+
+def test_run_caps_per_authorization():
+    agreements = [
+        _agreement(f"AGR-{i}", authorization_id=f"AUT-{i % 2}", account_id=f"ACC-{i}")
+        for i in range(8)
+    ]
+    engine = AgreementSyncEngine(8, max_per_authorization=2, max_per_account=8)
+    sync_func, peaks = _track_concurrency(lambda agreement: agreement["authorization"]["id"])
+
+    result = engine.run(agreements, sync_func)
+
+    assert len(result.synced) == 8
+    assert max(peaks.values()) <= 2
+
+
+def test_run_caps_per_account():
+    agreements = [_agreement(f"AGR-{i}", authorization_id=f"AUT-{i}") for i in range(4)]
+    engine = AgreementSyncEngine(4, max_per_authorization=4, max_per_account=1)
+    sync_func, peaks = _track_concurrency(lambda agreement: agreement["client"]["id"])
+
+    result = engine.run(agreements, sync_func)
+
+    assert len(result.synced) == 4
+    assert peaks == {"ACC-1": 1}
+
+
+def _wait_for_other_authorization(other_synced):
+    def sync_func(agreement):
+        if agreement["authorization"]["id"] == "AUT-2":
+            other_synced.set()
+        elif not other_synced.wait(timeout=2):
+            raise TimeoutError("AUT-2 agreement did not run")
+
+    return sync_func
+
+
+def test_run_does_not_block_workers_on_busy_authorization():
+    agreements = [
+        _agreement("AGR-0", authorization_id="AUT-1", account_id="ACC-0"),
+        _agreement("AGR-1", authorization_id="AUT-1", account_id="ACC-1"),
+        _agreement("AGR-2", authorization_id="AUT-2", account_id="ACC-2"),
+    ]
+    engine = AgreementSyncEngine(2, max_per_authorization=1)
+    sync_func = _wait_for_other_authorization(threading.Event())
+
+    result = engine.run(agreements, sync_func)
+
+    assert [outcome.status for outcome in result.outcomes] == [SyncOutcomeStatus.SYNCED] * 3
+
+
+def _track_start_order():
+    started = []
+
+    def sync_func(agreement):
+        started.append(agreement["id"])
+        time.sleep(0.05)
+
+    return sync_func, started
+
+
+def test_run_shares_workers_round_robin_between_authorizations():
+    agreements = [
+        _agreement(f"AGR-{i}", authorization_id="AUT-1", account_id=f"ACC-{i}") for i in range(3)
+    ]
+    agreements.append(_agreement("AGR-3", authorization_id="AUT-2", account_id="ACC-3"))
+    engine = AgreementSyncEngine(2, max_per_authorization=2, max_per_account=1)
+    sync_func, started = _track_start_order()
+
+    result = engine.run(agreements, sync_func)
+
+    assert set(started[:2]) == {"AGR-0", "AGR-3"}
+    assert len(result.synced) == 4
+
+
+def test_report_extend():
+    report = AgreementSyncReport([AgreementSyncOutcome("AGR-1", SyncOutcomeStatus.SYNCED, 1.0)])
+    other = AgreementSyncReport([AgreementSyncOutcome("AGR-2", SyncOutcomeStatus.FAILED, 1.0)])
+
+    report.extend(other)  # act
+
+    assert [outcome.agreement_id for outcome in report.outcomes] == ["AGR-1", "AGR-2"]
+
+
+def test_shards_split_agreements_without_overlap():
+    agreement_ids = [f"AGR-{i:04}" for i in range(100)]
+    shards = [AgreementShard(index, 3) for index in range(3)]
+
+    result = [[aid for aid in agreement_ids if shard.contains(aid)] for shard in shards]
+
+    assert sorted(aid for shard_ids in result for aid in shard_ids) == agreement_ids
+    assert all(shard_ids for shard_ids in result)
+
+
+@pytest.mark.parametrize(("index", "count"), [(3, 3), (-1, 2), (0, 0)])
+def test_shard_invalid(index, count):
+    with pytest.raises(ValueError, match="Invalid shard"):
+        AgreementShard(index, count)
+
+
+def test_run_only_processes_shard_agreements(mocker):
+    shard = AgreementShard(1, 2)
+    agreements = [_agreement(f"AGR-{i}") for i in range(10)]
+    sync_func = mocker.MagicMock()
+    engine = AgreementSyncEngine(shard=shard)
+
+    result = engine.run(agreements, sync_func)
+
+    expected_ids = [agreement["id"] for agreement in agreements if shard.contains(agreement["id"])]
+    assert [outcome.agreement_id for outcome in result.outcomes] == expected_ids
+    assert sync_func.call_count == len(expected_ids)
+    processed = len(expected_ids)
+    assert result.summary() == (
+        f"Shard 2/2: Processed {processed} agreements: {processed} synced, 0 failed, 0 skipped."
+    )
+
+
+def test_run_skips_and_records_checkpoint(mocker, tmp_path):
+    store = FileCheckpointStore(tmp_path / "checkpoint.log")
+    store.mark_completed("run-id", "AGR-0")
+    sync_func = mocker.MagicMock(side_effect=[None, ValueError("boom")])
+    engine = AgreementSyncEngine(checkpoint=SyncCheckpoint(store, "run-id"))
+
+    result = engine.run([_agreement("AGR-0"), _agreement("AGR-1"), _agreement("AGR-2")], sync_func)
+
+    assert [outcome.status for outcome in result.outcomes] == [
+        SyncOutcomeStatus.SKIPPED,
+        SyncOutcomeStatus.SYNCED,
+        SyncOutcomeStatus.FAILED,
+    ]
+    assert store.get_completed("run-id") == {"AGR-0", "AGR-1"}
+
+
+def test_run_reports_sync_func_status(tmp_path):
+    store = FileCheckpointStore(tmp_path / "checkpoint.log")
+    statuses = {
+        "AGR-0": SyncOutcomeStatus.SYNCED,
+        "AGR-1": SyncOutcomeStatus.SKIPPED,
+        "AGR-2": SyncOutcomeStatus.FAILED,
+    }
+    engine = AgreementSyncEngine(checkpoint=SyncCheckpoint(store, "run-id"))
+
+    result = engine.run(
+        [_agreement(agreement_id) for agreement_id in statuses],
+        lambda agreement: statuses[agreement["id"]],
+    )
+
+    assert [outcome.status for outcome in result.outcomes] == list(statuses.values())
+    assert result.summary() == "Processed 3 agreements: 1 synced, 1 failed, 1 skipped."
+    assert store.get_completed("run-id") == {"AGR-0"}
@@ -0,0 +1,76 @@
+from adobe_vipm.flows.constants import Param
+from adobe_vipm.flows.context import Context
+from adobe_vipm.flows.utils import ParameterView, set_customer_data
+
+
+def test_customer_data_memoized(order_factory):
+    context = Context(order=order_factory())
+    customer_data = context.customer_data
+
+    result = context.customer_data
+
+    assert result is customer_data
+    assert result[Param.COMPANY_NAME.value] == "FF Buyer good enough"
+
+
+def test_customer_data_invalidated_on_order_reassign(order_factory):
+    context = Context(order=order_factory())
+    customer_data = context.customer_data
+    context.order = set_customer_data(context.order, {Param.COMPANY_NAME.value: "New Company"})
+
+    result = context.customer_data
+
+    assert result[Param.COMPANY_NAME.value] == "New Company"
+    assert customer_data[Param.COMPANY_NAME.value] == "FF Buyer good enough"
+
+
+def test_deployment_id_invalidated(order_factory):
+    context = Context(order=order_factory())
+    deployment_id = context.deployment_id
+    ParameterView(context.order).update_value(
+        Param.PHASE_FULFILLMENT.value, Param.DEPLOYMENT_ID.value, "deployment-id"
+    )
+    context.invalidate()
+
+    result = context.deployment_id
+
+    assert result == "deployment-id"
+    assert deployment_id != result
+
+
+def test_get_one_time_skus_memoized(mocker, order_factory):
+    mocked_get_one_time_skus = mocker.patch(
+        "adobe_vipm.flows.context.get_one_time_skus", return_value=["sku"]
+    )
+    context = Context(order=order_factory())
+    context.get_one_time_skus(mocker.MagicMock())
+
+    result = context.get_one_time_skus(mocker.MagicMock())
+
+    assert result == ["sku"]
+    mocked_get_one_time_skus.assert_called_once()
+
+
+def test_line_splits_copied(order_factory):
+    context = Context(order=order_factory())
+    context.line_splits[2].clear()
+
+    result = context.line_splits
+
+    assert result[2] == context.order["lines"]
+
+
+def test_adobe_snapshot_rebuilt_on_subscriptions_reassign(
+    order_factory, adobe_customer_factory, adobe_subscription_factory
+):
+    subscription = adobe_subscription_factory()
+    context = Context(order=order_factory(), adobe_customer=adobe_customer_factory())
+    snapshot = context.adobe_snapshot
+    context.adobe_customer_subscriptions = [subscription]
+
+    result = context.adobe_snapshot
+
+    assert result is not snapshot
+    assert result.get_subscription(subscription["subscriptionId"]) == subscription
+    assert snapshot.get_subscription(subscription["subscriptionId"]) is None
+    assert result is context.adobe_snapshot
@@ -645,6 +645,25 @@ def test_update_prices_step_with_preview_order(
     mock_next_step.assert_called_once_with(mock_mpt_client, context)
 
 
+def test_update_prices_step_invalidates_context_facts(
+    mock_mpt_client, mock_next_step, mock_order, mock_update_order, adobe_order_factory
+):
+    context = Context(
+        order=mock_order,
+        order_id=mock_order["id"],
+        product_id=mock_order["agreement"]["product"]["id"],
+        currency=mock_order["agreement"]["listing"]["priceList"]["currency"],
+        adobe_preview_order=adobe_order_factory(order_type=ORDER_TYPE_PREVIEW),
+    )
+    customer_data = context.customer_data
+
+    UpdatePrices(is_validation=True)(mock_mpt_client, context, mock_next_step)  # act
+
+    assert context.customer_data is not customer_data
+    assert context.order["lines"][0]["price"] == {"unitPP": 849.16}
+    assert mock_order["lines"][0]["price"] != {"unitPP": 849.16}
+
+
 def test_update_prices_step_with_preview_order_validation_only(
     mock_mpt_client, mock_next_step, mock_order, mock_update_order, adobe_order_factory
 ):
@@ -4,7 +4,10 @@ from adobe_vipm.adobe.constants import (
     ThreeYearCommitmentStatus,
 )
 from adobe_vipm.flows.constants import Param
+from adobe_vipm.flows.errors import MPTAPIError
 from adobe_vipm.flows.mpt import (
+    get_agreement_assets,
+    get_agreement_subscriptions,
     get_agreements_by_3yc_commitment_request_invitation,
     get_agreements_by_3yc_commitment_request_status,
 )
@@ -70,3 +73,55 @@ def test_get_agreements_by_3yc_commitment_request_invitation(
     )  # act
 
     mock_mpt_get_agreements_by_query.assert_called_once_with(mock_mpt_client, rql_query)
+
+
+def test_get_agreement_subscriptions(mocker, mock_mpt_client):
+    mocked_get_by_query = mocker.patch(
+        "adobe_vipm.flows.mpt.get_subscriptions_by_query", return_value=[{"id": "SUB-0001"}]
+    )
+
+    result = get_agreement_subscriptions(mock_mpt_client, "AGR-0001")
+
+    assert result == [{"id": "SUB-0001"}]
+    mocked_get_by_query.assert_called_once_with(
+        mock_mpt_client,
+        "eq(agreement.id,AGR-0001)&select=lines,parameters,externalIds",
+        limit=100,
+    )
+
+
+def test_get_agreement_assets(mpt_client, requests_mocker):
+    url = (
+        "https://localhost/public/v1/commerce/assets?eq(agreement.id,AGR-0001)"
+        "&select=lines,parameters,externalIds"
+    )
+    requests_mocker.get(
+        f"{url}&limit=100&offset=0",
+        json={
+            "$meta": {"pagination": {"offset": 0, "limit": 100, "total": 101}},
+            "data": [{"id": f"AST-{index}"} for index in range(100)],
+        },
+    )
+    requests_mocker.get(
+        f"{url}&limit=100&offset=100",
+        json={
+            "$meta": {"pagination": {"offset": 100, "limit": 100, "total": 101}},
+            "data": [{"id": "AST-100"}],
+        },
+    )
+
+    result = get_agreement_assets(mpt_client, "AGR-0001")
+
+    assert [asset["id"] for asset in result] == [f"AST-{index}" for index in range(101)]
+
+
+def test_get_agreement_assets_error(mpt_client, requests_mocker):
+    requests_mocker.get(
+        "https://localhost/public/v1/commerce/assets?eq(agreement.id,AGR-0001)"
+        "&select=lines,parameters,externalIds&limit=100&offset=0",
+        status=400,
+        json={"status": 400, "title": "Bad Request", "detail": "Invalid RQL"},
+    )
+
+    with pytest.raises(MPTAPIError):
+        get_agreement_assets(mpt_client, "AGR-0001")
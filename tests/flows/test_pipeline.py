@@ -1,6 +1,15 @@
+import logging
+
 import pytest
 
-from adobe_vipm.flows.pipeline import Cursor, Pipeline, Step, get_failed_step
+from adobe_vipm.flows.pipeline import (
+    Cursor,
+    Pipeline,
+    Step,
+    StepMiddleware,
+    StepTimer,
+    get_failed_step,
+)
 
 
 def test_pipeline_completes(mocker, mock_mpt_client):
@@ -90,3 +99,131 @@ def test_get_failed_step_returns_none_outside_a_pipeline():
     result = get_failed_step(ValueError("boom"))
 
     assert result is None
+
+
+def test_pipeline_runs_steps_without_nesting(mocker, mock_mpt_client):
+    class TestStep(Step):
+        def __call__(self, client, context, next_step):
+            context.calls += 1
+            next_step(client, context)
+
+    # BL
+    mocked_context = mocker.MagicMock(calls=0)
+    pipeline = Pipeline(*(TestStep() for _ in range(5000)))
+
+    pipeline.run(mock_mpt_client, mocked_context)  # act
+
+    assert mocked_context.calls == 5000
+
+
+def test_pipeline_wrapping_step_handles_next_steps_errors(mocker, mock_mpt_client):
+    class WrappingStep(Step):
+        wraps_next_step = True
+
+        # BL
+        def __call__(self, client, context, next_step):
+            try:
+                next_step(client, context)
+            except ValueError as error:
+                context.handled = get_failed_step(error)
+
+    # BL
+    class PassingStep(Step):
+        def __call__(self, client, context, next_step):
+            next_step(client, context)
+
+    # BL
+    class FailingStep(Step):
+        def __call__(self, client, context, next_step):
+            raise ValueError("boom")
+
+    # BL
+    mocked_context = mocker.MagicMock()
+    pipeline = Pipeline(WrappingStep(), PassingStep(), FailingStep())
+
+    pipeline.run(mock_mpt_client, mocked_context)  # act
+
+    assert mocked_context.handled == "FailingStep"
+
+
+def test_pipeline_error_handler_continues(mocker, mock_mpt_client):
+    class FailingStep(Step):
+        def __call__(self, client, context, next_step):
+            raise ValueError("boom")
+
+    # BL
+    class LastStep(Step):
+        def __call__(self, client, context, next_step):
+            context.completed = True
+
+    # BL
+    mocked_context = mocker.MagicMock(completed=False)
+    pipeline = Pipeline(FailingStep(), LastStep())
+
+    pipeline.run(
+        mock_mpt_client,
+        mocked_context,
+        error_handler=lambda error, context, next_step: next_step(mock_mpt_client, context),
+    )  # act
+
+    assert mocked_context.completed
+
+
+def test_pipeline_middlewares(mocker, mock_mpt_client):
+    class PassingStep(Step):
+        def __call__(self, client, context, next_step):
+            next_step(client, context)
+
+    # BL
+    class FailingStep(Step):
+        def __call__(self, client, context, next_step):
+            raise ValueError("boom")
+
+    # BL
+    middleware = mocker.MagicMock(spec=StepMiddleware)
+    mocked_context = mocker.MagicMock()
+    passing_step = PassingStep()
+    failing_step = FailingStep()
+    pipeline = Pipeline(passing_step, failing_step, middlewares=(middleware,))
+
+    with pytest.raises(ValueError, match="boom"):
+        pipeline.run(mock_mpt_client, mocked_context)
+
+    assert middleware.mock_calls == [
+        mocker.call.before_step(passing_step, mocked_context),
+        mocker.call.after_step(passing_step, mocked_context),
+        mocker.call.before_step(failing_step, mocked_context),
+        mocker.call.on_step_error(failing_step, mocked_context, mocker.ANY),
+    ]
+
+
+def test_step_timer(mocker):
+    class TestStep(Step):
+        def __call__(self, client, context, next_step):
+            next_step(client, context)
+
+    # BL
+    mocker.patch("adobe_vipm.flows.pipeline.time.perf_counter", side_effect=[1, 1.5, 2, 2.25])
+    timer = StepTimer()
+    for step in (TestStep(), TestStep()):
+        timer.before_step(step, mocker.MagicMock())
+        timer.after_step(step, mocker.MagicMock())
+
+    result = timer.summary()
+
+    assert result == "TestStep=0.750s"
+
+
+def test_pipeline_logs_step_timings(mocker, mock_mpt_client, caplog):
+    class TestStep(Step):
+        def __call__(self, client, context, next_step):
+            next_step(client, context)
+
+    # BL
+    mocker.patch("adobe_vipm.flows.pipeline.time.perf_counter", side_effect=[1, 1.5])
+    pipeline = Pipeline(TestStep())
+
+    with caplog.at_level(logging.INFO):
+        pipeline.run(mock_mpt_client, "ORD-1234")  # act
+
+    assert caplog.messages == ["ORD-1234: pipeline steps took TestStep=0.500s"]
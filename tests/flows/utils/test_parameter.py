@@ -6,8 +6,13 @@ from pytest_mock import MockerFixture
 
 from adobe_vipm.flows.constants import Param
 from adobe_vipm.flows.utils.parameter import (
+    ParameterView,
+    get_coterm_date,
+    get_ordering_parameter,
     get_renewal_payload,
     get_switch_payload,
+    replace_parameter_fields,
+    set_coterm_date,
     update_agreement_params_visibility,
 )
 
@@ -199,3 +204,80 @@ def test_get_renewal_payload_not_set(order_factory):
     result = get_renewal_payload(order)  # act
 
     assert result is None
+
+
+def test_parameter_view_update_value(order_factory):
+    order = order_factory()
+    parameters = ParameterView(order)
+
+    result = parameters.update_value(
+        Param.PHASE_FULFILLMENT.value, Param.COTERM_DATE.value, "2025-01-01"
+    )
+
+    assert result is True
+    assert parameters.get(Param.PHASE_FULFILLMENT.value, Param.COTERM_DATE.value)["value"] == (
+        "2025-01-01"
+    )
+    assert (
+        next(
+            param
+            for param in order["parameters"]["fulfillment"]
+            if param["externalId"] == Param.COTERM_DATE.value
+        )["value"]
+        == "2025-01-01"
+    )
+
+
+def test_parameter_view_update_missing_parameter(order_factory):
+    parameters = ParameterView(order_factory())
+
+    result = parameters.update_value(Param.PHASE_ORDERING.value, "missing", "value")
+
+    assert result is False
+    assert parameters.get(Param.PHASE_ORDERING.value, "missing") == {}
+
+
+def test_parameter_view_get_changed_parameters(order_factory):
+    order = order_factory()
+    parameters = ParameterView(order)
+    parameters.update_value(Param.PHASE_FULFILLMENT.value, Param.COTERM_DATE.value, "2025-01-01")
+    parameters.update_value(Param.PHASE_FULFILLMENT.value, Param.COTERM_DATE.value, "2025-02-01")
+    parameters.update_value(
+        Param.PHASE_ORDERING.value,
+        Param.AGREEMENT_TYPE.value,
+        get_ordering_parameter(order, Param.AGREEMENT_TYPE.value)["value"],
+    )
+    parameters.update_constraints(
+        Param.PHASE_ORDERING.value, Param.COMPANY_NAME.value, hidden=True, required=False
+    )
+
+    result = parameters.get_changed_parameters()
+
+    assert result == {
+        Param.PHASE_FULFILLMENT.value: [
+            parameters.get(Param.PHASE_FULFILLMENT.value, Param.COTERM_DATE.value)
+        ],
+    }
+    assert result[Param.PHASE_FULFILLMENT.value][0]["value"] == "2025-02-01"
+
+
+def test_set_coterm_date_copies_updated_parameter_only(order_factory):
+    order = order_factory()
+
+    result = set_coterm_date(order, "2025-01-01")
+
+    assert result["lines"] is order["lines"]
+    assert result["parameters"] is not order["parameters"]
+    assert result["parameters"]["ordering"] is order["parameters"]["ordering"]
+    assert get_coterm_date(order) != "2025-01-01"
+    assert get_coterm_date(result) == "2025-01-01"
+
+
+def test_replace_parameter_fields_missing_parameter(order_factory):
+    order = order_factory()
+
+    result = replace_parameter_fields(order, Param.PHASE_ORDERING.value, "missing", value="value")
+
+    assert result == order
+    assert result is not order
+    assert get_ordering_parameter(result, "missing") == {}
@@ -45,11 +45,13 @@ def test_validate_downsizes_step(
     ret_info_3 = ReturnableOrderInfo(
         adobe_order_3, adobe_order_3["lineItems"][0], adobe_order_3["lineItems"][0]["quantity"]
     )
-    mock_adobe_client.get_returnable_orders_by_subscription_id.return_value = [
-        ret_info_1,
-        ret_info_2,
-        ret_info_3,
-    ]
+    mock_adobe_client.get_returnable_orders_by_subscription_ids.return_value = {
+        "6158e1cf0e4414a9b3a06d123969fdNA": [
+            ret_info_1,
+            ret_info_2,
+            ret_info_3,
+        ]
+    }
     mocked_client = mocker.MagicMock()
     mocked_next_step = mocker.MagicMock()
     context = Context(
@@ -64,10 +66,10 @@ def test_validate_downsizes_step(
     step(mocked_client, context, mocked_next_step)  # act
 
     assert context.validation_succeeded is True
-    mock_adobe_client.get_returnable_orders_by_subscription_id.assert_called_once_with(
+    mock_adobe_client.get_returnable_orders_by_subscription_ids.assert_called_once_with(
         context.authorization_id,
         context.adobe_customer_id,
-        "6158e1cf0e4414a9b3a06d123969fdNA",
+        ["6158e1cf0e4414a9b3a06d123969fdNA"],
         context.adobe_customer["cotermDate"],
     )
     mocked_next_step.assert_called_once_with(mocked_client, context)
@@ -86,7 +88,9 @@ def test_validate_downsizes_step_no_returnable_orders(
     order = order_factory(lines=lines_factory(quantity=7, old_quantity=14))
     coterm_date = dt.datetime.now(tz=dt.UTC).date() + dt.timedelta(days=20)
     adobe_customer = adobe_customer_factory(coterm_date=coterm_date.strftime("%Y-%m-%d"))
-    mock_adobe_client.get_returnable_orders_by_subscription_id.return_value = []
+    mock_adobe_client.get_returnable_orders_by_subscription_ids.return_value = {
+        "6158e1cf0e4414a9b3a06d123969fdNA": []
+    }
     mocked_client = mocker.MagicMock()
     mocked_next_step = mocker.MagicMock()
     context = Context(
@@ -101,10 +105,10 @@ def test_validate_downsizes_step_no_returnable_orders(
     step(mocked_client, context, mocked_next_step)  # act
 
     assert context.validation_succeeded is True
-    mock_adobe_client.get_returnable_orders_by_subscription_id.assert_called_once_with(
+    mock_adobe_client.get_returnable_orders_by_subscription_ids.assert_called_once_with(
         context.authorization_id,
         context.adobe_customer_id,
-        "6158e1cf0e4414a9b3a06d123969fdNA",
+        ["6158e1cf0e4414a9b3a06d123969fdNA"],
         context.adobe_customer["cotermDate"],
     )
     mocked_next_step.assert_called_once_with(mocked_client, context)
@@ -147,11 +151,13 @@ def test_validate_downsizes_step_invalid_quantity(
     ret_info_3 = ReturnableOrderInfo(
         adobe_order_3, adobe_order_3["lineItems"][0], adobe_order_3["lineItems"][0]["quantity"]
     )
-    mock_adobe_client.get_returnable_orders_by_subscription_id.return_value = [
-        ret_info_1,
-        ret_info_2,
-        ret_info_3,
-    ]
+    mock_adobe_client.get_returnable_orders_by_subscription_ids.return_value = {
+        "6158e1cf0e4414a9b3a06d123969fdNA": [
+            ret_info_1,
+            ret_info_2,
+            ret_info_3,
+        ]
+    }
     mocked_client = mocker.MagicMock()
     mocked_next_step = mocker.MagicMock()
     context = Context(
@@ -166,10 +172,10 @@ def test_validate_downsizes_step_invalid_quantity(
     step(mocked_client, context, mocked_next_step)  # act
 
     assert context.validation_succeeded is False
-    mock_adobe_client.get_returnable_orders_by_subscription_id.assert_called_once_with(
+    mock_adobe_client.get_returnable_orders_by_subscription_ids.assert_called_once_with(
         context.authorization_id,
         context.adobe_customer_id,
-        "6158e1cf0e4414a9b3a06d123969fdNA",
+        ["6158e1cf0e4414a9b3a06d123969fdNA"],
         context.adobe_customer["cotermDate"],
     )
     assert context.order["error"] == {
@@ -236,7 +242,9 @@ def test_validate_downsizes_step_invalid_quantity_initial_purchase_only(
     ret_info_1 = ReturnableOrderInfo(
         adobe_order_1, adobe_order_1["lineItems"][0], adobe_order_1["lineItems"][0]["quantity"]
     )
-    mock_adobe_client.get_returnable_orders_by_subscription_id.return_value = [ret_info_1]
+    mock_adobe_client.get_returnable_orders_by_subscription_ids.return_value = {
+        "6158e1cf0e4414a9b3a06d123969fdNA": [ret_info_1]
+    }
     mocked_client = mocker.MagicMock()
     mocked_next_step = mocker.MagicMock()
     context = Context(
@@ -251,10 +259,10 @@ def test_validate_downsizes_step_invalid_quantity_initial_purchase_only(
     step(mocked_client, context, mocked_next_step)  # act
 
     assert context.validation_succeeded is False
-    mock_adobe_client.get_returnable_orders_by_subscription_id.assert_called_once_with(
+    mock_adobe_client.get_returnable_orders_by_subscription_ids.assert_called_once_with(
         context.authorization_id,
         context.adobe_customer_id,
-        "6158e1cf0e4414a9b3a06d123969fdNA",
+        ["6158e1cf0e4414a9b3a06d123969fdNA"],
         context.adobe_customer["cotermDate"],
     )
     assert context.order["error"] == {
@@ -0,0 +1,47 @@
+from io import StringIO
+
+import requests
+
+from adobe_vipm.adobe.metrics import ADOBE_API_METRICS
+from adobe_vipm.management.commands.base import AdobeBaseCommand
+
+
+class Command(AdobeBaseCommand):
+    """Command sending an Adobe API request if asked."""
+
+    def handle(self, *args, **options):
+        """Records an Adobe API request without response."""
+        if not options["send_request"]:
+            return
+        ADOBE_API_METRICS.record(
+            "auth-uk",
+            requests.Request("GET", "https://adobe.api/v3/customers/P1005267002").prepare(),
+            None,
+            0.1,
+        )
+
+
+def test_command_writes_adobe_api_summary():
+    stdout = StringIO()
+
+    Command(stdout=stdout).execute(
+        skip_checks=True, no_color=True, force_color=False, send_request=True
+    )  # act
+
+    assert stdout.getvalue().splitlines() == [
+        "Adobe API requests:",
+        (
+            "  auth-uk GET /v3/customers/{id}: 1 requests, 0 retries, 0.1s, 0 bytes received, "
+            "statuses {'error': 1}"
+        ),
+    ]
+
+
+def test_command_without_adobe_api_requests():
+    stdout = StringIO()
+
+    Command(stdout=stdout).execute(
+        skip_checks=True, no_color=True, force_color=False, send_request=False
+    )  # act
+
+    assert not stdout.getvalue()
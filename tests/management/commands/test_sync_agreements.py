@@ -1,7 +1,24 @@
-from unittest.mock import DEFAULT
+from io import StringIO
+from unittest.mock import ANY, DEFAULT
 
 import pytest
 from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from adobe_vipm.flows.sync.checkpoint import SyncCheckpoint, get_checkpoint_store
+from adobe_vipm.flows.sync.engine import (
+    AgreementShard,
+    AgreementSyncOutcome,
+    AgreementSyncReport,
+    SyncOutcomeStatus,
+)
+
+
+@pytest.fixture(autouse=True)
+def checkpoint_path(settings, tmp_path):
+    path = tmp_path / "checkpoint.sqlite3"
+    settings.EXTENSION_CONFIG = {**settings.EXTENSION_CONFIG, "SYNC_CHECKPOINT_PATH": str(path)}
+    return path
 
 
 @pytest.mark.parametrize("dry_run", [True, False])
@@ -18,18 +35,21 @@ def test_process_sync_agreements(mocker, dry_run, mock_mpt_client, mock_adobe_cl
         sync_agreements_by_renewal_date=DEFAULT,
         spec=True,
     )
+    for mocked_sync in mocked.values():
+        mocked_sync.return_value = AgreementSyncReport()
 
     call_command("sync_agreements", dry_run=dry_run)  # act
 
     for v in mocked.values():
-        v.assert_called_once_with(mock_mpt_client, mock_adobe_client, dry_run=dry_run)
+        v.assert_called_once_with(mock_mpt_client, mock_adobe_client, dry_run=dry_run, engine=ANY)
 
 
 @pytest.mark.usefixtures("mock_setup_client")
 @pytest.mark.parametrize("dry_run", [True, False])
 def test_process_by_agreement_ids(mocker, dry_run, mock_mpt_client, mock_adobe_client):
     mocked = mocker.patch(
-        "adobe_vipm.management.commands.sync_agreements.sync_agreements_by_agreement_ids"
+        "adobe_vipm.management.commands.sync_agreements.sync_agreements_by_agreement_ids",
+        return_value=AgreementSyncReport(),
     )
 
     call_command("sync_agreements", agreements=["AGR-0001", "AGR-0002"], dry_run=dry_run)  # act
@@ -40,16 +60,147 @@ def test_process_by_agreement_ids(mocker, dry_run, mock_mpt_client, mock_adobe_c
         ["AGR-0001", "AGR-0002"],
         dry_run=dry_run,
         sync_prices=False,
+        engine=ANY,
     )
 
 
 @pytest.mark.usefixtures("mock_setup_client")
 @pytest.mark.parametrize("dry_run", [True, False])
 def test_process_all(mocker, dry_run, mock_mpt_client, mock_adobe_client):
-    mocked = mocker.patch("adobe_vipm.management.commands.sync_agreements.sync_all_agreements")
+    mocked = mocker.patch(
+        "adobe_vipm.management.commands.sync_agreements.sync_all_agreements",
+        return_value=AgreementSyncReport(),
+    )
 
     call_command("sync_agreements", all=True, dry_run=dry_run, sync_prices=True)  # act
 
     mocked.assert_called_once_with(
-        mock_mpt_client, mock_adobe_client, dry_run=dry_run, sync_prices=True
+        mock_mpt_client, mock_adobe_client, dry_run=dry_run, sync_prices=True, engine=ANY
+    )
+
+
+@pytest.mark.usefixtures("mock_setup_client")
+def test_process_all_with_workers(mocker, mock_mpt_client, mock_adobe_client):
+    report = AgreementSyncReport([
+        AgreementSyncOutcome("AGR-0001", SyncOutcomeStatus.SYNCED, 1.5),
+        AgreementSyncOutcome("AGR-0002", SyncOutcomeStatus.FAILED, 0.5, error="boom"),
+    ])
+    mocked = mocker.patch(
+        "adobe_vipm.management.commands.sync_agreements.sync_all_agreements",
+        return_value=report,
     )
+    stdout = StringIO()
+    stderr = StringIO()
+
+    call_command(
+        "sync_agreements",
+        all=True,
+        workers=8,
+        max_per_authorization=3,
+        max_per_account=1,
+        stdout=stdout,
+        stderr=stderr,
+    )  # act
+
+    engine = mocked.call_args.kwargs["engine"]
+    assert (engine.workers, engine.max_per_authorization, engine.max_per_account) == (8, 3, 1)
+    assert "AGR-0001: synced in 1.50s" in stdout.getvalue()
+    assert "Processed 2 agreements: 1 synced, 1 failed, 0 skipped." in stdout.getvalue()
+    assert "AGR-0002: failed in 0.50s (boom)" in stderr.getvalue()
+
+
+@pytest.mark.usefixtures("mock_setup_client")
+def test_process_all_sharded(mocker, mock_mpt_client, mock_adobe_client):
+    mocked = mocker.patch(
+        "adobe_vipm.management.commands.sync_agreements.sync_all_agreements",
+        return_value=AgreementSyncReport(shard=AgreementShard(1, 4)),
+    )
+    stdout = StringIO()
+
+    call_command("sync_agreements", all=True, shard_index=1, shard_count=4, stdout=stdout)  # act
+
+    assert mocked.call_args.kwargs["engine"].shard == AgreementShard(1, 4)
+    assert "Shard 2/4: Processed 0 agreements: 0 synced, 0 failed, 0 skipped." in stdout.getvalue()
+
+
+@pytest.mark.usefixtures("mock_setup_client", "mock_adobe_client")
+def test_process_invalid_shard(mocker):
+    mocked = mocker.patch("adobe_vipm.management.commands.sync_agreements.sync_all_agreements")
+
+    with pytest.raises(CommandError, match="Invalid shard 4 of 4"):
+        call_command("sync_agreements", all=True, shard_index=4, shard_count=4)
+
+    mocked.assert_not_called()
+
+
+@pytest.mark.usefixtures("mock_setup_client")
+def test_process_all_resume(mocker, mock_mpt_client, mock_adobe_client):
+    mocked = mocker.patch(
+        "adobe_vipm.management.commands.sync_agreements.sync_all_agreements",
+        return_value=AgreementSyncReport(),
+    )
+    mocked_clear = mocker.patch.object(SyncCheckpoint, "clear")
+    get_checkpoint_store().mark_completed("run-id", "AGR-0001")
+    stdout = StringIO()
+
+    call_command("sync_agreements", all=True, resume="run-id", stdout=stdout)  # act
+
+    checkpoint = mocked.call_args.kwargs["engine"].checkpoint
+    assert checkpoint.run_id == "run-id"
+    assert checkpoint.is_completed("AGR-0001")
+    mocked_clear.assert_called_once()
+    assert "Run ID: run-id" in stdout.getvalue()
+
+
+@pytest.mark.usefixtures("mock_setup_client")
+def test_process_all_clears_checkpoint(mocker, mock_mpt_client, mock_adobe_client):
+    mocker.patch(
+        "adobe_vipm.management.commands.sync_agreements.sync_all_agreements",
+        return_value=AgreementSyncReport(
+            outcomes=[AgreementSyncOutcome("AGR-0001", SyncOutcomeStatus.SYNCED, 1)]
+        ),
+    )
+    get_checkpoint_store().mark_completed("run-id", "AGR-0001")
+
+    call_command("sync_agreements", all=True, resume="run-id", stdout=StringIO())  # act
+
+    assert get_checkpoint_store().get_completed("run-id") == set()
+
+
+@pytest.mark.usefixtures("mock_setup_client")
+def test_process_all_keeps_checkpoint_on_failure(mocker, mock_mpt_client, mock_adobe_client):
+    mocker.patch(
+        "adobe_vipm.management.commands.sync_agreements.sync_all_agreements",
+        return_value=AgreementSyncReport(
+            outcomes=[AgreementSyncOutcome("AGR-0002", SyncOutcomeStatus.FAILED, 1)]
+        ),
+    )
+    get_checkpoint_store().mark_completed("run-id", "AGR-0001")
+    stdout = StringIO()
+
+    call_command("sync_agreements", all=True, resume="run-id", stdout=stdout)  # act
+
+    assert get_checkpoint_store().get_completed("run-id") == {"AGR-0001"}
+    assert "--resume run-id" in stdout.getvalue()
+
+
+@pytest.mark.usefixtures("mock_setup_client")
+def test_process_resume_without_checkpoint_path(
+    settings, mocker, tmp_path, mock_mpt_client, mock_adobe_client
+):
+    mocker.patch("adobe_vipm.flows.sync.checkpoint.tempfile.gettempdir", return_value=tmp_path)
+    mocked = mocker.patch(
+        "adobe_vipm.management.commands.sync_agreements.sync_all_agreements",
+        return_value=AgreementSyncReport(),
+    )
+    mocker.patch.object(SyncCheckpoint, "clear")
+    settings.EXTENSION_CONFIG = {
+        key: config_value
+        for key, config_value in settings.EXTENSION_CONFIG.items()
+        if key != "SYNC_CHECKPOINT_PATH"
+    }
+    get_checkpoint_store().mark_completed("run-id", "AGR-0001")
+
+    call_command("sync_agreements", all=True, resume="run-id", stdout=StringIO())  # act
+
+    assert mocked.call_args.kwargs["engine"].checkpoint.is_completed("AGR-0001")
@@ -0,0 +1,90 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from freezegun import freeze_time
+
+from adobe_vipm.cache import TTLCache
+
+
+def test_ttl_cache_expires_entries():
+    cache = TTLCache(ttl=60)
+    with freeze_time("2025-06-01 10:00:00") as frozen_time:
+        cache.set("key", "cached")
+        frozen_time.tick(59)
+        cached = cache.get("key")
+        frozen_time.tick(1)
+
+        result = cache.get("key", "expired")
+
+    assert cached == "cached"
+    assert result == "expired"
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_ttl_cache_get_or_load(mocker):
+    cache = TTLCache()
+    loader = mocker.MagicMock(return_value="loaded")
+    cache.get_or_load("key", loader)
+
+    result = cache.get_or_load("key", loader)
+
+    assert result == "loaded"
+    loader.assert_called_once_with()
+
+
+def test_ttl_cache_invalidate():
+    cache = TTLCache()
+    cache.set(("auth-1", "customer-1"), "cached")
+    cache.set(("auth-1", "customer-2"), "cached")
+    cache.set(("auth-2", "customer-1"), "cached")
+
+    result = cache.invalidate(lambda key: key[0] == "auth-1")
+
+    assert result == 2
+    assert ("auth-2", "customer-1") in cache
+    assert len(cache) == 1
+
+
+class _BlockingLoader:
+    def __init__(self):
+        self.calls = 0
+        self.loading = threading.Event()
+        self.release = threading.Event()
+
+    def __call__(self):
+        self.calls += 1
+        self.loading.set()
+        self.release.wait(5)
+        return "loaded"
+
+
+def test_ttl_cache_get_or_load_single_flight():
+    cache = TTLCache()
+    loader = _BlockingLoader()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        first = executor.submit(cache.get_or_load, "key", loader)
+        loader.loading.wait(5)
+        second = executor.submit(cache.get_or_load, "key", loader)
+        other_key = cache.get_or_load("other-key", lambda: "other")
+        loader.release.set()
+
+        result = (first.result(), second.result())
+
+    assert result == ("loaded", "loaded")
+    assert other_key == "other"
+    assert loader.calls == 1
+
+
+def _invalidate_and_load(cache):
+    cache.invalidate(lambda key: True)
+    return "stale"
+
+
+def test_ttl_cache_get_or_load_invalidated_while_loading():
+    cache = TTLCache()
+
+    result = cache.get_or_load("key", partial(_invalidate_and_load, cache))
+
+    assert result == "stale"
+    assert "key" not in cache
@@ -4,7 +4,14 @@ from mpt_extension_sdk.core.events.dataclasses import Event
 from mpt_extension_sdk.flows.context import Context
 from mpt_extension_sdk.runtime.djapp.conf import get_for_product
 
-from adobe_vipm.extension import ext, jwt_secret_callback, process_order_fulfillment
+from adobe_vipm.extension import (
+    adobe_api_metrics,
+    airtable_metrics,
+    ext,
+    fulfillment_metrics,
+    jwt_secret_callback,
+    process_order_fulfillment,
+)
 from adobe_vipm.flows.constants import Param
 from adobe_vipm.flows.utils import set_ordering_parameter_error
 
@@ -17,11 +24,18 @@ def test_listener_registered():
 
 def test_process_order_fulfillment(mocker, mock_mpt_client):
     mocked_fulfill_order = mocker.patch("adobe_vipm.extension.fulfill_order")
-    event = Event("evt-id", "orders", Context(order={"id": "ORD-0792-5000-2253-4210"}))
+    mocked_dispatcher = mocker.MagicMock()
+    mocker.patch("adobe_vipm.extension.get_fulfillment_dispatcher", return_value=mocked_dispatcher)
+    order = {"id": "ORD-0792-5000-2253-4210", "agreement": {"id": "AGR-2119-4550-8674-5962"}}
+    event = Event("evt-id", "orders", Context(order=order))
 
     process_order_fulfillment(mock_mpt_client, event)  # act
 
-    mocked_fulfill_order.assert_called_once_with(mock_mpt_client, event.data.order)
+    agreement_id, order_id, task = mocked_dispatcher.submit.call_args.args
+    assert (agreement_id, order_id) == ("AGR-2119-4550-8674-5962", "ORD-0792-5000-2253-4210")
+    mocked_fulfill_order.assert_not_called()
+    task()
+    mocked_fulfill_order.assert_called_once_with(mock_mpt_client, order)
 
 
 def test_jwt_secret_callback(mocker, settings, mpt_client, webhook):
@@ -78,3 +92,46 @@ def test_process_order_validation_error(client, mocker, jwt_token, webhook):
         "id": "VIPMG001",
         "message": "Unexpected error during validation: A super duper error.",
     }
+
+
+def test_adobe_api_metrics(mocker):
+    mocker.patch(
+        "adobe_vipm.extension.ADOBE_API_METRICS.collect",
+        return_value=[{"endpoint": "/v3/customers/{id}", "requests": 1}],
+    )
+    mocker.patch(
+        "adobe_vipm.extension.get_rate_limiter",
+        return_value=mocker.MagicMock(collect_metrics=lambda: {"auth-uk": {"acquired": 1}}),
+    )
+
+    result = adobe_api_metrics(mocker.MagicMock())
+
+    assert result == (
+        200,
+        {
+            "requests": [{"endpoint": "/v3/customers/{id}", "requests": 1}],
+            "rate_limit": {"auth-uk": {"acquired": 1}},
+        },
+    )
+
+
+def test_fulfillment_metrics(mocker):
+    mocker.patch(
+        "adobe_vipm.extension.get_fulfillment_dispatcher",
+        return_value=mocker.MagicMock(collect_metrics=lambda: {"queued": 2}),
+    )
+
+    result = fulfillment_metrics(mocker.MagicMock())
+
+    assert result == (200, {"queued": 2})
+
+
+def test_airtable_metrics(mocker):
+    mocker.patch(
+        "adobe_vipm.extension.get_pricelist_cache",
+        return_value=mocker.MagicMock(stats=lambda: {"entries": 1, "hits": 2}),
+    )
+
+    result = airtable_metrics(mocker.MagicMock())
+
+    assert result == (200, {"pricelist_cache": {"entries": 1, "hits": 2}})